@@ -0,0 +1,162 @@
+"""
+Arama İndeksi Modülü
+Bu modül bilgi tabanındaki mesajlar için karakter üçlüsü (trigram) ters indeksi sağlar.
+Benzerlik aramasında tüm bilgileri taramak yerine küçük bir aday listesi çıkarılır.
+"""
+
+import json
+from collections import Counter, defaultdict
+from itertools import chain
+from typing import Dict, List, Set, Iterable, Tuple
+from depolama import atomik_json_yaz
+
+
+class NgramIndeksi:
+    def __init__(self, n: int = 3):
+        """Boş bir n-gram indeksi oluştur"""
+        self.n = n
+        self.ngramlar: Dict[str, Set[str]] = defaultdict(set)
+        self.uzunluklar: Dict[str, int] = {}
+        self.siralar: Dict[str, int] = {}
+        self._sonraki_sira = 0
+
+    def __len__(self) -> int:
+        return len(self.uzunluklar)
+
+    def __contains__(self, bilgi_id: str) -> bool:
+        return bilgi_id in self.uzunluklar
+
+    def ngramlari_cikart(self, temiz_metin: str) -> Set[str]:
+        """Temizlenmiş metnin karakter n-gramlarını çıkart"""
+        dolgulu = f" {temiz_metin} "
+        if len(dolgulu) <= self.n:
+            return {dolgulu}
+        return {dolgulu[i:i + self.n] for i in range(len(dolgulu) - self.n + 1)}
+
+    def ekle(self, bilgi_id: str, temiz_metin: str):
+        """Bilgiyi indekse ekle"""
+        if bilgi_id in self.uzunluklar:
+            return
+
+        for ngram in self.ngramlari_cikart(temiz_metin):
+            self.ngramlar[ngram].add(bilgi_id)
+
+        self.uzunluklar[bilgi_id] = len(temiz_metin)
+        self.siralar[bilgi_id] = self._sonraki_sira
+        self._sonraki_sira += 1
+
+    def cikar(self, bilgi_id: str, temiz_metin: str):
+        """Bilgiyi indeksten çıkar"""
+        if bilgi_id not in self.uzunluklar:
+            return
+
+        for ngram in self.ngramlari_cikart(temiz_metin):
+            kume = self.ngramlar.get(ngram)
+            if kume is None:
+                continue
+            kume.discard(bilgi_id)
+            if not kume:
+                del self.ngramlar[ngram]
+
+        del self.uzunluklar[bilgi_id]
+        del self.siralar[bilgi_id]
+
+    @staticmethod
+    def uzunluk_uygun(uzunluk1: int, uzunluk2: int, esik: float) -> bool:
+        """Uzunluk farkı benzerlik eşiğine ulaşmaya izin veriyor mu?
+
+        fuzz.ratio en fazla 2 * min / (toplam uzunluk) olabilir, bu yüzden
+        bu sınırın altında kalan bilgiler hiçbir zaman eşiği geçemez.
+        """
+        toplam = uzunluk1 + uzunluk2
+        if toplam == 0:
+            return True
+        ust_sinir = round(200 * min(uzunluk1, uzunluk2) / toplam) / 100.0
+        return ust_sinir >= esik
+
+    @classmethod
+    def uzunluk_araligi(cls, uzunluk: int, esik: float) -> Tuple[int, int]:
+        """uzunluk_uygun kuralını sağlayan mesaj uzunluklarının aralığı
+
+        Üst sınır kısa olan uzunluk büyüdükçe artar, bu yüzden uygun uzunluklar
+        kesintisiz bir aralıktır.
+        """
+        en_kisa = 0
+        while not cls.uzunluk_uygun(uzunluk, en_kisa, esik):
+            en_kisa += 1
+        en_uzun = max(uzunluk, en_kisa)
+        while cls.uzunluk_uygun(uzunluk, en_uzun + 1, esik):
+            en_uzun += 1
+        return en_kisa, en_uzun
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int) -> List[str]:
+        """Metinle ortak n-gramı olan ve uzunluğu uygun aday bilgileri getir
+
+        Limitten fazla aday varsa ortak n-gramı en çok olanlar seçilir (eşitlikte
+        önce eklenen), adaylar eklenme sırasına göre döner.
+        """
+        ortak_sayilari = Counter(chain.from_iterable(
+            self.ngramlar.get(ngram, ()) for ngram in self.ngramlari_cikart(temiz_metin)
+        ))
+
+        en_kisa, en_uzun = self.uzunluk_araligi(len(temiz_metin), esik)
+        uzunluklar = self.uzunluklar
+        uygunlar = [
+            bilgi_id for bilgi_id in ortak_sayilari
+            if en_kisa <= uzunluklar[bilgi_id] <= en_uzun
+        ]
+
+        uygunlar.sort(key=self.siralar.__getitem__)
+        if len(uygunlar) > aday_limiti:
+            # Sıralama kararlı: ortak sayısı eşit olanlar eklenme sırasını korur
+            en_iyiler = sorted(uygunlar, key=ortak_sayilari.__getitem__, reverse=True)[:aday_limiti]
+            uygunlar = sorted(en_iyiler, key=self.siralar.__getitem__)
+
+        return uygunlar
+
+    def olustur(self, metinler: Iterable):
+        """(bilgi_id, temiz_metin) çiftlerinden indeksi sıfırdan oluştur"""
+        self.ngramlar = defaultdict(set)
+        self.uzunluklar = {}
+        self.siralar = {}
+        self._sonraki_sira = 0
+
+        for bilgi_id, temiz_metin in metinler:
+            self.ekle(bilgi_id, temiz_metin)
+
+    def kaydet(self, dosya_yolu: str, imza: str) -> bool:
+        """İndeksi JSON dosyasına kaydet"""
+        sirali_idler = sorted(self.uzunluklar, key=self.siralar.__getitem__)
+        veri = {
+            "imza": imza,
+            "n": self.n,
+            "bilgiler": [[bilgi_id, self.uzunluklar[bilgi_id]] for bilgi_id in sirali_idler],
+            "ngramlar": {ngram: sorted(idler) for ngram, idler in self.ngramlar.items()}
+        }
+
+        try:
+            atomik_json_yaz(veri, dosya_yolu, indent=None)
+            return True
+        except Exception as e:
+            print(f"❌ İndeks kaydetme hatası {dosya_yolu}: {e}")
+            return False
+
+    def yukle(self, dosya_yolu: str, imza: str) -> bool:
+        """İndeksi dosyadan yükle, imza uyuşmazsa yükleme"""
+        try:
+            with open(dosya_yolu, 'r', encoding='utf-8') as f:
+                veri = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        if veri.get("imza") != imza or veri.get("n") != self.n:
+            return False
+
+        self.ngramlar = defaultdict(set, {ngram: set(idler) for ngram, idler in veri["ngramlar"].items()})
+        self.uzunluklar = {}
+        self.siralar = {}
+        for sira, (bilgi_id, uzunluk) in enumerate(veri["bilgiler"]):
+            self.uzunluklar[bilgi_id] = uzunluk
+            self.siralar[bilgi_id] = sira
+        self._sonraki_sira = len(self.siralar)
+        return True
@@ -7,19 +7,77 @@ import json
 import datetime
 import time
 import sys
+import argparse
+from collections import deque
 from typing import Dict, List, Optional
-from colorama import init, Fore, Back, Style
+
+_ICE_AKTARMA_BASLANGICI = time.perf_counter()
 
 # Kendi modüllerimizi import et
-from dil_isleme import TurkceDilIsleme
+from dil_isleme import TurkceDilIsleme, MesajAnalizi
 from ogrenme_modulu import OgrenmeModulu
+from profil_deposu import ProfilDeposu
+from olcum import olcumler, zamanla
+
+ICE_AKTARMA_SURESI = time.perf_counter() - _ICE_AKTARMA_BASLANGICI
+
+
+class _Renkler:
+    """colorama.Fore yerine geçen vekil; colorama ilk renk kullanımında yüklenir
+    
+    Çıktı terminal değilse colorama renk kodlarını zaten sildiği için colorama
+    hiç yüklenmez, renkler boş metin olur (sunucu ve betik kullanımı).
+    """
+    
+    _colorama_hazir = False
+    
+    def __getattr__(self, renk: str) -> str:
+        if sys.stdout.isatty():
+            import colorama
+            if not self._colorama_hazir:
+                colorama.init(autoreset=True)
+                _Renkler._colorama_hazir = True
+            deger = getattr(colorama.Fore, renk)
+        else:
+            deger = ""
+        setattr(self, renk, deger)
+        return deger
+
+
+Fore = _Renkler()
+
+class Oturum:
+    """Bir kullanıcıyla yapılan sohbetin durumu
+    
+    Konsol modunda asistanın tek bir oturumu vardır; sunucu modunda her
+    bağlantı kendi oturumunu taşır, modüller oturumlar arasında paylaşılır.
+    """
+    
+    def __init__(self, aktif_kullanici: str = "misafir"):
+        self.aktif_kullanici = aktif_kullanici
+        self.oturum_baslangic = datetime.datetime.now()
+        self.konusma_gecmisi: List[Dict] = []
+
+
+def _giris_profili_guncelle(profil: Dict):
+    """Girişte profilin son etkileşim zamanını ve sohbet sayısını güncelle
+
+    Modül düzeyinde tanımlıdır; işçi havuzunda sahip sürece gönderilebilir.
+    """
+    profil["son_etkilesim"] = datetime.datetime.now().isoformat()
+    profil["toplam_sohbet"] += 1
 
-# Colorama'yı başlat
-init(autoreset=True)
 
 class OgrenenAsistan:
-    def __init__(self):
-        """Asistanı başlat"""
+    def __init__(self, ogrenme_modulu: Optional[OgrenmeModulu] = None,
+                 profil_deposu: Optional[ProfilDeposu] = None,
+                 dil_isleme: Optional[TurkceDilIsleme] = None):
+        """Asistanı başlat
+        
+        Dil işleme nesnesi verilmezse öğrenme modülününki kullanılır; asistan ve
+        öğrenme modülü dil kurallarını tek bir kez yükler.
+        """
+        baslangic = time.perf_counter()
         self.version = "1.0.0"
         self.ad = "Öğrenen Asistan"
         
@@ -27,55 +85,91 @@ class OgrenenAsistan:
         print(f"{Fore.CYAN}🤖 {self.ad} başlatılıyor...")
         
         try:
-            self.dil_isleme = TurkceDilIsleme()
+            if dil_isleme is None:
+                dil_isleme = ogrenme_modulu.dil_isleme if ogrenme_modulu else TurkceDilIsleme()
+            self.dil_isleme = dil_isleme
+            self.dil_isleme_suresi = time.perf_counter() - baslangic
             print(f"{Fore.GREEN}✅ Dil işleme modülü yüklendi")
             
-            self.ogrenme_modulu = OgrenmeModulu()
+            self.ogrenme_modulu = ogrenme_modulu or OgrenmeModulu(dil_isleme=self.dil_isleme)
             print(f"{Fore.GREEN}✅ Öğrenme modülü yüklendi")
             
+            # Aşama süreleri ve sayaçlar; Prometheus dosyası ve yavaş istek profili isteğe bağlı
+            ayarlar = self.ogrenme_modulu.ayarlar
+            olcumler.ayarla(
+                ayarlar.get("olcum_profil_orani", 0.0),
+                ayarlar.get("olcum_profil_esigi", 0.25),
+                ayarlar.get("olcum_profil_klasoru", "veri/profiller")
+            )
+            self.olcum_dosya = ayarlar.get("olcum_dosya", "")
+            
+            # Konsolda cevaptan önceki doğal gecikme (saniye); cevabı hesaplama süresi de sayılır
+            self.yanit_gecikmesi = ayarlar.get("yanit_gecikmesi", 0.5)
+            
             # Kullanıcı profili yönetimi
-            self.kullanici_profilleri = self._yukle_kullanici_profilleri()
-            self.aktif_kullanici = "misafir"
+            self.profil_deposu = profil_deposu or self._yukle_kullanici_profilleri()
+            
+            # Oturum bilgileri (konsol modundaki tek oturum)
+            self.oturum = Oturum()
             
-            # Oturum bilgileri
-            self.oturum_baslangic = datetime.datetime.now()
-            self.konusma_gecmisi = []
+            # Yalnızca konsolda arka planda tamamlanan öğrenmeler bildirilir
+            self.konsol_modu = False
+            self._tamamlanan_ogrenmeler = deque()
             
+            self.baslangic_suresi = time.perf_counter() - baslangic
             print(f"{Fore.GREEN}✅ {self.ad} hazır!")
             
         except Exception as e:
             print(f"{Fore.RED}❌ Başlatma hatası: {e}")
             sys.exit(1)
     
-    def _yukle_kullanici_profilleri(self) -> Dict:
-        """Kullanıcı profillerini yükle"""
-        try:
-            with open("veri/kullanici_profilleri.json", 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {"kullanicilar": {}, "varsayilan_profil": {}}
+    @property
+    def aktif_kullanici(self) -> str:
+        return self.oturum.aktif_kullanici
+    
+    @aktif_kullanici.setter
+    def aktif_kullanici(self, kullanici_adi: str):
+        self.oturum.aktif_kullanici = kullanici_adi
+    
+    @property
+    def konusma_gecmisi(self) -> List[Dict]:
+        return self.oturum.konusma_gecmisi
+    
+    @property
+    def oturum_baslangic(self) -> datetime.datetime:
+        return self.oturum.oturum_baslangic
+    
+    def _yukle_kullanici_profilleri(self) -> ProfilDeposu:
+        """Kullanıcı profil deposunu aç (profiller ilk erişimde yüklenir)"""
+        ayarlar = self.ogrenme_modulu.ayarlar
+        return ProfilDeposu(
+            ayarlar.get("profil_klasoru", "veri/kullanicilar"),
+            "veri/kullanici_profilleri.json",
+            ayarlar.get("profil_onbellek_boyutu", 1000)
+        )
     
     def _kaydet_kullanici_profilleri(self):
-        """Kullanıcı profillerini kaydet"""
-        try:
-            with open("veri/kullanici_profilleri.json", 'w', encoding='utf-8') as f:
-                json.dump(self.kullanici_profilleri, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"{Fore.RED}❌ Profil kaydetme hatası: {e}")
+        """Kullanıcı profillerini kaydedilmek üzere işaretle (yazma arka planda yapılır)"""
+        self.ogrenme_modulu.kayit_iscisi.isaretle("kullanici_profilleri", self._yaz_kullanici_profilleri)
+    
+    def _olcumleri_yaz(self):
+        """Ölçümleri Prometheus metin dosyasına yaz (yazma arka planda yapılır)"""
+        olcumler.prometheus_yaz(self.olcum_dosya)
     
-    def kullanici_girisi(self, kullanici_adi: str = None):
+    def _yaz_kullanici_profilleri(self):
+        """Değişen kullanıcı profillerini dosyalarına yaz"""
+        self.profil_deposu.yaz()
+    
+    def kullanici_girisi(self, kullanici_adi: str = None, oturum: Optional[Oturum] = None):
         """Kullanıcı girişi yap"""
+        oturum = oturum or self.oturum
         if kullanici_adi:
-            self.aktif_kullanici = kullanici_adi.lower()
-            
-            # Yeni kullanıcı mı?
-            if self.aktif_kullanici not in self.kullanici_profilleri["kullanicilar"]:
-                self._yeni_kullanici_olustur(self.aktif_kullanici)
+            oturum.aktif_kullanici = kullanici_adi.lower()
             
-            # Profili güncelle
-            profil = self.kullanici_profilleri["kullanicilar"][self.aktif_kullanici]
-            profil["son_etkilesim"] = datetime.datetime.now().isoformat()
-            profil["toplam_sohbet"] += 1
+            # Yeni kullanıcının profili varsayılan profilden oluşturulur
+            _, yeni_mi = self.profil_deposu.guncelle(oturum.aktif_kullanici, _giris_profili_guncelle)
+            if yeni_mi:
+                print(f"{Fore.YELLOW}🆕 Yeni kullanıcı profili oluşturuldu: {oturum.aktif_kullanici}")
             
             self._kaydet_kullanici_profilleri()
             
@@ -83,23 +177,16 @@ class OgrenenAsistan:
         else:
             return "👋 Merhaba! Ben Öğrenen Asistanım. Seninle sohbet etmeyi dört gözle bekliyorum!"
     
-    def _yeni_kullanici_olustur(self, kullanici_adi: str):
-        """Yeni kullanıcı profili oluştur"""
-        varsayilan = self.kullanici_profilleri["varsayilan_profil"].copy()
-        varsayilan["ad"] = kullanici_adi
-        varsayilan["olusturma_tarihi"] = datetime.datetime.now().isoformat()
-        
-        self.kullanici_profilleri["kullanicilar"][kullanici_adi] = varsayilan
-        
-        print(f"{Fore.YELLOW}🆕 Yeni kullanıcı profili oluşturuldu: {kullanici_adi}")
-    
-    def mesaj_isle(self, kullanici_mesaj: str) -> str:
+    @zamanla("mesaj_isle", profil=True)
+    def mesaj_isle(self, kullanici_mesaj: str, oturum: Optional[Oturum] = None) -> str:
         """Kullanıcı mesajını işle ve cevap üret"""
         if not kullanici_mesaj.strip():
             return "🤔 Bir şey söylemedin. Benimle sohbet etmek ister misin?"
         
+        oturum = oturum or self.oturum
+        
         # Konuşma geçmişine ekle
-        self.konusma_gecmisi.append({
+        oturum.konusma_gecmisi.append({
             "zaman": datetime.datetime.now().isoformat(),
             "kullanici": kullanici_mesaj,
             "asistan": ""  # Cevap sonra eklenecek
@@ -112,27 +199,23 @@ class OgrenenAsistan:
         cevap = self._cevap_uret(kullanici_mesaj, analiz)
         
         # Konuşma geçmişini güncelle
-        self.konusma_gecmisi[-1]["asistan"] = cevap
+        oturum.konusma_gecmisi[-1]["asistan"] = cevap
         
         # Öğrenme
         self._ogrenme_sureci(kullanici_mesaj, cevap, analiz)
         
+        if self.olcum_dosya:
+            self.ogrenme_modulu.kayit_iscisi.isaretle("olcumler", self._olcumleri_yaz)
+        
         return cevap
     
-    def _mesaj_analizi(self, mesaj: str) -> Dict:
-        """Mesajı analiz et"""
-        return {
-            "temiz_metin": self.dil_isleme.temizle_metin(mesaj),
-            "kelimeler": self.dil_isleme.kelimelere_ayir(mesaj),
-            "soru_mu": self.dil_isleme.soru_mu(mesaj),
-            "selamlasma_mi": self.dil_isleme.selamlasma_mi(mesaj),
-            "vedalasma_mi": self.dil_isleme.vedalasma_mi(mesaj),
-            "duygu": self.dil_isleme.duygu_analizi(mesaj),
-            "konu": self.dil_isleme.konu_belirle(mesaj),
-            "anahtar_kelimeler": self.dil_isleme.anahtar_kelimeleri_cikart(mesaj)
-        }
+    @zamanla("mesaj_analizi")
+    def _mesaj_analizi(self, mesaj: str) -> MesajAnalizi:
+        """Mesajı tek geçişte analiz et"""
+        return self.dil_isleme.mesaj_analizi(mesaj)
     
-    def _cevap_uret(self, mesaj: str, analiz: Dict) -> str:
+    @zamanla("cevap_uret")
+    def _cevap_uret(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Mesaj analizine göre cevap üret"""
         
         # Önceki deneyimlerden öğrenilmiş cevap var mı?
@@ -141,7 +224,7 @@ class OgrenenAsistan:
             return f"💡 {ogrenilmis_cevap}"
         
         # Vedalaşma
-        if analiz["vedalasma_mi"]:
+        if analiz.vedalasma_mi:
             vedalasmalar = [
                 "👋 Görüşmek üzere! Keyifli günler!",
                 "🌟 Hoşça kal! Tekrar konuşmak için sabırsızlanıyorum!",
@@ -150,7 +233,7 @@ class OgrenenAsistan:
             return self._rastgele_sec(vedalasmalar)
         
         # Selamlama
-        if analiz["selamlasma_mi"]:
+        if analiz.selamlasma_mi:
             selamlamalar = [
                 f"🤖 Merhaba! Ben {self.ad}. Nasılsın?",
                 "👋 Selam! Seninle tanışmak güzel! Bugün nasıl geçiyor?",
@@ -159,26 +242,26 @@ class OgrenenAsistan:
             return self._rastgele_sec(selamlamalar)
         
         # Soru
-        if analiz["soru_mu"]:
+        if analiz.soru_mu:
             return self._soru_cevapla(mesaj, analiz)
         
         # Konu bazlı cevaplar
-        if analiz["konu"] == "teknoloji":
+        if analiz.konu == "teknoloji":
             return self._teknoloji_cevabi(mesaj, analiz)
-        elif analiz["konu"] == "eğitim":
+        elif analiz.konu == "eğitim":
             return self._egitim_cevabi(mesaj, analiz)
-        elif analiz["konu"] == "kişisel":
+        elif analiz.konu == "kişisel":
             return self._kisisel_cevap(mesaj, analiz)
         
         # Genel cevap
         return self._genel_cevap(mesaj, analiz)
     
-    def _soru_cevapla(self, mesaj: str, analiz: Dict) -> str:
+    def _soru_cevapla(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Soruları cevapla"""
         # Konu bazlı bilgi var mı?
-        konu_bilgileri = self.ogrenme_modulu.konu_bazli_bilgi_getir(analiz["konu"], 1)
+        konu_bilgileri = self.ogrenme_modulu.konu_bazli_bilgi_getir(analiz.konu, 1)
         if konu_bilgileri:
-            return f"🤔 {analiz['konu'].title()} konusunda şunu biliyorum: {konu_bilgileri[0]['asistan_cevap']}"
+            return f"🤔 {analiz.konu.title()} konusunda şunu biliyorum: {konu_bilgileri[0]['asistan_cevap']}"
         
         sorular = [
             "🤔 Bu konuda henüz yeterince bilgim yok, ama öğrenmeye açığım! Bana daha fazla anlat?",
@@ -187,7 +270,7 @@ class OgrenenAsistan:
         ]
         return self._rastgele_sec(sorular)
     
-    def _teknoloji_cevabi(self, mesaj: str, analiz: Dict) -> str:
+    def _teknoloji_cevabi(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Teknoloji konularında cevap"""
         cevaplar = [
             "💻 Teknoloji gerçekten heyecan verici! Bu konuda daha fazla bilgi paylaşır mısın?",
@@ -196,7 +279,7 @@ class OgrenenAsistan:
         ]
         return self._rastgele_sec(cevaplar)
     
-    def _egitim_cevabi(self, mesaj: str, analiz: Dict) -> str:
+    def _egitim_cevabi(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Eğitim konularında cevap"""
         cevaplar = [
             "📚 Öğrenmeyi çok seviyorum! Sen de sürekli öğrenmeyi seviyor musun?",
@@ -205,15 +288,15 @@ class OgrenenAsistan:
         ]
         return self._rastgele_sec(cevaplar)
     
-    def _kisisel_cevap(self, mesaj: str, analiz: Dict) -> str:
+    def _kisisel_cevap(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Kişisel konularda cevap"""
-        if analiz["duygu"] == "olumlu":
+        if analiz.duygu == "olumlu":
             cevaplar = [
                 "😊 Bu güzel! Mutlu olduğunu duyduğuma sevindim!",
                 "🌟 Harika! Olumlu enerjin beni de mutlu ediyor!",
                 "💫 Ne güzel! Böyle pozitif şeyler duymak çok hoş!"
             ]
-        elif analiz["duygu"] == "olumsuz":
+        elif analiz.duygu == "olumsuz":
             cevaplar = [
                 "😔 Üzgün olduğunu duyduğuma ben de üzüldüm. Konuşmak ister misin?",
                 "💙 Zor zamanlar geçirdiğin anlaşılıyor. Buradayım, dinliyorum.",
@@ -227,7 +310,7 @@ class OgrenenAsistan:
             ]
         return self._rastgele_sec(cevaplar)
     
-    def _genel_cevap(self, mesaj: str, analiz: Dict) -> str:
+    def _genel_cevap(self, mesaj: str, analiz: MesajAnalizi) -> str:
         """Genel durumlar için cevap"""
         cevaplar = [
             "🤖 Anlıyorum! Bu konuda benimle daha fazla konuşmak ister misin?",
@@ -242,18 +325,28 @@ class OgrenenAsistan:
         import random
         return random.choice(liste)
     
-    def _ogrenme_sureci(self, kullanici_mesaj: str, asistan_cevap: str, analiz: Dict):
-        """Öğrenme sürecini başlat"""
+    @zamanla("ogrenme_sureci")
+    def _ogrenme_sureci(self, kullanici_mesaj: str, asistan_cevap: str, analiz: MesajAnalizi):
+        """Öğrenme sürecini başlat (öğrenme arka planda yapılır, cevap beklemez)"""
         # Anlamlı konuşmalar için öğrenme yap
-        if len(analiz["kelimeler"]) >= 3 and not analiz["selamlasma_mi"] and not analiz["vedalasma_mi"]:
-            basarili = self.ogrenme_modulu.yeni_bilgi_ogren(
+        if len(analiz.kelimeler) >= 3 and not analiz.selamlasma_mi and not analiz.vedalasma_mi:
+            self.ogrenme_modulu.arka_planda_ogren(
                 kullanici_mesaj, 
                 asistan_cevap, 
-                analiz["konu"]
+                analiz.konu,
+                analiz,
+                ogrenildi=self._ogrenme_tamamlandi if self.konsol_modu else None
             )
-            
-            if basarili:
-                print(f"{Fore.GREEN}📝 Yeni bilgi öğrendim!")
+    
+    def _ogrenme_tamamlandi(self):
+        """Öğrenme iş parçacığından çağrılır; bildirim bir sonraki cevapta yazılır"""
+        self._tamamlanan_ogrenmeler.append(True)
+    
+    def _ogrenme_bildirimlerini_yaz(self):
+        """Arka planda yeni bilgi açan öğrenmeleri bildir"""
+        while self._tamamlanan_ogrenmeler:
+            self._tamamlanan_ogrenmeler.popleft()
+            print(f"{Fore.GREEN}📝 Yeni bilgi öğrendim!")
     
     def istatistikleri_goster(self):
         """Asistan istatistiklerini göster"""
@@ -265,8 +358,35 @@ class OgrenenAsistan:
         print(f"{Fore.GREEN}✅ Başarılı Öğrenmeler: {ogrenme_stats['basarili_ogrenmeler']}")
         print(f"{Fore.RED}❌ Başarısız Öğrenmeler: {ogrenme_stats['basarisiz_ogrenmeler']}")
         print(f"{Fore.BLUE}📈 Başarı Oranı: %{ogrenme_stats['basari_orani']:.1f}")
+        print(f"{Fore.WHITE}📅 Bugün: {ogrenme_stats['bugun']['basarili']} başarılı, "
+              f"{ogrenme_stats['bugun']['basarisiz']} başarısız öğrenme")
+        onbellek_stats = self.ogrenme_modulu.sorgu_onbellegi.istatistikler()
+        print(f"{Fore.WHITE}⚡ Önbellek: {onbellek_stats['isabet']} isabet / "
+              f"{onbellek_stats['iskalama']} ıskalama (%{onbellek_stats['isabet_orani']:.1f})")
         print(f"{Fore.MAGENTA}🕒 Bu Oturum: {len(self.konusma_gecmisi)} mesaj")
         print(f"{Fore.CYAN}👤 Aktif Kullanıcı: {self.aktif_kullanici}")
+        
+        olcum = olcumler.anlik_goruntu()
+        if olcum["asamalar"]:
+            print(f"\n{Fore.CYAN}⏱️ Aşama Süreleri (ms)   adet     p50     p95     p99")
+            for asama, sure in olcum["asamalar"].items():
+                print(f"{Fore.WHITE}   {asama:<20}{sure['adet']:>6}{sure['p50_ms']:>8.1f}"
+                      f"{sure['p95_ms']:>8.1f}{sure['p99_ms']:>8.1f}")
+        sayaclar = olcum["sayaclar"]
+        print(f"{Fore.WHITE}🔢 Öğrenme: {sayaclar.get('ogrenme', 0):.0f}, arama: {sayaclar.get('arama', 0):.0f}, "
+              f"önbellek isabeti: {sayaclar.get('onbellek_isabet', 0):.0f}, "
+              f"yazılan: {sayaclar.get('yazilan_bayt', 0) / 1024:.1f} KB")
+    
+    def baslangic_profilini_goster(self):
+        """İçe aktarma, yükleme ve indeks kurma sürelerini göster"""
+        print(f"\n{Fore.CYAN}⏱️ Başlangıç Profili")
+        print(f"{Fore.YELLOW}{'='*40}")
+        print(f"{Fore.WHITE}📦 İçe aktarma: {ICE_AKTARMA_SURESI * 1000:.1f} ms")
+        print(f"{Fore.WHITE}🗣️ Dil işleme: {self.dil_isleme_suresi * 1000:.1f} ms")
+        for asama, sure in self.ogrenme_modulu.baslangic_sureleri.items():
+            print(f"{Fore.WHITE}   🧠 {asama}: {sure * 1000:.1f} ms")
+        print(f"{Fore.WHITE}🤖 Asistan başlatma: {self.baslangic_suresi * 1000:.1f} ms")
+        print(f"{Fore.GREEN}⏱️ Toplam: {(ICE_AKTARMA_SURESI + self.baslangic_suresi) * 1000:.1f} ms")
     
     def calistir(self):
         """Ana çalışma döngüsü"""
@@ -284,6 +404,11 @@ class OgrenenAsistan:
         print(f"{Fore.YELLOW}💾 Verileri kaydetmek için 'kaydet' yaz")
         print("-" * 50)
         
+        self.konsol_modu = True
+        
+        # Girdi ya da çıktı yönlendirildiyse (betik, boru) gecikme yapılmaz
+        gecikme = self.yanit_gecikmesi if sys.stdin.isatty() and sys.stdout.isatty() else 0.0
+        
         while True:
             try:
                 # Kullanıcı girişi al
@@ -293,6 +418,7 @@ class OgrenenAsistan:
                 if kullanici_mesaj.lower() in ['çıkış', 'exit', 'quit', 'bye']:
                     print(f"\n{Fore.CYAN}🤖: 👋 Görüşmek üzere! Benimle konuştuğun için teşekkürler!")
                     self.ogrenme_modulu.verileri_kaydet()
+                    self._ogrenme_bildirimlerini_yaz()
                     break
                 
                 elif kullanici_mesaj.lower() in ['stats', 'istatistik', 'istatistikler']:
@@ -318,8 +444,12 @@ class OgrenenAsistan:
                     continue
                 
                 # Cevap üret ve göster
-                time.sleep(0.5)  # Doğal gecikme
+                baslangic = time.monotonic()
                 cevap = self.mesaj_isle(kullanici_mesaj)
+                kalan = gecikme - (time.monotonic() - baslangic)
+                if kalan > 0:
+                    time.sleep(kalan)  # Doğal gecikme
+                self._ogrenme_bildirimlerini_yaz()
                 print(f"{Fore.CYAN}🤖: {cevap}")
                 
             except KeyboardInterrupt:
@@ -330,10 +460,18 @@ class OgrenenAsistan:
                 print(f"{Fore.RED}❌ Hata: {e}")
                 print(f"{Fore.YELLOW}💡 Lütfen tekrar deneyin veya 'çıkış' yazarak programı kapatın.")
 
-def main():
+def main(argv=None):
     """Ana fonksiyon"""
+    ayristirici = argparse.ArgumentParser(description="Öğrenen Asistan")
+    ayristirici.add_argument("--profile-startup", action="store_true",
+                             help="başlangıç sürelerini gösterip çık")
+    argumanlar = ayristirici.parse_args(argv)
+    
     try:
         asistan = OgrenenAsistan()
+        if argumanlar.profile_startup:
+            asistan.baslangic_profilini_goster()
+            return
         asistan.calistir()
     except Exception as e:
         print(f"{Fore.RED}❌ Kritik hata: {e}")
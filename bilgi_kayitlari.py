@@ -0,0 +1,344 @@
+"""
+Bilgi Kayıtları Modülü
+Bu modül bellekteki bilgileri sözlükler yerine __slots__ kullanan kayıtlarda tutar.
+Konular ve kelimeler ortak sözcüklerde numaralanır, kelime listeleri numara dizisi,
+tarihler epoch saniyesi olarak saklanır. Kayıtlar bilgi_tabani["bilgiler"] sözlüğü
+gibi okunur ve JSON'a aynı şemayla yazılır; okunan her bilgi, kaydı kopyalamayan hafif
+bir görünümdür.
+"""
+
+import datetime
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# Bilgi şemasındaki alanlar; sözlüğe ve JSON'a bu sırayla çözülür
+ALANLAR = ("id", "kullanici_mesaj", "asistan_cevap", "konu", "anahtar_kelimeler", "ogrenme_tarihi",
+           "kullanim_sayisi", "basari_skoru", "guncelleme_tarihi", "temiz_mesaj", "mesaj_uzunlugu")
+KONU_ALANLARI = ("konu",)
+KELIME_ALANLARI = ("anahtar_kelimeler",)
+TARIH_ALANLARI = ("ogrenme_tarihi", "guncelleme_tarihi")
+
+# Tarihler saat dilimsiz ISO metinleri olarak yazılır; saniyeler bu ana göre tutulur
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SANIYE = datetime.timedelta(seconds=1)
+# Bu sınırın altındaki saniyelerde float hatası yarım mikrosaniyeden küçüktür, metin aynen geri döner
+_TARIH_SINIRI = 2 ** 32
+
+# Kodlanamayan değer ve görünümde silinmiş alan işaretleri
+_YOK = object()
+_SILINDI = object()
+
+
+class BilgiKaydi:
+    """Tek bilginin alanları; bulunmayan alanın yuvası boş kalır
+
+    Kayıtlar değiştirilmez: güncellemede yeni kayıt oluşturulur, böylece önceden
+    verilmiş görünümler tutarlı bir anlık hal gösterir. Şemada olmayan ya da
+    beklenen türde olmayan alanlar _ek sözlüğünde olduğu gibi saklanır.
+    """
+
+    __slots__ = ALANLAR + ("_ek",)
+
+
+class Sozcukluk:
+    """Metinleri bir kez saklayıp sıra numarasıyla gösteren ortak sözlük
+
+    Numaralar kalıcıdır; unutulan bilgilerin metinleri sözcükte kalır.
+    """
+
+    __slots__ = ("metinler", "_numaralar")
+
+    def __init__(self):
+        self.metinler: List[str] = []
+        self._numaralar: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.metinler)
+
+    def numara(self, metin: str) -> int:
+        no = self._numaralar.get(metin)
+        if no is None:
+            no = self._numaralar[metin] = len(self.metinler)
+            self.metinler.append(metin)
+        return no
+
+
+class BilgiGorunumu(MutableMapping):
+    """Bir kaydı bilgi sözlüğü gibi gösteren görünüm
+
+    Alanlar okundukça çözülür. Görünümde yapılan değişiklikler kayda değil
+    görünümün kendisine yazılır; kalıcı olması için görünüm anahtarına geri
+    atanmalıdır (ikili görüntüden çözülen bilgilerdeki gibi).
+    """
+
+    __slots__ = ("_kayitlar", "_kayit", "_degisenler")
+
+    def __init__(self, kayitlar: "BilgiKayitlari", kayit: BilgiKaydi):
+        self._kayitlar = kayitlar
+        self._kayit = kayit
+        self._degisenler: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, alan: str):
+        if self._degisenler is not None and alan in self._degisenler:
+            deger = self._degisenler[alan]
+            if deger is _SILINDI:
+                raise KeyError(alan)
+            return deger
+        return self._kayitlar.alani_oku(self._kayit, alan)
+
+    def __setitem__(self, alan: str, deger):
+        if self._degisenler is None:
+            self._degisenler = {}
+        self._degisenler[alan] = deger
+
+    def __delitem__(self, alan: str):
+        if alan not in self:
+            raise KeyError(alan)
+        self[alan] = _SILINDI
+
+    def __iter__(self) -> Iterator[str]:
+        degisenler = self._degisenler or {}
+        for alan in self._kayitlar.alanlar(self._kayit):
+            if degisenler.get(alan) is not _SILINDI:
+                yield alan
+        for alan, deger in list(degisenler.items()):
+            if deger is not _SILINDI and not self._kayitlar.alan_var_mi(self._kayit, alan):
+                yield alan
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> Dict:
+        if not self._degisenler:
+            return self._kayitlar.coz(self._kayit)
+        return dict(self)
+
+    def items(self):
+        return self.copy().items()
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class BilgiKayitlari(MutableMapping):
+    """Bilgi kayıtlarını bilgi_tabani["bilgiler"] sözlüğü gibi gösteren kap
+
+    Sözlük atanan bilgiler kayda çevrilir, okunan bilgiler görünüm olarak döner;
+    eklenme sırası korunur.
+    """
+
+    def __init__(self):
+        self._kayitlar: Dict[str, BilgiKaydi] = {}
+        self.konular = Sozcukluk()
+        self.kelimeler = Sozcukluk()
+        # Toplu öğrenmede ve kayıtlarda aynı tarih art arda gelir; son çeviri paylaşılır
+        self._son_tarih: Tuple[Optional[str], float] = (None, 0.0)
+        self._son_cozulen: Tuple[Optional[float], str] = (None, "")
+        # Alan başına çözücü ve kodlayıcı; None olan alanlar kayıtta olduğu gibi durur
+        self._cozuculer = {alan: None for alan in ALANLAR}
+        self._cozuculer.update({alan: self.konular.metinler.__getitem__ for alan in KONU_ALANLARI})
+        self._cozuculer.update({alan: self._kelimeleri_coz for alan in KELIME_ALANLARI})
+        self._cozuculer.update({alan: self._tarihi_coz for alan in TARIH_ALANLARI})
+        self._kodlayicilar = {alan: None for alan in ALANLAR}
+        self._kodlayicilar.update({alan: self._konuyu_kodla for alan in KONU_ALANLARI})
+        self._kodlayicilar.update({alan: self._kelimeleri_kodla for alan in KELIME_ALANLARI})
+        self._kodlayicilar.update({alan: self._tarihi_kodla for alan in TARIH_ALANLARI})
+
+    @classmethod
+    def sozlukten(cls, bilgiler: Dict[str, Mapping]) -> "BilgiKayitlari":
+        """Bilgi sözlüğünü sırasıyla kayıtlara çevir
+
+        Sözlük çevrilirken boşaltılır; bellekte bilgilerin iki tam kopyası birden bulunmaz.
+        """
+        kayitlar = cls()
+        for bilgi_id in list(bilgiler):
+            kayitlar[bilgi_id] = bilgiler.pop(bilgi_id)
+        return kayitlar
+
+    def __getitem__(self, bilgi_id: str) -> BilgiGorunumu:
+        return BilgiGorunumu(self, self._kayitlar[bilgi_id])
+
+    def get(self, bilgi_id: str, varsayilan=None):
+        kayit = self._kayitlar.get(bilgi_id)
+        return varsayilan if kayit is None else BilgiGorunumu(self, kayit)
+
+    def __setitem__(self, bilgi_id: str, bilgi: Mapping):
+        if isinstance(bilgi, BilgiGorunumu) and bilgi._kayitlar is self:
+            kayit = bilgi._kayit if not bilgi._degisenler else self._degistir(bilgi._kayit, bilgi._degisenler)
+        else:
+            kayit = self.kodla(bilgi)
+        # Anahtar kayıttaki kimlik metniyle paylaşılır
+        if bilgi_id not in self._kayitlar and getattr(kayit, "id", None) == bilgi_id:
+            bilgi_id = kayit.id
+        self._kayitlar[bilgi_id] = kayit
+
+    def __delitem__(self, bilgi_id: str):
+        del self._kayitlar[bilgi_id]
+
+    def __contains__(self, bilgi_id) -> bool:
+        return bilgi_id in self._kayitlar
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._kayitlar)
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+    def items(self):
+        for bilgi_id, kayit in self._kayitlar.items():
+            yield bilgi_id, BilgiGorunumu(self, kayit)
+
+    def values(self):
+        for kayit in self._kayitlar.values():
+            yield BilgiGorunumu(self, kayit)
+
+    def kimlik(self, bilgi_id: str) -> str:
+        """Kayıttaki kimlik metni; konu listeleri gibi yapılar aynı nesneyi paylaşsın diye"""
+        kayit = self._kayitlar.get(bilgi_id)
+        return bilgi_id if kayit is None else getattr(kayit, "id", bilgi_id)
+
+    def temiz_mesajlar(self) -> Iterator[Tuple[str, str]]:
+        """Tekrar indeksi için görünüm oluşturmadan normalize mesajlar"""
+        for bilgi_id, kayit in self._kayitlar.items():
+            yield bilgi_id, self.alani_oku(kayit, "temiz_mesaj")
+
+    def kodla(self, bilgi: Mapping) -> BilgiKaydi:
+        """Bilgi sözlüğünü yeni kayda çevir"""
+        return self._alanlari_yaz(BilgiKaydi(), bilgi.items())
+
+    def coz(self, kayit: BilgiKaydi) -> Dict:
+        """Kaydı şema sırasıyla bilgi sözlüğüne çevir"""
+        ek = getattr(kayit, "_ek", None)
+        bilgi = {}
+        for alan, cozucu in self._cozuculer.items():
+            deger = getattr(kayit, alan, _YOK)
+            if deger is not _YOK:
+                bilgi[alan] = deger if cozucu is None else cozucu(deger)
+            elif ek is not None and alan in ek:
+                bilgi[alan] = ek[alan]
+        if ek is not None:
+            for alan, deger in ek.items():
+                if alan not in self._cozuculer:
+                    bilgi[alan] = deger
+        return bilgi
+
+    def alani_oku(self, kayit: BilgiKaydi, alan: str):
+        cozucu = self._cozuculer.get(alan, _YOK)
+        if cozucu is not _YOK:
+            try:
+                deger = getattr(kayit, alan)
+            except AttributeError:
+                pass
+            else:
+                return deger if cozucu is None else cozucu(deger)
+
+        ek = getattr(kayit, "_ek", None)
+        if ek is not None and alan in ek:
+            return ek[alan]
+        raise KeyError(alan)
+
+    def alan_var_mi(self, kayit: BilgiKaydi, alan: str) -> bool:
+        if alan in self._cozuculer and hasattr(kayit, alan):
+            return True
+        ek = getattr(kayit, "_ek", None)
+        return ek is not None and alan in ek
+
+    def alanlar(self, kayit: BilgiKaydi) -> Iterator[str]:
+        """Kayıttaki alanlar: şemadakiler şema sırasıyla, ardından ek alanlar"""
+        ek = getattr(kayit, "_ek", None) or {}
+        for alan in ALANLAR:
+            if hasattr(kayit, alan) or alan in ek:
+                yield alan
+        for alan in ek:
+            if alan not in self._cozuculer:
+                yield alan
+
+    def _alanlari_yaz(self, kayit: BilgiKaydi, ogeler: Iterable[Tuple[str, Any]]) -> BilgiKaydi:
+        kodlayicilar = self._kodlayicilar
+        for alan, deger in ogeler:
+            kodlayici = kodlayicilar.get(alan, _YOK)
+            if kodlayici is None:
+                setattr(kayit, alan, deger)
+                continue
+            if kodlayici is not _YOK:
+                kod = kodlayici(deger)
+                if kod is not _YOK:
+                    setattr(kayit, alan, kod)
+                    continue
+
+            ek = getattr(kayit, "_ek", None)
+            if ek is None:
+                ek = kayit._ek = {}
+            ek[alan] = deger
+        return kayit
+
+    def _alani_sil(self, kayit: BilgiKaydi, alan: str):
+        if alan in self._cozuculer and hasattr(kayit, alan):
+            delattr(kayit, alan)
+        ek = getattr(kayit, "_ek", None)
+        if ek is not None:
+            ek.pop(alan, None)
+            if not ek:
+                del kayit._ek
+
+    def _degistir(self, kayit: BilgiKaydi, degisenler: Dict[str, Any]) -> BilgiKaydi:
+        """Kaydın değişiklikler uygulanmış kopyası; metinler ve numaralar paylaşılır"""
+        yeni = BilgiKaydi()
+        for alan in BilgiKaydi.__slots__:
+            deger = getattr(kayit, alan, _YOK)
+            if deger is not _YOK:
+                setattr(yeni, alan, dict(deger) if alan == "_ek" else deger)
+
+        for alan in degisenler:
+            self._alani_sil(yeni, alan)
+        return self._alanlari_yaz(yeni, ((alan, deger) for alan, deger in degisenler.items()
+                                         if deger is not _SILINDI))
+
+    def _konuyu_kodla(self, konu):
+        return self.konular.numara(konu) if type(konu) is str else _YOK
+
+    def _kelimeleri_kodla(self, kelimeler):
+        if type(kelimeler) is not list:
+            return _YOK
+        try:
+            # Sözcükte yalnızca metinler bulunur; bilinen kelimeler tek sözlük aramasıyla çevrilir
+            numaralar = self.kelimeler._numaralar
+            return array('I', [numaralar[kelime] for kelime in kelimeler]).tobytes()
+        except (KeyError, TypeError):
+            pass
+        if not all(type(kelime) is str for kelime in kelimeler):
+            return _YOK
+        return array('I', map(self.kelimeler.numara, kelimeler)).tobytes()
+
+    def _kelimeleri_coz(self, veri: bytes) -> List[str]:
+        metinler = self.kelimeler.metinler
+        return [metinler[no] for no in array('I', veri)]
+
+    def _tarihi_kodla(self, tarih):
+        """Saat dilimsiz ISO tarihini saniyeye çevir; metne aynen geri dönmeyecekse kodlama"""
+        son_metin, son_saniye = self._son_tarih
+        if tarih == son_metin:
+            return son_saniye
+        if type(tarih) is not str:
+            return _YOK
+        try:
+            zaman = datetime.datetime.fromisoformat(tarih)
+        except ValueError:
+            return _YOK
+        if zaman.tzinfo is not None or zaman.isoformat() != tarih:
+            return _YOK
+
+        saniye = (zaman - _EPOCH) / _SANIYE
+        if abs(saniye) >= _TARIH_SINIRI:
+            return _YOK
+        self._son_tarih = (tarih, saniye)
+        return saniye
+
+    def _tarihi_coz(self, saniye: float) -> str:
+        son_saniye, son_metin = self._son_cozulen
+        if saniye == son_saniye:
+            return son_metin
+        metin = (_EPOCH + datetime.timedelta(seconds=saniye)).isoformat()
+        self._son_cozulen = (saniye, metin)
+        return metin
@@ -0,0 +1,153 @@
+"""
+Bulanık Sözlük Modülü
+Bu modül selamlaşma, vedalaşma ve duygu sözlükleri için derlenmiş bulanık eşleştirici sağlar.
+Kelimeler uzunluklarına göre gruplanıp BK-ağaçlarına yerleştirilir, böylece her kelime için
+tüm sözlüğü fuzz.ratio ile taramak gerekmez.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+# Levenshtein ağaçlar ilk kez kurulurken yüklenir; yoksa mesafe Python'da hesaplanır
+_levenshtein_orani = None
+
+
+def _levenshtein_yukle():
+    global _levenshtein_orani
+    try:
+        from Levenshtein import ratio
+    except ImportError:
+        return
+    _levenshtein_orani = ratio
+
+
+def _fuzz_orani(metin1: str, metin2: str) -> int:
+    """fuzz.ratio; fuzzywuzzy ilk eşleştirmede yüklenir, sonra doğrudan çağrılır"""
+    global _fuzz_orani
+    from fuzzywuzzy import fuzz
+    _fuzz_orani = fuzz.ratio
+    return _fuzz_orani(metin1, metin2)
+
+
+def indel_mesafesi(metin1: str, metin2: str) -> int:
+    """Yalnızca ekleme/silme işlemleriyle hesaplanan düzenleme mesafesi"""
+    toplam = len(metin1) + len(metin2)
+    if _levenshtein_orani is not None:
+        return round((1 - _levenshtein_orani(metin1, metin2)) * toplam)
+
+    # En uzun ortak alt dizi üzerinden hesapla
+    onceki = [0] * (len(metin2) + 1)
+    for karakter1 in metin1:
+        simdiki = [0]
+        for j, karakter2 in enumerate(metin2):
+            if karakter1 == karakter2:
+                simdiki.append(onceki[j] + 1)
+            else:
+                simdiki.append(max(onceki[j + 1], simdiki[j]))
+        onceki = simdiki
+    return toplam - 2 * onceki[-1]
+
+
+class _BKDugumu:
+    __slots__ = ("kelime", "cocuklar")
+
+    def __init__(self, kelime: str):
+        self.kelime = kelime
+        self.cocuklar: Dict[int, "_BKDugumu"] = {}
+
+
+class BulanikSozluk:
+    def __init__(self, kelimeler: Iterable[str], esik: int, onbellek_boyutu: int = 10000):
+        """Sözlüğü derle
+
+        esik: fuzz.ratio değerinin geçmesi gereken sınır (eşitlik sayılmaz)
+        """
+        self.esik = esik
+        self.onbellek_boyutu = onbellek_boyutu
+        self._onbellek: Dict[str, int] = {}
+
+        # Aynı kelime sözlükte birden fazla geçebilir, her biri ayrı eşleşme sayılır
+        self._tekrarlar = Counter(kelime for kelime in kelimeler if kelime)
+        # Ağaçlar ilk aramada kurulur; kısa ömürlü süreçler başlangıçta beklemez
+        self._agaclar: Optional[Dict[int, _BKDugumu]] = None
+        self._kurulum_kilidi = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(self._tekrarlar.values())
+
+    def _agaclari_kur(self) -> Dict[int, _BKDugumu]:
+        """BK-ağaçlarını bir kez kur (aynı anda arayan iş parçacıkları bekler)"""
+        with self._kurulum_kilidi:
+            if self._agaclar is None:
+                if _levenshtein_orani is None:
+                    _levenshtein_yukle()
+                agaclar: Dict[int, _BKDugumu] = {}
+                for kelime in self._tekrarlar:
+                    self._agaca_ekle(agaclar, kelime)
+                self._agaclar = agaclar
+        return self._agaclar
+
+    @staticmethod
+    def _agaca_ekle(agaclar: Dict[int, _BKDugumu], kelime: str):
+        """Kelimeyi kendi uzunluğundaki BK-ağacına ekle"""
+        kok = agaclar.get(len(kelime))
+        if kok is None:
+            agaclar[len(kelime)] = _BKDugumu(kelime)
+            return
+
+        dugum = kok
+        while True:
+            mesafe = indel_mesafesi(kelime, dugum.kelime)
+            cocuk = dugum.cocuklar.get(mesafe)
+            if cocuk is None:
+                dugum.cocuklar[mesafe] = _BKDugumu(kelime)
+                return
+            dugum = cocuk
+
+    def _yaricap(self, toplam_uzunluk: int) -> int:
+        """Eşiği geçebilecek en büyük indel mesafesi
+
+        fuzz.ratio > esik için oran en az (esik + 0.5) / 100 olmalıdır.
+        """
+        return toplam_uzunluk * (199 - 2 * self.esik) // 200
+
+    def _adaylar(self, kelime: str) -> List[str]:
+        """Mesafesi yarıçap içinde kalan sözlük kelimelerini bul"""
+        adaylar = []
+        agaclar = self._agaclar if self._agaclar is not None else self._agaclari_kur()
+        for uzunluk, kok in agaclar.items():
+            yaricap = self._yaricap(len(kelime) + uzunluk)
+            if abs(len(kelime) - uzunluk) > yaricap:
+                continue
+
+            yigin = [kok]
+            while yigin:
+                dugum = yigin.pop()
+                mesafe = indel_mesafesi(kelime, dugum.kelime)
+                if mesafe <= yaricap:
+                    adaylar.append(dugum.kelime)
+                for cocuk_mesafesi, cocuk in dugum.cocuklar.items():
+                    if mesafe - yaricap <= cocuk_mesafesi <= mesafe + yaricap:
+                        yigin.append(cocuk)
+        return adaylar
+
+    def eslesme_sayisi(self, kelime: str) -> int:
+        """Kelimeyle fuzz.ratio değeri eşiği geçen sözlük kelimelerinin sayısı"""
+        sayi = self._onbellek.get(kelime)
+        if sayi is not None:
+            return sayi
+
+        sayi = sum(
+            self._tekrarlar[aday] for aday in self._adaylar(kelime)
+            if _fuzz_orani(kelime, aday) > self.esik
+        )
+
+        if len(self._onbellek) >= self.onbellek_boyutu:
+            self._onbellek.clear()
+        self._onbellek[kelime] = sayi
+        return sayi
+
+    def eslesir_mi(self, kelime: str) -> bool:
+        """Kelime sözlükteki herhangi bir kelimeye yeterince benziyor mu?"""
+        return self.eslesme_sayisi(kelime) > 0
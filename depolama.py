@@ -0,0 +1,392 @@
+"""
+Depolama Modülü
+Bu modül verilerin diske güvenli yazılmasını sağlar: olay günlüğü, atomik anlık kayıt
+ve bilgi tabanını JSON dosyalarında tutan depo
+"""
+
+import os
+import json
+import atexit
+import threading
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from olcum import olcumler
+
+
+def gunluk_yolu(bilgi_tabani_dosya: str) -> str:
+    """Bilgi tabanı dosyasının yanındaki olay günlüğünün yolu"""
+    return os.path.splitext(bilgi_tabani_dosya)[0] + "_gunluk.jsonl"
+
+
+def _json_donustur(nesne):
+    """JSON'un tanımadığı sözlük benzeri görünümleri (bilgi kayıtları gibi) sözlüğe çevir"""
+    if isinstance(nesne, Mapping):
+        return dict(nesne.items())
+    raise TypeError(f"{type(nesne).__name__} JSON'a çevrilemez")
+
+
+def _json_parcalari(veri: Dict, indent: int) -> Iterator[str]:
+    """json.dump(veri, indent=indent) ile aynı metni parça parça üret
+
+    Sözlük olmayan Mapping değerlerin (bilgi kayıtları gibi) öğeleri tek tek çözülüp
+    yazılır; görünümün tamamı bir kerede sözlüğe çevrilmez.
+    """
+    bosluk = " " * indent
+
+    def kodla(deger, derinlik: int) -> str:
+        if isinstance(deger, Mapping) and not isinstance(deger, dict):
+            deger = _json_donustur(deger)
+        metin = json.dumps(deger, ensure_ascii=False, indent=indent, default=_json_donustur)
+        return metin.replace("\n", "\n" + bosluk * derinlik)
+
+    def anahtar(metin: str, derinlik: int, ilk: bool) -> str:
+        return ("" if ilk else ",") + "\n" + bosluk * derinlik + json.dumps(metin, ensure_ascii=False) + ": "
+
+    if not veri:
+        yield "{}"
+        return
+    yield "{"
+    for no, (ad, deger) in enumerate(veri.items()):
+        yield anahtar(ad, 1, no == 0)
+        if isinstance(deger, Mapping) and not isinstance(deger, dict) and len(deger):
+            yield "{"
+            for sira, (alt_ad, alt_deger) in enumerate(deger.items()):
+                yield anahtar(alt_ad, 2, sira == 0) + kodla(alt_deger, 2)
+            yield "\n" + bosluk + "}"
+        else:
+            yield kodla(deger, 1)
+    yield "\n}"
+
+
+def json_yukle(dosya_yolu: str) -> Dict:
+    """JSON dosyasını yükle"""
+    try:
+        with open(dosya_yolu, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"⚠️ Dosya bulunamadı: {dosya_yolu}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"⚠️ JSON formatı hatalı: {dosya_yolu}")
+        return {}
+
+
+def json_kaydet(veri: Dict, dosya_yolu: str) -> bool:
+    """JSON dosyasına atomik olarak kaydet"""
+    try:
+        atomik_json_yaz(veri, dosya_yolu)
+        return True
+    except Exception as e:
+        print(f"❌ Kaydetme hatası {dosya_yolu}: {e}")
+        return False
+
+
+def jsonl_ekle(kayitlar: List[Dict], dosya_yolu: str) -> bool:
+    """Kayıtları satır başına bir JSON olarak dosyanın sonuna ekle"""
+    try:
+        with open(dosya_yolu, 'a', encoding='utf-8') as f:
+            baslangic = f.tell()
+            f.writelines(json.dumps(kayit, ensure_ascii=False, default=_json_donustur) + "\n"
+                         for kayit in kayitlar)
+            olcumler.artir("yazilan_bayt", f.tell() - baslangic)
+        return True
+    except Exception as e:
+        print(f"❌ Kaydetme hatası {dosya_yolu}: {e}")
+        return False
+
+
+def atomik_json_yaz(veri: Dict, dosya_yolu: str, indent: int = 2):
+    """JSON verisini geçici dosyaya yazıp yeniden adlandırarak kaydet
+
+    Yazma yarıda kesilirse eski dosya olduğu gibi kalır.
+    """
+    import tempfile
+
+    klasor = os.path.dirname(os.path.abspath(dosya_yolu))
+    fd, gecici_yol = tempfile.mkstemp(dir=klasor, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            if indent is None:
+                json.dump(veri, f, ensure_ascii=False, default=_json_donustur)
+            else:
+                f.writelines(_json_parcalari(veri, indent))
+            f.flush()
+            os.fsync(f.fileno())
+            olcumler.artir("yazilan_bayt", os.fstat(f.fileno()).st_size)
+        os.replace(gecici_yol, dosya_yolu)
+    except BaseException:
+        if os.path.exists(gecici_yol):
+            os.remove(gecici_yol)
+        raise
+
+
+class OlayGunlugu:
+    def __init__(self, dosya_yolu: str, fsync: bool = False):
+        """Satır başına bir JSON olayı tutan, yalnızca sona eklenen günlük"""
+        self.dosya_yolu = dosya_yolu
+        self.fsync = fsync
+        self.sira = 0
+        self.olay_sayisi = 0
+        self._tampon: List[str] = []
+        self._kilit = threading.Lock()
+        self._onar()
+
+    def _onar(self):
+        """Yarıda kalmış son satırı at, sıra numarasını ve olay sayısını bul"""
+        try:
+            with open(self.dosya_yolu, 'rb') as f:
+                icerik = f.read()
+        except FileNotFoundError:
+            return
+
+        gecerli_uzunluk = icerik.rfind(b"\n") + 1
+        if gecerli_uzunluk != len(icerik):
+            with open(self.dosya_yolu, 'r+b') as f:
+                f.truncate(gecerli_uzunluk)
+
+        for olay in self.oku():
+            self.sira = max(self.sira, olay.get("sira", 0))
+            self.olay_sayisi += 1
+
+    def ekle(self, olay: Dict) -> int:
+        """Olaya sıra numarası verip yazılmayı bekleyen satırlara ekle
+
+        Olay o anki haliyle metne çevrilir; diske yaz() ile topluca yazılır.
+        """
+        with self._kilit:
+            self.sira += 1
+            olay["sira"] = self.sira
+            self._tampon.append(json.dumps(olay, ensure_ascii=False) + "\n")
+            self.olay_sayisi += 1
+            return self.sira
+
+    def yaz(self):
+        """Bekleyen satırları tek seferde günlüğün sonuna yaz"""
+        with self._kilit:
+            if not self._tampon:
+                return
+
+            with open(self.dosya_yolu, 'a', encoding='utf-8') as f:
+                baslangic = f.tell()
+                f.write("".join(self._tampon))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+                olcumler.artir("yazilan_bayt", f.tell() - baslangic)
+
+            self._tampon = []
+
+    def oku(self) -> Iterator[Dict]:
+        """Günlükteki olayları sırayla oku, bozuk satırda dur"""
+        try:
+            with open(self.dosya_yolu, 'r', encoding='utf-8') as f:
+                for satir in f:
+                    if not satir.strip():
+                        continue
+                    try:
+                        yield json.loads(satir)
+                    except json.JSONDecodeError:
+                        print(f"⚠️ Günlükte bozuk satır, sonrası atlandı: {self.dosya_yolu}")
+                        return
+        except FileNotFoundError:
+            return
+
+    def sifirla(self):
+        """Anlık kayıt alındıktan sonra günlüğü boşalt (sıra numarası korunur)"""
+        with self._kilit:
+            with open(self.dosya_yolu, 'w', encoding='utf-8'):
+                pass
+            self._tampon = []
+            self.olay_sayisi = 0
+
+
+# Çalışan kayıt işçileri; çıkışta tek bir atexit işlevi hepsini durdurur
+_calisan_isciler: Set["KayitIscisi"] = set()
+
+
+def _kayit_iscilerini_durdur():
+    for isci in list(_calisan_isciler):
+        isci.durdur()
+
+
+atexit.register(_kayit_iscilerini_durdur)
+
+
+class KayitIscisi:
+    """Kirli verilerin yazılmasını toplayıp arka planda tek seferde yapan iş parçacığı
+
+    aralik saniye dolduğunda ya da esik kadar işaret biriktiğinde bekleyen
+    yazma işlevleri çalıştırılır. aralik 0 ise işlevler hemen çalışır.
+    """
+
+    def __init__(self, aralik: float = 1.0, esik: int = 100):
+        self.aralik = aralik
+        self.esik = esik
+        self._bekleyenler: Dict[str, Callable[[], object]] = {}
+        self._isaret_sayisi = 0
+        self._durduruldu = False
+        self._kosul = threading.Condition()
+        self._bosaltma_kilidi = threading.Lock()
+        self._is_parcacigi: Optional[threading.Thread] = None
+
+        if self.aralik > 0:
+            self._is_parcacigi = threading.Thread(target=self._calis, name="kayit-iscisi", daemon=True)
+            self._is_parcacigi.start()
+            _calisan_isciler.add(self)
+
+    def isaretle(self, anahtar: str, yazici: Callable[[], object]):
+        """Veriyi kirli olarak işaretle; aynı anahtar için tek yazma yapılır
+
+        İşçi yoksa ya da durdurulduysa yazma hemen yapılır.
+        """
+        if self._is_parcacigi is None or self._durduruldu:
+            yazici()
+            return
+
+        with self._kosul:
+            self._bekleyenler[anahtar] = yazici
+            self._isaret_sayisi += 1
+            if self._isaret_sayisi >= self.esik:
+                self._kosul.notify()
+
+    def _calis(self):
+        while True:
+            with self._kosul:
+                while not self._bekleyenler and not self._durduruldu:
+                    self._kosul.wait()
+                if self._durduruldu:
+                    return
+
+                # İlk işaretten sonra aralık kadar ya da eşik dolana kadar biriktir
+                self._kosul.wait_for(
+                    lambda: self._durduruldu or self._isaret_sayisi >= self.esik,
+                    timeout=self.aralik
+                )
+
+            self.bosalt()
+
+    def bosalt(self):
+        """Bekleyen tüm yazmaları çağıran iş parçacığında hemen yap"""
+        with self._bosaltma_kilidi:
+            with self._kosul:
+                bekleyenler = self._bekleyenler
+                self._bekleyenler = {}
+                self._isaret_sayisi = 0
+
+            for anahtar, yazici in bekleyenler.items():
+                try:
+                    yazici()
+                except Exception as e:
+                    print(f"❌ Arka plan kayıt hatası ({anahtar}): {e}")
+
+    def durdur(self):
+        """Bekleyenleri yaz ve iş parçacığını durdur"""
+        with self._kosul:
+            self._durduruldu = True
+            self._kosul.notify()
+        _calisan_isciler.discard(self)
+
+        if self._is_parcacigi is not None and self._is_parcacigi is not threading.current_thread():
+            self._is_parcacigi.join()
+        self.bosalt()
+
+
+class JsonDepo:
+    """Bilgi tabanını bellekte tutan, JSON anlık kayıtları ve olay günlüğü kullanan depo"""
+
+    # Olaylar bellekteki sözlüklere öğrenme modülü tarafından uygulanır
+    bellekte = True
+
+    def __init__(self, bilgi_tabani_dosya: str, ogrenme_gecmisi_dosya: str, gunluk_dosya: str,
+                 fsync: bool = False, sikistirma_esigi: int = 1000,
+                 kayit_iscisi: Optional[KayitIscisi] = None):
+        self.bilgi_tabani_dosya = bilgi_tabani_dosya
+        self.ogrenme_gecmisi_dosya = ogrenme_gecmisi_dosya
+        self.gunluk_dosya = gunluk_dosya
+        self.fsync = fsync
+        self.sikistirma_esigi = sikistirma_esigi
+        self.kayit_iscisi = kayit_iscisi
+        self.gunluk: Optional[OlayGunlugu] = None
+        self._bilgi_sirasi = 0
+        self._gecmis_sirasi = 0
+
+    def yukle(self) -> Tuple[Dict, Dict]:
+        """Anlık kayıtları yükle ve günlüğü aç"""
+        bilgi_tabani = self._bilgi_tabanini_oku()
+        ogrenme_gecmisi = json_yukle(self.ogrenme_gecmisi_dosya)
+
+        self._bilgi_sirasi = bilgi_tabani.get("istatistikler", {}).get("gunluk_sirasi", 0)
+        self._gecmis_sirasi = ogrenme_gecmisi.get("gunluk_sirasi", 0)
+
+        self.gunluk = OlayGunlugu(self.gunluk_dosya, self.fsync)
+        self.gunluk.sira = max(self.gunluk.sira, self._bilgi_sirasi, self._gecmis_sirasi)
+
+        return bilgi_tabani, ogrenme_gecmisi
+
+    def _bilgi_tabanini_oku(self) -> Dict:
+        return json_yukle(self.bilgi_tabani_dosya)
+
+    def _bilgi_tabanini_yaz(self, bilgi_tabani: Dict) -> bool:
+        return json_kaydet(bilgi_tabani, self.bilgi_tabani_dosya)
+
+    def bekleyen_olaylar(self) -> Iterator[Tuple[Dict, bool, bool]]:
+        """Anlık kayıtlarda olmayan olayları (olay, bilgiye, gecmise) olarak döndür"""
+        for olay in self.gunluk.oku():
+            yield olay, olay["sira"] > self._bilgi_sirasi, olay["sira"] > self._gecmis_sirasi
+
+    def olay_yaz(self, olay: Dict):
+        """Olayı günlüğe ekle; kayıt işçisi varsa diske yazma ona bırakılır"""
+        self.toplu_olay_yaz([olay])
+
+    def toplu_olay_yaz(self, olaylar: List[Dict]):
+        """Olayları günlüğe ekle ve tek seferde yaz; kayıt işçisi varsa yazma ona bırakılır"""
+        for olay in olaylar:
+            self.gunluk.ekle(olay)
+
+        if self.kayit_iscisi is None:
+            self.gunluk.yaz()
+        else:
+            self.kayit_iscisi.isaretle("gunluk", self.gunluk.yaz)
+
+    def sikistirma_gerekli(self) -> bool:
+        """Günlük anlık kayda sıkıştırılacak kadar büyüdü mü?"""
+        return self.gunluk.olay_sayisi >= self.sikistirma_esigi
+
+    def kaydet(self, bilgi_tabani: Dict, ogrenme_gecmisi: Dict) -> bool:
+        """Anlık kayıtları yaz ve günlüğü sıkıştır"""
+        # Anlık kayıtlar günlüğün hangi olayına kadar geldiğini saklar
+        if "istatistikler" not in bilgi_tabani:
+            bilgi_tabani["istatistikler"] = {}
+        bilgi_tabani["istatistikler"]["gunluk_sirasi"] = self.gunluk.sira
+        ogrenme_gecmisi["gunluk_sirasi"] = self.gunluk.sira
+
+        # Geçmiş kayıtları bellekte halka (deque) olarak tutulur
+        gecmis = dict(ogrenme_gecmisi)
+        if "ogrenme_kayitlari" in gecmis:
+            gecmis["ogrenme_kayitlari"] = list(gecmis["ogrenme_kayitlari"])
+
+        bilgi_kaydedildi = self._bilgi_tabanini_yaz(bilgi_tabani)
+        gecmis_kaydedildi = json_kaydet(gecmis, self.ogrenme_gecmisi_dosya)
+
+        # İki anlık kayıt da yazıldıysa günlükteki olaylara artık gerek yok
+        if bilgi_kaydedildi and gecmis_kaydedildi:
+            self._bilgi_sirasi = self._gecmis_sirasi = self.gunluk.sira
+            self.gunluk.sifirla()
+
+        return bilgi_kaydedildi and gecmis_kaydedildi
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int) -> Optional[List[str]]:
+        """JSON deposu aday araması yapmaz, bellekteki indeks kullanılır"""
+        return None
+
+    def konu_bilgileri(self, konu: str, limit: int) -> Optional[List[Dict]]:
+        """JSON deposu konu sıralaması yapmaz, bellekteki konu sıralaması kullanılır"""
+        return None
+
+    def arama_indeksi(self):
+        """JSON deposunun hazır indeksi yok, öğrenme modülü kendi indeksini kurar"""
+        return None
+
+    def kapat(self):
+        """Açık kaynak yok"""
+        pass
@@ -6,14 +6,57 @@ Bu modül Türkçe metinlerin işlenmesi, analizi ve anlaşılması için gerekl
 import json
 import re
 from typing import List, Dict, Tuple
-from fuzzywuzzy import fuzz
 import string
+from collections import Counter
+from bulanik_sozluk import BulanikSozluk
+from ifade_otomati import IfadeOtomati
+
+# Soru ve ünlem işaretleri dışındaki noktalama işaretlerini silen tablo
+NOKTALAMA_TABLOSU = str.maketrans('', '', string.punctuation.replace('?', '').replace('!', ''))
+BOSLUK_DESENI = re.compile(r'\s+')
+
+
+def _benzerlik_orani(metin1: str, metin2: str) -> int:
+    """fuzz.ratio; fuzzywuzzy ilk benzerlik hesabında yüklenir"""
+    global _benzerlik_orani
+    from fuzzywuzzy import fuzz
+    _benzerlik_orani = fuzz.ratio
+    return _benzerlik_orani(metin1, metin2)
+
 
 class TurkceDilIsleme:
     def __init__(self, dil_kurallari_dosya: str = "yapilandirma/dil_kurallari.json"):
         """Türkçe dil işleme sınıfını başlat"""
+        self.dil_kurallari_dosya = dil_kurallari_dosya
         self.dil_kurallari = self._yukle_dil_kurallari(dil_kurallari_dosya)
         self.turkce_karakterler = self.dil_kurallari.get("turkce_karakterler", {})
+        self.durdurma_kelimeleri = set(self.dil_kurallari.get("durdurma_kelimeleri", []))
+        
+        # Tüm kural ifadeleri tek otomatta; mesaj bir geçişte taranır
+        self.konu_kelimeleri: Dict[str, List[str]] = self.dil_kurallari.get("konu_kelimeleri", {})
+        self.varsayilan_konu = self.dil_kurallari.get("varsayilan_konu", "genel")
+        kategoriler = {
+            "soru": self.dil_kurallari.get("soru_kelimeleri", []),
+            "selamlasma": self.dil_kurallari.get("selamlasmalar", []),
+            "vedalasma": self.dil_kurallari.get("vedalasmalar", []),
+            "olumlu": self.dil_kurallari.get("olumlu_ifadeler", []),
+            "olumsuz": self.dil_kurallari.get("olumsuz_ifadeler", [])
+        }
+        for konu, kelimeler in self.konu_kelimeleri.items():
+            kategoriler[f"konu:{konu}"] = kelimeler
+        self.ifade_otomati = IfadeOtomati(
+            {kategori: [self._ifadeyi_temizle(ifade) for ifade in ifadeler]
+             for kategori, ifadeler in kategoriler.items()},
+            self.dil_kurallari.get("ekler", []),
+            self.dil_kurallari.get("en_kisa_kok", 3),
+            en_kisa_kokler=self.dil_kurallari.get("en_kisa_kokler", {})
+        )
+        
+        # Otomatta tam eşleşme bulunmayınca yazım hatalarını yakalayan bulanık sözlükler
+        self.selamlasma_sozlugu = BulanikSozluk(self.dil_kurallari.get("selamlasmalar", []), 80)
+        self.vedalasma_sozlugu = BulanikSozluk(self.dil_kurallari.get("vedalasmalar", []), 80)
+        self.olumlu_sozlugu = BulanikSozluk(self.dil_kurallari.get("olumlu_ifadeler", []), 70)
+        self.olumsuz_sozlugu = BulanikSozluk(self.dil_kurallari.get("olumsuz_ifadeler", []), 70)
         
     def _yukle_dil_kurallari(self, dosya_yolu: str) -> Dict:
         """Dil kurallarını JSON dosyasından yükle"""
@@ -24,6 +67,10 @@ class TurkceDilIsleme:
             print(f"⚠️ Dil kuralları dosyası bulunamadı: {dosya_yolu}")
             return {}
     
+    def _ifadeyi_temizle(self, ifade: str) -> str:
+        """Kural ifadesini mesajlarla aynı biçime getir ("*" önek işareti korunur)"""
+        return self.temizle_metin(ifade) + ("*" if ifade.endswith("*") else "")
+    
     def temizle_metin(self, metin: str) -> str:
         """Metni temizle ve normalize et"""
         if not metin:
@@ -33,77 +80,85 @@ class TurkceDilIsleme:
         metin = metin.strip()
         
         # Fazla boşlukları tek boşluğa indir
-        metin = re.sub(r'\s+', ' ', metin)
+        metin = BOSLUK_DESENI.sub(' ', metin)
         
         # Noktalama işaretlerini temizle
-        metin = metin.translate(str.maketrans('', '', string.punctuation.replace('?', '').replace('!', '')))
+        metin = metin.translate(NOKTALAMA_TABLOSU)
         
-        return metin.lower()
+        # str.lower() "İ" harfini "i" ve birleşen noktaya ayırır
+        return metin.replace('İ', 'i').lower()
     
     def kelimelere_ayir(self, metin: str) -> List[str]:
         """Metni kelimelere ayır"""
+        return self.temiz_metni_ayir(self.temizle_metin(metin))
+    
+    def temiz_metni_ayir(self, temiz_metin: str) -> List[str]:
+        """Önceden temizlenmiş metni kelimelere ayır"""
+        # Durdurma kelimelerini filtrele
+        return [kelime for kelime in temiz_metin.split() if kelime not in self.durdurma_kelimeleri]
+    
+    def mesaj_analizi(self, metin: str) -> "MesajAnalizi":
+        """Metni bir kez temizleyip kelimelere ayırarak tüm özellikleri çıkart"""
         temiz_metin = self.temizle_metin(metin)
-        kelimeler = temiz_metin.split()
+        kelimeler = self.temiz_metni_ayir(temiz_metin)
+        taranan = self.ifade_otomati.tara(temiz_metin)
+        isabetler = Counter(kategori for kategori, _, _ in taranan)
+        
+        return MesajAnalizi(
+            temiz_metin=temiz_metin,
+            kelimeler=kelimeler,
+            soru_mu='?' in metin or isabetler["soru"] > 0,
+            selamlasma_mi=self._selamlasma_var(isabetler, kelimeler),
+            vedalasma_mi=self._vedalasma_var(isabetler, kelimeler),
+            duygu=self._duygu_belirle(temiz_metin, taranan, kelimeler),
+            konu=self._konu_sec(isabetler),
+            anahtar_kelimeler=self._anahtar_kelimeleri_sec(kelimeler)
+        )
+    
+    def kural_isabetleri(self, temiz_metin: str) -> Counter:
+        """Temiz metindeki kural isabetlerinin kategori başına sayısı
         
-        # Durdurma kelimelerini filtrele
-        durdurma_kelimeleri = self.dil_kurallari.get("durdurma_kelimeleri", [])
-        return [kelime for kelime in kelimeler if kelime not in durdurma_kelimeleri]
+        Kategoriler soru, selamlasma, vedalasma, olumlu, olumsuz ve konu:<konu>'dur.
+        """
+        return self.ifade_otomati.say(temiz_metin)
     
     def soru_mu(self, metin: str) -> bool:
         """Metnin soru olup olmadığını kontrol et"""
-        soru_kelimeleri = self.dil_kurallari.get("soru_kelimeleri", [])
-        kelimeler = self.kelimelere_ayir(metin)
-        
         # Soru işareti var mı?
         if '?' in metin:
             return True
         
-        # Soru kelimeleri var mı?
-        for kelime in kelimeler:
-            if kelime in soru_kelimeleri:
-                return True
-        
-        return False
+        return self.kural_isabetleri(self.temizle_metin(metin))["soru"] > 0
     
     def selamlasma_mi(self, metin: str) -> bool:
         """Metnin selamlama olup olmadığını kontrol et"""
-        selamlasmalar = self.dil_kurallari.get("selamlasmalar", [])
-        kelimeler = self.kelimelere_ayir(metin)
-        
-        for kelime in kelimeler:
-            for selamlasma in selamlasmalar:
-                if fuzz.ratio(kelime, selamlasma) > 80:
-                    return True
-        return False
+        temiz_metin = self.temizle_metin(metin)
+        return self._selamlasma_var(self.kural_isabetleri(temiz_metin), self.temiz_metni_ayir(temiz_metin))
+    
+    def _selamlasma_var(self, isabetler: Counter, kelimeler: List[str]) -> bool:
+        """Selamlaşma ifadesi var mı? (otomatta yoksa kelimeler bulanık aranır)"""
+        return isabetler["selamlasma"] > 0 or any(self.selamlasma_sozlugu.eslesir_mi(kelime) for kelime in kelimeler)
     
     def vedalasma_mi(self, metin: str) -> bool:
         """Metnin vedalaşma olup olmadığını kontrol et"""
-        vedalasmalar = self.dil_kurallari.get("vedalasmalar", [])
-        kelimeler = self.kelimelere_ayir(metin)
-        
-        for kelime in kelimeler:
-            for vedalasma in vedalasmalar:
-                if fuzz.ratio(kelime, vedalasma) > 80:
-                    return True
-        return False
+        temiz_metin = self.temizle_metin(metin)
+        return self._vedalasma_var(self.kural_isabetleri(temiz_metin), self.temiz_metni_ayir(temiz_metin))
+    
+    def _vedalasma_var(self, isabetler: Counter, kelimeler: List[str]) -> bool:
+        """Vedalaşma ifadesi var mı? (otomatta yoksa kelimeler bulanık aranır)"""
+        return isabetler["vedalasma"] > 0 or any(self.vedalasma_sozlugu.eslesir_mi(kelime) for kelime in kelimeler)
     
     def duygu_analizi(self, metin: str) -> str:
         """Basit duygu analizi yap"""
-        olumlu_ifadeler = self.dil_kurallari.get("olumlu_ifadeler", [])
-        olumsuz_ifadeler = self.dil_kurallari.get("olumsuz_ifadeler", [])
-        
-        kelimeler = self.kelimelere_ayir(metin)
-        olumlu_skor = 0
-        olumsuz_skor = 0
-        
-        for kelime in kelimeler:
-            for olumlu in olumlu_ifadeler:
-                if fuzz.ratio(kelime, olumlu) > 70:
-                    olumlu_skor += 1
-            
-            for olumsuz in olumsuz_ifadeler:
-                if fuzz.ratio(kelime, olumsuz) > 70:
-                    olumsuz_skor += 1
+        temiz_metin = self.temizle_metin(metin)
+        return self._duygu_belirle(temiz_metin, self.ifade_otomati.tara(temiz_metin),
+                                   self.temiz_metni_ayir(temiz_metin))
+    
+    def _duygu_belirle(self, temiz_metin: str, taranan: List[Tuple[str, int, int]],
+                       kelimeler: List[str]) -> str:
+        """Olumlu ve olumsuz ifadeleri sayarak duyguyu belirle"""
+        olumlu_skor = self._duygu_skoru("olumlu", self.olumlu_sozlugu, temiz_metin, taranan, kelimeler)
+        olumsuz_skor = self._duygu_skoru("olumsuz", self.olumsuz_sozlugu, temiz_metin, taranan, kelimeler)
         
         if olumlu_skor > olumsuz_skor:
             return "olumlu"
@@ -112,10 +167,35 @@ class TurkceDilIsleme:
         else:
             return "notr"
     
+    @staticmethod
+    def _duygu_skoru(kategori: str, sozluk: BulanikSozluk, temiz_metin: str,
+                     taranan: List[Tuple[str, int, int]], kelimeler: List[str]) -> int:
+        """Kelimelerin bulanık eşleşme sayısı ve bulanık sayılmayan otomat isabetleri
+        
+        Her kelime eşiği geçtiği sözlük kelimesi başına bir sayılır. Otomatın bulduğu
+        ifade bulanık sayılmış bir kelimedeyse tekrar sayılmaz; uzun ek almış ya da
+        çok kelimeli ifadeler birer kez eklenir.
+        """
+        skor = sum(sozluk.eslesme_sayisi(kelime) for kelime in kelimeler)
+        kelime_kumesi = set(kelimeler)
+        for isabet_kategorisi, bas, son in taranan:
+            if isabet_kategorisi != kategori:
+                continue
+            if ' ' not in temiz_metin[bas:son]:
+                kelime_basi = temiz_metin.rfind(' ', 0, bas) + 1
+                kelime_sonu = temiz_metin.find(' ', son)
+                kelime = temiz_metin[kelime_basi:kelime_sonu if kelime_sonu >= 0 else len(temiz_metin)]
+                if kelime in kelime_kumesi and sozluk.eslesir_mi(kelime):
+                    continue
+            skor += 1
+        return skor
+    
     def anahtar_kelimeleri_cikart(self, metin: str) -> List[str]:
         """Metinden anahtar kelimeleri çıkart"""
-        kelimeler = self.kelimelere_ayir(metin)
-        
+        return self._anahtar_kelimeleri_sec(self.kelimelere_ayir(metin))
+    
+    def _anahtar_kelimeleri_sec(self, kelimeler: List[str]) -> List[str]:
+        """Kelimeler arasından anahtar kelimeleri seç"""
         # En az 3 karakterli kelimeleri al
         anahtar_kelimeler = [kelime for kelime in kelimeler if len(kelime) >= 3]
         
@@ -124,26 +204,50 @@ class TurkceDilIsleme:
     
     def benzerlik_hesapla(self, metin1: str, metin2: str) -> float:
         """İki metin arasındaki benzerliği hesapla"""
-        return fuzz.ratio(self.temizle_metin(metin1), self.temizle_metin(metin2)) / 100.0
+        return self.temiz_benzerlik_hesapla(self.temizle_metin(metin1), self.temizle_metin(metin2))
+    
+    def temiz_benzerlik_hesapla(self, temiz_metin1: str, temiz_metin2: str) -> float:
+        """Önceden temizlenmiş iki metin arasındaki benzerliği hesapla"""
+        return _benzerlik_orani(temiz_metin1, temiz_metin2) / 100.0
     
     def konu_belirle(self, metin: str) -> str:
         """Metnin konusunu belirlemeye çalış"""
-        anahtar_kelimeler = self.anahtar_kelimeleri_cikart(metin)
-        
-        # Basit konu tespiti (geliştirilmesi gerekir)
-        teknoloji_kelimeleri = ["python", "kod", "program", "bilgisayar", "yazılım", "uygulama"]
-        egitim_kelimeleri = ["öğren", "ders", "kitap", "okul", "öğretmen", "öğrenci"]
-        kisisel_kelimeler = ["ben", "sen", "biz", "hayat", "aile", "arkadaş"]
-        
-        teknoloji_skor = sum(1 for kelime in anahtar_kelimeler if kelime in teknoloji_kelimeleri)
-        egitim_skor = sum(1 for kelime in anahtar_kelimeler if kelime in egitim_kelimeleri)
-        kisisel_skor = sum(1 for kelime in anahtar_kelimeler if kelime in kisisel_kelimeler)
-        
-        if teknoloji_skor > 0:
-            return "teknoloji"
-        elif egitim_skor > 0:
-            return "eğitim"
-        elif kisisel_skor > 0:
-            return "kişisel"
-        else:
-            return "genel"
+        return self._konu_sec(self.kural_isabetleri(self.temizle_metin(metin)))
+    
+    def _konu_sec(self, isabetler: Counter) -> str:
+        """En çok konu kelimesi geçen konuyu seç; eşitlikte dil kurallarındaki sıra önceliklidir"""
+        en_iyi_konu, en_iyi_skor = self.varsayilan_konu, 0
+        for konu in self.konu_kelimeleri:
+            skor = isabetler[f"konu:{konu}"]
+            if skor > en_iyi_skor:
+                en_iyi_konu, en_iyi_skor = konu, skor
+        return en_iyi_konu
+
+
+class MesajAnalizi:
+    """Tek geçişte çıkarılan mesaj özellikleri"""
+    
+    __slots__ = ("temiz_metin", "kelimeler", "soru_mu", "selamlasma_mi",
+                 "vedalasma_mi", "duygu", "konu", "anahtar_kelimeler")
+    
+    def __init__(self, temiz_metin: str, kelimeler: List[str], soru_mu: bool,
+                 selamlasma_mi: bool, vedalasma_mi: bool, duygu: str, konu: str,
+                 anahtar_kelimeler: List[str]):
+        self.temiz_metin = temiz_metin
+        self.kelimeler = kelimeler
+        self.soru_mu = soru_mu
+        self.selamlasma_mi = selamlasma_mi
+        self.vedalasma_mi = vedalasma_mi
+        self.duygu = duygu
+        self.konu = konu
+        self.anahtar_kelimeler = anahtar_kelimeler
+    
+    def __getitem__(self, alan: str):
+        """Eski sözlük tabanlı kullanım için analiz["konu"] erişimi"""
+        if alan not in self.__slots__:
+            raise KeyError(alan)
+        return getattr(self, alan)
+    
+    def sozluk(self) -> Dict:
+        """Analizi sözlük olarak döndür"""
+        return {alan: getattr(self, alan) for alan in self.__slots__}
@@ -0,0 +1,176 @@
+"""
+Eşzamanlılık Modülü
+Bu modül bilgi tabanına birden fazla iş parçacığından erişim için okuyucu-yazıcı
+kilidi sağlar: aramalar birbirini beklemeden okur, öğrenmeler tek tek yazar. Yanıt
+yolundan çıkarılan işler için sıralı, sınırlı bir arka plan kuyruğu da buradadır.
+"""
+
+import queue
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Set
+
+
+class OkumaYazmaKilidi:
+    """Yazıcıya öncelik veren, yeniden girilebilir okuyucu-yazıcı kilidi
+
+    Bekleyen bir yazıcı varken yeni okuyucu alınmaz, böylece sürekli aramalar
+    öğrenmeyi aç bırakmaz. Okuma kilidini tutan iş parçacığı tekrar okuyabilir;
+    yazma kilidini tutan iş parçacığı hem yazabilir hem okuyabilir. Okuma
+    kilidini tutarken yazma kilidi istemek kilitlenmeye yol açacağı için hatadır.
+    """
+
+    def __init__(self):
+        self._kosul = threading.Condition(threading.Lock())
+        self._okuyucu_sayisi = 0
+        self._yazan: Optional[int] = None
+        self._yazma_derinligi = 0
+        self._bekleyen_yazicilar = 0
+        self._yerel = threading.local()
+
+    def _okuma_derinligi(self) -> int:
+        return getattr(self._yerel, "derinlik", 0)
+
+    def okuma_al(self):
+        derinlik = self._okuma_derinligi()
+        if derinlik == 0 and self._yazan != threading.get_ident():
+            with self._kosul:
+                while self._yazan is not None or self._bekleyen_yazicilar:
+                    self._kosul.wait()
+                self._okuyucu_sayisi += 1
+            self._yerel.sayildi = True
+        elif derinlik == 0:
+            # Yazıcı kendi verisini okuyor, okuyucu sayılmaz
+            self._yerel.sayildi = False
+        self._yerel.derinlik = derinlik + 1
+
+    def okuma_birak(self):
+        derinlik = self._okuma_derinligi() - 1
+        if derinlik < 0:
+            raise RuntimeError("Alınmamış okuma kilidi bırakılamaz")
+        self._yerel.derinlik = derinlik
+        if derinlik == 0 and self._yerel.sayildi:
+            with self._kosul:
+                self._okuyucu_sayisi -= 1
+                if self._okuyucu_sayisi == 0:
+                    self._kosul.notify_all()
+
+    def yazma_al(self):
+        ben = threading.get_ident()
+        if self._yazan == ben:
+            self._yazma_derinligi += 1
+            return
+        if self._okuma_derinligi():
+            raise RuntimeError("Okuma kilidi tutulurken yazma kilidi alınamaz")
+
+        with self._kosul:
+            self._bekleyen_yazicilar += 1
+            try:
+                while self._yazan is not None or self._okuyucu_sayisi:
+                    self._kosul.wait()
+            finally:
+                self._bekleyen_yazicilar -= 1
+            self._yazan = ben
+            self._yazma_derinligi = 1
+
+    def yazma_birak(self):
+        if self._yazan != threading.get_ident():
+            raise RuntimeError("Yazma kilidi bu iş parçacığında değil")
+        self._yazma_derinligi -= 1
+        if self._yazma_derinligi == 0:
+            with self._kosul:
+                self._yazan = None
+                self._kosul.notify_all()
+
+    @contextmanager
+    def okuma(self) -> Iterator[None]:
+        self.okuma_al()
+        try:
+            yield
+        finally:
+            self.okuma_birak()
+
+    @contextmanager
+    def yazma(self) -> Iterator[None]:
+        self.yazma_al()
+        try:
+            yield
+        finally:
+            self.yazma_birak()
+
+
+# Çalışan iş kuyrukları; çıkışta bekleyen işler bitirilir
+_calisan_kuyruklar: Set["SiraliIsKuyrugu"] = set()
+
+
+def _is_kuyruklarini_durdur():
+    for kuyruk in list(_calisan_kuyruklar):
+        kuyruk.durdur()
+
+
+atexit.register(_is_kuyruklarini_durdur)
+
+
+class SiraliIsKuyrugu:
+    """İşleri tek bir arka plan iş parçacığında geldikleri sırayla çalıştıran sınırlı kuyruk
+
+    Kuyrukta boyut kadar iş birikmişse ekleyen iş parçacığı yer açılana kadar bekler.
+    boyut 0 ise ya da kuyruk durdurulduysa işler ekleyen iş parçacığında hemen
+    çalışır. İş parçacığı ilk işle başlar.
+    """
+
+    def __init__(self, boyut: int = 1000, ad: str = "is-kuyrugu"):
+        self.boyut = boyut
+        self.ad = ad
+        self._kuyruk: "queue.Queue[Optional[Callable[[], object]]]" = queue.Queue(max(boyut, 0))
+        self._durduruldu = False
+        self._kilit = threading.Lock()
+        self._is_parcacigi: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return self._kuyruk.qsize()
+
+    def ekle(self, is_: Callable[[], object]):
+        if self.boyut > 0:
+            # Durdurma, kuyruğa eklenip çalışmayacak iş bırakmasın
+            with self._kilit:
+                if not self._durduruldu:
+                    if self._is_parcacigi is None:
+                        self._is_parcacigi = threading.Thread(target=self._calis, name=self.ad, daemon=True)
+                        self._is_parcacigi.start()
+                        _calisan_kuyruklar.add(self)
+                    self._kuyruk.put(is_)
+                    return
+        self._calistir(is_)
+
+    def _calistir(self, is_: Callable[[], object]):
+        try:
+            is_()
+        except Exception as e:
+            print(f"❌ Arka plan iş hatası ({self.ad}): {e}")
+
+    def _calis(self):
+        while True:
+            is_ = self._kuyruk.get()
+            try:
+                if is_ is None:
+                    return
+                self._calistir(is_)
+            finally:
+                self._kuyruk.task_done()
+
+    def bosalt(self):
+        """Kuyruktaki tüm işler bitene kadar bekle"""
+        if self._is_parcacigi is not None and self._is_parcacigi is not threading.current_thread():
+            self._kuyruk.join()
+
+    def durdur(self):
+        """Bekleyen işleri bitir ve iş parçacığını durdur; sonraki işler hemen çalışır"""
+        with self._kilit:
+            self._durduruldu = True
+            is_parcacigi = self._is_parcacigi
+        _calisan_kuyruklar.discard(self)
+        if is_parcacigi is not None and is_parcacigi.is_alive() and is_parcacigi is not threading.current_thread():
+            self._kuyruk.put(None)
+            is_parcacigi.join()
@@ -0,0 +1,82 @@
+"""
+Geçmiş Modülü
+Bu modül öğrenme geçmişinin sayaçlarını ve arşivini yönetir. Bellekte yalnızca son
+kayıtlar tutulur; daha eskileri tarihli, sıkıştırılmış segment dosyalarına taşınır.
+"""
+
+import os
+import gzip
+import json
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def sayaclari_guncelle(ogrenme_gecmisi: Dict, kayit: Dict):
+    """Kaydı toplam ve gün bazlı sayaçlara işle
+
+    Toplu öğrenme kaydı "adet" kadar bilgiyi sayar.
+    """
+    adet = kayit.get("adet", 1)
+    anahtar = "basarili_ogrenmeler" if kayit["basarili"] else "basarisiz_ogrenmeler"
+    ogrenme_gecmisi[anahtar] = ogrenme_gecmisi.get(anahtar, 0) + adet
+    ogrenme_gecmisi["son_ogrenme"] = kayit["tarih"]
+
+    gun = ogrenme_gecmisi.setdefault("gunluk_ozet", {}).setdefault(
+        kayit["tarih"][:10], {"basarili": 0, "basarisiz": 0}
+    )
+    gun["basarili" if kayit["basarili"] else "basarisiz"] += adet
+
+
+class GecmisArsivi:
+    def __init__(self, klasor: str, onek: str = "ogrenme_gecmisi"):
+        """Geçmiş kayıtlarını gün başına bir gzip dosyasında tutan arşiv"""
+        self.klasor = klasor
+        self.onek = onek
+
+    def segment_yolu(self, gun: str) -> str:
+        """Verilen günün (YYYY-AA-GG) segment dosyası"""
+        return os.path.join(self.klasor, f"{self.onek}_{gun}.jsonl.gz")
+
+    def ekle(self, kayitlar: Iterable[Dict]) -> bool:
+        """Kayıtları tarihlerine göre segmentlerin sonuna ekle
+
+        Her ekleme ayrı bir gzip üyesi olarak yazılır, okuyucu hepsini art arda okur.
+        """
+        gunler: Dict[str, List[str]] = defaultdict(list)
+        for kayit in kayitlar:
+            gunler[kayit["tarih"][:10]].append(json.dumps(kayit, ensure_ascii=False) + "\n")
+
+        if not gunler:
+            return True
+
+        try:
+            os.makedirs(self.klasor, exist_ok=True)
+            for gun, satirlar in gunler.items():
+                with gzip.open(self.segment_yolu(gun), 'at', encoding='utf-8') as f:
+                    f.writelines(satirlar)
+            return True
+        except Exception as e:
+            print(f"❌ Geçmiş arşivleme hatası {self.klasor}: {e}")
+            return False
+
+    def gunler(self) -> List[str]:
+        """Arşivde segmenti bulunan günler (eskiden yeniye)"""
+        try:
+            dosyalar = os.listdir(self.klasor)
+        except FileNotFoundError:
+            return []
+
+        on, son = f"{self.onek}_", ".jsonl.gz"
+        return sorted(dosya[len(on):-len(son)] for dosya in dosyalar
+                      if dosya.startswith(on) and dosya.endswith(son))
+
+    def oku(self, gun: Optional[str] = None) -> Iterator[Dict]:
+        """Bir günün ya da tüm arşivin kayıtlarını sırayla oku"""
+        for segment_gunu in ([gun] if gun else self.gunler()):
+            try:
+                with gzip.open(self.segment_yolu(segment_gunu), 'rt', encoding='utf-8') as f:
+                    for satir in f:
+                        if satir.strip():
+                            yield json.loads(satir)
+            except FileNotFoundError:
+                continue
@@ -0,0 +1,82 @@
+"""
+Hafıza Modülü
+Bu modül bilgi tabanı hafıza sınırını aşınca unutulacak bilgileri seçer. Her bilginin
+kullanım sayısı, başarı skoru ve son güncelleme zamanından bir tutma skoru hesaplanır,
+en düşük skorlu bilgi bir yığından O(log n) sürede çıkarılır.
+"""
+
+import math
+import heapq
+import datetime
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+def tutma_skoru(bilgi: Dict, yari_omur_gun: float) -> float:
+    """Bilginin hafızada kalma önceliği (düşük olan önce unutulur)
+
+    Skor log(kullanım * (1 + başarı)) ile güncellemeden bu yana yarı ömür başına
+    bir yarıya inen bir zaman ağırlığının toplamıdır. Zaman ağırlığı sabit bir
+    başlangıca göre hesaplandığı için skor zamanla değişmez, yığın yeniden
+    düzenlenmeden karşılaştırılabilir kalır.
+    """
+    siklik = max(bilgi.get("kullanim_sayisi", 1), 1) * (1 + max(bilgi.get("basari_skoru", 0.0), 0.0))
+
+    try:
+        zaman = datetime.datetime.fromisoformat(bilgi.get("guncelleme_tarihi", "")).timestamp()
+    except (TypeError, ValueError):
+        zaman = 0.0
+
+    return math.log(siklik) + zaman * math.log(2) / (yari_omur_gun * 86400)
+
+
+class UnutmaYigini:
+    def __init__(self, yari_omur_gun: float = 30.0):
+        """Tutma skoruna göre sıralı, tembel silmeli en küçük yığın"""
+        self.yari_omur_gun = yari_omur_gun
+        self._yigin: List[Tuple[float, int, str]] = []
+        self._skorlar: Dict[str, float] = {}
+        self._sayac = 0
+
+    def __len__(self) -> int:
+        return len(self._skorlar)
+
+    def __contains__(self, bilgi_id: str) -> bool:
+        return bilgi_id in self._skorlar
+
+    def olustur(self, bilgiler: Mapping):
+        """Bilgi tabanındaki tüm bilgilerden yığını O(n) sürede kur
+
+        Bilgileri diskten okuyan görünümler tutma_alanlari() ile yalnızca skorda
+        kullanılan alanları verirse bilgiler tamamen çözülmez.
+        """
+        ogeler = bilgiler.tutma_alanlari() if hasattr(bilgiler, "tutma_alanlari") else bilgiler.items()
+        self._skorlar = {bilgi_id: tutma_skoru(bilgi, self.yari_omur_gun) for bilgi_id, bilgi in ogeler}
+        self._yigin = [(skor, sira, bilgi_id) for sira, (bilgi_id, skor) in enumerate(self._skorlar.items())]
+        self._sayac = len(self._yigin)
+        heapq.heapify(self._yigin)
+
+    def guncelle(self, bilgi_id: str, bilgi: Dict):
+        """Yeni ya da değişen bilginin skorunu yığına ekle (eski kayıt tembelce atlanır)"""
+        skor = tutma_skoru(bilgi, self.yari_omur_gun)
+        self._skorlar[bilgi_id] = skor
+        heapq.heappush(self._yigin, (skor, self._sayac, bilgi_id))
+        self._sayac += 1
+
+        # Eskimiş kayıtlar çoğalırsa yığını sıkıştır
+        if len(self._yigin) > 2 * len(self._skorlar) + 64:
+            self._yigin = [(skor, sira, bilgi_id) for skor, sira, bilgi_id in self._yigin
+                           if self._skorlar.get(bilgi_id) == skor]
+            heapq.heapify(self._yigin)
+
+    def cikar(self, bilgi_id: str):
+        """Bilgiyi unutma adaylarından çıkar"""
+        self._skorlar.pop(bilgi_id, None)
+
+    def en_dusuk(self) -> Optional[str]:
+        """Tutma skoru en düşük bilgiyi yığından çıkarıp döndür"""
+        while self._yigin:
+            skor, _, bilgi_id = heapq.heappop(self._yigin)
+            if self._skorlar.get(bilgi_id) == skor:
+                del self._skorlar[bilgi_id]
+                return bilgi_id
+        return None
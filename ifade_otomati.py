@@ -0,0 +1,172 @@
+"""
+İfade Otomatı Modülü
+Bu modül dil kurallarındaki tüm ifadeleri (soru kelimeleri, selamlaşmalar, duygu ve konu
+kelimeleri) tek bir Aho-Corasick otomatında derler. Mesaj bir kez baştan sona taranır ve
+her kuralın isabetleri birlikte bulunur; tarama süresi sözlük büyüklüğüyle artmaz.
+
+İfadeler kelime başında başlamalıdır. Çok kelimeli ifadeler ("ne zaman") tek boşlukla
+ayrılmış metinde olduğu gibi eşleşir. Son kelimeden sonra Türkçe ek zinciri gelebilir
+("hoşça kalın", "programlama"); "*" ile biten ifadeler kelimenin herhangi bir devamıyla
+eşleşir.
+
+Tek harfli ekler zincirde serbestçe dizilemez: tek ünlü ("ı", "e") yalnızca zinciri
+bitirir, tek ünsüz ("y", "n", "s") yalnızca ünlüden sonra gelir ("programlamayı",
+"arabası"). Böylece "kim" kökü "kimya" ya da "kimse" ile eşleşmez.
+"""
+
+from collections import Counter, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SESLILER = frozenset("aeıioöuüâîû")
+
+
+class IfadeOtomati:
+    def __init__(self, kategoriler: Dict[str, Iterable[str]], ekler: Iterable[str] = (),
+                 en_kisa_kok: int = 3, en_uzun_ek_zinciri: int = 12,
+                 en_kisa_kokler: Optional[Dict[str, int]] = None):
+        """Kategorilerdeki ifadeleri derle
+
+        ekler: ifadenin son kelimesine eklenebilen ekler; art arda gelebilirler
+        en_kisa_kok: ek alabilen en kısa ifade ("ne", "sa" gibi kısa ifadeler ek almaz)
+        en_kisa_kokler: kategori başına en_kisa_kok ("soru": 4 ile "kim" ek almaz)
+        """
+        self.ekler = frozenset(ek for ek in ekler if ek)
+        self._ek_uzunluklari = sorted({len(ek) for ek in self.ekler})
+        self.en_kisa_kok = en_kisa_kok
+        self.en_kisa_kokler = en_kisa_kokler or {}
+        self.en_uzun_ek_zinciri = en_uzun_ek_zinciri
+        self._ek_onbellegi: Dict[Tuple[str, str], bool] = {}
+
+        # Durum tabloları: geçişler, hata bağlantıları ve durumda biten ifadeler
+        self._gecisler: List[Dict[str, int]] = [{}]
+        self._hatalar: List[int] = [0]
+        self._ciktilar: List[List[int]] = [[]]
+        # İfade başına (uzunluk, kategoriler, önek mi, ek alabildiği kategoriler)
+        self._ifadeler: List[Tuple[int, Tuple[str, ...], bool, Tuple[str, ...]]] = []
+
+        numaralar: Dict[Tuple[str, bool], int] = {}
+        ifade_kategorileri: List[List[str]] = []
+        for kategori, ifadeler in kategoriler.items():
+            for ifade in ifadeler:
+                onek = ifade.endswith("*")
+                ifade = " ".join(ifade.rstrip("*").lower().split())
+                if not ifade:
+                    continue
+                anahtar = (ifade, onek)
+                if anahtar not in numaralar:
+                    numaralar[anahtar] = len(ifade_kategorileri)
+                    ifade_kategorileri.append([])
+                    self._ekle(ifade, numaralar[anahtar])
+                if kategori not in ifade_kategorileri[numaralar[anahtar]]:
+                    ifade_kategorileri[numaralar[anahtar]].append(kategori)
+
+        for (ifade, onek), no in sorted(numaralar.items(), key=lambda x: x[1]):
+            ekli_kategoriler = tuple(
+                kategori for kategori in ifade_kategorileri[no]
+                if len(ifade) >= self.en_kisa_kokler.get(kategori, en_kisa_kok)
+            )
+            self._ifadeler.append((len(ifade), tuple(ifade_kategorileri[no]), onek, ekli_kategoriler))
+        self._hatalari_kur()
+
+    def __len__(self) -> int:
+        return len(self._ifadeler)
+
+    def _ekle(self, ifade: str, no: int):
+        durum = 0
+        for karakter in ifade:
+            sonraki = self._gecisler[durum].get(karakter)
+            if sonraki is None:
+                sonraki = len(self._gecisler)
+                self._gecisler[durum][karakter] = sonraki
+                self._gecisler.append({})
+                self._hatalar.append(0)
+                self._ciktilar.append([])
+            durum = sonraki
+        self._ciktilar[durum].append(no)
+
+    def _hatalari_kur(self):
+        """Hata bağlantılarını genişlik öncelikli kur; çıktılar hata zincirinden devralınır"""
+        kuyruk = deque(self._gecisler[0].values())
+        while kuyruk:
+            durum = kuyruk.popleft()
+            for karakter, sonraki in self._gecisler[durum].items():
+                hata = self._hatalar[durum]
+                while hata and karakter not in self._gecisler[hata]:
+                    hata = self._hatalar[hata]
+                hata = self._gecisler[hata].get(karakter, 0)
+                self._hatalar[sonraki] = hata
+                self._ciktilar[sonraki] = self._ciktilar[sonraki] + self._ciktilar[hata]
+                kuyruk.append(sonraki)
+
+    def _ek_zinciri_mi(self, kuyruk: str, kok_sonu: str) -> bool:
+        """Kelimenin kalanı tanınan eklerin art arda gelişi mi?
+
+        kok_sonu kökün son harfidir; tek ünsüzlü ekin ünlüden sonra gelip gelmediğine bakılır.
+        """
+        anahtar = (kok_sonu, kuyruk)
+        sonuc = self._ek_onbellegi.get(anahtar)
+        if sonuc is not None:
+            return sonuc
+
+        sonuc = False
+        if len(kuyruk) <= self.en_uzun_ek_zinciri:
+            ulasilan = [True] + [False] * len(kuyruk)
+            for bas in range(len(kuyruk)):
+                if not ulasilan[bas]:
+                    continue
+                for uzunluk in self._ek_uzunluklari:
+                    if bas + uzunluk > len(kuyruk) or kuyruk[bas:bas + uzunluk] not in self.ekler:
+                        continue
+                    if uzunluk == 1:
+                        if kuyruk[bas] in SESLILER:
+                            # Tek ünlü zinciri bitirir
+                            if bas + 1 != len(kuyruk):
+                                continue
+                        elif (kuyruk[bas - 1] if bas else kok_sonu) not in SESLILER:
+                            # Tek ünsüz (kaynaştırma harfi) yalnızca ünlüden sonra gelir
+                            continue
+                    ulasilan[bas + uzunluk] = True
+            sonuc = ulasilan[-1]
+
+        if len(self._ek_onbellegi) >= 10000:
+            self._ek_onbellegi.clear()
+        self._ek_onbellegi[anahtar] = sonuc
+        return sonuc
+
+    def tara(self, metin: str) -> List[Tuple[str, int, int]]:
+        """Metindeki tüm isabetler: (kategori, başlangıç, bitiş) metin sırasıyla
+
+        Metin önceden küçük harfe çevrilmiş ve boşlukları tekilleştirilmiş olmalıdır.
+        """
+        isabetler = []
+        gecisler, hatalar, ciktilar = self._gecisler, self._hatalar, self._ciktilar
+        durum = 0
+        for konum, karakter in enumerate(metin):
+            while durum and karakter not in gecisler[durum]:
+                durum = hatalar[durum]
+            durum = gecisler[durum].get(karakter, 0)
+            for no in ciktilar[durum]:
+                uzunluk, kategoriler, onek, ekli_kategoriler = self._ifadeler[no]
+                bas = konum + 1 - uzunluk
+                if bas > 0 and metin[bas - 1].isalnum():
+                    continue
+
+                son = konum + 1
+                if son < len(metin) and metin[son].isalnum() and not onek:
+                    if not ekli_kategoriler:
+                        continue
+                    kelime_sonu = son
+                    while kelime_sonu < len(metin) and metin[kelime_sonu].isalnum():
+                        kelime_sonu += 1
+                    if not self._ek_zinciri_mi(metin[son:kelime_sonu], karakter):
+                        continue
+                    son = kelime_sonu
+                    kategoriler = ekli_kategoriler
+
+                for kategori in kategoriler:
+                    isabetler.append((kategori, bas, son))
+        return isabetler
+
+    def say(self, metin: str) -> Counter:
+        """Kategori başına isabet sayısı"""
+        return Counter(kategori for kategori, _, _ in self.tara(metin))
@@ -0,0 +1,253 @@
+"""
+İkili Depo Modülü
+Bu modül bilgi tabanını mmap ile açılan ikili anlık görüntüde saklar. Başlangıçta dosya
+okunmaz, yalnızca eşlenir; bilgiler erişildikçe çözülür. Sonradan eklenen, değişen ve
+silinen bilgiler bellekte görüntünün üzerine yazılır, olay günlüğü JSON deposundaki gibi
+tutulur ve anlık kayıtta görüntü yeniden yazılır.
+"""
+
+import os
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from arama_indeksi import NgramIndeksi
+from depolama import JsonDepo, KayitIscisi
+from ikili_goruntu import IkiliGoruntu, goruntu_yaz
+
+
+class GoruntuBilgileri(MutableMapping):
+    """Görüntüdeki bilgileri bilgi_tabani["bilgiler"] sözlüğü gibi gösteren görünüm
+
+    Görüntüdeki bilgiler her erişimde yeniden çözülür; bellekte yalnızca sonradan
+    eklenen ya da değiştirilen bilgiler ve silinenlerin sıraları tutulur. Çözülmüş
+    bilgide yapılan değişiklik, kalıcı olması için anahtarına geri atanmalıdır.
+    """
+
+    def __init__(self, goruntu: IkiliGoruntu):
+        self.goruntu = goruntu
+        self.silinenler: Set[int] = set()
+        self._degisenler: Dict[str, Dict] = {}
+        self._yeniler: Dict[str, Dict] = {}
+
+    def goruntu_numarasi(self, bilgi_id: str) -> Optional[int]:
+        """Bilginin görüntüdeki sırası; görüntüde yoksa ya da silindiyse None"""
+        no = self.goruntu.numara(bilgi_id)
+        return None if no is None or no in self.silinenler else no
+
+    def __getitem__(self, bilgi_id: str) -> Dict:
+        bilgi = self._yeniler.get(bilgi_id) or self._degisenler.get(bilgi_id)
+        if bilgi is not None:
+            return bilgi
+        no = self.goruntu_numarasi(bilgi_id)
+        if no is None:
+            raise KeyError(bilgi_id)
+        return self.goruntu.bilgi(no)
+
+    def __setitem__(self, bilgi_id: str, bilgi: Dict):
+        if bilgi_id in self._degisenler or self.goruntu_numarasi(bilgi_id) is not None:
+            self._degisenler[bilgi_id] = bilgi
+        else:
+            self._yeniler[bilgi_id] = bilgi
+
+    def __delitem__(self, bilgi_id: str):
+        if self._yeniler.pop(bilgi_id, None) is not None:
+            return
+        no = self.goruntu_numarasi(bilgi_id)
+        if no is None:
+            raise KeyError(bilgi_id)
+        self.silinenler.add(no)
+        self._degisenler.pop(bilgi_id, None)
+
+    def __contains__(self, bilgi_id) -> bool:
+        return bilgi_id in self._yeniler or self.goruntu_numarasi(bilgi_id) is not None
+
+    def __len__(self) -> int:
+        return len(self.goruntu) - len(self.silinenler) + len(self._yeniler)
+
+    def __iter__(self) -> Iterator[str]:
+        for bilgi_id, _ in self._goruntudekiler():
+            yield bilgi_id
+        yield from list(self._yeniler)
+
+    def _goruntudekiler(self) -> Iterator[Tuple[str, int]]:
+        for no in range(len(self.goruntu)):
+            if no not in self.silinenler:
+                yield self.goruntu.bilgi_id(no), no
+
+    def values(self):
+        for _, bilgi in self.items():
+            yield bilgi
+
+    def items(self):
+        for bilgi_id, no in self._goruntudekiler():
+            bilgi = self._degisenler.get(bilgi_id)
+            yield bilgi_id, self.goruntu.bilgi(no) if bilgi is None else bilgi
+        yield from list(self._yeniler.items())
+
+    def tutma_alanlari(self) -> Iterator[Tuple[str, Dict]]:
+        """Unutma yığını için yalnızca tutma skorunda kullanılan alanlar"""
+        for bilgi_id, no in self._goruntudekiler():
+            bilgi = self._degisenler.get(bilgi_id)
+            yield bilgi_id, self.goruntu.tutma_alanlari(no) if bilgi is None else bilgi
+        yield from list(self._yeniler.items())
+
+    def temiz_mesajlar(self) -> Iterator[Tuple[str, str]]:
+        """Tekrar indeksi için yalnızca normalize mesajlar"""
+        for bilgi_id, no in self._goruntudekiler():
+            yield bilgi_id, self.goruntu.temiz_mesaj(no)
+        for bilgi_id, bilgi in list(self._yeniler.items()):
+            yield bilgi_id, bilgi["temiz_mesaj"]
+
+
+class GoruntuKonulari(MutableMapping):
+    """Görüntüdeki konu listelerini bilgi_tabani["konular"] sözlüğü gibi gösteren görünüm
+
+    Öğrenme konu listesine yerinde ekleme yaptığı için bir konunun listesi ilk
+    erişimde çözülüp bellekte tutulur; diğer konular görüntüde kalır.
+    """
+
+    def __init__(self, goruntu: IkiliGoruntu):
+        self.goruntu = goruntu
+        self._listeler: Dict[str, List[str]] = {}
+        self._silinenler: Set[str] = set()
+
+    def _goruntudeki_liste(self, konu: str) -> List[str]:
+        if konu in self._silinenler:
+            return []
+        return [self.goruntu.bilgi_id(no) for no in self.goruntu.konu_numaralari(konu)]
+
+    def __getitem__(self, konu: str) -> List[str]:
+        liste = self._listeler.get(konu)
+        if liste is None:
+            liste = self._goruntudeki_liste(konu)
+            if not liste:
+                raise KeyError(konu)
+            liste = self._listeler.setdefault(konu, liste)
+        return liste
+
+    def __setitem__(self, konu: str, liste: List[str]):
+        self._listeler[konu] = liste
+        self._silinenler.discard(konu)
+
+    def __delitem__(self, konu: str):
+        if konu not in self:
+            raise KeyError(konu)
+        self._listeler.pop(konu, None)
+        self._silinenler.add(konu)
+
+    def __contains__(self, konu) -> bool:
+        if konu in self._listeler:
+            return True
+        return konu not in self._silinenler and len(self.goruntu.konu_numaralari(konu)) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        adlar = self.goruntu.konu_adlari()
+        for konu in adlar:
+            if konu in self:
+                yield konu
+        goruntudekiler = set(adlar)
+        yield from [konu for konu in self._listeler if konu not in goruntudekiler]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def items(self):
+        """Konu listeleri; bellekte olmayanlar tutulmadan çözülür"""
+        for konu in self:
+            liste = self._listeler.get(konu)
+            yield konu, self._goruntudeki_liste(konu) if liste is None else liste
+
+
+class GoruntuIndeksi:
+    """Görüntünün n-gram tablolarını ve sonradan eklenen bilgilerin indeksini birlikte arar
+
+    NgramIndeksi ile aynı arayüzü sunar. Görüntüdeki bilgilerin n-gramları dosyada
+    durduğu için indeks ayrıca kaydedilmez.
+    """
+
+    def __init__(self, bilgiler: GoruntuBilgileri):
+        self._bilgiler = bilgiler
+        self._goruntu = bilgiler.goruntu
+        self.ekler = NgramIndeksi(self._goruntu.n)
+
+    def __len__(self) -> int:
+        return len(self._bilgiler)
+
+    def ekle(self, bilgi_id: str, temiz_metin: str):
+        if self._bilgiler.goruntu_numarasi(bilgi_id) is None:
+            self.ekler.ekle(bilgi_id, temiz_metin)
+
+    def cikar(self, bilgi_id: str, temiz_metin: str):
+        """Görüntüden silinenler bilgiler görünümünün silinenler kümesinden atlanır"""
+        self.ekler.cikar(bilgi_id, temiz_metin)
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int) -> List[str]:
+        """Görüntüdeki adaylar sırasıyla, ardından sonradan eklenen adaylar
+
+        İki kaynaktan biri limite takılırsa toplam limitten az olmaz; öğrenme modülü
+        bu durumda önbellekteki sonucu kesilmiş sayar.
+        """
+        numaralar = self._goruntu.adaylar(temiz_metin, esik, aday_limiti, self._bilgiler.silinenler)
+        return ([self._goruntu.bilgi_id(no) for no in numaralar] +
+                self.ekler.adaylar(temiz_metin, esik, aday_limiti))
+
+    def kaydet(self, dosya_yolu: str, imza: str) -> bool:
+        return True
+
+    def yukle(self, dosya_yolu: str, imza: str) -> bool:
+        return False
+
+
+def sozluge_cevir(bilgi_tabani: Dict) -> Dict:
+    """Görünümlü bilgi tabanını düz JSON sözlüğüne çevir (kopyalar, görünümleri değiştirmez)"""
+    return {
+        **bilgi_tabani,
+        "bilgiler": dict(bilgi_tabani.get("bilgiler", {}).items()),
+        "konular": {konu: list(liste) for konu, liste in bilgi_tabani.get("konular", {}).items()}
+    }
+
+
+class IkiliDepo(JsonDepo):
+    """Bilgi tabanını mmap ile açılan ikili görüntüde, öğrenme geçmişini JSON'da tutan depo
+
+    Görüntü dosyası yoksa bilgi tabanı JSON dosyasından yüklenir ve ilk anlık
+    kayıtta ikili görüntüye geçilir; olay günlüğü iki biçimde de aynıdır.
+    """
+
+    def __init__(self, ikili_dosya: str, bilgi_tabani_dosya: str, ogrenme_gecmisi_dosya: str,
+                 gunluk_dosya: str, fsync: bool = False, sikistirma_esigi: int = 1000,
+                 kayit_iscisi: Optional[KayitIscisi] = None):
+        super().__init__(bilgi_tabani_dosya, ogrenme_gecmisi_dosya, gunluk_dosya,
+                         fsync=fsync, sikistirma_esigi=sikistirma_esigi, kayit_iscisi=kayit_iscisi)
+        self.ikili_dosya = ikili_dosya
+        self.goruntu: Optional[IkiliGoruntu] = None
+        self._indeks: Optional[GoruntuIndeksi] = None
+
+    def _bilgi_tabanini_oku(self) -> Dict:
+        if not os.path.exists(self.ikili_dosya):
+            return super()._bilgi_tabanini_oku()
+
+        self.goruntu = IkiliGoruntu(self.ikili_dosya)
+        bilgiler = GoruntuBilgileri(self.goruntu)
+        # İndeks görüntüden silinenleri bilgiler görünümünden öğrenir
+        self._indeks = GoruntuIndeksi(bilgiler)
+        return {
+            **self.goruntu.meta.get("bilgi_tabani", {}),
+            "bilgiler": bilgiler,
+            "konular": GoruntuKonulari(self.goruntu)
+        }
+
+    def _bilgi_tabanini_yaz(self, bilgi_tabani: Dict) -> bool:
+        """Görüntüyü yeniden yaz; açık eşleme eski dosyayı göstermeye devam eder"""
+        bilgi_tabani = {**bilgi_tabani, "konular": dict(bilgi_tabani.get("konular", {}).items())}
+        return goruntu_yaz(bilgi_tabani, self.ikili_dosya)
+
+    def arama_indeksi(self) -> Optional[GoruntuIndeksi]:
+        """Görüntüden açıldıysa n-gram tablolarını kullanan indeks"""
+        return self._indeks
+
+    def kapat(self):
+        """Görüntü eşlemesini bırak"""
+        if self.goruntu is not None:
+            self.goruntu.kapat()
+            self.goruntu = None
+            self._indeks = None
@@ -0,0 +1,358 @@
+"""
+İkili Görüntü Modülü
+Bu modül bilgi tabanının salt okunur ikili anlık görüntüsünü yazar ve mmap ile açar.
+Dosya bir başlık, sabit genişlikte bilgi kayıtları, kimlik ve n-gram arama tabloları,
+konu tablosu ve kayıtların ofsetle gösterdiği metin alanından oluşur. Bilgiler yalnızca
+erişildiklerinde çözülür; aynı dosyayı açan süreçler işletim sisteminin sayfa
+önbelleğini paylaşır.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Container, Dict, Iterator, List, Optional, Sequence
+from arama_indeksi import NgramIndeksi
+from olcum import olcumler
+
+SIHIRLI = b"OAGB"
+SURUM = 1
+# Tablolar makinenin bayt sırasıyla yazılır; başka sırayla yazılmış dosya açılmaz
+BAYT_SIRASI = 0 if sys.byteorder == "little" else 1
+
+# sihirli, sürüm, n, bayt sırası (0: küçük sonlu), nesil, bilgi/ngram/konu sayıları,
+# bölüm ofsetleri (kayıtlar, kimlikler, ngramlar, ngram konumları, ngram listeleri,
+# konular, konu listeleri, metinler, meta) ve meta uzunluğu
+BASLIK = struct.Struct("<4sHBBQIII9QQ")
+
+# Bilgi kaydındaki metin alanları; her biri metin alanında (ofset, uzunluk) çifti
+METIN_ALANLARI = ("id", "kullanici_mesaj", "asistan_cevap", "temiz_mesaj",
+                  "ogrenme_tarihi", "guncelleme_tarihi")
+# Metin alanları, ek alanlar (JSON), konu numarası, kullanım, başarı skoru, mesaj uzunluğu
+KAYIT = struct.Struct("<" + "QI" * (len(METIN_ALANLARI) + 1) + "IIdI")
+KONU = struct.Struct("<QIII")
+
+# Kayıtta ayrı sütunu olmayan alanlar bu sırayla ek JSON'a yazılır
+_SABIT_ALANLAR = set(METIN_ALANLARI) | {"konu", "kullanim_sayisi", "basari_skoru", "mesaj_uzunlugu"}
+_YOK = 0xFFFFFFFF
+
+
+def _ozet(metin: str) -> int:
+    """Metnin 64 bitlik özeti (kimlik ve n-gram tablolarının anahtarı)"""
+    return int.from_bytes(hashlib.blake2b(metin.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _hizala(uzunluk: int) -> bytes:
+    return b"\0" * (-uzunluk % 8)
+
+
+def goruntu_yaz(bilgi_tabani: Dict, dosya_yolu: str, nesil: int = 0, n: int = 3,
+                meta: Optional[Dict] = None) -> bool:
+    """Bilgi tabanını ikili görüntü dosyasına atomik olarak yaz
+
+    Bilgilerde temiz_mesaj ve mesaj_uzunlugu alanları dolu olmalıdır. Konu listeleri
+    bilgi_tabani["konular"] sırasıyla, diğer üst düzey alanlar meta olarak saklanır.
+    """
+    bilgiler = bilgi_tabani.get("bilgiler", {})
+    konu_listeleri = bilgi_tabani.get("konular", {})
+
+    metinler = bytearray()
+
+    def metin_ekle(deger) -> tuple:
+        if deger is None:
+            return 0, _YOK
+        veri = deger.encode('utf-8')
+        ofset = len(metinler)
+        metinler.extend(veri)
+        return ofset, len(veri)
+
+    konu_numaralari: Dict[str, int] = {}
+    for konu in list(konu_listeleri) + [bilgi.get("konu", "") for bilgi in bilgiler.values()]:
+        konu_numaralari.setdefault(konu, len(konu_numaralari))
+
+    ngram_indeksi = NgramIndeksi(n)
+    ngram_listeleri: Dict[int, array] = {}
+    kimlikler = []
+    kayitlar = bytearray()
+
+    for no, (bilgi_id, bilgi) in enumerate(bilgiler.items()):
+        alanlar = []
+        for alan in METIN_ALANLARI:
+            alanlar.extend(metin_ekle(bilgi.get(alan)))
+
+        ek = {alan: deger for alan, deger in bilgi.items() if alan not in _SABIT_ALANLAR}
+        alanlar.extend(metin_ekle(json.dumps(ek, ensure_ascii=False) if ek else None))
+
+        kayitlar += KAYIT.pack(
+            *alanlar,
+            konu_numaralari[bilgi.get("konu", "")],
+            bilgi.get("kullanim_sayisi", 0),
+            bilgi.get("basari_skoru", 0.0),
+            bilgi.get("mesaj_uzunlugu", len(bilgi["temiz_mesaj"]))
+        )
+        kimlikler.append((_ozet(bilgi_id), no))
+
+        for ngram in ngram_indeksi.ngramlari_cikart(bilgi["temiz_mesaj"]):
+            ngram_listeleri.setdefault(_ozet(ngram), array('I')).append(no)
+
+    kimlikler.sort()
+    ngram_ozetleri = sorted(ngram_listeleri)
+    ngram_konumlari = array('Q', [0])
+    ngram_verisi = array('I')
+    for ozet in ngram_ozetleri:
+        ngram_verisi.extend(ngram_listeleri[ozet])
+        ngram_konumlari.append(len(ngram_verisi))
+
+    numaralar = {bilgi_id: no for no, bilgi_id in enumerate(bilgiler)}
+    konu_tablosu = bytearray()
+    konu_verisi = array('I')
+    for konu in konu_numaralari:
+        liste = [numaralar[bilgi_id] for bilgi_id in konu_listeleri.get(konu, ()) if bilgi_id in numaralar]
+        ofset, uzunluk = metin_ekle(konu)
+        konu_tablosu += KONU.pack(ofset, uzunluk, len(konu_verisi), len(liste))
+        konu_verisi.extend(liste)
+
+    meta_verisi = json.dumps({
+        "bilgi_tabani": {anahtar: deger for anahtar, deger in bilgi_tabani.items()
+                         if anahtar not in ("bilgiler", "konular")},
+        **(meta or {})
+    }, ensure_ascii=False).encode('utf-8')
+
+    bolumler = [
+        bytes(kayitlar),
+        array('Q', (ozet for ozet, _ in kimlikler)).tobytes() + array('I', (no for _, no in kimlikler)).tobytes(),
+        array('Q', ngram_ozetleri).tobytes(),
+        ngram_konumlari.tobytes(),
+        ngram_verisi.tobytes(),
+        bytes(konu_tablosu),
+        konu_verisi.tobytes(),
+        bytes(metinler),
+        meta_verisi
+    ]
+
+    ofsetler = []
+    konum = BASLIK.size + len(_hizala(BASLIK.size))
+    for bolum in bolumler:
+        ofsetler.append(konum)
+        konum += len(bolum) + len(_hizala(len(bolum)))
+
+    baslik = BASLIK.pack(SIHIRLI, SURUM, n, BAYT_SIRASI, nesil,
+                         len(bilgiler), len(ngram_ozetleri), len(konu_numaralari),
+                         *ofsetler, len(meta_verisi))
+
+    klasor = os.path.dirname(dosya_yolu) or "."
+    try:
+        os.makedirs(klasor, exist_ok=True)
+        fd, gecici_yol = tempfile.mkstemp(dir=klasor, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(baslik + _hizala(len(baslik)))
+                for bolum in bolumler:
+                    f.write(bolum)
+                    f.write(_hizala(len(bolum)))
+                f.flush()
+                os.fsync(f.fileno())
+                olcumler.artir("yazilan_bayt", f.tell())
+            os.replace(gecici_yol, dosya_yolu)
+        except BaseException:
+            if os.path.exists(gecici_yol):
+                os.remove(gecici_yol)
+            raise
+        return True
+    except Exception as e:
+        print(f"❌ Görüntü yazma hatası {dosya_yolu}: {e}")
+        return False
+
+
+class IkiliGoruntu:
+    def __init__(self, dosya_yolu: str):
+        """Görüntü dosyasını salt okunur olarak eşle; bilgiler erişildikçe çözülür"""
+        self.dosya_yolu = dosya_yolu
+        with open(dosya_yolu, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (sihirli, surum, self.n, bayt_sirasi, self.nesil, self.bilgi_sayisi, ngram_sayisi, konu_sayisi,
+         kayitlar, kimlikler, ngramlar, ngram_konumlari, ngram_listeleri, konular, konu_listeleri,
+         metinler, meta, self._meta_uzunlugu) = BASLIK.unpack_from(self._mm, 0)
+
+        if sihirli != SIHIRLI or surum != SURUM:
+            self._mm.close()
+            raise ValueError(f"Geçersiz görüntü dosyası: {dosya_yolu}")
+        if bayt_sirasi != BAYT_SIRASI:
+            self._mm.close()
+            raise ValueError(f"Görüntü dosyası başka bayt sırasıyla yazılmış: {dosya_yolu}")
+
+        bellek = memoryview(self._mm)
+        sayi = self.bilgi_sayisi
+        self._kayitlar_ofset = kayitlar
+        self._kimlik_ozetleri = bellek[kimlikler:kimlikler + 8 * sayi].cast('Q')
+        self._kimlik_numaralari = bellek[kimlikler + 8 * sayi:kimlikler + 12 * sayi].cast('I')
+        self._ngram_ozetleri = bellek[ngramlar:ngramlar + 8 * ngram_sayisi].cast('Q')
+        self._ngram_konumlari = bellek[ngram_konumlari:ngram_konumlari + 8 * (ngram_sayisi + 1)].cast('Q')
+        self._ngram_listeleri = bellek[ngram_listeleri:konular].cast('I')
+        self._konular_ofset = konular
+        self._konu_sayisi = konu_sayisi
+        self._konu_listeleri = bellek[konu_listeleri:metinler].cast('I')
+        self._metinler_ofset = metinler
+        self._meta_ofset = meta
+        self._meta: Optional[Dict] = None
+        self._konu_adlari: Optional[List[str]] = None
+        self._konu_numaralari: Optional[Dict[str, int]] = None
+        self._bellek = bellek
+        self._ngram_indeksi = NgramIndeksi(self.n)
+
+    def __len__(self) -> int:
+        return self.bilgi_sayisi
+
+    def kapat(self):
+        """Eşlemeyi bırak (açık görünümler varken çağrılmamalı)"""
+        for gorunum in (self._kimlik_ozetleri, self._kimlik_numaralari, self._ngram_ozetleri,
+                        self._ngram_konumlari, self._ngram_listeleri, self._konu_listeleri, self._bellek):
+            gorunum.release()
+        self._mm.close()
+
+    @property
+    def meta(self) -> Dict:
+        """Görüntüyle birlikte yazılan meta veriler (ilk erişimde çözülür)"""
+        if self._meta is None:
+            self._meta = json.loads(str(self._mm[self._meta_ofset:self._meta_ofset + self._meta_uzunlugu], 'utf-8'))
+        return self._meta
+
+    def _metin(self, ofset: int, uzunluk: int) -> Optional[str]:
+        if uzunluk == _YOK:
+            return None
+        baslangic = self._metinler_ofset + ofset
+        return str(self._mm[baslangic:baslangic + uzunluk], 'utf-8')
+
+    def _kayit(self, no: int) -> tuple:
+        if not 0 <= no < self.bilgi_sayisi:
+            raise IndexError(no)
+        return KAYIT.unpack_from(self._mm, self._kayitlar_ofset + no * KAYIT.size)
+
+    def bilgi_id(self, no: int) -> str:
+        ofset, uzunluk = KAYIT.unpack_from(self._mm, self._kayitlar_ofset + no * KAYIT.size)[:2]
+        return self._metin(ofset, uzunluk)
+
+    def temiz_mesaj(self, no: int) -> str:
+        kayit = self._kayit(no)
+        return self._metin(kayit[6], kayit[7])
+
+    def mesaj_uzunlugu(self, no: int) -> int:
+        return self._kayit(no)[-1]
+
+    def tutma_alanlari(self, no: int) -> Dict:
+        """Unutma yığınının kullandığı alanlar; ek alanlar çözülmez"""
+        kayit = self._kayit(no)
+        return {
+            "kullanim_sayisi": kayit[-3],
+            "basari_skoru": kayit[-2],
+            "guncelleme_tarihi": self._metin(kayit[10], kayit[11])
+        }
+
+    def bilgi(self, no: int) -> Dict:
+        """no sıradaki bilgiyi sözlük olarak çöz"""
+        kayit = self._kayit(no)
+        metinler = {alan: self._metin(kayit[2 * i], kayit[2 * i + 1]) for i, alan in enumerate(METIN_ALANLARI)}
+        ek_metni = self._metin(kayit[2 * len(METIN_ALANLARI)], kayit[2 * len(METIN_ALANLARI) + 1])
+        ek = json.loads(ek_metni) if ek_metni else {}
+        konu_no, kullanim_sayisi, basari_skoru, mesaj_uzunlugu = kayit[-4:]
+
+        bilgi = {
+            "id": metinler["id"],
+            "kullanici_mesaj": metinler["kullanici_mesaj"],
+            "asistan_cevap": metinler["asistan_cevap"],
+            "konu": self.konu_adlari()[konu_no],
+            "anahtar_kelimeler": ek.pop("anahtar_kelimeler", None),
+            "ogrenme_tarihi": metinler["ogrenme_tarihi"],
+            "kullanim_sayisi": kullanim_sayisi,
+            "basari_skoru": basari_skoru,
+            "guncelleme_tarihi": metinler["guncelleme_tarihi"],
+            "temiz_mesaj": metinler["temiz_mesaj"],
+            "mesaj_uzunlugu": mesaj_uzunlugu
+        }
+        # Eski görüntülerde kalan, artık tutulmayan alan
+        ek.pop("mesaj_kelimeleri", None)
+        # Asıl kayıtta bulunmayan alanlar çözülmüş bilgide de olmamalı
+        for alan in ("kullanici_mesaj", "asistan_cevap", "anahtar_kelimeler", "ogrenme_tarihi",
+                     "guncelleme_tarihi"):
+            if bilgi[alan] is None:
+                del bilgi[alan]
+        bilgi.update(ek)
+        return bilgi
+
+    def numara(self, bilgi_id: str) -> Optional[int]:
+        """Bilginin görüntüdeki sırası, yoksa None"""
+        ozet = _ozet(bilgi_id)
+        i = bisect_left(self._kimlik_ozetleri, ozet)
+        while i < self.bilgi_sayisi and self._kimlik_ozetleri[i] == ozet:
+            no = self._kimlik_numaralari[i]
+            if self.bilgi_id(no) == bilgi_id:
+                return no
+            i += 1
+        return None
+
+    def getir(self, bilgi_id: str) -> Optional[Dict]:
+        no = self.numara(bilgi_id)
+        return None if no is None else self.bilgi(no)
+
+    def idler(self) -> Iterator[str]:
+        """Bilgi kimlikleri, bilgi tabanındaki sırasıyla"""
+        for no in range(self.bilgi_sayisi):
+            yield self.bilgi_id(no)
+
+    def konu_adlari(self) -> List[str]:
+        if self._konu_adlari is None:
+            adlar = []
+            for i in range(self._konu_sayisi):
+                ofset, uzunluk, _, _ = KONU.unpack_from(self._mm, self._konular_ofset + i * KONU.size)
+                adlar.append(self._metin(ofset, uzunluk))
+            self._konu_numaralari = {ad: i for i, ad in enumerate(adlar)}
+            self._konu_adlari = adlar
+        return self._konu_adlari
+
+    def konu_numaralari(self, konu: str) -> Sequence[int]:
+        """Konudaki bilgilerin sıraları, konu listesindeki sırayla"""
+        self.konu_adlari()
+        i = self._konu_numaralari.get(konu)
+        if i is None:
+            return ()
+        _, _, baslangic, uzunluk = KONU.unpack_from(self._mm, self._konular_ofset + i * KONU.size)
+        return self._konu_listeleri[baslangic:baslangic + uzunluk]
+
+    def konu_listeleri(self) -> Dict[str, List[str]]:
+        """Bilgi tabanındaki konular sözlüğünün karşılığı (boş konular hariç)"""
+        return {konu: [self.bilgi_id(no) for no in self.konu_numaralari(konu)]
+                for konu in self.konu_adlari() if len(self.konu_numaralari(konu))}
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int,
+                haric: Container[int] = ()) -> List[int]:
+        """NgramIndeksi.adaylar ile aynı kuralla aday bilgilerin sıralarını getir
+
+        haric içindeki sıralar (silinmiş bilgiler) limit uygulanmadan önce atlanır.
+        """
+        ortak_sayilari: Dict[int, int] = defaultdict(int)
+        for ngram in self._ngram_indeksi.ngramlari_cikart(temiz_metin):
+            ozet = _ozet(ngram)
+            i = bisect_left(self._ngram_ozetleri, ozet)
+            if i == len(self._ngram_ozetleri) or self._ngram_ozetleri[i] != ozet:
+                continue
+            for no in self._ngram_listeleri[self._ngram_konumlari[i]:self._ngram_konumlari[i + 1]]:
+                ortak_sayilari[no] += 1
+
+        uzunluk = len(temiz_metin)
+        uygunlar = [
+            (sayi, no) for no, sayi in ortak_sayilari.items()
+            if no not in haric and NgramIndeksi.uzunluk_uygun(uzunluk, self.mesaj_uzunlugu(no), esik)
+        ]
+
+        if len(uygunlar) > aday_limiti:
+            uygunlar.sort(key=lambda x: (-x[0], x[1]))
+            uygunlar = uygunlar[:aday_limiti]
+
+        return sorted(no for _, no in uygunlar)
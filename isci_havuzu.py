@@ -0,0 +1,436 @@
+"""
+İşçi Havuzu Modülü
+Bu modül sunucuyu önceden başlatılmış (pre-fork) işçi süreçleriyle çalıştırır. Öğrenme ve
+kalıcılık tek bir sahip süreçte yapılır; sahip bilgi tabanını nesil numaralı ikili
+görüntüler olarak yayınlar. İşçiler güncel görüntüyü mmap ile paylaşarak okur, yazma
+isteklerini sınırlı bir kuyrukla sahibe gönderir ve yeni nesle yeniden başlamadan geçer.
+"""
+
+import os
+import re
+import sys
+import copy
+import queue
+import signal
+import socket
+import time
+import datetime
+import asyncio
+import threading
+import multiprocessing
+from typing import Callable, Dict, List, Optional, Tuple
+from dil_isleme import TurkceDilIsleme, MesajAnalizi
+from ogrenme_modulu import OgrenmeModulu
+from onbellek import SorguOnbellegi
+from depolama import KayitIscisi
+from ikili_goruntu import IkiliGoruntu
+from profil_deposu import ProfilDeposu
+
+GORUNTU_DESENI = re.compile(r"^goruntu_(\d+)\.bin$")
+
+
+def goruntu_yolu(klasor: str, nesil: int) -> str:
+    """Verilen neslin görüntü dosyası"""
+    return os.path.join(klasor, f"goruntu_{nesil}.bin")
+
+
+class GoruntuOgrenmeModulu:
+    """İşçi süreçte OgrenmeModulu yerine geçen, yayınlanmış görüntüden okuyan modül
+
+    Aramalar yerel görüntüden yapılır; öğrenme, güncelleme ve kullanım artışları
+    sahibe gönderilir ve bir sonraki nesilde görünür olur.
+    """
+
+    def __init__(self, klasor: str, nesil, yazma_kuyrugu, ayarlar: Dict,
+                 dil_isleme: Optional[TurkceDilIsleme] = None):
+        self.klasor = klasor
+        self.ayarlar = ayarlar
+        self.dil_isleme = dil_isleme or TurkceDilIsleme()
+        self.benzerlik_esigi = ayarlar.get("benzerlik_esigi", 0.6)
+        self.aday_limiti = ayarlar.get("aday_limiti", 500)
+        self.tam_tarama_uzunlugu = ayarlar.get("tam_tarama_uzunlugu", 3)
+        self.sorgu_onbellegi = SorguOnbellegi(
+            ayarlar.get("onbellek_boyutu", 1000),
+            ayarlar.get("onbellek_suresi", 300)
+        )
+        # İşçinin kendi dosya yazması yok; asistanın işaretledikleri hemen çalışır
+        self.kayit_iscisi = KayitIscisi(0)
+
+        self._nesil = nesil
+        self._kuyruk = yazma_kuyrugu
+        self._goruntu: Optional[IkiliGoruntu] = None
+        self._kilit = threading.Lock()
+        # (nesil, konu) -> görüntüdeki sıralar, başarı ve kullanıma göre sıralı
+        self._konu_siralari: Dict[Tuple[int, str], List[int]] = {}
+
+    def goruntu(self) -> IkiliGoruntu:
+        """Güncel görüntü; sahip yeni bir nesil yayınladıysa ona geç
+
+        Eski görüntüyü kullanmakta olan istekler onu bitirene kadar tutar, eşleme
+        son başvuru bırakılınca kapanır.
+        """
+        # Sahip ilk görüntüyü yayınlamadan gelen istekler onu bekler
+        while self._nesil.value == 0:
+            time.sleep(0.05)
+
+        goruntu = self._goruntu
+        if goruntu is not None and goruntu.nesil == self._nesil.value:
+            return goruntu
+
+        with self._kilit:
+            while self._goruntu is None or self._goruntu.nesil != self._nesil.value:
+                nesil = self._nesil.value
+                try:
+                    self._goruntu = IkiliGoruntu(goruntu_yolu(self.klasor, nesil))
+                except FileNotFoundError:
+                    # Sahip daha yeni bir nesil yayınlayıp bu dosyayı silmiş olabilir
+                    if self._nesil.value == nesil:
+                        raise
+            self.sorgu_onbellegi.temizle()
+            self._konu_siralari = {}
+            return self._goruntu
+
+    def _gonder(self, istek: tuple) -> bool:
+        """İsteği sahibe ilet; kuyruk doluysa kısa süre bekle, yine doluysa vazgeç"""
+        try:
+            self._kuyruk.put(istek, timeout=1.0)
+            return True
+        except queue.Full:
+            print("⚠️ Sahip süreç yetişemiyor, istek bırakıldı")
+            return False
+
+    def benzer_bilgi_bul(self, kullanici_mesaj: str, limit: int = 5) -> List[Dict]:
+        """Kullanıcı mesajına benzer bilgileri görüntüden bul"""
+        goruntu = self.goruntu()
+        temiz_mesaj = self.dil_isleme.temizle_metin(kullanici_mesaj)
+
+        # Önbellekteki sıra numaraları yalnızca kendi neslinde geçerlidir
+        anahtar = f"{goruntu.nesil}:{temiz_mesaj}"
+        skorlar = self.sorgu_onbellegi.getir(anahtar)
+        if skorlar is None:
+            nesil = self.sorgu_onbellegi.nesil
+            # OgrenmeModulu gibi yalnızca kısa sorgularda tüm görüntü taranır
+            aday_nolar = range(len(goruntu))
+            kesildi = False
+            if len(temiz_mesaj) > self.tam_tarama_uzunlugu:
+                aday_nolar = goruntu.adaylar(temiz_mesaj, self.benzerlik_esigi, self.aday_limiti)
+                kesildi = len(aday_nolar) >= self.aday_limiti
+
+            skorlar = []
+            for no in aday_nolar:
+                benzerlik = self.dil_isleme.temiz_benzerlik_hesapla(temiz_mesaj, goruntu.temiz_mesaj(no))
+                if benzerlik >= self.benzerlik_esigi:
+                    skorlar.append((no, benzerlik))
+
+            skorlar.sort(key=lambda x: x[1], reverse=True)
+            self.sorgu_onbellegi.koy(anahtar, skorlar, kesildi, nesil)
+
+        benzer_bilgiler = []
+        for no, benzerlik in skorlar[:limit]:
+            bilgi = goruntu.bilgi(no)
+            bilgi["benzerlik_skoru"] = benzerlik
+            benzer_bilgiler.append(bilgi)
+        return benzer_bilgiler
+
+    def en_iyi_cevap_bul(self, kullanici_mesaj: str) -> Optional[str]:
+        """Kullanıcı mesajı için en iyi cevabı bul"""
+        benzer_bilgiler = self.benzer_bilgi_bul(kullanici_mesaj, 1)
+
+        if benzer_bilgiler and benzer_bilgiler[0]["benzerlik_skoru"] > 0.8:
+            self._gonder(("kullan", benzer_bilgiler[0]["id"]))
+            return benzer_bilgiler[0]["asistan_cevap"]
+
+        return None
+
+    def konu_bazli_bilgi_getir(self, konu: str, limit: int = 3) -> List[Dict]:
+        """Belirli bir konuya ait en iyi bilgileri getir (OgrenmeModulu ile aynı sırayla)"""
+        goruntu = self.goruntu()
+        return [goruntu.bilgi(no) for no in self._konu_sirasi(goruntu, konu)[:limit]]
+
+    def _konu_sirasi(self, goruntu: IkiliGoruntu, konu: str) -> List[int]:
+        """Görüntü değişmediği için konu sıralaması nesil başına bir kez kurulur"""
+        anahtar = (goruntu.nesil, konu)
+        sira = self._konu_siralari.get(anahtar)
+        if sira is None:
+            def sira_anahtari(oge: Tuple[int, int]) -> Tuple[float, int, int]:
+                konumu, no = oge
+                alanlar = goruntu.tutma_alanlari(no)
+                return -alanlar["basari_skoru"], -alanlar["kullanim_sayisi"], konumu
+
+            sira = [no for _, no in sorted(enumerate(goruntu.konu_numaralari(konu)), key=sira_anahtari)]
+            self._konu_siralari[anahtar] = sira
+        return sira
+
+    def yeni_bilgi_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None,
+                         analiz: Optional[MesajAnalizi] = None) -> bool:
+        """Yeni bilgiyi sahibe gönder (sonraki nesilde aranabilir olur)"""
+        return self._gonder(("ogren", kullanici_mesaj, asistan_cevap, konu, analiz))
+
+    def arka_planda_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None,
+                          analiz: Optional[MesajAnalizi] = None,
+                          ogrenildi: Optional[Callable[[], None]] = None):
+        """Öğrenme zaten sahipte sırayla uygulanır; isteği göndermek yeterli
+        
+        Sonuç sahipte belli olduğundan ogrenildi çağrılmaz.
+        """
+        self.yeni_bilgi_ogren(kullanici_mesaj, asistan_cevap, konu, analiz)
+
+    def bilgi_guncelle(self, bilgi_id: str, yeni_cevap: str) -> bool:
+        """Mevcut bilginin güncellenmesini sahibe gönder"""
+        if self.goruntu().numara(bilgi_id) is None:
+            return False
+        return self._gonder(("guncelle", bilgi_id, yeni_cevap))
+
+    def ogrenme_istatistikleri_getir(self) -> Dict:
+        """Görüntü yayınlandığı andaki öğrenme istatistikleri"""
+        return self.goruntu().meta["ogrenme"]
+
+    def verileri_kaydet(self) -> bool:
+        """Sahipten kalıcı kayıt iste"""
+        try:
+            self._kuyruk.put_nowait(("kaydet",))
+        except queue.Full:
+            return False
+        return True
+
+
+class UzakProfilDeposu:
+    """İşçi süreçte ProfilDeposu yerine geçen, değişiklikleri sahibe gönderen depo
+
+    Profil dosyalarını yalnızca sahip yazar; işçi onları okur ve güncellemeleri
+    (değiştirme işleviyle birlikte) kuyruğa koyar. Böylece aynı kullanıcıya farklı
+    işçilerden gelen girişler birbirinin üzerine yazılmaz.
+    """
+
+    profil_yolu = ProfilDeposu.profil_yolu
+    _oku = staticmethod(ProfilDeposu._oku)
+
+    def __init__(self, klasor: str, gonder: Callable[[tuple], bool]):
+        self.klasor = klasor
+        self._gonder = gonder
+        self._varsayilan_profil: Optional[Dict] = None
+
+    @property
+    def varsayilan_profil(self) -> Dict:
+        # Sahip eski dosyadan aktarımı işçiler başlamadan bitirir
+        if self._varsayilan_profil is None:
+            self._varsayilan_profil = self._oku(os.path.join(self.klasor, "varsayilan_profil.json")) or {}
+        return self._varsayilan_profil
+
+    def getir(self, kullanici_adi: str) -> Optional[Dict]:
+        """Sahibin en son yazdığı profili getir, yoksa None"""
+        return self._oku(self.profil_yolu(kullanici_adi))
+
+    def guncelle(self, kullanici_adi: str, degistir: Callable[[Dict], None]) -> Tuple[Dict, bool]:
+        """Değişikliği sahibe gönder, yerel kopyaya uygulanmış halini döndür
+
+        degistir sahip sürece gönderildiği için modül düzeyinde bir işlev olmalıdır.
+        (profil, yeni_mi) döndürür.
+        """
+        profil = self.getir(kullanici_adi)
+        yeni_mi = profil is None
+        if yeni_mi:
+            profil = copy.deepcopy(self.varsayilan_profil)
+            profil["ad"] = kullanici_adi
+            profil["olusturma_tarihi"] = datetime.datetime.now().isoformat()
+
+        degistir(profil)
+        self._gonder(("profil", kullanici_adi, degistir))
+        return profil, yeni_mi
+
+    def yaz(self) -> bool:
+        """Profilleri sahip yazar"""
+        return True
+
+
+class GoruntuSahibi:
+    def __init__(self, ogrenme_modulu: OgrenmeModulu, klasor: str, yayin_araligi: float = 1.0,
+                 kuyruk_boyutu: int = 10000, baglam=None,
+                 profil_deposu: Optional[ProfilDeposu] = None):
+        """Bilgi tabanının ve profillerin tek yazıcısı; işçilerden gelen istekleri uygular,
+        görüntü yayınlar
+
+        yayin_araligi: değişiklik olduğunda iki yayın arasındaki en kısa süre (saniye)
+        kuyruk_boyutu: işçilerden gelen bekleyen istek sınırı; dolunca işçiler yavaşlar
+        profil_deposu: işçilerin profil güncellemelerinin uygulandığı depo
+        """
+        self.ogrenme_modulu = ogrenme_modulu
+        self.profil_deposu = profil_deposu
+        self.klasor = klasor
+        self.yayin_araligi = yayin_araligi
+        self.baglam = baglam or multiprocessing.get_context()
+        # İşçiler her istekte okur; tek bir 64 bitlik değer olduğu için kilit gerekmez
+        self.nesil = self.baglam.Value('Q', 0, lock=False)
+        self.kuyruk = self.baglam.Queue(kuyruk_boyutu)
+        self._degisti = False
+        self._son_yayin = 0.0
+
+    def yayinla(self) -> bool:
+        """Yeni nesil görüntüyü yaz, işçilere duyur ve eski nesillerin dosyalarını sil"""
+        nesil = self.nesil.value + 1
+        if not self.ogrenme_modulu.goruntu_yaz(goruntu_yolu(self.klasor, nesil), nesil):
+            return False
+
+        self.nesil.value = nesil
+        self._degisti = False
+        self._son_yayin = time.monotonic()
+
+        # Bir önceki nesil geçiş yapmakta olan işçiler için bırakılır, diğerleri (önceki
+        # çalıştırmalardan kalanlar dahil) silinir; açık eşlemeler dosya silinse de geçerli kalır
+        for dosya in os.listdir(self.klasor):
+            eslesme = GORUNTU_DESENI.match(dosya)
+            if eslesme and int(eslesme.group(1)) not in (nesil, nesil - 1):
+                try:
+                    os.remove(os.path.join(self.klasor, dosya))
+                except OSError:
+                    pass
+        return True
+
+    def istek_isle(self, istek: tuple):
+        """İşçiden gelen isteği bilgi tabanına uygula"""
+        tip = istek[0]
+        if tip == "ogren":
+            _, kullanici_mesaj, asistan_cevap, konu, analiz = istek
+            self.ogrenme_modulu.yeni_bilgi_ogren(kullanici_mesaj, asistan_cevap, konu, analiz)
+        elif tip == "kullan":
+            self.ogrenme_modulu.kullanim_kaydet(istek[1])
+        elif tip == "guncelle":
+            self.ogrenme_modulu.bilgi_guncelle(istek[1], istek[2])
+        elif tip == "profil" and self.profil_deposu is not None:
+            _, kullanici_adi, degistir = istek
+            self.profil_deposu.guncelle(kullanici_adi, degistir)
+            self.ogrenme_modulu.kayit_iscisi.isaretle("kullanici_profilleri", self.profil_deposu.yaz)
+            return
+        elif tip == "kaydet":
+            self.ogrenme_modulu.verileri_kaydet()
+            if self.profil_deposu is not None:
+                self.profil_deposu.yaz()
+            return
+        else:
+            print(f"⚠️ Bilinmeyen işçi isteği: {tip}")
+            return
+        self._degisti = True
+
+    def adim(self, zaman_asimi: float = 0.1, en_fazla: int = 1000) -> int:
+        """Kuyruktaki istekleri (en fazla en_fazla tane) işle, zamanı geldiyse yayınla
+
+        İşlenen istek sayısını döndürür.
+        """
+        islenen = 0
+        try:
+            istek = self.kuyruk.get(timeout=zaman_asimi)
+            while True:
+                self.istek_isle(istek)
+                islenen += 1
+                if islenen >= en_fazla:
+                    break
+                istek = self.kuyruk.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self._degisti and time.monotonic() - self._son_yayin >= self.yayin_araligi:
+            # Kullanım artışları da görünür olsun
+            self.ogrenme_modulu.kullanim_sayilarini_isle()
+            self.yayinla()
+        return islenen
+
+    def bosalt(self):
+        """Kuyrukta kalan istekleri işle ve son hali yayınla"""
+        while self.adim(zaman_asimi=0.05):
+            pass
+        if self._degisti:
+            self.ogrenme_modulu.kullanim_sayilarini_isle()
+            self.yayinla()
+
+
+def _isci_calistir(soket: socket.socket, klasor: str, nesil, kuyruk, ayarlar: Dict, secenekler: Dict):
+    """İşçi süreç: paylaşılan soketi dinleyen sunucuyu görüntü modülüyle çalıştır"""
+    from asistan import OgrenenAsistan
+    from sunucu import AsistanSunucusu
+
+    # Ctrl+C sahibe gelir; işçiler sahibin gönderdiği SIGTERM ile düzenli kapanır
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    ogrenme = GoruntuOgrenmeModulu(klasor, nesil, kuyruk, ayarlar)
+    profiller = UzakProfilDeposu(ayarlar.get("profil_klasoru", "veri/kullanicilar"), ogrenme._gonder)
+    asistan = OgrenenAsistan(ogrenme_modulu=ogrenme, profil_deposu=profiller)
+    sunucu = AsistanSunucusu.ayarlardan(asistan, soket=soket, **secenekler)
+
+    async def calistir():
+        # Windows'ta olay döngüsü sinyal işleyici desteklemez; terminate() süreci doğrudan bitirir
+        if sys.platform != "win32":
+            gorev = asyncio.current_task()
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, gorev.cancel)
+        try:
+            await sunucu.calistir()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await sunucu.kapat()
+
+    asyncio.run(calistir())
+
+
+def havuzu_calistir(surec_sayisi: int, host: str = None, port: int = None, **secenekler) -> int:
+    """Sahip süreci ve surec_sayisi işçiyi başlat, Ctrl+C gelene kadar çalıştır
+
+    Ölen işçiler yeniden başlatılır. secenekler işçilerdeki AsistanSunucusu'na geçer.
+    """
+    # Sahipte kayıt iş parçacığı çalışırken çatallamak kilitleri yarım kopyalayabilir;
+    # işçiler bilgi tabanını görüntüden okuduğu için her platformda spawn kullanılır
+    baglam = multiprocessing.get_context("spawn")
+
+    ogrenme = OgrenmeModulu()
+    ayarlar = ogrenme.ayarlar
+    # Eski profil dosyasının aktarımı da burada, işçiler başlamadan bir kez yapılır
+    profiller = ProfilDeposu(
+        ayarlar.get("profil_klasoru", "veri/kullanicilar"),
+        "veri/kullanici_profilleri.json",
+        ayarlar.get("profil_onbellek_boyutu", 1000)
+    )
+    sahip = GoruntuSahibi(
+        ogrenme,
+        ayarlar.get("goruntu_klasoru", "veri/goruntu"),
+        ayarlar.get("goruntu_yayin_araligi", 1.0),
+        ayarlar.get("goruntu_kuyruk_boyutu", 10000),
+        baglam,
+        profiller
+    )
+    if not sahip.yayinla():
+        return 1
+
+    host = host or ayarlar.get("sunucu_host", "127.0.0.1")
+    port = ayarlar.get("sunucu_port", 8765) if port is None else port
+    soket = socket.create_server((host, port))
+    print(f"🌐 {surec_sayisi} işçi {host}:{soket.getsockname()[1]} adresinde dinliyor")
+
+    def isci_baslat():
+        isci = baglam.Process(
+            target=_isci_calistir,
+            args=(soket, sahip.klasor, sahip.nesil, sahip.kuyruk, ayarlar, secenekler),
+            daemon=True
+        )
+        isci.start()
+        return isci
+
+    isciler = [isci_baslat() for _ in range(surec_sayisi)]
+
+    try:
+        while True:
+            sahip.adim(zaman_asimi=0.5)
+            for i, isci in enumerate(isciler):
+                if not isci.is_alive():
+                    print(f"⚠️ İşçi {isci.pid} durdu (çıkış kodu {isci.exitcode}), yeniden başlatılıyor")
+                    isciler[i] = isci_baslat()
+    except KeyboardInterrupt:
+        print("\n👋 İşçiler durduruluyor...")
+    finally:
+        for isci in isciler:
+            isci.terminate()
+        for isci in isciler:
+            isci.join(timeout=10)
+        sahip.bosalt()
+        ogrenme.verileri_kaydet()
+        profiller.yaz()
+        soket.close()
+    return 0
@@ -0,0 +1,435 @@
+"""
+Öğrenen Asistan - Kıyaslama Takımı
+Sentetik Türkçe soru-cevap derlemleriyle tekrarlanabilir performans ölçümü
+
+Her boyut geçici bir klasörde ve ayrı bir alt süreçte ölçülür; tepe bellek (RSS)
+böylece yalnızca o boyuta aittir. Derlem tohumdan üretildiği için aynı argümanlarla
+her çalıştırmada aynı sorular, cevaplar ve sorgular kullanılır.
+
+Kullanım:
+    python kiyaslama.py [--boyutlar 1000,10000,100000] [--cikti kiyaslama_sonuclari.json]
+    python kiyaslama.py --boyutlar 1000,10000,100000,1000000 --depolama ikili
+    python kiyaslama.py --temel kiyaslama_temel.json [--esik 0.20]
+
+--temel verilirse sonuçlar kayıtlı temel ölçümle karşılaştırılır; herhangi bir
+ölçüm eşikten fazla kötüleşmişse çıkış kodu 1 olur.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from sunucu import _yuzdelik
+
+# Konu başına özneler; konu anahtar kelimeleri dil işlemenin konu tespitine uyar
+OZNELER = {
+    "teknoloji": [
+        "python", "yazılım testi", "mobil uygulama", "bilgisayar ağı", "veritabanı", "bulut sunucusu",
+        "program derleyicisi", "kod incelemesi", "yapay zeka", "siber güvenlik", "web sitesi",
+        "oyun motoru", "işletim sistemi", "açık kaynak kod", "veri analizi", "robot programı"
+    ],
+    "eğitim": [
+        "matematik dersi", "yabancı dil", "tarih kitabı", "okul kütüphanesi", "öğrenci kulübü",
+        "sınav hazırlığı", "öğretmen eğitimi", "fen laboratuvarı", "uzaktan eğitim", "ders programı",
+        "okuma alışkanlığı", "üniversite tercihi", "burs başvurusu", "ödev planı", "kitap özeti",
+        "öğren yöntemi"
+    ],
+    "kişisel": [
+        "aile bütçesi", "arkadaş ilişkisi", "hayat hedefi", "uyku düzeni", "sabah rutini",
+        "zaman yönetimi", "stres kontrolü", "hobi seçimi", "spor alışkanlığı", "sağlıklı beslenme",
+        "tatil planı", "taşınma süreci", "kariyer değişikliği", "meditasyon", "günlük tutma",
+        "ev düzeni"
+    ],
+    "genel": [
+        "iklim değişikliği", "geri dönüşüm", "toplu taşıma", "şehir planlaması", "yerel seçim",
+        "kahve kültürü", "deprem hazırlığı", "su tasarrufu", "güneş enerjisi", "antik kent",
+        "halk müziği", "sokak hayvanı", "bahçe bakımı", "trafik kuralı", "hava durumu",
+        "müze ziyareti"
+    ]
+}
+
+YONLER = [
+    "maliyet", "güvenlik", "verimlilik", "kalite", "hız", "süreklilik", "erişilebilirlik",
+    "esneklik", "planlama", "ölçülebilirlik", "sadelik", "dayanıklılık", "uyum", "motivasyon",
+    "zaman", "risk", "iletişim", "sürdürülebilirlik", "başarı", "denetim", "öncelik", "kapsam",
+    "bakım", "tasarruf", "yaratıcılık", "disiplin", "doğruluk", "tutarlılık", "şeffaflık",
+    "işbirliği", "deneyim", "gelişim", "denge", "performans", "güven", "hata payı", "kaynak",
+    "bütçe", "yenilik", "sabır"
+]
+
+BAGLAMLAR = [
+    "yeni başlayanlar için", "küçük işletmelerde", "büyük şehirlerde", "kırsal bölgelerde",
+    "üniversitede", "evde", "iş yerinde", "kış aylarında", "yaz tatilinde", "sınav döneminde",
+    "uzun vadede", "kısa sürede", "sınırlı bütçeyle", "ekip çalışmasında", "tek başına",
+    "çocuklarla birlikte", "emeklilikte", "ilk yılda", "yoğun haftalarda", "hafta sonlarında",
+    "uzaktan çalışırken", "yolculuk sırasında", "kriz anlarında", "yeni bir şehirde",
+    "kalabalık ortamlarda", "sessiz ortamlarda", "sabah saatlerinde", "akşam saatlerinde",
+    "pandemi sonrasında", "gönüllü projelerde", "aile içinde", "arkadaş grubunda",
+    "lise yıllarında", "yüksek lisansta", "staj döneminde", "ilk işte", "emekli olunca",
+    "bayram tatilinde", "taşındıktan sonra", "yeni yılda"
+]
+
+SORU_SABLONLARI = [
+    "{ozne} {baglam} {yon} açısından nasıl kullanılır?",
+    "{baglam} {ozne} için {yon} neden önemlidir?",
+    "{ozne} nedir, {baglam} {yon} konusunda ne işe yarar?",
+    "{baglam} {ozne} öğrenirken {yon} nasıl geliştirilir?",
+    "{ozne} ile ilgili {yon} sorunları {baglam} nasıl çözülür?",
+    "{baglam} {ozne} seçerken {yon} neye göre değerlendirilir?",
+    "{ozne} hakkında {yon} bilgisi {baglam} nereden edinilir?",
+    "{baglam} {ozne} kullanmanın {yon} avantajları nelerdir?",
+    "{ozne} {baglam} {yon} bakımından ne kadar zaman ister?",
+    "{baglam} {ozne} konusunda {yon} hataları nelerdir?",
+    "{ozne} için {baglam} {yon} hedefi nasıl belirlenir?",
+    "{baglam} {ozne} ve {yon} arasındaki ilişki nedir?",
+    "{ozne} {yon} açısından {baglam} nasıl ölçülür?",
+    "{baglam} {ozne} planlarken {yon} için ne yapmalıyım?",
+    "{ozne} {baglam} {yon} yönünden nasıl iyileştirilir?",
+    "{baglam} {ozne} denerken {yon} ile ilgili neye dikkat edilir?"
+]
+
+CEVAP_SABLONLARI = [
+    "{ozne} {baglam} ele alınırken {yon} ilk sırada düşünülmeli; küçük adımlarla başlayıp sonuçları düzenli ölçmek en sağlıklısı.",
+    "{baglam} {ozne} için {yon} belirleyicidir. Önce ihtiyacı netleştir, sonra seçenekleri karşılaştır.",
+    "Kısaca: {ozne} {baglam} {yon} sağlar. Deneyimli birinden geri bildirim almak süreci hızlandırır.",
+    "{yon} açısından {ozne} {baglam} planlı yürütüldüğünde iyi sonuç verir; acele etmemek gerekir.",
+    "{baglam} {ozne} konusunda {yon} için kaynakları önceden ayırmak ve ilerlemeyi not etmek işe yarar."
+]
+
+# Ölçümlerin iyileşme yönü: bu son eklerle bitenlerde yüksek değer iyidir
+YUKSEK_IYI_EKLER = ("_hizi",)
+
+
+def _derlem_alani() -> Tuple[List[Tuple[str, str]], int]:
+    """(konu, özne) listesi ve tüm soru birleşimlerinin sayısı"""
+    ozneler = [(konu, ozne) for konu, liste in OZNELER.items() for ozne in liste]
+    return ozneler, len(SORU_SABLONLARI) * len(ozneler) * len(YONLER) * len(BAGLAMLAR)
+
+
+def sentetik_kayit(sira: int, tohum: int = 42) -> Tuple[str, str, str]:
+    """Derlemin verilen sıradaki (soru, cevap, konu) kaydı
+
+    Sıra, birleşim uzayında asal bir adımla dolaşılarak şablon, özne, yön ve
+    bağlam seçimine çevrilir; uzay boyutuna kadar her sıra farklı bir soru verir.
+    """
+    ozneler, uzay = _derlem_alani()
+    numara = (sira * 1_000_003 + tohum * 7_919) % uzay
+    numara, sablon = divmod(numara, len(SORU_SABLONLARI))
+    numara, ozne_no = divmod(numara, len(ozneler))
+    numara, yon_no = divmod(numara, len(YONLER))
+    baglam_no = numara % len(BAGLAMLAR)
+
+    konu, ozne = ozneler[ozne_no]
+    alanlar = {"ozne": ozne, "yon": YONLER[yon_no], "baglam": BAGLAMLAR[baglam_no]}
+    soru = SORU_SABLONLARI[sablon].format(**alanlar)
+    cevap = CEVAP_SABLONLARI[(sira + tohum) % len(CEVAP_SABLONLARI)].format(**alanlar)
+    return soru[0].upper() + soru[1:], cevap[0].upper() + cevap[1:], konu
+
+
+def sentetik_derlem(boyut: int, tohum: int = 42, baslangic: int = 0) -> Iterator[Tuple[str, str, str]]:
+    """Belirlenimci sentetik Türkçe soru-cevap derlemi (akış halinde)"""
+    for sira in range(baslangic, baslangic + boyut):
+        yield sentetik_kayit(sira, tohum)
+
+
+def sentetik_sorgular(boyut: int, adet: int, tohum: int = 42) -> List[str]:
+    """Derlemdeki sorulardan türetilmiş, birbirinden farklı sorgular
+
+    Sorgular kayıtlı soruların küçük harfli, bir kelimesi eksik biçimleridir;
+    indeksten aday bulunur ama sorgu önbelleğine denk gelmez.
+    """
+    rastgele = random.Random(tohum)
+    sorgular = []
+    for sira in rastgele.sample(range(boyut), min(adet, boyut)):
+        kelimeler = sentetik_kayit(sira, tohum)[0].lower().split()
+        del kelimeler[rastgele.randrange(len(kelimeler))]
+        sorgular.append(" ".join(kelimeler))
+    return list(dict.fromkeys(sorgular))
+
+
+def _gecikmeler(islev: Callable[[str], object], sorgular: List[str]) -> Dict[str, float]:
+    """Her sorgunun süresini ölç; p50/p95/p99 milisaniye olarak"""
+    sureler = []
+    for sorgu in sorgular:
+        baslangic = time.perf_counter()
+        islev(sorgu)
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    sureler.sort()
+    return {f"p{int(oran * 100)}": _yuzdelik(sureler, oran) for oran in (0.50, 0.95, 0.99)}
+
+
+def tepe_bellek_mb() -> Optional[float]:
+    """Bu sürecin tepe bellek kullanımı (RSS, MB); ölçülemiyorsa None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    return tepe / (1024 * 1024) if sys.platform == "darwin" else tepe / 1024
+
+
+def bilgi_bellegi_olc(bilgiler: Mapping, ornek_sayisi: int = 20000) -> Dict[str, float]:
+    """Bilgi başına bellek (bayt): JSON'dan yüklenen sözlükler ve sıkıştırılmış kayıtlar
+
+    İlk ornek_sayisi bilgi JSON metnine yazılıp tracemalloc altında geri okunur.
+    Kayıtlar sözlükler bırakıldıktan sonra ölçülür; paylaştıkları metinler ve
+    sözcükler kayıtlara sayılır.
+    """
+    import tracemalloc
+    from bilgi_kayitlari import BilgiKayitlari
+
+    ornek = dict(itertools.islice(bilgiler.items(), ornek_sayisi))
+    if not ornek:
+        return {}
+    metin = json.dumps(ornek, ensure_ascii=False, default=lambda gorunum: dict(gorunum.items()))
+    sayi = len(ornek)
+    del ornek
+
+    tracemalloc.start()
+    try:
+        sozlukler = json.loads(metin)
+        sozluk_bayt = tracemalloc.get_traced_memory()[0]
+        kayitlar = BilgiKayitlari.sozlukten(sozlukler)
+        del sozlukler
+        kayit_bayt = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kayitlar
+    return {"sozluk_bilgi_bayt": sozluk_bayt / sayi, "kayit_bilgi_bayt": kayit_bayt / sayi}
+
+
+def _ayarlari_yaz(klasor: str, depolama: str) -> str:
+    """Varsayılan ayarları geçici klasöre yönlendirip yaz; hafıza sınırı kapalı"""
+    with open("yapilandirma/ayarlar.json", encoding='utf-8') as f:
+        ayarlar = json.load(f)
+    ayarlar.update({
+        "depolama": depolama,
+        "maksimum_hafiza": 0,
+        "arsiv_dosya": os.path.join(klasor, "bilgi_arsivi.jsonl"),
+        "gecmis_arsiv_klasoru": os.path.join(klasor, "gecmis"),
+        "profil_klasoru": os.path.join(klasor, "kullanicilar"),
+        "goruntu_klasoru": os.path.join(klasor, "goruntu"),
+        "sqlite_dosya": os.path.join(klasor, "bilgi_tabani.db"),
+        "ikili_dosya": os.path.join(klasor, "bilgi_tabani.bin")
+    })
+    ayarlar_dosya = os.path.join(klasor, "ayarlar.json")
+    with open(ayarlar_dosya, 'w', encoding='utf-8') as f:
+        json.dump(ayarlar, f, ensure_ascii=False, indent=2)
+    return ayarlar_dosya
+
+
+def boyutu_olc(boyut: int, klasor: str, tohum: int = 42, depolama: str = "json",
+               sorgu_sayisi: int = 200, ogrenme_sayisi: int = 1000, isci_sayisi: int = 0) -> Dict:
+    """Verilen boyuttaki derlemi klasörde yükleyip tüm ölçümleri al
+
+    Sıra: toplu yükleme, tek tek öğrenme, anlık kayıt, soğuk başlangıç, benzerlik
+    araması, asistan mesaj işleme ve bilgi başına bellek. Asistanın ekrana yazdıkları
+    gizlenir.
+    """
+    from asistan import OgrenenAsistan
+    from ogrenme_modulu import OgrenmeModulu
+    from profil_deposu import ProfilDeposu
+
+    random.seed(tohum)
+    os.makedirs(klasor, exist_ok=True)
+    dosyalar = {
+        "bilgi_tabani_dosya": os.path.join(klasor, "bilgi_tabani.json"),
+        "ogrenme_gecmisi_dosya": os.path.join(klasor, "ogrenme_gecmisi.json"),
+        "ayarlar_dosya": _ayarlari_yaz(klasor, depolama),
+        "arama_indeksi_dosya": os.path.join(klasor, "arama_indeksi.json")
+    }
+    sonuc: Dict[str, float] = {"boyut": boyut}
+
+    modul = OgrenmeModulu(**dosyalar)
+    toplu = modul.toplu_ogren(sentetik_derlem(boyut, tohum), isci_sayisi=isci_sayisi)
+    sonuc["toplu_yukleme_sn"] = toplu["sure"]
+    sonuc["toplu_yukleme_hizi"] = toplu["satir_hizi"]
+
+    # Derlemin devamı tek tek öğrenilir; sorular bilgi tabanındakilerden farklıdır
+    yeni_kayitlar = list(sentetik_derlem(ogrenme_sayisi, tohum, baslangic=boyut))
+    baslangic = time.perf_counter()
+    for soru, cevap, konu in yeni_kayitlar:
+        modul.yeni_bilgi_ogren(soru, cevap, konu)
+    sure = time.perf_counter() - baslangic
+    sonuc["yeni_bilgi_hizi"] = len(yeni_kayitlar) / sure if sure > 0 else 0.0
+
+    baslangic = time.perf_counter()
+    modul.verileri_kaydet()
+    sonuc["kaydetme_sn"] = time.perf_counter() - baslangic
+    modul.kapat()
+
+    baslangic = time.perf_counter()
+    modul = OgrenmeModulu(**dosyalar)
+    sonuc["soguk_baslangic_sn"] = time.perf_counter() - baslangic
+
+    sorgular = sentetik_sorgular(boyut, sorgu_sayisi * 2, tohum)
+    for ad, deger in _gecikmeler(modul.benzer_bilgi_bul, sorgular[::2]).items():
+        sonuc[f"benzer_bilgi_bul_{ad}_ms"] = deger
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        asistan = OgrenenAsistan(
+            ogrenme_modulu=modul,
+            profil_deposu=ProfilDeposu(os.path.join(klasor, "kullanicilar"),
+                                       os.path.join(klasor, "kullanici_profilleri.json"))
+        )
+        gecikmeler = _gecikmeler(asistan.mesaj_isle, sorgular[1::2])
+    for ad, deger in gecikmeler.items():
+        sonuc[f"mesaj_isle_{ad}_ms"] = deger
+
+    tepe = tepe_bellek_mb()
+    if tepe is not None:
+        sonuc["tepe_rss_mb"] = tepe
+    # Bilgilerin JSON kopyasını oluşturduğu için tepe bellekten sonra ölçülür
+    sonuc.update(bilgi_bellegi_olc(modul.bilgi_tabani.get("bilgiler", {})))
+    modul.kapat()
+    return sonuc
+
+
+def _alt_surecte_olc(boyut: int, argumanlar: argparse.Namespace) -> Optional[Dict]:
+    """Boyutu ayrı bir Python sürecinde ölç; tepe bellek diğer boyutlara karışmaz"""
+    klasor = tempfile.mkdtemp(prefix="kiyaslama_")
+    try:
+        sonuc_dosya = os.path.join(klasor, "sonuc.json")
+        komut = [
+            sys.executable, os.path.abspath(__file__), "--tek-boyut", str(boyut),
+            "--klasor", os.path.join(klasor, "veri"), "--cikti", sonuc_dosya,
+            "--tohum", str(argumanlar.tohum), "--depolama", argumanlar.depolama,
+            "--sorgu", str(argumanlar.sorgu), "--ogrenme", str(argumanlar.ogrenme),
+            "--isci", str(argumanlar.isci)
+        ]
+        if subprocess.run(komut).returncode != 0 or not os.path.exists(sonuc_dosya):
+            return None
+        with open(sonuc_dosya, encoding='utf-8') as f:
+            return json.load(f)
+    finally:
+        shutil.rmtree(klasor, ignore_errors=True)
+
+
+def karsilastir(sonuclar: Dict, temel: Dict, esik: float) -> List[str]:
+    """Temel ölçüme göre eşikten fazla kötüleşen ölçümlerin açıklamaları
+
+    Süre ve bellek ölçümlerinde artış, _hizi ile biten ölçümlerde düşüş kötüleşmedir.
+    Yalnızca iki tarafta da bulunan boyut ve ölçümler karşılaştırılır.
+    """
+    gerilemeler = []
+    for boyut, olcumler in sonuclar.get("boyutlar", {}).items():
+        temel_olcumler = temel.get("boyutlar", {}).get(boyut)
+        if not temel_olcumler:
+            continue
+        for ad, deger in olcumler.items():
+            eski = temel_olcumler.get(ad)
+            if ad == "boyut" or not eski:
+                continue
+            oran = deger / eski - 1
+            if ad.endswith(YUKSEK_IYI_EKLER):
+                oran = -oran
+            if oran > esik:
+                gerilemeler.append(f"{boyut} bilgi, {ad}: {eski:.4g} -> {deger:.4g} (%{oran * 100:.0f} kötü)")
+    return gerilemeler
+
+
+def tek_boyut(argumanlar: argparse.Namespace) -> int:
+    """Alt süreç girişi: tek boyutu ölç ve sonucu dosyaya yaz"""
+    sonuc = boyutu_olc(argumanlar.tek_boyut, argumanlar.klasor, argumanlar.tohum,
+                       argumanlar.depolama, argumanlar.sorgu, argumanlar.ogrenme, argumanlar.isci)
+    with open(argumanlar.cikti, 'w', encoding='utf-8') as f:
+        json.dump(sonuc, f)
+    return 0
+
+
+def kiyasla(argumanlar: argparse.Namespace) -> int:
+    """Tüm boyutları ölç, sonuçları yaz ve istenirse temel ölçümle karşılaştır"""
+    sonuclar = {
+        "tarih": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tohum": argumanlar.tohum,
+        "depolama": argumanlar.depolama,
+        "boyutlar": {}
+    }
+
+    for boyut in argumanlar.boyutlar:
+        print(f"⏱️ {boyut} bilgi ölçülüyor...")
+        sonuc = _alt_surecte_olc(boyut, argumanlar)
+        if sonuc is None:
+            print(f"❌ {boyut} bilgilik ölçüm başarısız oldu")
+            return 1
+        sonuclar["boyutlar"][str(boyut)] = sonuc
+        print(f"   📥 Toplu yükleme: {sonuc['toplu_yukleme_sn']:.2f} sn, "
+              f"📚 öğrenme: {sonuc['yeni_bilgi_hizi']:.0f}/sn, "
+              f"💾 kayıt: {sonuc['kaydetme_sn']:.2f} sn, "
+              f"🚀 soğuk başlangıç: {sonuc['soguk_baslangic_sn']:.2f} sn")
+        print(f"   🔍 benzer_bilgi_bul p50/p95/p99: {sonuc['benzer_bilgi_bul_p50_ms']:.2f}/"
+              f"{sonuc['benzer_bilgi_bul_p95_ms']:.2f}/{sonuc['benzer_bilgi_bul_p99_ms']:.2f} ms, "
+              f"💬 mesaj_isle: {sonuc['mesaj_isle_p50_ms']:.2f}/{sonuc['mesaj_isle_p95_ms']:.2f}/"
+              f"{sonuc['mesaj_isle_p99_ms']:.2f} ms")
+        if "tepe_rss_mb" in sonuc:
+            print(f"   🧠 Tepe bellek: {sonuc['tepe_rss_mb']:.0f} MB")
+        if "kayit_bilgi_bayt" in sonuc:
+            print(f"   🧮 Bilgi başına bellek: sözlük {sonuc['sozluk_bilgi_bayt']:.0f} B → "
+                  f"kayıt {sonuc['kayit_bilgi_bayt']:.0f} B")
+
+    with open(argumanlar.cikti, 'w', encoding='utf-8') as f:
+        json.dump(sonuclar, f, ensure_ascii=False, indent=2)
+    print(f"✅ Sonuçlar {argumanlar.cikti} dosyasına yazıldı")
+
+    if not argumanlar.temel:
+        return 0
+    try:
+        with open(argumanlar.temel, encoding='utf-8') as f:
+            temel = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Temel ölçüm okunamadı: {e}")
+        return 1
+
+    gerilemeler = karsilastir(sonuclar, temel, argumanlar.esik)
+    if gerilemeler:
+        print(f"⚠️ {len(gerilemeler)} ölçüm %{argumanlar.esik * 100:.0f} eşiğinden fazla kötüleşti:")
+        for aciklama in gerilemeler:
+            print(f"   ❌ {aciklama}")
+        return 1
+    print(f"✅ Temel ölçüme göre %{argumanlar.esik * 100:.0f} eşiğini aşan kötüleşme yok")
+    return 0
+
+
+def _boyut_listesi(metin: str) -> List[int]:
+    return [int(parca) for parca in metin.split(",") if parca.strip()]
+
+
+def main(argv=None) -> int:
+    """Komut satırı argümanlarını çözümle ve kıyaslamayı çalıştır"""
+    ayristirici = argparse.ArgumentParser(description="Öğrenen Asistan performans kıyaslaması")
+    ayristirici.add_argument("--boyutlar", type=_boyut_listesi, default=[1000, 10000, 100000],
+                             help="virgülle ayrılmış derlem boyutları (ör. 1000,10000,100000,1000000)")
+    ayristirici.add_argument("--cikti", default="kiyaslama_sonuclari.json")
+    ayristirici.add_argument("--temel", help="karşılaştırılacak önceki sonuç dosyası")
+    ayristirici.add_argument("--esik", type=float, default=0.20,
+                             help="kötüleşme sayılacak oran (0.20: %%20)")
+    ayristirici.add_argument("--tohum", type=int, default=42)
+    ayristirici.add_argument("--depolama", choices=("json", "sqlite", "ikili"), default="json")
+    ayristirici.add_argument("--sorgu", type=int, default=200, help="gecikme ölçümü başına sorgu sayısı")
+    ayristirici.add_argument("--ogrenme", type=int, default=1000, help="tek tek öğrenilecek bilgi sayısı")
+    ayristirici.add_argument("--isci", type=int, default=0, help="toplu yüklemede analiz süreci sayısı")
+    ayristirici.add_argument("--tek-boyut", type=int, help=argparse.SUPPRESS)
+    ayristirici.add_argument("--klasor", help=argparse.SUPPRESS)
+
+    argumanlar = ayristirici.parse_args(argv)
+    if argumanlar.tek_boyut is not None:
+        return tek_boyut(argumanlar)
+    return kiyasla(argumanlar)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
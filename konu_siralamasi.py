@@ -0,0 +1,102 @@
+"""
+Konu Sıralaması Modülü
+Bu modül her konunun bilgilerini başarı skoru ve kullanım sayısına göre sıralı tutar.
+Sıralama öğrenme, kullanım, güncelleme ve unutmada yerinde güncellenir; bir konunun en
+iyi k bilgisi konu listesi baştan sıralanmadan okunur.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# (-başarı skoru, -kullanım sayısı, eklenme sırası, bilgi_id); küçük olan önce gelir
+SiraAnahtari = Tuple[float, int, int, str]
+
+
+def sira_anahtari(bilgi: Mapping, sira: int) -> SiraAnahtari:
+    """Bilginin konusundaki sıralama anahtarı; eşitlikte önce eklenen önde"""
+    return (-bilgi.get("basari_skoru", 0.0), -bilgi.get("kullanim_sayisi", 1), sira, bilgi["id"])
+
+
+class KonuSiralamasi:
+    def __init__(self):
+        """Konu başına sıralı anahtar listeleri
+
+        Bir konunun listesi ilk sorulduğunda konu listesinden kurulur (tüm bilgi
+        tabanı başlangıçta çözülmez); henüz kurulmamış konulara gelen değişiklikler
+        atlanır, kurulum zaten güncel halleri okur. Ekleme ve çıkarma ikili aramayla
+        yapılır, en iyi k bilgi listenin başından okunur.
+        """
+        self._listeler: Dict[str, List[SiraAnahtari]] = {}
+        self._anahtarlar: Dict[str, Tuple[str, SiraAnahtari]] = {}
+        self._sonraki_sira: Dict[str, int] = {}
+        self._kilit = threading.Lock()
+
+    def __contains__(self, konu: str) -> bool:
+        return konu in self._listeler
+
+    def en_iyiler(self, konu: str, limit: int,
+                  kaynak: Callable[[], Iterable[Tuple[str, Optional[Mapping]]]]) -> List[str]:
+        """Konunun en iyi limit bilgisinin kimlikleri
+
+        kaynak, konu henüz kurulmadıysa (bilgi_id, bilgi) çiftlerini konu listesi
+        sırasıyla verir; silinmiş bilgiler için bilgi None olabilir.
+        """
+        with self._kilit:
+            liste = self._listeler.get(konu)
+            if liste is None:
+                liste = self._kur(konu, kaynak())
+            return [anahtar[3] for anahtar in liste[:limit]]
+
+    def _kur(self, konu: str, ogeler: Iterable[Tuple[str, Optional[Mapping]]]) -> List[SiraAnahtari]:
+        liste = []
+        sira = 0
+        for bilgi_id, bilgi in ogeler:
+            if bilgi is None:
+                continue
+            anahtar = sira_anahtari(bilgi, sira)
+            liste.append(anahtar)
+            self._anahtarlar[bilgi_id] = (konu, anahtar)
+            sira += 1
+        liste.sort()
+        self._listeler[konu] = liste
+        self._sonraki_sira[konu] = sira
+        return liste
+
+    def ekle(self, bilgi: Mapping):
+        """Yeni öğrenilen bilgiyi konusunun sonuna (eşitler arasında en sona) ekle"""
+        konu = bilgi["konu"]
+        with self._kilit:
+            liste = self._listeler.get(konu)
+            if liste is None or bilgi["id"] in self._anahtarlar:
+                return
+            sira = self._sonraki_sira[konu]
+            self._sonraki_sira[konu] = sira + 1
+            anahtar = sira_anahtari(bilgi, sira)
+            insort(liste, anahtar)
+            self._anahtarlar[bilgi["id"]] = (konu, anahtar)
+
+    def guncelle(self, bilgi: Mapping):
+        """Kullanım ya da başarı skoru değişen bilgiyi yeni yerine taşı"""
+        with self._kilit:
+            kayit = self._anahtarlar.get(bilgi["id"])
+            if kayit is None:
+                return
+            konu, eski = kayit
+            yeni = sira_anahtari(bilgi, eski[2])
+            if yeni == eski:
+                return
+            liste = self._listeler[konu]
+            del liste[bisect_left(liste, eski)]
+            insort(liste, yeni)
+            self._anahtarlar[bilgi["id"]] = (konu, yeni)
+
+    def cikar(self, bilgi_id: str):
+        """Unutulan bilgiyi konusundan çıkar"""
+        with self._kilit:
+            kayit = self._anahtarlar.pop(bilgi_id, None)
+            if kayit is None:
+                return
+            konu, anahtar = kayit
+            liste = self._listeler[konu]
+            del liste[bisect_left(liste, anahtar)]
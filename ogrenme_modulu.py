@@ -3,140 +3,663 @@
 Bu modül asistanın öğrenme yeteneklerini sağlar: bilgi depolama, analiz, bağlantı kurma
 """
 
-import json
+import os
+import time
+import threading
 import datetime
-from typing import Dict, List, Any, Optional
-from dil_isleme import TurkceDilIsleme
+from collections import Counter, defaultdict, deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from dil_isleme import TurkceDilIsleme, MesajAnalizi
+from arama_indeksi import NgramIndeksi
+from vektor_arama import TfidfIndeksi, numpy_var_mi
+from onbellek import SorguOnbellegi
+from hafiza import UnutmaYigini
+from konu_siralamasi import KonuSiralamasi
+from bilgi_kayitlari import BilgiGorunumu, BilgiKayitlari
+from tekrar_indeksi import MinHashIndeksi, cevap_puani
+from gecmis import GecmisArsivi, sayaclari_guncelle
+from eszamanlilik import OkumaYazmaKilidi, SiraliIsKuyrugu
+from olcum import olcumler, zamanla
+from depolama import JsonDepo, KayitIscisi, gunluk_yolu, json_yukle, json_kaydet, jsonl_ekle
+
+# Toplu öğrenmede her analiz sürecinin kendi dil işleme nesnesi
+_toplu_dil_isleme: Optional[TurkceDilIsleme] = None
+
+
+def _toplu_analiz_baslat(dil_kurallari_dosya: str):
+    """Süreç havuzundaki analiz sürecini hazırla"""
+    global _toplu_dil_isleme
+    _toplu_dil_isleme = TurkceDilIsleme(dil_kurallari_dosya)
+
+
+def _toplu_analiz_et(kullanici_mesaj: str) -> MesajAnalizi:
+    """Mesajı süreç havuzunda analiz et"""
+    return _toplu_dil_isleme.mesaj_analizi(kullanici_mesaj)
+
 
 class OgrenmeModulu:
     def __init__(self, 
                  bilgi_tabani_dosya: str = "veri/bilgi_tabani.json",
                  ogrenme_gecmisi_dosya: str = "veri/ogrenme_gecmisi.json",
-                 ayarlar_dosya: str = "yapilandirma/ayarlar.json"):
+                 ayarlar_dosya: str = "yapilandirma/ayarlar.json",
+                 arama_indeksi_dosya: str = "veri/arama_indeksi.json",
+                 gunluk_dosya: str = None,
+                 depo=None,
+                 dil_isleme: Optional[TurkceDilIsleme] = None):
+        """Öğrenme modülünü başlat
+        
+        dil_isleme verilirse asistanla aynı dil işleme nesnesi (ve derlenmiş
+        sözlükleri) paylaşılır. Başlangıç aşamalarının süreleri
+        baslangic_sureleri sözlüğünde saniye olarak tutulur.
+        """
+        self.baslangic_sureleri: Dict[str, float] = {}
+        zaman = time.perf_counter()
         
         self.bilgi_tabani_dosya = bilgi_tabani_dosya
         self.ogrenme_gecmisi_dosya = ogrenme_gecmisi_dosya
         self.ayarlar_dosya = ayarlar_dosya
+        self.arama_indeksi_dosya = arama_indeksi_dosya
+        self.gunluk_dosya = gunluk_dosya or gunluk_yolu(bilgi_tabani_dosya)
         
-        # Dil işleme modülünü başlat
-        self.dil_isleme = TurkceDilIsleme()
+        # Dil işleme modülünü başlat (verilmediyse)
+        self.dil_isleme = dil_isleme or TurkceDilIsleme()
+        zaman = self._sure_kaydet("dil_isleme", zaman)
         
         # Verileri yükle
-        self.bilgi_tabani = self._yukle_json(bilgi_tabani_dosya)
-        self.ogrenme_gecmisi = self._yukle_json(ogrenme_gecmisi_dosya)
         self.ayarlar = self._yukle_json(ayarlar_dosya)
         
+        # Diske yazmaları yanıt yolundan çıkaran arka plan işçisi
+        self.kayit_iscisi = KayitIscisi(
+            self.ayarlar.get("kayit_araligi", 1.0),
+            self.ayarlar.get("kayit_esigi", 100)
+        )
+        # Aramalar okuma, öğrenme ve güncellemeler yazma kilidiyle çalışır
+        self._kilit = OkumaYazmaKilidi()
+        # Anlık kayıt okuma kilidiyle alınır; iki kayıt aynı anda yazılmasın
+        self._sikistirma_kilidi = threading.Lock()
+        
+        # Yanıt yolundan çıkarılan öğrenmeler tek iş parçacığında geliş sırasıyla uygulanır
+        self.ogrenme_kuyrugu = SiraliIsKuyrugu(self.ayarlar.get("ogrenme_kuyrugu_boyutu", 1000), "ogrenme-kuyrugu")
+        
+        # Kullanım sayısı artışları kilitsiz bir kuyrukta birikip toplu işlenir
+        self._kullanim_tamponu: Deque[str] = deque()
+        self.kullanim_tampon_boyutu = self.ayarlar.get("kullanim_tampon_boyutu", 64)
+        
+        zaman = self._sure_kaydet("ayarlar", zaman)
+        
+        self.depo = depo or self._depo_olustur()
+        self.bilgi_tabani, self.ogrenme_gecmisi = self.depo.yukle()
+        if self.depo.bellekte:
+            self._mesaj_alanlarini_doldur()
+            self._kayitlara_cevir()
+        zaman = self._sure_kaydet("depo_yukleme", zaman)
+        
         # Öğrenme parametreleri
         self.ogrenme_hizi = self.ayarlar.get("ogrenme_hizi", 0.8)
         self.ogrenme_esigi = self.ayarlar.get("ogrenme_esigi", 0.7)
         self.benzerlik_esigi = self.ayarlar.get("benzerlik_esigi", 0.6)
+        self.aday_limiti = self.ayarlar.get("aday_limiti", 500)
+        self.tam_tarama_uzunlugu = self.ayarlar.get("tam_tarama_uzunlugu", 3)
+        
+        # Benzerlik araması için n-gram indeksi (SQLite deposu kendi FTS indeksini kullanır)
+        self.arama_indeksi = self._arama_indeksini_hazirla() if self.depo.bellekte else None
+        zaman = self._sure_kaydet("arama_indeksi", zaman)
+        
+        # Konu bilgileri başarı ve kullanıma göre sıralı tutulur (SQLite deposu kendisi sıralar)
+        self.konu_siralamasi = KonuSiralamasi()
+        
+        # Neredeyse aynı mesajlar mevcut bilgiyle birleştirilir (0 ise kapalı); indeks ilk öğrenmede kurulur
+        self.tekrar_esigi = self.ayarlar.get("tekrar_esigi", 0.98)
+        self.tekrar_indeksi: Optional[MinHashIndeksi] = None
+        
+        # Tekrarlanan sorgular için benzerlik arama sonuçları
+        self.sorgu_onbellegi = SorguOnbellegi(
+            self.ayarlar.get("onbellek_boyutu", 1000),
+            self.ayarlar.get("onbellek_suresi", 300)
+        )
+        
+        # Öğrenme geçmişinin son kayıtları bellekte, eskileri arşiv segmentlerinde
+        self.gecmis_arsivi = GecmisArsivi(self.ayarlar.get("gecmis_arsiv_klasoru", "veri/gecmis"))
+        self._arsivlenecek_kayitlar: List[Dict] = []
+        if self.depo.bellekte:
+            self._gecmis_halkasini_hazirla(self.ayarlar.get("gecmis_tampon_boyutu", 1000))
+        
+        # Son anlık kayıttan sonraki olayları günlükten geri yükle
+        for olay, bilgiye, gecmise in self.depo.bekleyen_olaylar():
+            self._olay_uygula(olay, bilgiye, gecmise)
+        zaman = self._sure_kaydet("gunluk_oynatma", zaman)
+        
+        # Hafıza sınırı (0 ise sınırsız); aşılınca tutma skoru en düşük bilgiler unutulur.
+        # Sınır öğrenmede uygulanır: aktarma gibi yalnızca okuyan işlemler bilgi unutturmaz
+        self.maksimum_hafiza = self.ayarlar.get("maksimum_hafiza", 10000)
+        self.arsiv_dosya = self.ayarlar.get("arsiv_dosya", "veri/bilgi_arsivi.jsonl")
+        self._arsivlenecek_bilgiler: List[Dict] = []
+        self.unutma_yigini = None
+        if self.maksimum_hafiza > 0:
+            self.unutma_yigini = UnutmaYigini(self.ayarlar.get("hafiza_yari_omru_gun", 30))
+            self.unutma_yigini.olustur(self.bilgi_tabani.get("bilgiler", {}))
+        self._sure_kaydet("unutma_yigini", zaman)
+    
+    def _sure_kaydet(self, asama: str, baslangic: float) -> float:
+        """Başlangıç aşamasının süresini kaydet, bir sonraki aşamanın başlangıcını döndür"""
+        simdi = time.perf_counter()
+        self.baslangic_sureleri[asama] = simdi - baslangic
+        return simdi
+    
+    def _depo_olustur(self):
+        """Ayarlardaki depolama türüne göre depoyu oluştur"""
+        depolama = self.ayarlar.get("depolama", "json")
+        if depolama == "sqlite":
+            from sqlite_depo import SqliteDepo
+            return SqliteDepo(self.ayarlar.get("sqlite_dosya", "veri/bilgi_tabani.db"))
+        
+        if depolama == "ikili":
+            from ikili_depo import IkiliDepo
+            return IkiliDepo(
+                self.ayarlar.get("ikili_dosya", "veri/bilgi_tabani.bin"),
+                self.bilgi_tabani_dosya,
+                self.ogrenme_gecmisi_dosya,
+                self.gunluk_dosya,
+                fsync=self.ayarlar.get("gunluk_fsync", False),
+                sikistirma_esigi=self.ayarlar.get("gunluk_sikistirma_esigi", 1000),
+                kayit_iscisi=self.kayit_iscisi
+            )
+        
+        return JsonDepo(
+            self.bilgi_tabani_dosya,
+            self.ogrenme_gecmisi_dosya,
+            self.gunluk_dosya,
+            fsync=self.ayarlar.get("gunluk_fsync", False),
+            sikistirma_esigi=self.ayarlar.get("gunluk_sikistirma_esigi", 1000),
+            kayit_iscisi=self.kayit_iscisi
+        )
+    
+    def _indeks_imzasi(self) -> str:
+        """Kayıtlı indeksin bilgi tabanıyla uyumunu kontrol etmek için imza"""
+        istatistikler = self.bilgi_tabani.get("istatistikler", {})
+        return f"{len(self.bilgi_tabani.get('bilgiler', {}))}:{istatistikler.get('son_guncelleme', '')}"
+    
+    def _arama_indeksini_hazirla(self):
+        """İndeksi dosyadan yükle, güncel değilse bilgi tabanından oluştur
+        
+        Ayarlarda "arama_motoru": "tfidf" seçiliyse ve numpy kuruluysa TF-IDF
+        matrisi kullanılır; matris indeks dosyasının yanındaki .npz dosyasında saklanır.
+        İkili görüntü deposu kendi n-gram tablolarını verir, indeks kurulmaz.
+        """
+        indeks = self.depo.arama_indeksi()
+        if indeks is not None:
+            return indeks
+        
+        metinler = (
+            (bilgi_id, bilgi["temiz_mesaj"])
+            for bilgi_id, bilgi in self.bilgi_tabani.get("bilgiler", {}).items()
+        )
+        
+        if self.ayarlar.get("arama_motoru", "ngram") == "tfidf":
+            if numpy_var_mi():
+                self.arama_indeksi_dosya = os.path.splitext(self.arama_indeksi_dosya)[0] + "_tfidf.npz"
+                indeks = TfidfIndeksi()
+                if not indeks.yukle(self.arama_indeksi_dosya, self._indeks_imzasi()):
+                    indeks.olustur(metinler)
+                return indeks
+            print("⚠️ TF-IDF arama motoru için numpy kurulu değil, n-gram indeksi kullanılıyor")
+        
+        indeks = NgramIndeksi()
+        if indeks.yukle(self.arama_indeksi_dosya, self._indeks_imzasi()):
+            return indeks
+        
+        indeks.olustur(metinler)
+        return indeks
+    
+    def _gecmis_halkasini_hazirla(self, boyut: int):
+        """Geçmiş kayıtlarını sınırlı halkaya çevir, sığmayanları arşive ayır
+        
+        Gün bazlı özet olmayan eski dosyalarda özet eldeki kayıtlardan çıkarılır.
+        """
+        kayitlar = list(self.ogrenme_gecmisi.get("ogrenme_kayitlari", []))
+        
+        if "gunluk_ozet" not in self.ogrenme_gecmisi:
+            ozet = {}
+            for kayit in kayitlar:
+                sayaclari_guncelle(ozet, kayit)
+            self.ogrenme_gecmisi["gunluk_ozet"] = ozet.get("gunluk_ozet", {})
+        
+        fazla = len(kayitlar) - boyut
+        if fazla > 0:
+            self._arsivlenecek_kayitlar.extend(kayitlar[:fazla])
+        self.ogrenme_gecmisi["ogrenme_kayitlari"] = deque(kayitlar[max(fazla, 0):], maxlen=boyut)
+    
+    def _mesaj_alanlarini_doldur(self):
+        """Eski JSON dosyalarından gelen bilgilerin normalize alanlarını yüklemede doldur
+        
+        Alanlar sonraki anlık kayıtta dosyaya yazılır. Aramalar okuma kilidiyle
+        paralel çalıştığı için bilgileri değiştirmez, bu alanların dolu olduğuna güvenir.
+        İkili görüntüdeki bilgilerde alanlar zaten doludur.
+        """
+        bilgiler = self.bilgi_tabani.get("bilgiler", {})
+        if not isinstance(bilgiler, dict):
+            return
+        for bilgi in bilgiler.values():
+            self._mesaj_alanlarini_hazirla(bilgi)
+    
+    def _kayitlara_cevir(self):
+        """JSON'dan yüklenen bilgi sözlüklerini sıkıştırılmış kayıtlara çevir
+        
+        Konu listeleri kayıtlardaki kimlik metinlerini paylaşır. İkili görüntüdeki
+        bilgiler zaten dosyada durduğu için çevrilmez.
+        """
+        bilgiler = self.bilgi_tabani.get("bilgiler", {})
+        if not isinstance(bilgiler, dict):
+            return
+        kayitlar = BilgiKayitlari.sozlukten(bilgiler)
+        self.bilgi_tabani["bilgiler"] = kayitlar
+        konular = self.bilgi_tabani.get("konular")
+        if isinstance(konular, dict):
+            for konu, liste in konular.items():
+                konular[konu] = [kayitlar.kimlik(bilgi_id) for bilgi_id in liste]
+    
+    def _mesaj_alanlarini_hazirla(self, bilgi: Dict) -> Dict:
+        """Bilginin normalize edilmiş mesaj alanlarını yoksa hesapla"""
+        if "temiz_mesaj" not in bilgi:
+            temiz_mesaj = self.dil_isleme.temizle_metin(bilgi["kullanici_mesaj"])
+            bilgi["temiz_mesaj"] = temiz_mesaj
+            bilgi["mesaj_uzunlugu"] = len(temiz_mesaj)
+        # Önceki sürümlerin yazdığı kelime listesini hiçbir arama okumaz
+        bilgi.pop("mesaj_kelimeleri", None)
+        return bilgi
     
     def _yukle_json(self, dosya_yolu: str) -> Dict:
         """JSON dosyasını yükle"""
-        try:
-            with open(dosya_yolu, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"⚠️ Dosya bulunamadı: {dosya_yolu}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"⚠️ JSON formatı hatalı: {dosya_yolu}")
-            return {}
+        return json_yukle(dosya_yolu)
     
     def _kaydet_json(self, veri: Dict, dosya_yolu: str) -> bool:
-        """JSON dosyasına kaydet"""
-        try:
-            with open(dosya_yolu, 'w', encoding='utf-8') as f:
-                json.dump(veri, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"❌ Kaydetme hatası {dosya_yolu}: {e}")
-            return False
+        """JSON dosyasına atomik olarak kaydet"""
+        return json_kaydet(veri, dosya_yolu)
     
-    def yeni_bilgi_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None) -> bool:
-        """Yeni bilgiyi öğren ve sakla"""
+    def yeni_bilgi_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None,
+                         analiz: Optional[MesajAnalizi] = None) -> bool:
+        """Yeni bilgiyi öğren ve sakla
+        
+        Mesaj önceden analiz edildiyse analiz sonucu tekrar kullanılır. Aynı konuda
+        neredeyse aynı bir mesaj varsa yeni bilgi açılmaz, mevcut bilgiyle birleştirilir.
+        """
+        return self._bilgi_ogren(kullanici_mesaj, asistan_cevap, konu, analiz) is not None
+    
+    @zamanla("yeni_bilgi_ogren")
+    def _bilgi_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None,
+                     analiz: Optional[MesajAnalizi] = None) -> Optional[bool]:
+        """Öğren; yeni bilgi açıldıysa True, mevcut bilgiyle birleştiyse False, hatada None"""
         try:
+            # Mesajı bir kez analiz et
+            if analiz is None:
+                analiz = self.dil_isleme.mesaj_analizi(kullanici_mesaj)
+            
             # Konuyu belirle
             if not konu:
-                konu = self.dil_isleme.konu_belirle(kullanici_mesaj)
-            
-            # Anahtar kelimeleri çıkart
-            anahtar_kelimeler = self.dil_isleme.anahtar_kelimeleri_cikart(kullanici_mesaj)
-            
-            # Benzersiz ID oluştur
-            bilgi_id = f"{konu}_{len(self.bilgi_tabani.get('bilgiler', {}))}"
-            
-            # Yeni bilgi objesi oluştur
-            yeni_bilgi = {
-                "id": bilgi_id,
-                "kullanici_mesaj": kullanici_mesaj,
-                "asistan_cevap": asistan_cevap,
-                "konu": konu,
-                "anahtar_kelimeler": anahtar_kelimeler,
-                "ogrenme_tarihi": datetime.datetime.now().isoformat(),
-                "kullanim_sayisi": 1,
-                "basari_skoru": 0.0,
-                "guncelleme_tarihi": datetime.datetime.now().isoformat()
-            }
+                konu = analiz.konu
             
-            # Bilgi tabanına ekle
-            if "bilgiler" not in self.bilgi_tabani:
-                self.bilgi_tabani["bilgiler"] = {}
+            with self._kilit.yazma():
+                simdi = datetime.datetime.now().isoformat()
+                
+                tekrar = None
+                if self.tekrar_esigi > 0:
+                    tekrar = self._tekrari_bul(analiz.temiz_metin, konu, self._tekrar_indeksini_hazirla())
+                
+                if tekrar is not None:
+                    self._tekrarla_birlestir(tekrar, asistan_cevap, simdi)
+                else:
+                    # Benzersiz ID oluştur
+                    sayi = self._sonraki_id()
+                    bilgi_id = f"{konu}_{sayi}"
+                    
+                    # Yeni bilgi objesi oluştur
+                    yeni_bilgi = self._bilgi_olustur(bilgi_id, kullanici_mesaj, asistan_cevap, konu, analiz, simdi)
+                    
+                    # Bilgi tabanına ve öğrenme geçmişine ekle, günlüğe yaz
+                    self._olay_isle({
+                        "tip": "ogren",
+                        "bilgi": yeni_bilgi,
+                        "sonraki_id": sayi + 1,
+                        "kayit": self._gecmis_kaydi_olustur("yeni_bilgi", bilgi_id, True, simdi)
+                    })
             
-            self.bilgi_tabani["bilgiler"][bilgi_id] = yeni_bilgi
+            olcumler.artir("ogrenme" if tekrar is None else "tekrar_birlestirme")
+            return tekrar is None
             
-            # Konu kategorisine ekle
-            if "konular" not in self.bilgi_tabani:
-                self.bilgi_tabani["konular"] = {}
+        except Exception as e:
+            print(f"❌ Öğrenme hatası: {e}")
+            self._ogrenme_gecmisine_ekle("yeni_bilgi", "hata", False)
+            return None
+    
+    def arka_planda_ogren(self, kullanici_mesaj: str, asistan_cevap: str, konu: str = None,
+                          analiz: Optional[MesajAnalizi] = None,
+                          ogrenildi: Optional[Callable[[], None]] = None):
+        """Öğrenmeyi kuyruğa bırak ve hemen dön
+        
+        Öğrenme ve indeksleme arka planda sırayla yapılır; kuyruk doluysa yer açılana
+        kadar beklenir. Kayıt ve kapatma önce kuyruğu boşaltır. ogrenildi verilirse
+        yalnızca yeni bilgi açıldığında öğrenme iş parçacığında çağrılır; birleştirme
+        ve hata bildirilmez.
+        """
+        def ogren():
+            if self._bilgi_ogren(kullanici_mesaj, asistan_cevap, konu, analiz) and ogrenildi is not None:
+                ogrenildi()
+        
+        self.ogrenme_kuyrugu.ekle(ogren)
+    
+    def _tekrar_indeksini_hazirla(self) -> MinHashIndeksi:
+        """Tekrar indeksini ilk kullanımda bilgi tabanından kur
+        
+        Diskten okuyan görünümler temiz_mesajlar() ile yalnızca mesajları verirse
+        bilgiler tamamen çözülmez.
+        """
+        if self.tekrar_indeksi is None:
+            bilgiler = self.bilgi_tabani.get("bilgiler", {})
+            indeks = MinHashIndeksi()
+            if hasattr(bilgiler, "temiz_mesajlar"):
+                indeks.olustur(bilgiler.temiz_mesajlar())
+            else:
+                indeks.olustur((bilgi_id, bilgi["temiz_mesaj"]) for bilgi_id, bilgi in bilgiler.items())
+            self.tekrar_indeksi = indeks
+        return self.tekrar_indeksi
+    
+    def _tekrari_bul(self, temiz_mesaj: str, konu: str, indeks: MinHashIndeksi,
+                     esik: float = None) -> Optional[Dict]:
+        """Aynı konuda benzerliği eşiği geçen en benzer bilgi (eşitlikte önce öğrenilen)"""
+        esik = esik or self.tekrar_esigi
+        bilgiler = self.bilgi_tabani.get("bilgiler", {})
+        en_benzer, en_yuksek = None, esik
+        for bilgi_id in indeks.adaylar(temiz_mesaj):
+            bilgi = bilgiler.get(bilgi_id)
+            if bilgi is None or bilgi["konu"] != konu:
+                continue
+            if not NgramIndeksi.uzunluk_uygun(len(temiz_mesaj), len(bilgi["temiz_mesaj"]), esik):
+                continue
+            benzerlik = self.dil_isleme.temiz_benzerlik_hesapla(temiz_mesaj, bilgi["temiz_mesaj"])
+            if benzerlik > en_yuksek or (en_benzer is None and benzerlik >= esik):
+                en_benzer, en_yuksek = bilgi, benzerlik
+        return en_benzer
+    
+    def _tekrarla_birlestir(self, bilgi: Dict, asistan_cevap: str, tarih: str):
+        """Tekrar eden mesajı mevcut bilginin bir kullanımı say, daha iyi cevabı tut"""
+        olay = {
+            "tip": "guncelle",
+            "bilgi_id": bilgi["id"],
+            "kullanim_sayisi": bilgi["kullanim_sayisi"] + 1,
+            "guncelleme_tarihi": tarih,
+            "kayit": self._gecmis_kaydi_olustur("tekrar_birlestirme", bilgi["id"], True, tarih)
+        }
+        if cevap_puani(asistan_cevap) > cevap_puani(bilgi["asistan_cevap"]):
+            olay["asistan_cevap"] = asistan_cevap
+        self._olay_isle(olay)
+    
+    def tekrarlari_birlestir(self, esik: float = None) -> int:
+        """Bilgi tabanındaki neredeyse aynı bilgileri önce öğrenilenle birleştir
+        
+        Bilgiler öğrenilme sırasıyla gezilir. Tekrarın kullanım sayısı ilk bilgiye
+        eklenir, daha iyi cevap tutulur ve tekrar silinir; değişiklikler depoya (JSON
+        deposunda günlüğe) tek seferde yazılır. Silinen bilgi sayısını döndürür.
+        """
+        esik = esik or self.tekrar_esigi
+        if esik <= 0:
+            return 0
+        
+        self.kullanim_sayilarini_isle()
+        with self._kilit.yazma():
+            bilgiler = self.bilgi_tabani.get("bilgiler", {})
+            indeks = MinHashIndeksi()
+            birlesimler: Dict[str, Dict] = {}
+            tekrarlar: List[str] = []
+            for bilgi_id, bilgi in list(bilgiler.items()):
+                ilk = self._tekrari_bul(bilgi["temiz_mesaj"], bilgi["konu"], indeks, esik)
+                if ilk is None:
+                    indeks.ekle(bilgi_id, bilgi["temiz_mesaj"])
+                    continue
+                
+                birlesim = birlesimler.setdefault(ilk["id"], {
+                    "kullanim_sayisi": ilk["kullanim_sayisi"],
+                    "asistan_cevap": ilk["asistan_cevap"]
+                })
+                birlesim["kullanim_sayisi"] += bilgi["kullanim_sayisi"]
+                if cevap_puani(bilgi["asistan_cevap"]) > cevap_puani(birlesim["asistan_cevap"]):
+                    birlesim["asistan_cevap"] = bilgi["asistan_cevap"]
+                tekrarlar.append(bilgi_id)
             
-            if konu not in self.bilgi_tabani["konular"]:
-                self.bilgi_tabani["konular"][konu] = []
+            simdi = datetime.datetime.now().isoformat()
+            olaylar = [{"tip": "guncelle", "bilgi_id": bilgi_id, **alanlar, "guncelleme_tarihi": simdi}
+                       for bilgi_id, alanlar in birlesimler.items()]
+            olaylar += [{"tip": "unut", "bilgi_id": bilgi_id} for bilgi_id in tekrarlar]
             
-            self.bilgi_tabani["konular"][konu].append(bilgi_id)
+            # Konu listeleri silinenler için bir kez süzülür
+            if self.depo.bellekte:
+                for olay in olaylar[:len(birlesimler)]:
+                    self._olay_uygula(olay, istatistik=False)
+                self._bilgileri_sil(tekrarlar)
+                self._istatistikleri_guncelle(simdi)
             
-            # İstatistikleri güncelle
-            self._istatistikleri_guncelle()
+            self.depo.toplu_olay_yaz(olaylar)
+            for olay in olaylar:
+                self._hafizayi_guncelle(olay)
+            self.tekrar_indeksi = indeks
+            self.sorgu_onbellegi.temizle()
+        
+        return len(tekrarlar)
+    
+    def _sonraki_id(self) -> int:
+        """Yeni bilgi kimliğinde kullanılacak sayı
+        
+        Unutulan bilgiler yüzünden bilgi sayısı azalabildiği için sayaç
+        istatistiklerde saklanır; eski dosyalarda bilgi sayısından başlar.
+        """
+        istatistikler = self.bilgi_tabani.setdefault("istatistikler", {})
+        return istatistikler.get("sonraki_id", len(self.bilgi_tabani.get("bilgiler", {})))
+    
+    def _bilgi_olustur(self, bilgi_id: str, kullanici_mesaj: str, asistan_cevap: str, konu: str,
+                       analiz: MesajAnalizi, tarih: str) -> Dict:
+        """Analiz edilmiş mesajdan bilgi tabanı kaydı oluştur"""
+        temiz_mesaj = analiz.temiz_metin
+        return {
+            "id": bilgi_id,
+            "kullanici_mesaj": kullanici_mesaj,
+            "asistan_cevap": asistan_cevap,
+            "konu": konu,
+            "anahtar_kelimeler": analiz.anahtar_kelimeler,
+            "ogrenme_tarihi": tarih,
+            "kullanim_sayisi": 1,
+            "basari_skoru": 0.0,
+            "guncelleme_tarihi": tarih,
+            "temiz_mesaj": temiz_mesaj,
+            "mesaj_uzunlugu": len(temiz_mesaj)
+        }
+    
+    def toplu_ogren(self, satirlar: Iterable[Tuple[str, str, Optional[str]]], parti_boyutu: int = 1000,
+                    isci_sayisi: Optional[int] = None,
+                    ilerleme: Optional[Callable[[int, float], None]] = None) -> Dict:
+        """(soru, cevap, konu) satırlarını partiler halinde öğren, sonunda bir kez kaydet
+        
+        Mesajlar süreç havuzunda paralel analiz edilir; bir parti analiz edilirken
+        önceki parti bilgi tabanına eklenir, bellekte en fazla iki parti bulunur.
+        JSON deposunda olaylar günlüğe tek tek yazılmaz, SQLite deposunda her parti
+        tek bir işlemdir. isci_sayisi 0 ise analiz bu süreçte yapılır. Hafıza sınırı
+        aşılırsa unutulan bilgiler (bu toplu öğrenmede gelenler dahil) unutulan_sayisi
+        olarak ayrıca döner.
+        """
+        baslangic = time.perf_counter()
+        if isci_sayisi is None:
+            isci_sayisi = os.cpu_count() or 1
+        
+        havuz = None
+        if isci_sayisi > 0:
+            from concurrent.futures import ProcessPoolExecutor
+            havuz = ProcessPoolExecutor(
+                isci_sayisi,
+                initializer=_toplu_analiz_baslat,
+                initargs=(self.dil_isleme.dil_kurallari_dosya,)
+            )
+        
+        toplam = unutulan = 0
+        try:
+            bekleyen = None
+            for parti in self._partilere_bol(satirlar, parti_boyutu):
+                mesajlar = [satir[0] for satir in parti]
+                if havuz is not None:
+                    parca = max(1, len(mesajlar) // (isci_sayisi * 4))
+                    analizler = havuz.map(_toplu_analiz_et, mesajlar, chunksize=parca)
+                else:
+                    analizler = map(self.dil_isleme.mesaj_analizi, mesajlar)
+                
+                # Bu parti havuzda analiz edilirken öncekini bilgi tabanına ekle
+                if bekleyen is not None:
+                    ogrenilen, parti_unutulan = self._partiyi_ogren(*bekleyen)
+                    toplam += ogrenilen
+                    unutulan += parti_unutulan
+                    if ilerleme:
+                        ilerleme(toplam, time.perf_counter() - baslangic)
+                bekleyen = (parti, analizler)
             
-            # Öğrenme geçmişini kaydet
-            self._ogrenme_gecmisine_ekle("yeni_bilgi", bilgi_id, True)
+            if bekleyen is not None:
+                ogrenilen, parti_unutulan = self._partiyi_ogren(*bekleyen)
+                toplam += ogrenilen
+                unutulan += parti_unutulan
+                if ilerleme:
+                    ilerleme(toplam, time.perf_counter() - baslangic)
+        finally:
+            if havuz is not None:
+                havuz.shutdown()
+            self.verileri_kaydet()
+        
+        sure = time.perf_counter() - baslangic
+        return {
+            "satir_sayisi": toplam,
+            "unutulan_sayisi": unutulan,
+            "sure": sure,
+            "satir_hizi": toplam / sure if sure > 0 else 0.0
+        }
+    
+    @staticmethod
+    def _partilere_bol(satirlar: Iterable, parti_boyutu: int) -> Iterator[List]:
+        """Satırları akıştan okuyup parti_boyutu uzunluğunda listeler halinde döndür"""
+        parti = []
+        for satir in satirlar:
+            parti.append(satir)
+            if len(parti) >= parti_boyutu:
+                yield parti
+                parti = []
+        if parti:
+            yield parti
+    
+    def _partiyi_ogren(self, parti: List, analizler: Iterable[MesajAnalizi]) -> Tuple[int, int]:
+        """Analiz edilmiş partiyi bilgi tabanına ekle ve depoya tek seferde yaz
+        
+        Öğrenilen ve hafıza sınırı yüzünden unutulan bilgi sayılarını döndürür.
+        """
+        simdi = datetime.datetime.now().isoformat()
+        
+        with self._kilit.yazma():
+            sayi = self._sonraki_id()
+            yeni_bilgiler = []
+            olaylar = []
+            for (kullanici_mesaj, asistan_cevap, konu), analiz in zip(parti, analizler):
+                konu = konu or analiz.konu
+                bilgi = self._bilgi_olustur(f"{konu}_{sayi}", kullanici_mesaj, asistan_cevap,
+                                            konu, analiz, simdi)
+                sayi += 1
+                yeni_bilgiler.append(bilgi)
+                olaylar.append({"tip": "ogren", "bilgi": bilgi, "sonraki_id": sayi})
             
-            # Dosyaya kaydet
-            if self.ayarlar.get("otomatik_kaydet", True):
-                self._kaydet_json(self.bilgi_tabani, self.bilgi_tabani_dosya)
-                self._kaydet_json(self.ogrenme_gecmisi, self.ogrenme_gecmisi_dosya)
+            # Parti geçmişe tek kayıt olarak girer, sayaçlar satır sayısı kadar artar
+            kayit = self._gecmis_kaydi_olustur("toplu_ogrenme", None, True, simdi)
+            kayit["adet"] = len(yeni_bilgiler)
+            olaylar.append({"tip": "gecmis", "kayit": kayit})
             
-            return True
+            # Hafıza sınırını aşan bilgiler aynı partide unutulur
+            unutma_olaylari = self._unutma_olaylari(yeni_bilgiler)
             
-        except Exception as e:
-            print(f"❌ Öğrenme hatası: {e}")
-            self._ogrenme_gecmisine_ekle("yeni_bilgi", "hata", False)
-            return False
+            # Bellekteki depolarda olaylar günlüğe yazılmaz, toplu öğrenme sonunda anlık kayıt alınır
+            if self.depo.bellekte:
+                for olay in olaylar:
+                    self._olay_uygula(olay, istatistik=False)
+                self._bilgileri_sil([olay["bilgi_id"] for olay in unutma_olaylari])
+                self._istatistikleri_guncelle(simdi)
+            else:
+                self.depo.toplu_olay_yaz(olaylar + unutma_olaylari)
+            self.sorgu_onbellegi.temizle()
+            # Toplu öğrenme tekrar denetimi yapmaz; indeks bir sonraki öğrenmede yeniden kurulur
+            self.tekrar_indeksi = None
+        
+        olcumler.artir("ogrenme", len(yeni_bilgiler))
+        return len(yeni_bilgiler), len(unutma_olaylari)
     
+    @zamanla("benzer_bilgi_bul")
     def benzer_bilgi_bul(self, kullanici_mesaj: str, limit: int = 5) -> List[Dict]:
-        """Kullanıcı mesajına benzer bilgileri bul"""
+        """Kullanıcı mesajına benzer bilgileri bul
+        
+        Sonuçlar normalize mesaja göre önbellekte (bilgi_id, skor) olarak tutulur;
+        bilgiler her çağrıda güncel halleriyle döner. Bellekteki kayıtlar kopyalanmaz,
+        değişiklikleri kendi üstünde tutan görünümleri verilir.
+        """
         benzer_bilgiler = []
         
         if "bilgiler" not in self.bilgi_tabani:
             return benzer_bilgiler
+        olcumler.artir("arama")
         
-        for bilgi_id, bilgi in self.bilgi_tabani["bilgiler"].items():
-            # Benzerlik hesapla
-            benzerlik = self.dil_isleme.benzerlik_hesapla(
-                kullanici_mesaj, 
-                bilgi["kullanici_mesaj"]
-            )
+        bilgiler = self.bilgi_tabani["bilgiler"]
+        temiz_mesaj = self.dil_isleme.temizle_metin(kullanici_mesaj)
+        
+        # Aday arama ve sonuçların okunması sırasında bilgi tabanı değişmesin
+        with self._kilit.okuma():
+            skorlar = self.sorgu_onbellegi.getir(temiz_mesaj)
+            olcumler.artir("onbellek_iskalama" if skorlar is None else "onbellek_isabet")
+            if skorlar is None:
+                nesil = self.sorgu_onbellegi.nesil
+                
+                adaylar, kesildi = self._adaylar(temiz_mesaj, bilgiler)
+                skorlar = []
+                for bilgi_id, bilgi in adaylar:
+                    if bilgi is None:
+                        continue
+                    
+                    # Benzerlik hesapla
+                    benzerlik = self.dil_isleme.temiz_benzerlik_hesapla(temiz_mesaj, bilgi["temiz_mesaj"])
+                    
+                    # Eşiği geçenler
+                    if benzerlik >= self.benzerlik_esigi:
+                        skorlar.append((bilgi_id, benzerlik))
+                
+                # Benzerlik skoruna göre sırala
+                skorlar.sort(key=lambda x: x[1], reverse=True)
+                self.sorgu_onbellegi.koy(temiz_mesaj, skorlar, kesildi, nesil)
             
-            # Eşiği geçenler
-            if benzerlik >= self.benzerlik_esigi:
-                bilgi_kopyasi = bilgi.copy()
-                bilgi_kopyasi["benzerlik_skoru"] = benzerlik
-                benzer_bilgiler.append(bilgi_kopyasi)
+            for bilgi_id, benzerlik in skorlar[:limit]:
+                bilgi = bilgiler.get(bilgi_id)
+                if bilgi is None:
+                    continue
+                sonuc = bilgi if isinstance(bilgi, BilgiGorunumu) else bilgi.copy()
+                sonuc["benzerlik_skoru"] = benzerlik
+                benzer_bilgiler.append(sonuc)
         
-        # Benzerlik skoruna göre sırala
-        benzer_bilgiler.sort(key=lambda x: x["benzerlik_skoru"], reverse=True)
+        return benzer_bilgiler
+    
+    def _adaylar(self, temiz_mesaj: str, bilgiler) -> Tuple[Iterable[Tuple[str, Optional[Dict]]], bool]:
+        """Benzerliği hesaplanacak (bilgi_id, bilgi) çiftleri ve aday listesinin kesilip kesilmediği
+        
+        Adaylar bellekteki indeksten ya da depodan gelir; limitten fazlası varsa ortak
+        üçlüsü en çok olan aday_limiti kadarı alınır. Ortak üçlüsü olmadan eşiği
+        geçebilen çok kısa sorgularda tüm bilgiler taranır.
+        """
+        if len(temiz_mesaj) <= self.tam_tarama_uzunlugu:
+            return bilgiler.items(), False
         
-        return benzer_bilgiler[:limit]
+        if self.arama_indeksi is not None:
+            aday_idler = self.arama_indeksi.adaylar(temiz_mesaj, self.benzerlik_esigi, self.aday_limiti)
+        else:
+            aday_idler = self.depo.adaylar(temiz_mesaj, self.benzerlik_esigi, self.aday_limiti)
+        
+        adaylar = ((bilgi_id, bilgiler.get(bilgi_id)) for bilgi_id in aday_idler)
+        return adaylar, len(aday_idler) >= self.aday_limiti
     
+    @zamanla("en_iyi_cevap_bul")
     def en_iyi_cevap_bul(self, kullanici_mesaj: str) -> Optional[str]:
         """Kullanıcı mesajı için en iyi cevabı bul"""
         benzer_bilgiler = self.benzer_bilgi_bul(kullanici_mesaj, 1)
@@ -145,74 +668,319 @@ class OgrenmeModulu:
             # En benzer bilgiyi kullan
             en_iyi_bilgi = benzer_bilgiler[0]
             
-            # Kullanım sayısını artır
-            bilgi_id = en_iyi_bilgi["id"]
-            if bilgi_id in self.bilgi_tabani["bilgiler"]:
-                self.bilgi_tabani["bilgiler"][bilgi_id]["kullanim_sayisi"] += 1
-                self.bilgi_tabani["bilgiler"][bilgi_id]["guncelleme_tarihi"] = datetime.datetime.now().isoformat()
-            
+            self.kullanim_kaydet(en_iyi_bilgi["id"])
             return en_iyi_bilgi["asistan_cevap"]
         
         return None
     
-    def konu_bazli_bilgi_getir(self, konu: str, limit: int = 3) -> List[Dict]:
-        """Belirli bir konuya ait bilgileri getir"""
-        if "konular" not in self.bilgi_tabani or konu not in self.bilgi_tabani["konular"]:
-            return []
+    def kullanim_kaydet(self, bilgi_id: str):
+        """Kullanım sayısı artışını tampona bırak, tampon dolunca toplu işle"""
+        self._kullanim_tamponu.append(bilgi_id)
+        if len(self._kullanim_tamponu) >= self.kullanim_tampon_boyutu:
+            self.kullanim_sayilarini_isle()
+    
+    def kullanim_sayilarini_isle(self) -> int:
+        """Tampondaki kullanım artışlarını bilgi başına tek olay olarak işle
         
-        bilgi_idleri = self.bilgi_tabani["konular"][konu]
-        bilgiler = []
+        Kuyruktan alma kilitsizdir; artışlar yazma kilidi altında güncel sayıya
+        eklendiği için aynı anda boşaltan iş parçacıkları birbirinin artışını ezmez.
+        İşlenen bilgi sayısını döndürür.
+        """
+        artislar = Counter()
+        while True:
+            try:
+                artislar[self._kullanim_tamponu.popleft()] += 1
+            except IndexError:
+                break
         
-        for bilgi_id in bilgi_idleri[:limit]:
-            if bilgi_id in self.bilgi_tabani["bilgiler"]:
-                bilgiler.append(self.bilgi_tabani["bilgiler"][bilgi_id])
+        if not artislar:
+            return 0
         
-        return bilgiler
+        simdi = datetime.datetime.now().isoformat()
+        with self._kilit.yazma():
+            bilgiler = self.bilgi_tabani.get("bilgiler", {})
+            for bilgi_id, artis in artislar.items():
+                # Tamponda beklerken unutulan bilgiler atlanır
+                bilgi = bilgiler.get(bilgi_id)
+                if bilgi is None:
+                    continue
+                self._olay_isle({
+                    "tip": "kullan",
+                    "bilgi_id": bilgi_id,
+                    "kullanim_sayisi": bilgi["kullanim_sayisi"] + artis,
+                    "guncelleme_tarihi": simdi
+                })
+        
+        return len(artislar)
+    
+    def konu_bazli_bilgi_getir(self, konu: str, limit: int = 3) -> List[Dict]:
+        """Belirli bir konuya ait en iyi bilgileri getir
+        
+        Bilgiler başarı skoru, sonra kullanım sayısına göre azalan sırada gelir;
+        eşitlikte önce öğrenilen öndedir.
+        """
+        with self._kilit.okuma():
+            if not self.depo.bellekte:
+                return self.depo.konu_bilgileri(konu, limit)
+            
+            if "konular" not in self.bilgi_tabani or konu not in self.bilgi_tabani["konular"]:
+                return []
+            
+            bilgiler = self.bilgi_tabani["bilgiler"]
+            konu_listesi = self.bilgi_tabani["konular"][konu]
+            bilgi_idleri = self.konu_siralamasi.en_iyiler(
+                konu, limit, lambda: ((bilgi_id, bilgiler.get(bilgi_id)) for bilgi_id in konu_listesi)
+            )
+            
+            return [bilgiler[bilgi_id] for bilgi_id in bilgi_idleri]
     
     def bilgi_guncelle(self, bilgi_id: str, yeni_cevap: str) -> bool:
         """Mevcut bilgiyi güncelle"""
-        if "bilgiler" not in self.bilgi_tabani or bilgi_id not in self.bilgi_tabani["bilgiler"]:
-            return False
+        with self._kilit.yazma():
+            if "bilgiler" not in self.bilgi_tabani or bilgi_id not in self.bilgi_tabani["bilgiler"]:
+                return False
+            
+            self._olay_isle({
+                "tip": "guncelle",
+                "bilgi_id": bilgi_id,
+                "asistan_cevap": yeni_cevap,
+                "guncelleme_tarihi": datetime.datetime.now().isoformat()
+            })
         
-        self.bilgi_tabani["bilgiler"][bilgi_id]["asistan_cevap"] = yeni_cevap
-        self.bilgi_tabani["bilgiler"][bilgi_id]["guncelleme_tarihi"] = datetime.datetime.now().isoformat()
+        return True
+    
+    def _olay_isle(self, olay: Dict):
+        """Olayı bellekteki verilere uygula ve depoya yaz"""
+        with self._kilit.yazma():
+            unutulan = None
+            if olay["tip"] == "unut":
+                unutulan = self.bilgi_tabani.get("bilgiler", {}).get(olay["bilgi_id"])
+            
+            if self.depo.bellekte:
+                self._olay_uygula(olay)
+            
+            if not self.depo.bellekte or self.ayarlar.get("otomatik_kaydet", True):
+                self.depo.olay_yaz(olay)
+                
+                # Günlük büyüdüyse anlık kayda sıkıştırmayı arka plana bırak
+                if self.depo.sikistirma_gerekli():
+                    self.kayit_iscisi.isaretle("sikistir", self._sikistir)
+            
+            # Değişiklik görünür olduktan sonra etkileyebileceği sorguları önbellekten çıkar
+            if olay["tip"] == "ogren":
+                self._onbellegi_gecersiz_kil(olay["bilgi"]["temiz_mesaj"])
+            elif unutulan is not None:
+                self._onbellegi_gecersiz_kil(unutulan["temiz_mesaj"])
+            
+            # Hafıza sınırı yeni bilgiyi hemen unutabilir; indeks ondan önce güncellenir
+            self._tekrar_indeksini_guncelle(olay)
+            self._hafizayi_guncelle(olay)
+    
+    def _tekrar_indeksini_guncelle(self, olay: Dict):
+        """Kurulduysa tekrar indeksine öğrenilen bilgiyi ekle, unutulanı çıkar"""
+        if self.tekrar_indeksi is None:
+            return
         
-        # Kaydet
-        if self.ayarlar.get("otomatik_kaydet", True):
-            self._kaydet_json(self.bilgi_tabani, self.bilgi_tabani_dosya)
+        if olay["tip"] == "ogren":
+            self.tekrar_indeksi.ekle(olay["bilgi"]["id"], olay["bilgi"]["temiz_mesaj"])
+        elif olay["tip"] == "unut":
+            self.tekrar_indeksi.cikar(olay["bilgi_id"])
+    
+    def _hafizayi_guncelle(self, olay: Dict):
+        """Olaydan etkilenen bilginin tutma skorunu güncelle, sınır aşıldıysa unut"""
+        if self.unutma_yigini is None:
+            return
         
-        return True
+        tip = olay["tip"]
+        if tip == "ogren":
+            self.unutma_yigini.guncelle(olay["bilgi"]["id"], olay["bilgi"])
+            self._hafizayi_sinirla()
+        elif tip in ("kullan", "guncelle"):
+            bilgi = self.bilgi_tabani.get("bilgiler", {}).get(olay["bilgi_id"])
+            if bilgi is not None:
+                self.unutma_yigini.guncelle(olay["bilgi_id"], bilgi)
+        elif tip == "unut":
+            self.unutma_yigini.cikar(olay["bilgi_id"])
+    
+    def _hafizayi_sinirla(self):
+        """Bilgi sayısı maksimum_hafiza değerine inene kadar bilgileri unut"""
+        for olay in self._unutma_olaylari():
+            self._olay_isle(olay)
+    
+    def _unutma_olaylari(self, yeni_bilgiler: List[Dict] = ()) -> List[Dict]:
+        """Hafıza sınırını aşan bilgileri seç, arşivle ve unutma olaylarını döndür
+        
+        yeni_bilgiler henüz bilgi tabanına eklenmemiş ama sayılması gereken bilgilerdir.
+        """
+        if self.unutma_yigini is None:
+            return []
+        
+        yeniler = {}
+        for bilgi in yeni_bilgiler:
+            self.unutma_yigini.guncelle(bilgi["id"], bilgi)
+            yeniler[bilgi["id"]] = bilgi
+        
+        # Tamponda bekleyen kullanımlar unutulacakları seçmeden önce skorlara yansısın
+        if len(self.unutma_yigini) > self.maksimum_hafiza:
+            self.kullanim_sayilarini_isle()
+        
+        bilgiler = self.bilgi_tabani.get("bilgiler", {})
+        unutulanlar = []
+        while len(self.unutma_yigini) > self.maksimum_hafiza:
+            bilgi_id = self.unutma_yigini.en_dusuk()
+            bilgi = yeniler.get(bilgi_id) or bilgiler.get(bilgi_id)
+            if bilgi is not None:
+                unutulanlar.append(bilgi)
+        
+        # Unutulan bilgiler istenirse soğuk arşiv dosyasına arka planda taşınır
+        if unutulanlar and self.arsiv_dosya:
+            self._arsivlenecek_bilgiler.extend(unutulanlar)
+            self.kayit_iscisi.isaretle("bilgi_arsivi", self._bilgi_arsivini_yaz)
+        
+        return [{"tip": "unut", "bilgi_id": bilgi["id"]} for bilgi in unutulanlar]
+    
+    def _bilgi_arsivini_yaz(self):
+        """Unutulmak üzere ayrılan bilgileri arşiv dosyasının sonuna ekle"""
+        bilgiler, self._arsivlenecek_bilgiler = self._arsivlenecek_bilgiler, []
+        if bilgiler and not jsonl_ekle(bilgiler, self.arsiv_dosya):
+            self._arsivlenecek_bilgiler[:0] = bilgiler
     
-    def _istatistikleri_guncelle(self):
+    def _onbellegi_gecersiz_kil(self, temiz_mesaj: str):
+        """Yeni mesajın benzerlik eşiğini geçtiği önbellekteki sorguları çıkar
+        
+        Güncellemeler sorgu sonuçlarını değiştirmez: önbellek yalnızca bilgi
+        kimliklerini tutar, cevaplar her çağrıda bilgi tabanından okunur.
+        """
+        def etkilenir_mi(sorgu: str) -> bool:
+            return (NgramIndeksi.uzunluk_uygun(len(sorgu), len(temiz_mesaj), self.benzerlik_esigi) and
+                    self.dil_isleme.temiz_benzerlik_hesapla(sorgu, temiz_mesaj) >= self.benzerlik_esigi)
+        
+        self.sorgu_onbellegi.gecersiz_kil(etkilenir_mi)
+    
+    def _olay_uygula(self, olay: Dict, bilgiye: bool = True, gecmise: bool = True,
+                     istatistik: bool = True):
+        """Günlük olayını bilgi tabanına ve öğrenme geçmişine uygula
+        
+        Canlı işlemler ve başlangıçtaki günlük oynatma aynı yoldan geçer.
+        Toplu öğrenmede istatistikler parti sonunda bir kez güncellenir.
+        """
+        tip = olay["tip"]
+        
+        if bilgiye and tip == "ogren":
+            bilgi = self._mesaj_alanlarini_hazirla(olay["bilgi"])
+            bilgi_id = bilgi["id"]
+            
+            # Bilgi tabanına ekle
+            if "bilgiler" not in self.bilgi_tabani:
+                self.bilgi_tabani["bilgiler"] = BilgiKayitlari()
+            
+            self.bilgi_tabani["bilgiler"][bilgi_id] = bilgi
+            
+            # Konu kategorisine ekle
+            if "konular" not in self.bilgi_tabani:
+                self.bilgi_tabani["konular"] = {}
+            
+            if bilgi["konu"] not in self.bilgi_tabani["konular"]:
+                self.bilgi_tabani["konular"][bilgi["konu"]] = []
+            
+            self.bilgi_tabani["konular"][bilgi["konu"]].append(bilgi_id)
+            self.konu_siralamasi.ekle(bilgi)
+            
+            # Arama indeksine ekle
+            self.arama_indeksi.ekle(bilgi_id, bilgi["temiz_mesaj"])
+            
+            if "sonraki_id" in olay:
+                self.bilgi_tabani.setdefault("istatistikler", {})["sonraki_id"] = olay["sonraki_id"]
+            
+            # İstatistikleri güncelle
+            if istatistik:
+                self._istatistikleri_guncelle(bilgi["ogrenme_tarihi"])
+        
+        elif bilgiye and tip == "unut":
+            self._bilgileri_sil([olay["bilgi_id"]])
+            if istatistik:
+                self._istatistikleri_guncelle()
+        
+        elif bilgiye and tip in ("kullan", "guncelle"):
+            bilgiler = self.bilgi_tabani.get("bilgiler", {})
+            bilgi = bilgiler.get(olay["bilgi_id"])
+            if bilgi is not None:
+                for alan in ("kullanim_sayisi", "asistan_cevap", "guncelleme_tarihi"):
+                    if alan in olay:
+                        bilgi[alan] = olay[alan]
+                # Görüntüden çözülen bilgi bir kopya, kayıt görünümü değişikliği kendinde tutar; geri yazılır
+                bilgiler[olay["bilgi_id"]] = bilgi
+                self.konu_siralamasi.guncelle(bilgi)
+        
+        if gecmise and "kayit" in olay:
+            self._gecmise_uygula(olay["kayit"])
+    
+    def _bilgileri_sil(self, bilgi_idler: List[str]):
+        """Bilgileri bilgi tabanından, konu listelerinden ve arama indeksinden çıkar"""
+        bilgiler = self.bilgi_tabani.get("bilgiler", {})
+        konular = self.bilgi_tabani.get("konular", {})
+        
+        konu_silinenleri = defaultdict(set)
+        for bilgi_id in bilgi_idler:
+            bilgi = bilgiler.pop(bilgi_id, None)
+            if bilgi is None:
+                continue
+            konu_silinenleri[bilgi["konu"]].add(bilgi_id)
+            self.arama_indeksi.cikar(bilgi_id, bilgi["temiz_mesaj"])
+            self.konu_siralamasi.cikar(bilgi_id)
+        
+        # Her konu listesi bir kez süzülür
+        for konu, silinenler in konu_silinenleri.items():
+            kalanlar = [bilgi_id for bilgi_id in konular.get(konu, []) if bilgi_id not in silinenler]
+            if kalanlar:
+                konular[konu] = kalanlar
+            else:
+                konular.pop(konu, None)
+    
+    def _istatistikleri_guncelle(self, tarih: str = None):
         """Bilgi tabanı istatistiklerini güncelle"""
         if "istatistikler" not in self.bilgi_tabani:
             self.bilgi_tabani["istatistikler"] = {}
         
         self.bilgi_tabani["istatistikler"]["toplam_bilgi"] = len(self.bilgi_tabani.get("bilgiler", {}))
-        self.bilgi_tabani["istatistikler"]["son_guncelleme"] = datetime.datetime.now().isoformat()
+        self.bilgi_tabani["istatistikler"]["son_guncelleme"] = tarih or datetime.datetime.now().isoformat()
         self.bilgi_tabani["istatistikler"]["version"] = "1.0"
     
-    def _ogrenme_gecmisine_ekle(self, islem_tipi: str, bilgi_id: str, basarili: bool):
-        """Öğrenme geçmişine yeni kayıt ekle"""
-        if "ogrenme_kayitlari" not in self.ogrenme_gecmisi:
-            self.ogrenme_gecmisi["ogrenme_kayitlari"] = []
-        
-        kayit = {
-            "tarih": datetime.datetime.now().isoformat(),
+    def _gecmis_kaydi_olustur(self, islem_tipi: str, bilgi_id: str, basarili: bool, tarih: str = None) -> Dict:
+        """Öğrenme geçmişi kaydı oluştur"""
+        return {
+            "tarih": tarih or datetime.datetime.now().isoformat(),
             "islem_tipi": islem_tipi,
             "bilgi_id": bilgi_id,
             "basarili": basarili
         }
+    
+    def _ogrenme_gecmisine_ekle(self, islem_tipi: str, bilgi_id: str, basarili: bool):
+        """Öğrenme geçmişine yeni kayıt ekle"""
+        self._olay_isle({
+            "tip": "gecmis",
+            "kayit": self._gecmis_kaydi_olustur(islem_tipi, bilgi_id, basarili)
+        })
+    
+    def _gecmise_uygula(self, kayit: Dict):
+        """Kaydı öğrenme geçmişine ekle ve sayaçları güncelle
         
-        self.ogrenme_gecmisi["ogrenme_kayitlari"].append(kayit)
+        Halka dolduysa en eski kayıt bir sonraki anlık kayıtta arşive yazılmak üzere ayrılır.
+        """
+        kayitlar = self.ogrenme_gecmisi.get("ogrenme_kayitlari")
+        if not isinstance(kayitlar, deque):
+            kayitlar = deque(kayitlar or [], maxlen=self.ayarlar.get("gecmis_tampon_boyutu", 1000))
+            self.ogrenme_gecmisi["ogrenme_kayitlari"] = kayitlar
         
-        # İstatistikleri güncelle
-        if basarili:
-            self.ogrenme_gecmisi["basarili_ogrenmeler"] = self.ogrenme_gecmisi.get("basarili_ogrenmeler", 0) + 1
-        else:
-            self.ogrenme_gecmisi["basarisiz_ogrenmeler"] = self.ogrenme_gecmisi.get("basarisiz_ogrenmeler", 0) + 1
+        if len(kayitlar) == kayitlar.maxlen:
+            if kayitlar.maxlen:
+                self._arsivlenecek_kayitlar.append(kayitlar[0])
+            else:
+                self._arsivlenecek_kayitlar.append(kayit)
+        kayitlar.append(kayit)
         
-        self.ogrenme_gecmisi["son_ogrenme"] = datetime.datetime.now().isoformat()
+        # İstatistikleri güncelle (toplu öğrenme kaydı birden fazla bilgiyi sayar)
+        sayaclari_guncelle(self.ogrenme_gecmisi, kayit)
     
     def ogrenme_istatistikleri_getir(self) -> Dict:
         """Öğrenme istatistiklerini getir"""
@@ -226,12 +994,50 @@ class OgrenmeModulu:
             "basarili_ogrenmeler": basarili,
             "basarisiz_ogrenmeler": basarisiz,
             "basari_orani": (basarili / toplam_ogrenme * 100) if toplam_ogrenme > 0 else 0,
-            "son_ogrenme": self.ogrenme_gecmisi.get("son_ogrenme", "Henüz öğrenme yok")
+            "son_ogrenme": self.ogrenme_gecmisi.get("son_ogrenme", "Henüz öğrenme yok"),
+            "bugun": self.ogrenme_gecmisi.get("gunluk_ozet", {}).get(
+                datetime.date.today().isoformat(), {"basarili": 0, "basarisiz": 0}
+            )
         }
     
+    def goruntu_yaz(self, dosya_yolu: str, nesil: int = 0) -> bool:
+        """Bilgi tabanının salt okunur ikili görüntüsünü yaz (işçi süreçler için)"""
+        import ikili_goruntu
+        
+        with self._kilit.okuma():
+            return ikili_goruntu.goruntu_yaz(self.bilgi_tabani, dosya_yolu, nesil,
+                               meta={"ogrenme": self.ogrenme_istatistikleri_getir()})
+    
+    def kapat(self):
+        """Bekleyen öğrenme ve yazmaları bitir, arka plan işçilerini durdur ve depoyu kapat"""
+        self.ogrenme_kuyrugu.durdur()
+        self.kullanim_sayilarini_isle()
+        self.kayit_iscisi.durdur()
+        self.depo.kapat()
+    
+    @zamanla("verileri_kaydet")
     def verileri_kaydet(self):
-        """Tüm verileri manuel olarak kaydet"""
-        bilgi_kaydedildi = self._kaydet_json(self.bilgi_tabani, self.bilgi_tabani_dosya)
-        gecmis_kaydedildi = self._kaydet_json(self.ogrenme_gecmisi, self.ogrenme_gecmisi_dosya)
+        """Bekleyen öğrenme ve yazmaları bitir, tüm verileri depoya kalıcı olarak yaz"""
+        self.ogrenme_kuyrugu.bosalt()
+        self.kullanim_sayilarini_isle()
+        self.kayit_iscisi.bosalt()
+        return self._sikistir()
+    
+    def _sikistir(self) -> bool:
+        """Anlık kayıt al
+        
+        Kayıt okuma kilidiyle yazılır: aramalar sürer, yeni olaylar kayıt bitene
+        kadar bekler. Anlık kayıt ile sıfırlanan günlük böylece tutarlı kalır.
+        """
+        with self._kilit.okuma(), self._sikistirma_kilidi:
+            # Halkadan taşan kayıtlar anlık kayıttan önce arşive yazılır; anlık kayıt
+            # yazılamazsa günlük oynatılınca aynı kayıtlar tekrar arşive gidebilir
+            if self._arsivlenecek_kayitlar and self.gecmis_arsivi.ekle(self._arsivlenecek_kayitlar):
+                self._arsivlenecek_kayitlar = []
+            
+            kaydedildi = self.depo.kaydet(self.bilgi_tabani, self.ogrenme_gecmisi)
+            
+            if self.arama_indeksi is not None:
+                self.arama_indeksi.kaydet(self.arama_indeksi_dosya, self._indeks_imzasi())
         
-        return bilgi_kaydedildi and gecmis_kaydedildi
+        return kaydedildi
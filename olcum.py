@@ -0,0 +1,223 @@
+"""
+Ölçüm Modülü
+Bu modül yanıt yolundaki aşamaların sürelerini sabit kovalı histogramlarda, öğrenme,
+arama, önbellek isabeti ve yazılan bayt gibi olayları sayaçlarda toplar. Ölçümler
+süreç genelinde tek bir kayıtta tutulur; anlık görüntü olarak okunur ya da Prometheus
+metin biçiminde yazılır. İstenirse örneklenen yavaş istekler cProfile ile kaydedilir.
+"""
+
+import os
+import time
+import random
+import datetime
+import functools
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+# Kova üst sınırları (saniye); son kova sınırsızdır
+VARSAYILAN_KOVALAR = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Sabit kovalı süre histogramı; gözlem başına tek ikili arama ve sayaç artışı"""
+
+    def __init__(self, kovalar: Sequence[float] = VARSAYILAN_KOVALAR):
+        self.kovalar = tuple(kovalar)
+        self.sayilar: List[int] = [0] * (len(self.kovalar) + 1)
+        self.adet = 0
+        self.toplam = 0.0
+        self.en_buyuk = 0.0
+
+    def gozlemle(self, sure: float):
+        self.sayilar[bisect_left(self.kovalar, sure)] += 1
+        self.adet += 1
+        self.toplam += sure
+        if sure > self.en_buyuk:
+            self.en_buyuk = sure
+
+    def yuzdelik(self, oran: float) -> float:
+        """Verilen oranın düştüğü kovanın üst sınırı (sınırsız kovada en büyük gözlem)"""
+        if self.adet == 0:
+            return 0.0
+        sira = max(1, int(oran * self.adet + 0.5))
+        birikmis = 0
+        for no, sayi in enumerate(self.sayilar):
+            birikmis += sayi
+            if birikmis >= sira:
+                return self.kovalar[no] if no < len(self.kovalar) else self.en_buyuk
+        return self.en_buyuk
+
+
+class Olcumler:
+    """Aşama histogramları ve sayaçlar
+
+    Güncellemeler tek bir kilitle yapılır; ölçüm başına maliyet birkaç mikrosaniyedir.
+    Yavaş istek profili profil_orani > 0 ise açıktır: istekler bu oranla örneklenir,
+    aynı anda yalnızca biri profillenir ve profil_esigi saniyeden uzun sürenlerin
+    cProfile çıktısı profil_klasoru altına .prof dosyası olarak yazılır.
+    """
+
+    def __init__(self, kovalar: Sequence[float] = VARSAYILAN_KOVALAR):
+        self.kovalar = tuple(kovalar)
+        self.profil_orani = 0.0
+        self.profil_esigi = 0.25
+        self.profil_klasoru = "veri/profiller"
+        self._sayaclar: Dict[str, float] = {}
+        self._histogramlar: Dict[str, Histogram] = {}
+        self._kilit = threading.Lock()
+        self._profil_kilidi = threading.Lock()
+
+    def ayarla(self, profil_orani: float = None, profil_esigi: float = None, profil_klasoru: str = None):
+        """Yavaş istek profili ayarlarını değiştir (None verilenler korunur)"""
+        if profil_orani is not None:
+            self.profil_orani = profil_orani
+        if profil_esigi is not None:
+            self.profil_esigi = profil_esigi
+        if profil_klasoru is not None:
+            self.profil_klasoru = profil_klasoru
+
+    def artir(self, ad: str, miktar: float = 1):
+        with self._kilit:
+            self._sayaclar[ad] = self._sayaclar.get(ad, 0) + miktar
+
+    def gozlemle(self, asama: str, sure: float):
+        with self._kilit:
+            histogram = self._histogramlar.get(asama)
+            if histogram is None:
+                histogram = self._histogramlar[asama] = Histogram(self.kovalar)
+            histogram.gozlemle(sure)
+
+    @contextmanager
+    def sure(self, asama: str, profil: bool = False) -> Iterator[None]:
+        """Bloğun süresini aşamanın histogramına ekle; profil True ise istek örneklenebilir"""
+        profilci = self._profil_baslat() if profil and self.profil_orani > 0 else None
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            gecen = time.perf_counter() - baslangic
+            self.gozlemle(asama, gecen)
+            if profilci is not None:
+                self._profil_bitir(profilci, asama, gecen)
+
+    def _profil_baslat(self):
+        if random.random() >= self.profil_orani or not self._profil_kilidi.acquire(blocking=False):
+            return None
+        import cProfile
+
+        profilci = cProfile.Profile()
+        try:
+            profilci.enable()
+        except ValueError:
+            # Başka bir profil aracı çalışıyor
+            self._profil_kilidi.release()
+            return None
+        return profilci
+
+    def _profil_bitir(self, profilci, asama: str, gecen: float):
+        profilci.disable()
+        self._profil_kilidi.release()
+        self.artir("profillenen_istek")
+        if gecen < self.profil_esigi:
+            return
+        try:
+            os.makedirs(self.profil_klasoru, exist_ok=True)
+            zaman = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            profilci.dump_stats(os.path.join(self.profil_klasoru, f"{asama}_{zaman}_{gecen * 1000:.0f}ms.prof"))
+            self.artir("kaydedilen_profil")
+        except OSError as e:
+            print(f"❌ Profil yazma hatası: {e}")
+
+    def anlik_goruntu(self) -> Dict:
+        """Sayaçların ve aşama sürelerinin kopyası (süreler milisaniye)"""
+        with self._kilit:
+            asamalar = {}
+            for asama, histogram in self._histogramlar.items():
+                asamalar[asama] = {
+                    "adet": histogram.adet,
+                    "toplam_ms": histogram.toplam * 1000,
+                    "ortalama_ms": histogram.toplam * 1000 / histogram.adet if histogram.adet else 0.0,
+                    "p50_ms": histogram.yuzdelik(0.50) * 1000,
+                    "p95_ms": histogram.yuzdelik(0.95) * 1000,
+                    "p99_ms": histogram.yuzdelik(0.99) * 1000,
+                    "en_buyuk_ms": histogram.en_buyuk * 1000,
+                    "kovalar": list(histogram.sayilar)
+                }
+            return {
+                "kova_sinirlari_ms": [sinir * 1000 for sinir in self.kovalar],
+                "sayaclar": dict(self._sayaclar),
+                "asamalar": asamalar
+            }
+
+    def prometheus_metni(self, onek: str = "ogrenen_asistan") -> str:
+        """Ölçümleri Prometheus metin biçiminde döndür"""
+        with self._kilit:
+            sayaclar = sorted(self._sayaclar.items())
+            histogramlar = sorted(
+                (asama, list(h.sayilar), h.adet, h.toplam) for asama, h in self._histogramlar.items()
+            )
+
+        satirlar = []
+        for ad, deger in sayaclar:
+            satirlar.append(f"# TYPE {onek}_{ad}_total counter")
+            satirlar.append(f"{onek}_{ad}_total {deger}")
+
+        if histogramlar:
+            ad = f"{onek}_asama_sure_saniye"
+            satirlar.append(f"# HELP {ad} Yanıt yolundaki aşamaların süresi")
+            satirlar.append(f"# TYPE {ad} histogram")
+        for asama, sayilar, adet, toplam in histogramlar:
+            birikmis = 0
+            for sinir, sayi in zip(self.kovalar, sayilar):
+                birikmis += sayi
+                satirlar.append(f'{ad}_bucket{{asama="{asama}",le="{sinir:g}"}} {birikmis}')
+            satirlar.append(f'{ad}_bucket{{asama="{asama}",le="+Inf"}} {adet}')
+            satirlar.append(f'{ad}_sum{{asama="{asama}"}} {toplam:.6f}')
+            satirlar.append(f'{ad}_count{{asama="{asama}"}} {adet}')
+        return "\n".join(satirlar) + "\n"
+
+    def prometheus_yaz(self, dosya_yolu: str) -> bool:
+        """Prometheus metnini dosyaya atomik olarak yaz (node_exporter metin dosyası toplayıcısı için)"""
+        gecici_yol = f"{dosya_yolu}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(dosya_yolu) or ".", exist_ok=True)
+            with open(gecici_yol, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_metni())
+            os.replace(gecici_yol, dosya_yolu)
+            return True
+        except OSError as e:
+            print(f"❌ Ölçüm yazma hatası {dosya_yolu}: {e}")
+            return False
+
+    def sifirla(self):
+        with self._kilit:
+            self._sayaclar.clear()
+            self._histogramlar.clear()
+
+
+# Süreç genelindeki ölçüm kaydı
+olcumler = Olcumler()
+
+
+def zamanla(asama: str, profil: bool = False) -> Callable:
+    """Fonksiyonun her çağrısının süresini aşamanın histogramına ekleyen dekoratör"""
+    def dekorator(islev: Callable) -> Callable:
+        if profil:
+            @functools.wraps(islev)
+            def profilli(*args, **kwargs):
+                with olcumler.sure(asama, profil=True):
+                    return islev(*args, **kwargs)
+            return profilli
+        
+        # Sık çağrılan aşamalarda bağlam yöneticisi maliyetinden kaçınılır
+        @functools.wraps(islev)
+        def sarmalayici(*args, **kwargs):
+            baslangic = time.perf_counter()
+            try:
+                return islev(*args, **kwargs)
+            finally:
+                olcumler.gozlemle(asama, time.perf_counter() - baslangic)
+        return sarmalayici
+    return dekorator
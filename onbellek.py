@@ -0,0 +1,99 @@
+"""
+Önbellek Modülü
+Bu modül normalize edilmiş sorgu metnine göre benzerlik arama sonuçlarını saklayan
+boyutu sınırlı, süreli (LRU/TTL) önbellek sağlar.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Önbellekte bir sorgu için saklanan sonuç: [(bilgi_id, benzerlik_skoru), ...]
+Sonuc = List[Tuple[str, float]]
+
+
+class SorguOnbellegi:
+    def __init__(self, boyut: int = 1000, sure: float = 300.0):
+        """Önbelleği oluştur
+
+        boyut: saklanacak en fazla sorgu sayısı (0 ise önbellek kapalı)
+        sure: kaydın geçerli kaldığı saniye (0 ise süresiz)
+        """
+        self.boyut = boyut
+        self.sure = sure
+        self.isabet = 0
+        self.iskalama = 0
+        self._kayitlar: "OrderedDict[str, Tuple[float, bool, Sonuc]]" = OrderedDict()
+        self._nesil = 0
+        self._kilit = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+    @property
+    def nesil(self) -> int:
+        """Her geçersiz kılmada artan sayaç; hesaplama sürerken değiştiyse sonuç saklanmaz"""
+        return self._nesil
+
+    def getir(self, sorgu: str) -> Optional[Sonuc]:
+        """Sorgunun saklanan sonucunu getir, yoksa ya da süresi dolduysa None"""
+        with self._kilit:
+            kayit = self._kayitlar.get(sorgu)
+            if kayit is not None and self.sure > 0 and time.monotonic() - kayit[0] > self.sure:
+                del self._kayitlar[sorgu]
+                kayit = None
+
+            if kayit is None:
+                self.iskalama += 1
+                return None
+
+            self._kayitlar.move_to_end(sorgu)
+            self.isabet += 1
+            return kayit[2]
+
+    def koy(self, sorgu: str, sonuc: Sonuc, kesildi: bool, nesil: int):
+        """Sonucu sakla
+
+        kesildi: aday listesi aday limitine takıldıysa True; böyle sonuçlar her yeni
+        bilgide geçersiz sayılır çünkü yeni bilgi aday listesinden başka bir bilgiyi itebilir.
+        """
+        if self.boyut <= 0:
+            return
+
+        with self._kilit:
+            if nesil != self._nesil:
+                return
+
+            self._kayitlar[sorgu] = (time.monotonic(), kesildi, sonuc)
+            self._kayitlar.move_to_end(sorgu)
+            while len(self._kayitlar) > self.boyut:
+                self._kayitlar.popitem(last=False)
+
+    def gecersiz_kil(self, etkilenir_mi: Callable[[str], bool]) -> int:
+        """Yeni bilginin etkileyebileceği sorguları çıkar, çıkarılan sayısını döndür"""
+        with self._kilit:
+            self._nesil += 1
+            silinecekler = [
+                sorgu for sorgu, (_, kesildi, _) in self._kayitlar.items()
+                if kesildi or etkilenir_mi(sorgu)
+            ]
+            for sorgu in silinecekler:
+                del self._kayitlar[sorgu]
+            return len(silinecekler)
+
+    def temizle(self):
+        """Tüm kayıtları çıkar"""
+        with self._kilit:
+            self._nesil += 1
+            self._kayitlar.clear()
+
+    def istatistikler(self) -> Dict:
+        """İsabet/ıskalama sayaçları ve doluluk"""
+        toplam = self.isabet + self.iskalama
+        return {
+            "isabet": self.isabet,
+            "iskalama": self.iskalama,
+            "isabet_orani": (self.isabet / toplam * 100) if toplam > 0 else 0,
+            "kayit_sayisi": len(self._kayitlar)
+        }
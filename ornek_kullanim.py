@@ -23,7 +23,7 @@ def basit_kullanim():
     
     # 2. Öğrenme modülünü kullan
     print("\n2️⃣ Öğrenme Özellikleri:")
-    ogrenme = OgrenmeModulu()
+    ogrenme = OgrenmeModulu(dil_isleme=dil)
     
     # Yeni bilgi öğret
     soru = "Python nasıl öğrenilir?"
@@ -0,0 +1,126 @@
+"""
+Profil Deposu Modülü
+Bu modül kullanıcı profillerini kullanıcı başına bir dosya olarak, karma değerine göre
+parçalanmış (sharded) bir klasörde tutar. Profiller ilk erişimde yüklenir, sınırlı bir
+LRU önbellekte tutulur ve yalnızca değişenler diske yazılır.
+"""
+
+import os
+import copy
+import json
+import hashlib
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from depolama import atomik_json_yaz
+
+
+class ProfilDeposu:
+    def __init__(self, klasor: str = "veri/kullanicilar",
+                 eski_dosya: str = "veri/kullanici_profilleri.json",
+                 onbellek_boyutu: int = 1000):
+        """Profil deposunu aç; klasör yoksa eski tek dosyalık profillerden oluştur"""
+        self.klasor = klasor
+        self.eski_dosya = eski_dosya
+        self.onbellek_boyutu = onbellek_boyutu
+        self._onbellek: "OrderedDict[str, Dict]" = OrderedDict()
+        self._kirliler: Dict[str, Dict] = {}
+        self._kilit = threading.RLock()
+
+        if not os.path.exists(self._varsayilan_yolu()):
+            self._eski_dosyadan_aktar()
+        self.varsayilan_profil = self._oku(self._varsayilan_yolu()) or {}
+
+    def _varsayilan_yolu(self) -> str:
+        return os.path.join(self.klasor, "varsayilan_profil.json")
+
+    def profil_yolu(self, kullanici_adi: str) -> str:
+        """Kullanıcının profil dosyası: klasor/<ilk iki karakter>/<sha1>.json"""
+        ozet = hashlib.sha1(kullanici_adi.encode('utf-8')).hexdigest()
+        return os.path.join(self.klasor, ozet[:2], ozet + ".json")
+
+    @staticmethod
+    def _oku(dosya_yolu: str) -> Optional[Dict]:
+        try:
+            with open(dosya_yolu, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            print(f"⚠️ JSON formatı hatalı: {dosya_yolu}")
+            return None
+
+    def _dosyaya_yaz(self, dosya_yolu: str, veri: Dict):
+        os.makedirs(os.path.dirname(dosya_yolu), exist_ok=True)
+        atomik_json_yaz(veri, dosya_yolu)
+
+    def _eski_dosyadan_aktar(self):
+        """Tüm kullanıcıları tutan eski profil dosyasını parçalı klasöre bir kez aktar"""
+        eski = self._oku(self.eski_dosya) or {}
+        kullanicilar = eski.get("kullanicilar", {})
+
+        for kullanici_adi, profil in kullanicilar.items():
+            self._dosyaya_yaz(self.profil_yolu(kullanici_adi), profil)
+
+        # Varsayılan profil en son yazılır, varlığı aktarımın bittiğini gösterir
+        self._dosyaya_yaz(self._varsayilan_yolu(), eski.get("varsayilan_profil", {}))
+
+        if kullanicilar:
+            print(f"📦 {len(kullanicilar)} kullanıcı profili {self.klasor} klasörüne aktarıldı")
+
+    def _yukle(self, kullanici_adi: str) -> Optional[Dict]:
+        """Profili önbellekten ya da diskten getir, önbelleğin en yenisi yap"""
+        profil = self._onbellek.get(kullanici_adi)
+        if profil is not None:
+            self._onbellek.move_to_end(kullanici_adi)
+            return profil
+
+        profil = self._kirliler.get(kullanici_adi) or self._oku(self.profil_yolu(kullanici_adi))
+        if profil is None:
+            return None
+
+        self._onbellek[kullanici_adi] = profil
+        # Önbellekten düşen değişmiş profiller yazılana kadar kirliler arasında kalır
+        while len(self._onbellek) > self.onbellek_boyutu:
+            self._onbellek.popitem(last=False)
+        return profil
+
+    def getir(self, kullanici_adi: str) -> Optional[Dict]:
+        """Kullanıcının profilini getir, yoksa None"""
+        with self._kilit:
+            return self._yukle(kullanici_adi)
+
+    def guncelle(self, kullanici_adi: str, degistir: Callable[[Dict], None]) -> Tuple[Dict, bool]:
+        """Profili (yoksa varsayılan profilden oluşturup) değiştir ve kirli işaretle
+
+        (profil, yeni_mi) döndürür.
+        """
+        with self._kilit:
+            profil = self._yukle(kullanici_adi)
+            yeni_mi = profil is None
+            if yeni_mi:
+                profil = copy.deepcopy(self.varsayilan_profil)
+                profil["ad"] = kullanici_adi
+                profil["olusturma_tarihi"] = datetime.datetime.now().isoformat()
+                self._onbellek[kullanici_adi] = profil
+
+            degistir(profil)
+            self._kirliler[kullanici_adi] = profil
+            return profil, yeni_mi
+
+    def yaz(self) -> bool:
+        """Değişen profilleri kendi dosyalarına yaz"""
+        with self._kilit:
+            kirliler = self._kirliler
+            self._kirliler = {}
+
+            basarili = True
+            for kullanici_adi, profil in kirliler.items():
+                try:
+                    self._dosyaya_yaz(self.profil_yolu(kullanici_adi), profil)
+                except Exception as e:
+                    print(f"❌ Profil kaydetme hatası ({kullanici_adi}): {e}")
+                    self._kirliler.setdefault(kullanici_adi, profil)
+                    basarili = False
+            return basarili
@@ -0,0 +1,392 @@
+"""
+SQLite Depo Modülü
+Bu modül bilgi tabanını SQLite veritabanında saklar. Bilgiler, konular ve öğrenme kayıtları
+indeksli tablolarda tutulur, benzer mesaj adayları FTS5 üçlü (trigram) aramasıyla bulunur.
+Veriler belleğe toptan yüklenmez, ihtiyaç duyuldukça sorgulanır.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+from arama_indeksi import NgramIndeksi
+from gecmis import sayaclari_guncelle
+
+SEMA = """
+CREATE TABLE IF NOT EXISTS bilgiler (
+    sira INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    kullanici_mesaj TEXT NOT NULL,
+    asistan_cevap TEXT NOT NULL,
+    konu TEXT NOT NULL,
+    anahtar_kelimeler TEXT NOT NULL DEFAULT '[]',
+    ogrenme_tarihi TEXT,
+    kullanim_sayisi INTEGER NOT NULL DEFAULT 1,
+    basari_skoru REAL NOT NULL DEFAULT 0,
+    guncelleme_tarihi TEXT,
+    temiz_mesaj TEXT NOT NULL,
+    mesaj_uzunlugu INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bilgiler_uzunluk ON bilgiler(mesaj_uzunlugu);
+CREATE INDEX IF NOT EXISTS bilgiler_konu_sirasi ON bilgiler(konu, basari_skoru DESC, kullanim_sayisi DESC, sira);
+
+CREATE TABLE IF NOT EXISTS konular (
+    sira INTEGER PRIMARY KEY AUTOINCREMENT,
+    konu TEXT NOT NULL,
+    bilgi_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS konular_konu ON konular(konu, sira);
+CREATE INDEX IF NOT EXISTS konular_bilgi ON konular(bilgi_id);
+
+CREATE TABLE IF NOT EXISTS ogrenme_kayitlari (
+    sira INTEGER PRIMARY KEY AUTOINCREMENT,
+    tarih TEXT NOT NULL,
+    islem_tipi TEXT NOT NULL,
+    bilgi_id TEXT,
+    basarili INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ogrenme_kayitlari_tarih ON ogrenme_kayitlari(tarih);
+
+CREATE TABLE IF NOT EXISTS meta (
+    anahtar TEXT PRIMARY KEY,
+    deger TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS bilgi_fts USING fts5(temiz_mesaj, tokenize='trigram');
+"""
+
+BILGI_ALANLARI = ("id", "kullanici_mesaj", "asistan_cevap", "konu", "anahtar_kelimeler",
+                  "ogrenme_tarihi", "kullanim_sayisi", "basari_skoru", "guncelleme_tarihi",
+                  "temiz_mesaj", "mesaj_uzunlugu")
+JSON_ALANLARI = ("anahtar_kelimeler",)
+GUNCELLENEBILIR_ALANLAR = ("kullanim_sayisi", "asistan_cevap", "guncelleme_tarihi")
+
+
+def _satirdan_bilgi(satir: Tuple) -> Dict:
+    """Veritabanı satırını bilgi sözlüğüne çevir"""
+    bilgi = dict(zip(BILGI_ALANLARI, satir))
+    for alan in JSON_ALANLARI:
+        bilgi[alan] = json.loads(bilgi[alan])
+    return bilgi
+
+
+def _fts_metni(temiz_mesaj: str) -> str:
+    """FTS tablosuna yazılan metin; NgramIndeksi gibi kelime sınırı üçlüleri için boşlukla çevrili"""
+    return f" {temiz_mesaj} "
+
+
+def _bilgiden_satir(bilgi: Dict) -> Tuple:
+    """Bilgi sözlüğünü veritabanı satırına çevir"""
+    return tuple(
+        json.dumps(bilgi.get(alan, []), ensure_ascii=False) if alan in JSON_ALANLARI else bilgi.get(alan)
+        for alan in BILGI_ALANLARI
+    )
+
+
+class SqliteBilgiler(Mapping):
+    """bilgiler tablosunu bilgi_tabani["bilgiler"] sözlüğü gibi gösteren salt okunur görünüm"""
+
+    def __init__(self, depo: "SqliteDepo"):
+        self._depo = depo
+
+    def __getitem__(self, bilgi_id: str) -> Dict:
+        satir = self._depo.baglanti().execute(
+            f"SELECT {', '.join(BILGI_ALANLARI)} FROM bilgiler WHERE id = ?", (bilgi_id,)
+        ).fetchone()
+        if satir is None:
+            raise KeyError(bilgi_id)
+        return _satirdan_bilgi(satir)
+
+    def __contains__(self, bilgi_id) -> bool:
+        return self._depo.baglanti().execute(
+            "SELECT 1 FROM bilgiler WHERE id = ?", (bilgi_id,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (bilgi_id,) in self._depo.baglanti().execute("SELECT id FROM bilgiler ORDER BY sira"):
+            yield bilgi_id
+
+    def __len__(self) -> int:
+        return self._depo.baglanti().execute("SELECT COUNT(*) FROM bilgiler").fetchone()[0]
+
+    def values(self):
+        for satir in self._depo.baglanti().execute(
+                f"SELECT {', '.join(BILGI_ALANLARI)} FROM bilgiler ORDER BY sira"):
+            yield _satirdan_bilgi(satir)
+
+    def items(self):
+        for bilgi in self.values():
+            yield bilgi["id"], bilgi
+
+    def tutma_alanlari(self) -> Iterator[Tuple[str, Dict]]:
+        """Unutma yığını için yalnızca tutma skorunda kullanılan sütunlar"""
+        for bilgi_id, kullanim_sayisi, basari_skoru, guncelleme_tarihi in self._depo.baglanti().execute(
+                "SELECT id, kullanim_sayisi, basari_skoru, guncelleme_tarihi FROM bilgiler ORDER BY sira"):
+            yield bilgi_id, {
+                "kullanim_sayisi": kullanim_sayisi,
+                "basari_skoru": basari_skoru,
+                "guncelleme_tarihi": guncelleme_tarihi
+            }
+
+    def temiz_mesajlar(self) -> Iterator[Tuple[str, str]]:
+        """Tekrar indeksi için yalnızca normalize mesaj sütunu"""
+        yield from self._depo.baglanti().execute("SELECT id, temiz_mesaj FROM bilgiler ORDER BY sira")
+
+
+class SqliteKonular(Mapping):
+    """konular tablosunu bilgi_tabani["konular"] sözlüğü gibi gösteren salt okunur görünüm"""
+
+    def __init__(self, depo: "SqliteDepo"):
+        self._depo = depo
+
+    def __getitem__(self, konu: str) -> List[str]:
+        idler = [bilgi_id for (bilgi_id,) in self._depo.baglanti().execute(
+            "SELECT bilgi_id FROM konular WHERE konu = ? ORDER BY sira", (konu,))]
+        if not idler:
+            raise KeyError(konu)
+        return idler
+
+    def __contains__(self, konu) -> bool:
+        return self._depo.baglanti().execute(
+            "SELECT 1 FROM konular WHERE konu = ? LIMIT 1", (konu,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (konu,) in self._depo.baglanti().execute("SELECT DISTINCT konu FROM konular"):
+            yield konu
+
+    def __len__(self) -> int:
+        return self._depo.baglanti().execute("SELECT COUNT(DISTINCT konu) FROM konular").fetchone()[0]
+
+
+class SqliteDepo:
+    """Bilgi tabanını SQLite veritabanında tutan depo"""
+
+    # Olayları veritabanına depo kendisi uygular
+    bellekte = False
+
+    def __init__(self, dosya_yolu: str):
+        self.dosya_yolu = dosya_yolu
+        self._yerel = threading.local()
+        self._yazma_kilidi = threading.Lock()
+        self.istatistikler: Dict = {}
+        self.ogrenme_gecmisi: Dict = {}
+
+        with self._yazma_kilidi:
+            baglanti = self.baglanti()
+            baglanti.executescript(SEMA)
+            if not self._meta_oku("fts").get("dolgulu"):
+                self._fts_yeniden_olustur(baglanti)
+
+    def baglanti(self) -> sqlite3.Connection:
+        """İş parçacığına özel bağlantı; WAL sayesinde okuyucular yazmayı beklemez"""
+        baglanti = getattr(self._yerel, "baglanti", None)
+        if baglanti is None:
+            baglanti = sqlite3.connect(self.dosya_yolu, timeout=30)
+            baglanti.execute("PRAGMA journal_mode=WAL")
+            baglanti.execute("PRAGMA synchronous=NORMAL")
+            self._yerel.baglanti = baglanti
+        return baglanti
+
+    def _meta_oku(self, anahtar: str) -> Dict:
+        satir = self.baglanti().execute("SELECT deger FROM meta WHERE anahtar = ?", (anahtar,)).fetchone()
+        return json.loads(satir[0]) if satir else {}
+
+    def _meta_yaz(self, baglanti: sqlite3.Connection, anahtar: str, deger: Dict):
+        baglanti.execute(
+            "INSERT OR REPLACE INTO meta (anahtar, deger) VALUES (?, ?)",
+            (anahtar, json.dumps(deger, ensure_ascii=False))
+        )
+
+    def _fts_yeniden_olustur(self, baglanti: sqlite3.Connection):
+        """Boşlukla çevrilmeden yazılmış eski FTS tablosunu bilgiler tablosundan yeniden doldur"""
+        with baglanti:
+            baglanti.execute("DELETE FROM bilgi_fts")
+            baglanti.execute(
+                "INSERT INTO bilgi_fts (rowid, temiz_mesaj) SELECT sira, ' ' || temiz_mesaj || ' ' FROM bilgiler"
+            )
+            self._meta_yaz(baglanti, "fts", {"dolgulu": True})
+
+    def yukle(self) -> Tuple[Dict, Dict]:
+        """Tabloları bilgi tabanı sözlüğü görünümleriyle döndür"""
+        self.istatistikler = self._meta_oku("istatistikler")
+        self.ogrenme_gecmisi = self._meta_oku("ogrenme_gecmisi")
+
+        bilgi_tabani = {
+            "bilgiler": SqliteBilgiler(self),
+            "konular": SqliteKonular(self),
+            "istatistikler": self.istatistikler
+        }
+        return bilgi_tabani, self.ogrenme_gecmisi
+
+    def bekleyen_olaylar(self) -> Iterator[Tuple[Dict, bool, bool]]:
+        """Veritabanı her olayı hemen işlediği için bekleyen olay yoktur"""
+        return iter(())
+
+    def olay_yaz(self, olay: Dict):
+        """Olayı tek bir işlemde veritabanına uygula"""
+        with self._yazma_kilidi:
+            baglanti = self.baglanti()
+            with baglanti:
+                self._olay_uygula(baglanti, olay)
+
+    def toplu_olay_yaz(self, olaylar: List[Dict]):
+        """Olayları tek bir işlemde veritabanına uygula"""
+        with self._yazma_kilidi:
+            baglanti = self.baglanti()
+            with baglanti:
+                for olay in olaylar:
+                    self._olay_uygula(baglanti, olay)
+
+    def _olay_uygula(self, baglanti: sqlite3.Connection, olay: Dict):
+        tip = olay["tip"]
+
+        if tip == "ogren":
+            self._bilgi_ekle(baglanti, olay["bilgi"])
+            self.istatistikler["toplam_bilgi"] = self.istatistikler.get("toplam_bilgi", 0) + 1
+            self.istatistikler["son_guncelleme"] = olay["bilgi"]["ogrenme_tarihi"]
+            self.istatistikler["version"] = "1.0"
+            if "sonraki_id" in olay:
+                self.istatistikler["sonraki_id"] = olay["sonraki_id"]
+            self._meta_yaz(baglanti, "istatistikler", self.istatistikler)
+
+        elif tip == "unut":
+            if self._bilgi_sil(baglanti, olay["bilgi_id"]):
+                self.istatistikler["toplam_bilgi"] = self.istatistikler.get("toplam_bilgi", 1) - 1
+                self._meta_yaz(baglanti, "istatistikler", self.istatistikler)
+
+        elif tip in ("kullan", "guncelle"):
+            alanlar = [alan for alan in GUNCELLENEBILIR_ALANLAR if alan in olay]
+            baglanti.execute(
+                f"UPDATE bilgiler SET {', '.join(f'{alan} = ?' for alan in alanlar)} WHERE id = ?",
+                [olay[alan] for alan in alanlar] + [olay["bilgi_id"]]
+            )
+
+        if "kayit" in olay:
+            self._kayit_ekle(baglanti, olay["kayit"])
+            self._meta_yaz(baglanti, "ogrenme_gecmisi", self.ogrenme_gecmisi)
+
+    def _bilgi_ekle(self, baglanti: sqlite3.Connection, bilgi: Dict):
+        imlec = baglanti.execute(
+            f"INSERT INTO bilgiler ({', '.join(BILGI_ALANLARI)}) VALUES ({', '.join('?' * len(BILGI_ALANLARI))})",
+            _bilgiden_satir(bilgi)
+        )
+        baglanti.execute("INSERT INTO bilgi_fts (rowid, temiz_mesaj) VALUES (?, ?)",
+                         (imlec.lastrowid, _fts_metni(bilgi["temiz_mesaj"])))
+        baglanti.execute("INSERT INTO konular (konu, bilgi_id) VALUES (?, ?)", (bilgi["konu"], bilgi["id"]))
+
+    def _bilgi_sil(self, baglanti: sqlite3.Connection, bilgi_id: str) -> bool:
+        satir = baglanti.execute("SELECT sira FROM bilgiler WHERE id = ?", (bilgi_id,)).fetchone()
+        if satir is None:
+            return False
+        baglanti.execute("DELETE FROM bilgi_fts WHERE rowid = ?", satir)
+        baglanti.execute("DELETE FROM bilgiler WHERE sira = ?", satir)
+        baglanti.execute("DELETE FROM konular WHERE bilgi_id = ?", (bilgi_id,))
+        return True
+
+    def _kayit_ekle(self, baglanti: sqlite3.Connection, kayit: Dict):
+        baglanti.execute(
+            "INSERT INTO ogrenme_kayitlari (tarih, islem_tipi, bilgi_id, basarili) VALUES (?, ?, ?, ?)",
+            (kayit["tarih"], kayit["islem_tipi"], kayit["bilgi_id"], int(kayit["basarili"]))
+        )
+
+        sayaclari_guncelle(self.ogrenme_gecmisi, kayit)
+
+    def sikistirma_gerekli(self) -> bool:
+        return False
+
+    def kaydet(self, bilgi_tabani: Dict, ogrenme_gecmisi: Dict) -> bool:
+        """Olaylar zaten kalıcı; WAL dosyasını ana veritabanına aktar"""
+        try:
+            self.baglanti().execute("PRAGMA wal_checkpoint(PASSIVE)")
+            return True
+        except sqlite3.Error as e:
+            print(f"❌ Kaydetme hatası {self.dosya_yolu}: {e}")
+            return False
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int) -> Optional[List[str]]:
+        """FTS5 üçlü aramasıyla uzunluğu uygun aday bilgileri eklenme sırasıyla getir
+
+        Üçlüler NgramIndeksi gibi boşlukla çevrili metinden çıkarılır; harfleri yer
+        değiştirmiş kısa kelimeler de kelime sınırındaki üçlülerle bulunur.
+        """
+        en_kisa, en_uzun = NgramIndeksi.uzunluk_araligi(len(temiz_metin), esik)
+        dolgulu = _fts_metni(temiz_metin)
+        ucluler = {dolgulu[i:i + 3] for i in range(len(dolgulu) - 2)}
+
+        if ucluler:
+            sorgu = " OR ".join('"' + uclu.replace('"', '""') + '"' for uclu in ucluler)
+            satirlar = self.baglanti().execute(
+                "SELECT b.sira, b.id FROM bilgi_fts JOIN bilgiler b ON b.sira = bilgi_fts.rowid "
+                "WHERE bilgi_fts MATCH ? AND b.mesaj_uzunlugu BETWEEN ? AND ? "
+                "ORDER BY bilgi_fts.rank LIMIT ?",
+                (sorgu, en_kisa, en_uzun, aday_limiti)
+            ).fetchall()
+        else:
+            # Üçlü çıkmayacak kadar kısa mesajlarda yalnızca uzunluk filtresi
+            satirlar = self.baglanti().execute(
+                "SELECT sira, id FROM bilgiler WHERE mesaj_uzunlugu BETWEEN ? AND ? ORDER BY sira LIMIT ?",
+                (en_kisa, en_uzun, aday_limiti)
+            ).fetchall()
+
+        return [bilgi_id for _, bilgi_id in sorted(satirlar)]
+
+    def konu_bilgileri(self, konu: str, limit: int) -> List[Dict]:
+        """Konunun en iyi bilgileri; sıralama indeksinden ilk limit satır okunur"""
+        return [_satirdan_bilgi(satir) for satir in self.baglanti().execute(
+            f"SELECT {', '.join(BILGI_ALANLARI)} FROM bilgiler WHERE konu = ? "
+            "ORDER BY basari_skoru DESC, kullanim_sayisi DESC, sira LIMIT ?",
+            (konu, limit)
+        )]
+
+    def json_aktar(self, bilgi_tabani: Dict, ogrenme_gecmisi: Dict):
+        """JSON bilgi tabanını ve öğrenme geçmişini boş veritabanına aktar
+
+        Bilgilerde normalize mesaj alanları bulunmalıdır.
+        """
+        with self._yazma_kilidi:
+            baglanti = self.baglanti()
+            if baglanti.execute("SELECT COUNT(*) FROM bilgiler").fetchone()[0]:
+                raise ValueError(f"Veritabanı boş değil: {self.dosya_yolu}")
+
+            with baglanti:
+                for bilgi in bilgi_tabani.get("bilgiler", {}).values():
+                    imlec = baglanti.execute(
+                        f"INSERT INTO bilgiler ({', '.join(BILGI_ALANLARI)}) "
+                        f"VALUES ({', '.join('?' * len(BILGI_ALANLARI))})",
+                        _bilgiden_satir(bilgi)
+                    )
+                    baglanti.execute("INSERT INTO bilgi_fts (rowid, temiz_mesaj) VALUES (?, ?)",
+                                     (imlec.lastrowid, _fts_metni(bilgi["temiz_mesaj"])))
+
+                # Konu listelerindeki sıra korunur
+                baglanti.executemany(
+                    "INSERT INTO konular (konu, bilgi_id) VALUES (?, ?)",
+                    ((konu, bilgi_id) for konu, idler in bilgi_tabani.get("konular", {}).items() for bilgi_id in idler)
+                )
+
+                baglanti.executemany(
+                    "INSERT INTO ogrenme_kayitlari (tarih, islem_tipi, bilgi_id, basarili) VALUES (?, ?, ?, ?)",
+                    ((k["tarih"], k["islem_tipi"], k["bilgi_id"], int(k["basarili"]))
+                     for k in ogrenme_gecmisi.get("ogrenme_kayitlari", []))
+                )
+
+                self.istatistikler.clear()
+                self.istatistikler.update(bilgi_tabani.get("istatistikler", {}))
+                self.istatistikler.pop("gunluk_sirasi", None)
+                self.istatistikler["toplam_bilgi"] = len(bilgi_tabani.get("bilgiler", {}))
+                self.ogrenme_gecmisi.clear()
+                self.ogrenme_gecmisi.update(
+                    (anahtar, deger) for anahtar, deger in ogrenme_gecmisi.items()
+                    if anahtar not in ("ogrenme_kayitlari", "gunluk_sirasi")
+                )
+                self._meta_yaz(baglanti, "istatistikler", self.istatistikler)
+                self._meta_yaz(baglanti, "ogrenme_gecmisi", self.ogrenme_gecmisi)
+
+    def kapat(self):
+        """Bu iş parçacığının bağlantısını kapat"""
+        baglanti = getattr(self._yerel, "baglanti", None)
+        if baglanti is not None:
+            baglanti.close()
+            self._yerel.baglanti = None
@@ -0,0 +1,402 @@
+"""
+Öğrenen Asistan - Sunucu
+Asistanı TCP üzerinden satır satır JSON konuşan, çok oturumlu bir asyncio sunucusu
+olarak çalıştırır. Her bağlantı kendi oturumunu taşır; dil işleme ve öğrenme modülleri
+tüm oturumlar arasında paylaşılır.
+
+Protokol: her istek ve yanıt tek satırlık bir JSON nesnesidir.
+    {"komut": "giris", "kullanici": "ahmet"}   -> {"tamam": true, "kullanici": "ahmet"}
+    {"komut": "mesaj", "metin": "merhaba"}     -> {"tamam": true, "cevap": "..."}
+    {"komut": "istatistik"}                    -> {"tamam": true, "istatistik": {...}}
+    {"komut": "olcumler"}                      -> {"tamam": true, "olcumler": {...}}
+    {"komut": "olcumler", "bicim": "prometheus"} -> {"tamam": true, "olcumler": "# TYPE ..."}
+    {"komut": "cikis"}                         -> {"tamam": true} ve bağlantı kapanır
+İsteğe eklenen "no" alanı yanıtta aynen döner. Hatalar {"tamam": false, "hata": "..."} olur.
+
+Kullanım:
+    python sunucu.py baslat [--host 127.0.0.1] [--port 8765] [--isci 4] [--eszamanli 32] [--surec 0]
+    python sunucu.py yuk-testi [--istemci 50] [--mesaj 20]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from asistan import OgrenenAsistan, Oturum
+from olcum import olcumler
+
+
+class AsistanSunucusu:
+    def __init__(self, asistan: OgrenenAsistan, host: str = "127.0.0.1", port: int = 8765,
+                 maksimum_baglanti: int = 1000, eszamanli_istek: int = 32,
+                 isci_sayisi: int = 4, satir_limiti: int = 65536,
+                 soket: Optional[socket.socket] = None):
+        """Sunucuyu hazırla
+
+        maksimum_baglanti: aynı anda açık kalabilecek bağlantı sayısı, fazlası reddedilir
+        eszamanli_istek: aynı anda işlenen istek sayısı; dolunca bağlantılar okumayı bırakır
+            ve istemciler TCP akış denetimiyle yavaşlatılır
+        isci_sayisi: mesaj analizi ve arama yapan iş parçacığı sayısı
+        satir_limiti: tek bir istek satırının bayt sınırı
+        soket: verilirse host/port yerine bu dinleyen soket kullanılır (işçi havuzu)
+        """
+        self.asistan = asistan
+        self.host = host
+        self.port = port
+        self.maksimum_baglanti = maksimum_baglanti
+        self.eszamanli_istek = eszamanli_istek
+        self.satir_limiti = satir_limiti
+        self.soket = soket
+
+        self.aktif_baglanti = 0
+        self.islenen_istek = 0
+        self.reddedilen_baglanti = 0
+
+        # CPU'yu kullanan işler olay döngüsünü bekletmesin
+        self._yurutucu = ThreadPoolExecutor(max_workers=isci_sayisi, thread_name_prefix="asistan")
+        self._istek_siniri: Optional[asyncio.Semaphore] = None
+        self._sunucu: Optional[asyncio.AbstractServer] = None
+
+    @classmethod
+    def ayarlardan(cls, asistan: OgrenenAsistan, **degisiklikler) -> "AsistanSunucusu":
+        """Sunucuyu ayarlar.json'daki sunucu_* ayarlarıyla oluştur (None olmayan değişiklikler önceliklidir)"""
+        ayarlar = asistan.ogrenme_modulu.ayarlar
+        secenekler = {
+            "host": ayarlar.get("sunucu_host", "127.0.0.1"),
+            "port": ayarlar.get("sunucu_port", 8765),
+            "maksimum_baglanti": ayarlar.get("sunucu_maksimum_baglanti", 1000),
+            "eszamanli_istek": ayarlar.get("sunucu_eszamanli_istek", 32),
+            "isci_sayisi": ayarlar.get("sunucu_isci_sayisi", 4),
+            "satir_limiti": ayarlar.get("sunucu_satir_limiti", 65536)
+        }
+        secenekler.update({ad: deger for ad, deger in degisiklikler.items() if deger is not None})
+        return cls(asistan, **secenekler)
+
+    async def baslat(self):
+        """Dinlemeye başla (port 0 verildiyse seçilen port self.port'a yazılır)"""
+        self._istek_siniri = asyncio.Semaphore(self.eszamanli_istek)
+        if self.soket is not None:
+            self._sunucu = await asyncio.start_server(self._baglanti_isle, sock=self.soket, limit=self.satir_limiti)
+        else:
+            self._sunucu = await asyncio.start_server(
+                self._baglanti_isle, self.host, self.port, limit=self.satir_limiti
+            )
+        self.port = self._sunucu.sockets[0].getsockname()[1]
+
+    async def calistir(self):
+        """Sunucuyu başlat ve kapatılana kadar hizmet ver"""
+        await self.baslat()
+        print(f"🌐 {self.asistan.ad} {self.host}:{self.port} adresinde dinliyor")
+        async with self._sunucu:
+            await self._sunucu.serve_forever()
+
+    async def kapat(self):
+        """Yeni bağlantı kabul etmeyi bırak, süren işleri bekle ve verileri kaydet"""
+        if self._sunucu is not None:
+            self._sunucu.close()
+            await self._sunucu.wait_closed()
+
+        await asyncio.get_running_loop().run_in_executor(None, self._yurutucu.shutdown)
+        self.asistan.ogrenme_modulu.verileri_kaydet()
+        self.asistan._yaz_kullanici_profilleri()
+
+    async def _baglanti_isle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Bir bağlantının isteklerini sırayla işle
+
+        Yanıt yazılmadan sonraki satır okunmaz, bu yüzden yavaş okuyan ya da çok
+        hızlı yazan bir istemci sunucuda birikmez.
+        """
+        if self.aktif_baglanti >= self.maksimum_baglanti:
+            self.reddedilen_baglanti += 1
+            try:
+                await self._yanit_yaz(writer, {"tamam": False, "hata": "Sunucu dolu, daha sonra tekrar deneyin"})
+            finally:
+                await self._baglantiyi_kapat(writer)
+            return
+
+        self.aktif_baglanti += 1
+        oturum = Oturum()
+        try:
+            while True:
+                try:
+                    satir = await reader.readline()
+                except ValueError:
+                    await self._yanit_yaz(writer, {"tamam": False, "hata": "İstek satırı çok uzun"})
+                    break
+
+                if not satir:
+                    break
+                if not satir.strip():
+                    continue
+
+                yanit, devam = await self._istek_isle(satir, oturum)
+                await self._yanit_yaz(writer, yanit)
+                if not devam:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.aktif_baglanti -= 1
+            await self._baglantiyi_kapat(writer)
+
+    async def _istek_isle(self, satir: bytes, oturum: Oturum) -> Tuple[Dict, bool]:
+        """İsteği çözümle ve çalıştır; (yanıt, bağlantı açık kalsın mı) döndür"""
+        try:
+            istek = json.loads(satir)
+            if not isinstance(istek, dict):
+                raise ValueError
+        except (ValueError, UnicodeDecodeError):
+            return {"tamam": False, "hata": "Geçersiz JSON isteği"}, True
+
+        yanit = {"no": istek["no"]} if "no" in istek else {}
+        komut = istek.get("komut")
+
+        if komut == "cikis":
+            yanit["tamam"] = True
+            return yanit, False
+
+        islev = {
+            "giris": self._giris,
+            "mesaj": self._mesaj,
+            "istatistik": self._istatistik,
+            "olcumler": self._olcumler
+        }.get(komut) if isinstance(komut, str) else None
+        if islev is None:
+            yanit.update(tamam=False, hata=f"Bilinmeyen komut: {komut}")
+            return yanit, True
+
+        async with self._istek_siniri:
+            try:
+                sonuc = await asyncio.get_running_loop().run_in_executor(self._yurutucu, islev, istek, oturum)
+            except Exception as e:
+                yanit.update(tamam=False, hata=str(e))
+                return yanit, True
+
+        self.islenen_istek += 1
+        yanit["tamam"] = True
+        yanit.update(sonuc)
+        return yanit, True
+
+    def _giris(self, istek: Dict, oturum: Oturum) -> Dict:
+        kullanici_adi = str(istek.get("kullanici") or "").strip()
+        if not kullanici_adi:
+            raise ValueError("Kullanıcı adı gerekli")
+        self.asistan.kullanici_girisi(kullanici_adi, oturum)
+        return {"kullanici": oturum.aktif_kullanici}
+
+    def _mesaj(self, istek: Dict, oturum: Oturum) -> Dict:
+        return {"cevap": self.asistan.mesaj_isle(str(istek.get("metin", "")), oturum)}
+
+    def _istatistik(self, istek: Dict, oturum: Oturum) -> Dict:
+        return {"istatistik": {
+            "ogrenme": self.asistan.ogrenme_modulu.ogrenme_istatistikleri_getir(),
+            "oturum": {
+                "kullanici": oturum.aktif_kullanici,
+                "mesaj_sayisi": len(oturum.konusma_gecmisi),
+                "baslangic": oturum.oturum_baslangic.isoformat()
+            },
+            "sunucu": {
+                "aktif_baglanti": self.aktif_baglanti,
+                "islenen_istek": self.islenen_istek,
+                "reddedilen_baglanti": self.reddedilen_baglanti
+            }
+        }}
+
+    def _olcumler(self, istek: Dict, oturum: Oturum) -> Dict:
+        if istek.get("bicim") == "prometheus":
+            return {"olcumler": olcumler.prometheus_metni()}
+        return {"olcumler": olcumler.anlik_goruntu()}
+
+    @staticmethod
+    async def _yanit_yaz(writer: asyncio.StreamWriter, yanit: Dict):
+        """Yanıtı yaz ve gönderme tamponu boşalana kadar bekle"""
+        writer.write(json.dumps(yanit, ensure_ascii=False).encode('utf-8') + b"\n")
+        await writer.drain()
+
+    @staticmethod
+    async def _baglantiyi_kapat(writer: asyncio.StreamWriter):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class AsistanIstemcisi:
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765):
+        """Sunucuya tek bir oturum açan basit istemci"""
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._kilit: Optional[asyncio.Lock] = None
+
+    async def baglan(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._kilit = asyncio.Lock()
+
+    async def gonder(self, komut: str, **alanlar) -> Dict:
+        """İsteği gönder ve yanıtını bekle (aynı istemcinin istekleri sırayla gider)"""
+        istek = dict(alanlar, komut=komut)
+        async with self._kilit:
+            self._writer.write(json.dumps(istek, ensure_ascii=False).encode('utf-8') + b"\n")
+            await self._writer.drain()
+            satir = await self._reader.readline()
+
+        if not satir:
+            raise ConnectionError("Sunucu bağlantıyı kapattı")
+        return json.loads(satir)
+
+    async def kapat(self):
+        if self._writer is None:
+            return
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+YUK_TESTI_MESAJLARI = [
+    "merhaba",
+    "python programlama dili nedir",
+    "bugün hava çok güzel",
+    "yapay zeka nasıl öğrenir",
+    "bana bir kitap önerir misin",
+    "teşekkür ederim"
+]
+
+
+def _yuzdelik(degerler: List[float], oran: float) -> float:
+    """Sıralı listenin verilen orandaki değeri (en yakın sıra yöntemi)"""
+    if not degerler:
+        return 0.0
+    return degerler[min(len(degerler) - 1, int(oran * len(degerler)))]
+
+
+async def yuk_testi(host: str, port: int, istemci_sayisi: int = 50, mesaj_sayisi: int = 20,
+                    mesajlar: List[str] = None) -> Dict:
+    """Aynı anda istemci_sayisi oturum açıp her birinden mesaj_sayisi mesaj gönder
+
+    Gecikmeler milisaniye cinsinden döner.
+    """
+    mesajlar = mesajlar or YUK_TESTI_MESAJLARI
+    gecikmeler: List[float] = []
+    hatalar = 0
+
+    async def istemci_calistir(sira: int):
+        nonlocal hatalar
+        istemci = AsistanIstemcisi(host, port)
+        try:
+            await istemci.baglan()
+            await istemci.gonder("giris", kullanici=f"yuk_testi_{sira}")
+            for i in range(mesaj_sayisi):
+                baslangic = time.perf_counter()
+                yanit = await istemci.gonder("mesaj", metin=mesajlar[(sira + i) % len(mesajlar)])
+                gecikmeler.append((time.perf_counter() - baslangic) * 1000)
+                if not yanit.get("tamam"):
+                    hatalar += 1
+            await istemci.gonder("cikis")
+        except (ConnectionError, OSError, ValueError):
+            hatalar += 1
+        finally:
+            await istemci.kapat()
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(istemci_calistir(sira) for sira in range(istemci_sayisi)))
+    sure = time.perf_counter() - baslangic
+
+    gecikmeler.sort()
+    return {
+        "istek_sayisi": len(gecikmeler),
+        "hata_sayisi": hatalar,
+        "sure": sure,
+        "istek_hizi": len(gecikmeler) / sure if sure > 0 else 0,
+        "p50": _yuzdelik(gecikmeler, 0.50),
+        "p95": _yuzdelik(gecikmeler, 0.95),
+        "p99": _yuzdelik(gecikmeler, 0.99)
+    }
+
+
+def baslat(argumanlar: argparse.Namespace) -> int:
+    """Sunucuyu Ctrl+C ile durdurulana kadar çalıştır"""
+    if argumanlar.surec:
+        from isci_havuzu import havuzu_calistir
+        return havuzu_calistir(
+            argumanlar.surec,
+            argumanlar.host,
+            argumanlar.port,
+            maksimum_baglanti=argumanlar.maksimum_baglanti,
+            eszamanli_istek=argumanlar.eszamanli,
+            isci_sayisi=argumanlar.isci
+        )
+    
+    asistan = OgrenenAsistan()
+    sunucu = AsistanSunucusu.ayarlardan(
+        asistan,
+        host=argumanlar.host,
+        port=argumanlar.port,
+        maksimum_baglanti=argumanlar.maksimum_baglanti,
+        eszamanli_istek=argumanlar.eszamanli,
+        isci_sayisi=argumanlar.isci
+    )
+
+    async def calistir():
+        try:
+            await sunucu.calistir()
+        finally:
+            await sunucu.kapat()
+
+    try:
+        asyncio.run(calistir())
+    except KeyboardInterrupt:
+        print("\n👋 Sunucu kapatıldı")
+    return 0
+
+
+def yuk_testi_calistir(argumanlar: argparse.Namespace) -> int:
+    """Çalışan bir sunucuya yük testi uygula ve sonuçları yazdır"""
+    try:
+        sonuc = asyncio.run(yuk_testi(argumanlar.host, argumanlar.port, argumanlar.istemci, argumanlar.mesaj))
+    except OSError as e:
+        print(f"❌ Sunucuya bağlanılamadı: {e}")
+        return 1
+
+    print(f"✅ {sonuc['istek_sayisi']} istek, {sonuc['hata_sayisi']} hata "
+          f"({sonuc['sure']:.2f} sn, {sonuc['istek_hizi']:.0f} istek/sn)")
+    print(f"⏱️ Gecikme p50 {sonuc['p50']:.1f} ms, p95 {sonuc['p95']:.1f} ms, p99 {sonuc['p99']:.1f} ms")
+    return 0 if sonuc["hata_sayisi"] == 0 else 1
+
+
+def main(argv=None) -> int:
+    """Komut satırı argümanlarını çözümle ve ilgili komutu çalıştır"""
+    ayristirici = argparse.ArgumentParser(description="Öğrenen Asistan sunucusu")
+    alt_komutlar = ayristirici.add_subparsers(dest="komut", required=True)
+
+    sunucu = alt_komutlar.add_parser("baslat", help="sunucuyu başlat (varsayılanlar ayarlar.json'dan)")
+    sunucu.add_argument("--host", default=None)
+    sunucu.add_argument("--port", type=int, default=None)
+    sunucu.add_argument("--maksimum-baglanti", type=int, default=None, help="açık bağlantı sınırı")
+    sunucu.add_argument("--eszamanli", type=int, default=None, help="aynı anda işlenen istek sınırı")
+    sunucu.add_argument("--isci", type=int, default=None, help="iş parçacığı sayısı")
+    sunucu.add_argument("--surec", type=int, default=0,
+                        help="işçi süreç sayısı (0: tek süreç); süreçler bilgi tabanı görüntüsünü paylaşır")
+    sunucu.set_defaults(islev=baslat)
+
+    yuk = alt_komutlar.add_parser("yuk-testi", help="çalışan sunucuya eşzamanlı oturumlarla yük uygula")
+    yuk.add_argument("--host", default="127.0.0.1")
+    yuk.add_argument("--port", type=int, default=8765)
+    yuk.add_argument("--istemci", type=int, default=50, help="eşzamanlı oturum sayısı")
+    yuk.add_argument("--mesaj", type=int, default=20, help="oturum başına mesaj sayısı")
+    yuk.set_defaults(islev=yuk_testi_calistir)
+
+    argumanlar = ayristirici.parse_args(argv)
+    return argumanlar.islev(argumanlar)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Tekrar İndeksi Modülü
+Bu modül neredeyse aynı mesajları bulmak için MinHash imzalarını LSH kovalarında tutar.
+Mesajın UTF-8 bayt üçlüleri tek geçişte imza kutularına dağıtılır (tek permütasyonlu
+MinHash), imza bantlara bölünür ve en az bir bandı aynı olan bilgiler aday olur.
+Aday sayısı bilgi sayısıyla değil benzer mesaj sayısıyla artar; adaylar öğrenme
+modülünde mesaj benzerliğiyle doğrulanır.
+"""
+
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def cevap_puani(cevap: str) -> Tuple[int, int]:
+    """Birleştirmede hangi cevabın tutulacağı: farklı kelime sayısı, sonra uzunluk"""
+    return len(set(cevap.lower().split())), len(cevap)
+
+
+class MinHashIndeksi:
+    def __init__(self, kutu_sayisi: int = 64, bant_genisligi: int = 8):
+        """Boş bir MinHash LSH indeksi oluştur
+
+        kutu_sayisi imza uzunluğudur ve ikinin kuvveti olmalıdır. İmza
+        kutu_sayisi / bant_genisligi banda bölünür; 64 kutu ve 8 genişlikte üçlü
+        kümelerinin Jaccard benzerliği 0.9 olan iki mesaj %99, 0.5 olan iki mesaj
+        %3 olasılıkla aday olur.
+        """
+        if kutu_sayisi & (kutu_sayisi - 1) or kutu_sayisi % bant_genisligi:
+            raise ValueError("kutu_sayisi ikinin kuvveti ve bant_genisligi'nin katı olmalı")
+        self.kutu_sayisi = kutu_sayisi
+        self.bant_genisligi = bant_genisligi
+        self._kaydirma = kutu_sayisi.bit_length() - 1
+        self._kovalar: List[Dict[int, Set[str]]] = [
+            defaultdict(set) for _ in range(kutu_sayisi // bant_genisligi)
+        ]
+        self._bantlar: Dict[str, Tuple[int, ...]] = {}
+        self.siralar: Dict[str, int] = {}
+        self._sonraki_sira = 0
+
+    def __len__(self) -> int:
+        return len(self._bantlar)
+
+    def __contains__(self, bilgi_id: str) -> bool:
+        return bilgi_id in self._bantlar
+
+    def imza(self, temiz_metin: str) -> List[int]:
+        """Bayt üçlülerinin tek permütasyonlu MinHash imzası
+
+        Her üçlünün CRC32 özetinin alt bitleri kutuyu, üst bitleri değeri seçer;
+        boş kalan kutular sağdaki ilk dolu kutudan uzaklığa göre kaydırılmış değerle
+        doldurulur (döndürmeli yoğunlaştırma). Özet süreçten bağımsızdır.
+        """
+        maske = self.kutu_sayisi - 1
+        kaydirma = self._kaydirma
+        # Değerler bu sınırın altında kalır; sınırın kendisi boş kutuyu gösterir
+        bos = 1 << (32 - kaydirma)
+        kutular = [bos] * self.kutu_sayisi
+        veri = f" {temiz_metin} ".encode('utf-8')
+        for uclu in {veri[i:i + 3] for i in range(max(len(veri) - 2, 1))}:
+            ozet = zlib.crc32(uclu)
+            deger = ozet >> kaydirma
+            if deger < kutular[ozet & maske]:
+                kutular[ozet & maske] = deger
+
+        if bos not in kutular:
+            return kutular
+
+        # Metinde en az bir üçlü olduğu için en az bir kutu doludur
+        imza = list(kutular)
+        for kutu in range(self.kutu_sayisi):
+            if kutular[kutu] == bos:
+                uzaklik = 1
+                while kutular[(kutu + uzaklik) & maske] == bos:
+                    uzaklik += 1
+                imza[kutu] = kutular[(kutu + uzaklik) & maske] + uzaklik * bos
+        return imza
+
+    def _bant_ozetleri(self, temiz_metin: str) -> Tuple[int, ...]:
+        imza = self.imza(temiz_metin)
+        genislik = self.bant_genisligi
+        return tuple(hash(tuple(imza[i:i + genislik])) for i in range(0, len(imza), genislik))
+
+    def ekle(self, bilgi_id: str, temiz_metin: str):
+        """Bilgiyi indekse ekle"""
+        if bilgi_id in self._bantlar:
+            return
+        bantlar = self._bant_ozetleri(temiz_metin)
+        for kovalar, ozet in zip(self._kovalar, bantlar):
+            kovalar[ozet].add(bilgi_id)
+        self._bantlar[bilgi_id] = bantlar
+        self.siralar[bilgi_id] = self._sonraki_sira
+        self._sonraki_sira += 1
+
+    def cikar(self, bilgi_id: str):
+        """Bilgiyi indeksten çıkar"""
+        bantlar = self._bantlar.pop(bilgi_id, None)
+        if bantlar is None:
+            return
+        for kovalar, ozet in zip(self._kovalar, bantlar):
+            kova = kovalar.get(ozet)
+            if kova is None:
+                continue
+            kova.discard(bilgi_id)
+            if not kova:
+                del kovalar[ozet]
+        del self.siralar[bilgi_id]
+
+    def olustur(self, metinler: Iterable[Tuple[str, str]]):
+        """(bilgi_id, temiz_metin) çiftlerinden indeksi oluştur"""
+        for bilgi_id, temiz_metin in metinler:
+            self.ekle(bilgi_id, temiz_metin)
+
+    def adaylar(self, temiz_metin: str) -> List[str]:
+        """En az bir bandı metninkiyle aynı olan bilgiler, eklenme sırasıyla"""
+        adaylar: Set[str] = set()
+        for kovalar, ozet in zip(self._kovalar, self._bant_ozetleri(temiz_metin)):
+            kova = kovalar.get(ozet)
+            if kova:
+                adaylar.update(kova)
+        return sorted(adaylar, key=self.siralar.__getitem__)
@@ -3,9 +3,39 @@
 Asistanın özelliklerini otomatik olarak test eder
 """
 
+import io
+import os
 import sys
+import json
 import time
+import asyncio
+import sqlite3
+import builtins
+import tempfile
+import threading
+import subprocess
+from contextlib import contextmanager, redirect_stdout
+from fuzzywuzzy import fuzz
 from dil_isleme import TurkceDilIsleme
+from bulanik_sozluk import BulanikSozluk
+from ifade_otomati import IfadeOtomati
+from arama_indeksi import NgramIndeksi
+from vektor_arama import TfidfIndeksi, numpy_var_mi
+from sqlite_depo import SqliteDepo
+from ikili_depo import GoruntuBilgileri, sozluge_cevir
+import depolama
+from depolama import KayitIscisi
+from profil_deposu import ProfilDeposu
+from eszamanlilik import OkumaYazmaKilidi, SiraliIsKuyrugu
+from asistan import OgrenenAsistan, _giris_profili_guncelle
+from sunucu import AsistanSunucusu, AsistanIstemcisi, yuk_testi
+from ikili_goruntu import IkiliGoruntu
+from tekrar_indeksi import MinHashIndeksi
+from bilgi_kayitlari import BilgiGorunumu, BilgiKayitlari
+from isci_havuzu import GoruntuOgrenmeModulu, GoruntuSahibi, UzakProfilDeposu
+import yonetim
+import kiyaslama
+from olcum import Histogram, Olcumler, olcumler
 from ogrenme_modulu import OgrenmeModulu
 
 def test_dil_isleme():
@@ -31,39 +61,1396 @@ def test_dil_isleme():
         print(f"   🎯 Konu: {dil.konu_belirle(metin)}")
         print("-" * 40)
 
+def test_mesaj_analizi():
+    """Tek geçişli analizin tek tek metotlarla aynı sonucu verdiğini test et"""
+    print("\n🧬 Mesaj Analizi Test Ediliyor...\n")
+    
+    dil = TurkceDilIsleme()
+    
+    test_metinleri = [
+        "Merhaba, nasılsın?",
+        "Python ile kod yazmak çok güzel",
+        "Hayır, bu yanlış ve kötü oldu",
+        "Görüşürüz, hoşça kal!",
+        ""
+    ]
+    
+    for metin in test_metinleri:
+        analiz = dil.mesaj_analizi(metin)
+        print(f"📝 '{metin}' -> {analiz.sozluk()}")
+        assert analiz.temiz_metin == dil.temizle_metin(metin)
+        assert analiz.kelimeler == dil.kelimelere_ayir(metin)
+        assert analiz.soru_mu == dil.soru_mu(metin)
+        assert analiz.selamlasma_mi == dil.selamlasma_mi(metin)
+        assert analiz.vedalasma_mi == dil.vedalasma_mi(metin)
+        assert analiz.duygu == dil.duygu_analizi(metin)
+        assert analiz.konu == dil.konu_belirle(metin)
+        assert sorted(analiz.anahtar_kelimeler) == sorted(dil.anahtar_kelimeleri_cikart(metin))
+        assert analiz["konu"] == analiz.konu
+
+def test_bulanik_sozluk():
+    """Derlenmiş sözlüğün tüm sözlüğü taramakla aynı sonucu verdiğini test et"""
+    print("\n📖 Bulanık Sözlük Test Ediliyor...\n")
+    
+    dil = TurkceDilIsleme()
+    kelimeler = set()
+    for metin in ["merhabalar selamm heyy günaydınn elvedaa görüşürüzz",
+                  "tamamm olurr güzell süperr hayırr olmazz kötüü yanlışş",
+                  "sa as se hey he iyi günler bay python evett tabi dogru"]:
+        kelimeler.update(dil.kelimelere_ayir(metin))
+    
+    for anahtar, esik in [("selamlasmalar", 80), ("vedalasmalar", 80),
+                          ("olumlu_ifadeler", 70), ("olumsuz_ifadeler", 70)]:
+        sozluk_kelimeleri = dil.dil_kurallari.get(anahtar, [])
+        sozluk = BulanikSozluk(sozluk_kelimeleri, esik)
+        for kelime in kelimeler:
+            beklenen = sum(1 for s in sozluk_kelimeleri if fuzz.ratio(kelime, s) > esik)
+            assert sozluk.eslesme_sayisi(kelime) == beklenen, (anahtar, kelime)
+        print(f"   ✅ {anahtar}: {len(kelimeler)} kelime doğrulandı")
+
+def test_ifade_otomati():
+    """Otomatın çok kelimeli, ekli ve önekli ifadeleri tek taramada bulduğunu test et"""
+    print("\n🔤 İfade Otomatı Test Ediliyor...\n")
+    
+    otomat = IfadeOtomati({
+        "soru": ["ne", "ne zaman", "nasıl"],
+        "veda": ["hoşça kal", "iyi günler"],
+        "selam": ["iyi günler", "sa"],
+        "konu": ["program", "yaz*"]
+    }, ekler=["sın", "ın", "la", "ma", "lar", "ler"])
+    assert len(otomat) == 8
+    
+    def kategoriler(metin):
+        return sorted(kategori for kategori, _, _ in otomat.tara(metin))
+    
+    assert kategoriler("ne zaman gelirsin") == ["soru", "soru"]
+    assert kategoriler("hoşça kalın, iyi günler!") == ["selam", "veda", "veda"]
+    assert kategoriler("nasılsın?") == ["soru"]
+    assert kategoriler("programlama ve yazılım") == ["konu", "konu"]
+    # Kelime içinde, tanınmayan ekle ve kısa köke ek gelince eşleşmez
+    assert kategoriler("dane programcı sana nasılca") == []
+    assert otomat.tara("ne zaman") == [("soru", 0, 2), ("soru", 0, 8)]
+    
+    # Dil kurallarındaki kelimelerin tümü bir geçişte bulunur
+    dil = TurkceDilIsleme()
+    isabetler = dil.kural_isabetleri(dil.temizle_metin("İyi günler! Python programlamayı okulda öğrenmek istiyorum, ne zaman başlarız?"))
+    assert isabetler["selamlasma"] == 1 and isabetler["vedalasma"] == 1
+    assert isabetler["soru"] == 2
+    assert isabetler["konu:teknoloji"] == 2 and isabetler["konu:eğitim"] == 2
+    assert dil.konu_belirle("okulda kitap okuyan öğrenciler bilgisayar kullanıyor") == "eğitim"
+    assert dil.konu_belirle("hava güzel") == "genel"
+    analiz = dil.mesaj_analizi("Hoşça kalın, görüşmek üzere")
+    assert analiz.vedalasma_mi and not analiz.selamlasma_mi
+    
+    # Tek harfli ekler serbestçe dizilmez: tek ünlü zinciri bitirir, tek ünsüz ünlüden sonra gelir
+    ekli = IfadeOtomati({"soru": ["kim", "nerede"], "konu": ["program"]},
+                        ekler=["y", "s", "n", "ı", "a", "e", "la", "ma", "in"])
+    assert [k for k, _, _ in ekli.tara("programlamayı")] == ["konu"]
+    assert [k for k, _, _ in ekli.tara("kime kimin")] == ["soru", "soru"]
+    assert ekli.tara("kimya kimse neredeyse") == []
+    # Kısa soru kelimeleri ek almaz, sık çekimleri kurallarda ayrıca yer alır
+    for metin in ["kimya dersi çok zor", "kimse gelmedi", "neredeyse bitti",
+                  "kimlik kartımı kaybettim", "kaçmak istiyorum"]:
+        assert not dil.soru_mu(metin), metin
+    for metin in ["sen kimsin", "merhaba nasılsın", "hangisi daha iyi", "kaçta buluşalım"]:
+        assert dil.soru_mu(metin), metin
+    
+    # Duygu skoru BK-ağacı sözlüklerinin bulanık sayımıdır; tam isabetler iki kez sayılmaz,
+    # yalnızca bulanık sayılmayan uzun ekli ifadeler eklenir
+    def bulanik_duygu(metin):
+        kelimeler = dil.kelimelere_ayir(metin)
+        olumlu = sum(dil.olumlu_sozlugu.eslesme_sayisi(kelime) for kelime in kelimeler)
+        olumsuz = sum(dil.olumsuz_sozlugu.eslesme_sayisi(kelime) for kelime in kelimeler)
+        return "olumlu" if olumlu > olumsuz else "olumsuz" if olumsuz > olumlu else "notr"
+    for metin in ["tamam ama bu kötü ve yanlş", "güzel!", "evet tamam ama kötü",
+                  "süpr ama yanlış", "haklısınız", "dogru ama kötü ve yanlış"]:
+        assert dil.duygu_analizi(metin) == dil.mesaj_analizi(metin).duygu == bulanik_duygu(metin), metin
+    assert dil.duygu_analizi("tamam ama bu kötü ve yanlş") == "olumsuz"
+    assert dil.duygu_analizi("güzel ama kötü") == "notr"
+    assert bulanik_duygu("güzellikler") == "notr" and dil.duygu_analizi("güzellikler") == "olumlu"
+
+def test_gecikmeli_yukleme():
+    """Ağır modüllerin ve bulanık sözlük ağaçlarının ilk kullanıma kadar yüklenmediğini test et"""
+    print("\n⏱️ Gecikmeli Yükleme Test Ediliyor...\n")
+    
+    kod = (
+        "import sys, asistan\n"
+        "from dil_isleme import TurkceDilIsleme\n"
+        "dil = TurkceDilIsleme()\n"
+        "assert dil.selamlasma_sozlugu._agaclar is None\n"
+        "print(sorted(m for m in ('numpy', 'colorama', 'fuzzywuzzy', 'Levenshtein') if m in sys.modules))\n"
+        "assert dil.mesaj_analizi('merhaba nasılsın').selamlasma_mi\n"
+        "print(dil.temiz_benzerlik_hesapla('python nedir', 'python nedir?'))\n"
+    )
+    cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, check=True).stdout
+    print(f"   📦 {cikti.strip()}")
+    yuklenenler, benzerlik = cikti.splitlines()
+    assert yuklenenler == "[]"
+    assert float(benzerlik) == fuzz.ratio('python nedir', 'python nedir?') / 100.0
+
 def test_ogrenme_modulu():
     """Öğrenme modülünü test et"""
     print("\n🧠 Öğrenme Modülü Test Ediliyor...\n")
     
-    ogrenme = OgrenmeModulu()
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+
+        # Test öğrenmeleri
+        test_veriler = [
+            ("Python nedir?", "Python yüksek seviyeli bir programlama dilidir.", "teknoloji"),
+            ("Nasıl öğrenebilirim?", "Sürekli pratik yaparak ve merak ederek öğrenebilirsin.", "eğitim"),
+            ("Bugün nasılsın?", "İyiyim, teşekkür ederim! Sen nasılsın?", "kişisel")
+        ]
+    
+        for soru, cevap, konu in test_veriler:
+            print(f"📚 Öğrenilen: '{soru}' -> '{cevap}' [{konu}]")
+            basarili = ogrenme.yeni_bilgi_ogren(soru, cevap, konu)
+            print(f"   ✅ Başarılı: {basarili}")
     
-    # Test öğrenmeleri
-    test_veriler = [
-        ("Python nedir?", "Python yüksek seviyeli bir programlama dilidir.", "teknoloji"),
-        ("Nasıl öğrenebilirim?", "Sürekli pratik yaparak ve merak ederek öğrenebilirsin.", "eğitim"),
-        ("Bugün nasılsın?", "İyiyim, teşekkür ederim! Sen nasılsın?", "kişisel")
-    ]
+        # Benzer bilgi arama testi
+        print(f"\n🔍 Benzer bilgi arama testi:")
+        benzer = ogrenme.benzer_bilgi_bul("Python programlama dili nedir?")
+        if benzer:
+            print(f"   💡 Bulundu: {benzer[0]['asistan_cevap']}")
+            print(f"   📊 Benzerlik: {benzer[0]['benzerlik_skoru']:.2f}")
+        else:
+            print("   ❌ Benzer bilgi bulunamadı")
+    
+        # İstatistikler
+        stats = ogrenme.ogrenme_istatistikleri_getir()
+        print(f"\n📊 Öğrenme İstatistikleri:")
+        print(f"   🧠 Toplam Bilgi: {stats['toplam_bilgi']}")
+        print(f"   ✅ Başarılı: {stats['basarili_ogrenmeler']}")
+        print(f"   � Başarı Oranı: %{stats['basari_orani']:.1f}")
+
+# Geçici klasörlerde açılan öğrenme modülleri; klasör silinmeden önce kapatılır
+_acik_moduller = []
+
+@contextmanager
+def _gecici_klasor():
+    """Geçici klasör; içinde açılan öğrenme modüllerini klasör silinmeden kapat"""
+    with tempfile.TemporaryDirectory() as klasor:
+        try:
+            yield klasor
+        finally:
+            while _acik_moduller:
+                _acik_moduller.pop().kapat()
+
+def _gecici_ogrenme_modulu(klasor: str, depo=None, **ayarlar) -> OgrenmeModulu:
+    """Geçici klasördeki dosyalarla çalışan öğrenme modülü oluştur
+    
+    Verilen ayarlar varsayılan ayarların üzerine yazılır; arşiv, profil ve görüntü
+    klasörleri de geçici klasöre yönlendirilir, veri/ klasörüne yazılmaz.
+    """
+    with open("yapilandirma/ayarlar.json", encoding='utf-8') as f:
+        varsayilanlar = json.load(f)
+    os.makedirs(klasor, exist_ok=True)
+    ayarlar_dosya = os.path.join(klasor, "ayarlar.json")
+    with open(ayarlar_dosya, 'w', encoding='utf-8') as f:
+        json.dump({
+            **varsayilanlar,
+            "arsiv_dosya": os.path.join(klasor, "bilgi_arsivi.jsonl"),
+            "gecmis_arsiv_klasoru": os.path.join(klasor, "gecmis"),
+            "profil_klasoru": os.path.join(klasor, "kullanicilar"),
+            "goruntu_klasoru": os.path.join(klasor, "goruntu"),
+            "sqlite_dosya": os.path.join(klasor, "bilgi_tabani.db"),
+            "ikili_dosya": os.path.join(klasor, "bilgi_tabani.bin"),
+            "olcum_profil_klasoru": os.path.join(klasor, "profiller"),
+            **ayarlar
+        }, f)
+    
+    ogrenme = OgrenmeModulu(
+        bilgi_tabani_dosya=os.path.join(klasor, "bilgi_tabani.json"),
+        ogrenme_gecmisi_dosya=os.path.join(klasor, "ogrenme_gecmisi.json"),
+        ayarlar_dosya=ayarlar_dosya,
+        arama_indeksi_dosya=os.path.join(klasor, "arama_indeksi.json"),
+        depo=depo
+    )
+    _acik_moduller.append(ogrenme)
+    return ogrenme
+
+def test_arama_indeksi():
+    """İndeksli aramanın tam taramayla aynı sonuçları verdiğini test et"""
+    print("\n🔎 Arama İndeksi Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        
+        konular = ["python", "java", "okul", "kitap", "hava", "müzik", "film", "spor"]
+        kaliplar = ["{} nedir?", "{} nasıl öğrenilir?", "{} hakkında ne düşünüyorsun",
+                    "en iyi {} hangisi?", "bugün {} ile ilgili konuştuk"]
+        for konu in konular:
+            for kalip in kaliplar:
+                ogrenme.yeni_bilgi_ogren(kalip.format(konu), f"{konu} cevabı")
+        
+        sorgular = ["Python nedir?", "java nasıl öğrenilir", "en iyi film hangisi",
+                    "müzik hakkında ne düşünürsün?", "tamamen alakasız bir cümle"]
+        for sorgu in sorgular:
+            # Tüm bilgileri tarayarak beklenen sonucu hesapla
+            beklenen = []
+            for bilgi in ogrenme.bilgi_tabani["bilgiler"].values():
+                skor = ogrenme.dil_isleme.benzerlik_hesapla(sorgu, bilgi["kullanici_mesaj"])
+                if skor >= ogrenme.benzerlik_esigi:
+                    beklenen.append((bilgi["id"], skor))
+            beklenen.sort(key=lambda x: x[1], reverse=True)
+            
+            bulunan = [(b["id"], b["benzerlik_skoru"]) for b in ogrenme.benzer_bilgi_bul(sorgu)]
+            print(f"   🔍 '{sorgu}' -> {[bilgi_id for bilgi_id, _ in bulunan]}")
+            assert bulunan == beklenen[:5]
+        
+        # Kaydedilen indeks yeniden yüklenebilmeli
+        ogrenme.verileri_kaydet()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert len(yeniden.arama_indeksi) == len(ogrenme.arama_indeksi)
+        
+        # Eski dosyalardan gelen bilgilerin normalize alanları yüklemede doldurulmalı,
+        # artık tutulmayan kelime listesi atılmalı; aramalar bilgileri değiştirmez
+        eski_bilgi = yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]
+        for alan in ("temiz_mesaj", "mesaj_uzunlugu"):
+            eski_bilgi.pop(alan)
+        eski_bilgi["mesaj_kelimeleri"] = ["python", "nedir?"]
+        yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"] = eski_bilgi
+        yeniden.verileri_kaydet()
+        yeniden.kayit_iscisi.bosalt()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        eski_bilgi = yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]
+        assert eski_bilgi["temiz_mesaj"] == "python nedir?"
+        assert eski_bilgi["mesaj_uzunlugu"] == len("python nedir?")
+        assert "mesaj_kelimeleri" not in eski_bilgi
+        onceki = {bilgi_id: dict(bilgi) for bilgi_id, bilgi in yeniden.bilgi_tabani["bilgiler"].items()}
+        yeniden.benzer_bilgi_bul("python nedir")
+        assert yeniden.bilgi_tabani["bilgiler"] == onceki
+
+def test_tam_tarama_karsilastirma():
+    """Kısa sorgularda sonuçların kaba kuvvet taramayla aynı olduğunu test et"""
+    print("\n🧮 Kaba Kuvvet Karşılaştırması Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, onbellek_boyutu=0)
+        mesajlar = ["ab", "a b", "ev", "su", "ne", "evet", "abc", "python nedir?", "java nedir?",
+                    "okul ne zaman", "bugün hava nasıl", "en iyi film hangisi", "ne nedir"]
+        for mesaj in mesajlar:
+            ogrenme.yeni_bilgi_ogren(mesaj, f"{mesaj} cevabı", "genel")
+        
+        def kaba_kuvvet(sorgu: str) -> list:
+            temiz = ogrenme.dil_isleme.temizle_metin(sorgu)
+            skorlar = []
+            for bilgi in ogrenme.bilgi_tabani["bilgiler"].values():
+                skor = ogrenme.dil_isleme.temiz_benzerlik_hesapla(temiz, bilgi["temiz_mesaj"])
+                if skor >= ogrenme.benzerlik_esigi:
+                    skorlar.append((bilgi["id"], skor))
+            skorlar.sort(key=lambda x: x[1], reverse=True)
+            return skorlar[:5]
+        
+        sorgular = ["a", "e", "ab", "ev", "s", "nedir", "python nedir", "okul ne", "hava nasıl"]
+        # fuzz.ratio('a', 'ab') = 67: ortak üçlüsü olmayan kısa mesajlar da bulunmalı
+        assert "genel_0" in [bilgi_id for bilgi_id, _ in kaba_kuvvet("a")]
+        for sorgu in sorgular:
+            bulunan = [(b["id"], b["benzerlik_skoru"]) for b in ogrenme.benzer_bilgi_bul(sorgu)]
+            assert bulunan == kaba_kuvvet(sorgu), (sorgu, bulunan)
+        
+        # Aday limitine takılan sorgular tam taramaya geçmez, bulunanlar yine doğru skorlanır
+        ogrenme.aday_limiti = 2
+        for sorgu in sorgular[5:]:
+            bulunan = [(b["id"], b["benzerlik_skoru"]) for b in ogrenme.benzer_bilgi_bul(sorgu)]
+            assert len(bulunan) <= 2 and set(bulunan) <= set(kaba_kuvvet(sorgu)), (sorgu, bulunan)
+        ogrenme.kayit_iscisi.bosalt()
+
+def test_aday_limiti():
+    """Çok bilgiyle eşleşen yaygın sorgularda yalnızca en iyi adayların skorlandığını test et"""
+    print("\n🎯 Aday Limiti Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, aday_limiti=20, maksimum_hafiza=0)
+        dersler = ["matematik", "fizik", "kimya", "biyoloji", "tarih", "coğrafya", "edebiyat", "müzik"]
+        ogrenme.toplu_ogren((
+            (f"{ders} dersinde {numara} numaralı ödev nasıl yapılır?", f"{ders} {numara} cevabı", "okul")
+            for ders in dersler for numara in range(50)
+        ), isci_sayisi=0)
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        assert len(bilgiler) == 400
+        
+        # Tüm bilgiler ortak üçlü paylaşır; tam tarama yapılmamalı
+        hesaplananlar = []
+        benzerlik = ogrenme.dil_isleme.temiz_benzerlik_hesapla
+        def sayarak(sorgu, metin):
+            hesaplananlar.append(metin)
+            return benzerlik(sorgu, metin)
+        ogrenme.dil_isleme.temiz_benzerlik_hesapla = sayarak
+        def tam_tarama():
+            raise AssertionError("tüm bilgiler tarandı")
+        bilgiler.items = tam_tarama
+        
+        sonuc = ogrenme.benzer_bilgi_bul("kimya dersinde 17 numaralı ödev nasıl yapılır")
+        print(f"   🎯 {len(hesaplananlar)} aday skorlandı, en iyi: {sonuc[0]['kullanici_mesaj']}")
+        assert len(hesaplananlar) == ogrenme.aday_limiti
+        assert sonuc[0]["kullanici_mesaj"] == "kimya dersinde 17 numaralı ödev nasıl yapılır?"
+        del bilgiler.items
+        
+        # Kesilmiş aday listesi ilgisiz bir öğrenmede de önbellekten çıkar
+        assert len(ogrenme.sorgu_onbellegi) == 1
+        ogrenme.yeni_bilgi_ogren("Bugün hava nasıl olacak?", "Güneşli.")
+        assert len(ogrenme.sorgu_onbellegi) == 0
+        ogrenme.kayit_iscisi.bosalt()
+
+def test_olay_gunlugu():
+    """Kaydedilmemiş öğrenmelerin günlükten geri yüklendiğini test et"""
+    print("\n📒 Olay Günlüğü Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        ogrenme.yeni_bilgi_ogren("Python nedir?", "Bir programlama dili.", "teknoloji")
+        ogrenme.verileri_kaydet()
+        
+        # Anlık kayıttan sonraki işlemler yalnızca günlüğe yazılır
+        ogrenme.yeni_bilgi_ogren("Java nedir?", "Başka bir programlama dili.", "teknoloji")
+        ogrenme.bilgi_guncelle("teknoloji_0", "Yüksek seviyeli bir programlama dili.")
+        ogrenme.en_iyi_cevap_bul("Python nedir?")
+        ogrenme.kullanim_sayilarini_isle()
+        
+        # Arka plan işçisinin toplu yazmasını bekle
+        ogrenme.kayit_iscisi.bosalt()
+        
+        # Yarıda kesilmiş bir yazma taklidi
+        with open(ogrenme.gunluk_dosya, 'a', encoding='utf-8') as f:
+            f.write('{"tip": "ogren", "bilg')
+        
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        bilgiler = yeniden.bilgi_tabani["bilgiler"]
+        print(f"   📚 Geri yüklenen bilgiler: {list(bilgiler)}")
+        assert list(bilgiler) == ["teknoloji_0", "teknoloji_1"]
+        assert bilgiler["teknoloji_0"]["asistan_cevap"] == "Yüksek seviyeli bir programlama dili."
+        assert bilgiler["teknoloji_0"]["kullanim_sayisi"] == 2
+        assert yeniden.bilgi_tabani["konular"]["teknoloji"] == ["teknoloji_0", "teknoloji_1"]
+        assert yeniden.ogrenme_istatistikleri_getir()["basarili_ogrenmeler"] == 2
+        assert yeniden.benzer_bilgi_bul("Java nedir?")[0]["id"] == "teknoloji_1"
+        
+        # Yeni olaylar onarılmış günlüğe sorunsuz eklenmeli
+        yeniden.yeni_bilgi_ogren("Okul ne zaman başlıyor?", "Eylülde.", "eğitim")
+        yeniden.kayit_iscisi.bosalt()
+        ucuncu = _gecici_ogrenme_modulu(klasor)
+        assert len(ucuncu.bilgi_tabani["bilgiler"]) == 3
+
+def test_kayit_iscisi():
+    """Art arda işaretlenen yazmaların tek yazmada birleştiğini test et"""
+    print("\n💾 Kayıt İşçisi Test Ediliyor...\n")
+    
+    yazmalar = []
+    iscisi = KayitIscisi(aralik=60, esik=1000)
+    for _ in range(100):
+        iscisi.isaretle("bilgi_tabani", lambda: yazmalar.append("bilgi_tabani"))
+    iscisi.isaretle("profiller", lambda: yazmalar.append("profiller"))
+    assert yazmalar == []
+    
+    iscisi.bosalt()
+    print(f"   ✍️ 101 işaret -> {len(yazmalar)} yazma")
+    assert yazmalar == ["bilgi_tabani", "profiller"]
+    
+    # Eşik dolunca aralık beklenmeden yazılmalı
+    esikli = KayitIscisi(aralik=60, esik=5)
+    for _ in range(5):
+        esikli.isaretle("bilgi_tabani", lambda: yazmalar.append("esik"))
+    for _ in range(100):
+        if "esik" in yazmalar:
+            break
+        time.sleep(0.01)
+    assert "esik" in yazmalar
+    
+    iscisi.durdur()
+    esikli.durdur()
+    assert not iscisi._is_parcacigi.is_alive() and not esikli._is_parcacigi.is_alive()
+    
+    # Durdurulan işçi çıkışta tekrar çağrılmaz, sonraki işaretler hemen yazılır
+    assert iscisi not in depolama._calisan_isciler
+    iscisi.isaretle("sonra", lambda: yazmalar.append("sonra"))
+    assert yazmalar[-1] == "sonra"
+
+def test_sqlite_depo():
+    """JSON'dan aktarılan SQLite deposunun aynı sonuçları verdiğini test et"""
+    print("\n🗄️ SQLite Deposu Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        for konu in ["python", "java", "okul", "kitap", "müzik"]:
+            for kalip in ["{} nedir?", "{} nasıl öğrenilir?", "en iyi {} hangisi?"]:
+                ogrenme.yeni_bilgi_ogren(kalip.format(konu), f"{konu} cevabı")
+        ogrenme.bilgi_guncelle("teknoloji_0", "Python bir programlama dilidir.")
+        # Harfleri yer değiştirmiş kelimeler yalnızca kelime sınırındaki üçlüleri paylaşır
+        ogrenme.yeni_bilgi_ogren("Pyhton", "Yazım hatası.", "genel")
+        
+        ogrenme.kayit_iscisi.bosalt()
+        
+        veritabani = os.path.join(klasor, "bilgi_tabani.db")
+        assert yonetim.main([
+            "sqlite-aktar",
+            "--bilgi-tabani", ogrenme.bilgi_tabani_dosya,
+            "--ogrenme-gecmisi", ogrenme.ogrenme_gecmisi_dosya,
+            "--hedef", veritabani
+        ]) == 0
+        
+        sqlite_ogrenme = _gecici_ogrenme_modulu(klasor, depo=SqliteDepo(veritabani))
+        assert len(sqlite_ogrenme.bilgi_tabani["bilgiler"]) == len(ogrenme.bilgi_tabani["bilgiler"])
+        assert sqlite_ogrenme.ogrenme_istatistikleri_getir()["basarili_ogrenmeler"] == 16
+        
+        for sorgu in ["Python nedir?", "java nasıl öğrenilir", "en iyi müzik hangisi", "xyz",
+                      "python", "jaav nedir", "en iyi mzüik hangisi"]:
+            beklenen = [(b["id"], b["benzerlik_skoru"]) for b in ogrenme.benzer_bilgi_bul(sorgu)]
+            bulunan = [(b["id"], b["benzerlik_skoru"]) for b in sqlite_ogrenme.benzer_bilgi_bul(sorgu)]
+            print(f"   🔍 '{sorgu}' -> {[bilgi_id for bilgi_id, _ in bulunan]}")
+            assert bulunan == beklenen, (sorgu, bulunan, beklenen)
+        assert "genel_15" in [b["id"] for b in sqlite_ogrenme.benzer_bilgi_bul("python")]
+        
+        # Yeni öğrenme, kullanım ve güncelleme doğrudan veritabanına yazılır
+        assert sqlite_ogrenme.en_iyi_cevap_bul("Python nedir?") == "Python bir programlama dilidir."
+        sqlite_ogrenme.yeni_bilgi_ogren("Kod yazmayı nereden öğrenebilirim?", "Pratik yaparak.", "eğitim")
+        sqlite_ogrenme.kullanim_sayilarini_isle()
+        sqlite_ogrenme.depo.kapat()
+        
+        # Boşlukla çevrilmeden yazılmış eski FTS tablosu açılışta yeniden doldurulur
+        eski = sqlite3.connect(veritabani)
+        with eski:
+            eski.execute("DELETE FROM meta WHERE anahtar = 'fts'")
+            eski.execute("DELETE FROM bilgi_fts")
+            eski.execute("INSERT INTO bilgi_fts (rowid, temiz_mesaj) SELECT sira, temiz_mesaj FROM bilgiler")
+        eski.close()
+        
+        yeniden = _gecici_ogrenme_modulu(klasor, depo=SqliteDepo(veritabani))
+        assert len(yeniden.bilgi_tabani["bilgiler"]) == 17
+        assert "genel_15" in [b["id"] for b in yeniden.benzer_bilgi_bul("python")]
+        # Unutma yığını bilgileri çözmeden yalnızca skor sütunlarından kurulur
+        assert len(yeniden.unutma_yigini) == 17
+        assert dict(yeniden.bilgi_tabani["bilgiler"].tutma_alanlari())["teknoloji_0"]["kullanim_sayisi"] == 2
+        assert yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]["kullanim_sayisi"] == 2
+        assert yeniden.konu_bazli_bilgi_getir("eğitim", 10)[-1]["asistan_cevap"] == "Pratik yaparak."
+
+def test_ikili_depo():
+    """İkili görüntü deposunun JSON deposuyla aynı sonuçları verdiğini ve tembel açıldığını test et"""
+    print("\n💾 İkili Görüntü Deposu Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        for konu in ["python", "java", "okul", "kitap", "müzik"]:
+            for kalip in ["{} nedir?", "{} nasıl öğrenilir?", "en iyi {} hangisi?"]:
+                ogrenme.yeni_bilgi_ogren(kalip.format(konu), f"{konu} cevabı")
+        ogrenme.bilgi_guncelle("teknoloji_0", "Python bir programlama dilidir.")
+        ogrenme.kayit_iscisi.bosalt()
+        
+        ikili_dosya = os.path.join(klasor, "bilgi_tabani.bin")
+        assert yonetim.main([
+            "ikili-aktar",
+            "--bilgi-tabani", ogrenme.bilgi_tabani_dosya,
+            "--ogrenme-gecmisi", ogrenme.ogrenme_gecmisi_dosya,
+            "--hedef", ikili_dosya
+        ]) == 0
+        
+        # Açılışta hiçbir bilgi çözülmez; aramalar aynı sonuçları verir
+        ikili = _gecici_ogrenme_modulu(klasor, depolama="ikili")
+        bilgiler = ikili.bilgi_tabani["bilgiler"]
+        assert isinstance(bilgiler, GoruntuBilgileri)
+        assert not bilgiler._degisenler and not bilgiler._yeniler
+        assert len(bilgiler) == 15 and len(ikili.unutma_yigini) == 15
+        for sorgu in ["Python nedir?", "java nasıl öğrenilir", "en iyi müzik hangisi", "xyz"]:
+            beklenen = [(b["id"], b["benzerlik_skoru"]) for b in ogrenme.benzer_bilgi_bul(sorgu)]
+            bulunan = [(b["id"], b["benzerlik_skoru"]) for b in ikili.benzer_bilgi_bul(sorgu)]
+            print(f"   🔍 '{sorgu}' -> {[bilgi_id for bilgi_id, _ in bulunan]}")
+            assert bulunan == beklenen
+        assert ikili.konu_bazli_bilgi_getir("teknoloji", 10) == ogrenme.konu_bazli_bilgi_getir("teknoloji", 10)
+        
+        # Değişiklikler görüntünün üzerine yazılır, anlık kayıtta yeni görüntü yazılır
+        assert ikili.en_iyi_cevap_bul("Python nedir?") == "Python bir programlama dilidir."
+        ikili.yeni_bilgi_ogren("Kod yazmayı nereden öğrenebilirim?", "Pratik yaparak.", "eğitim")
+        assert ikili.verileri_kaydet()
+        assert len(bilgiler._degisenler) == 1 and len(bilgiler._yeniler) == 1
+        # Kaydedilmeyen öğrenme günlükten geri gelir
+        ikili.yeni_bilgi_ogren("Kahve nasıl yapılır?", "Demleyerek.", "genel")
+        ikili.kapat()
+        
+        yeniden = _gecici_ogrenme_modulu(klasor, depolama="ikili", maksimum_hafiza=17)
+        assert len(yeniden.bilgi_tabani["bilgiler"]) == 17
+        assert yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]["kullanim_sayisi"] == 2
+        assert yeniden.en_iyi_cevap_bul("kod yazmayı nereden öğrenebilirim") == "Pratik yaparak."
+        assert yeniden.en_iyi_cevap_bul("kahve nasıl yapılır") == "Demleyerek."
+        
+        # Hafıza sınırında görüntüdeki bilgi silinir, aramalarda da görünmez
+        yeniden.yeni_bilgi_ogren("Çay nasıl demlenir?", "Demlikte.", "genel")
+        bilgiler = yeniden.bilgi_tabani["bilgiler"]
+        assert len(bilgiler) == 17 and len(bilgiler.silinenler) == 1
+        unutulan = yeniden.depo.goruntu.bilgi(next(iter(bilgiler.silinenler)))
+        assert unutulan["id"] not in bilgiler
+        assert unutulan["id"] not in yeniden.bilgi_tabani["konular"].get(unutulan["konu"], [])
+        assert unutulan["id"] not in [b["id"] for b in yeniden.benzer_bilgi_bul(unutulan["kullanici_mesaj"])]
+        yeniden.kullanim_sayilarini_isle()
+        beklenen = sozluge_cevir(yeniden.bilgi_tabani)
+        yeniden.kapat()
+        
+        # JSON'a geri aktarılan bilgi tabanı görünümlerle aynıdır
+        assert yonetim.main([
+            "json-aktar",
+            "--kaynak", ikili_dosya,
+            "--bilgi-tabani", os.path.join(klasor, "bilgi_tabani.json"),
+            "--ogrenme-gecmisi", os.path.join(klasor, "ogrenme_gecmisi.json"),
+            "--hedef", os.path.join(klasor, "geri.json")
+        ]) == 0
+        with open(os.path.join(klasor, "geri.json"), encoding='utf-8') as f:
+            geri = json.load(f)
+        assert geri["bilgiler"] == beklenen["bilgiler"]
+        assert geri["konular"] == beklenen["konular"]
+
+def test_toplu_ogrenme():
+    """Paralel toplu öğrenmenin tek tek öğrenmeyle aynı bilgi tabanını ürettiğini test et"""
+    print("\n📥 Toplu Öğrenme Test Ediliyor...\n")
+    
+    satirlar = []
+    for konu in ["python", "java", "okul", "kitap", "müzik", "futbol"]:
+        for kalip in ["{} nedir?", "{} nasıl öğrenilir?", "en iyi {} hangisi?", "{} sever misin"]:
+            satirlar.append((kalip.format(konu), f"{konu} cevabı", "hobi" if konu == "futbol" else None))
+    
+    with _gecici_klasor() as klasor:
+        csv_dosyasi = os.path.join(klasor, "veriler.csv")
+        with open(csv_dosyasi, 'w', encoding='utf-8') as f:
+            f.write("soru,cevap,konu\n")
+            f.writelines(f'"{soru}","{cevap}",{konu or ""}\n' for soru, cevap, konu in satirlar)
+        assert list(yonetim.csv_satirlari(csv_dosyasi)) == satirlar
+        
+        # Soru ya da cevabı metin olmayan JSON satırları uyarıyla atlanır
+        jsonl_dosyasi = os.path.join(klasor, "veriler.jsonl")
+        with open(jsonl_dosyasi, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps({"soru": soru, "cevap": cevap, "konu": konu}, ensure_ascii=False) + "\n"
+                         for soru, cevap, konu in satirlar[:2])
+            f.write('{"soru": 42, "cevap": "sayı"}\n{"soru": "boş cevap", "cevap": null}\n'
+                    '["liste"]\n{"soru": "eksik"}\n')
+        cikti = io.StringIO()
+        with redirect_stdout(cikti):
+            assert list(yonetim.jsonl_satirlari(jsonl_dosyasi)) == satirlar[:2]
+        assert cikti.getvalue().count("satır atlandı") == 4
+        
+        os.makedirs(os.path.join(klasor, "tek"))
+        os.makedirs(os.path.join(klasor, "toplu"))
+        tek_tek = _gecici_ogrenme_modulu(os.path.join(klasor, "tek"))
+        toplu = _gecici_ogrenme_modulu(os.path.join(klasor, "toplu"))
+        for soru, cevap, konu in satirlar:
+            tek_tek.yeni_bilgi_ogren(soru, cevap, konu)
+        
+        sonuc = toplu.toplu_ogren(iter(satirlar), parti_boyutu=7, isci_sayisi=2)
+        print(f"   ⚡ {sonuc['satir_sayisi']} satır, {sonuc['satir_hizi']:.0f} satır/sn")
+        assert sonuc["satir_sayisi"] == len(satirlar)
+        
+        assert list(toplu.bilgi_tabani["bilgiler"]) == list(tek_tek.bilgi_tabani["bilgiler"])
+        assert toplu.bilgi_tabani["konular"] == tek_tek.bilgi_tabani["konular"]
+        assert toplu.ogrenme_istatistikleri_getir()["basarili_ogrenmeler"] == len(satirlar)
+        for sorgu in ["Python nedir?", "futbol sever misin", "en iyi kitap"]:
+            assert ([b["id"] for b in toplu.benzer_bilgi_bul(sorgu)] ==
+                    [b["id"] for b in tek_tek.benzer_bilgi_bul(sorgu)])
+        
+        # Toplu öğrenme sonunda anlık kayıt alınmış olmalı
+        yeniden = _gecici_ogrenme_modulu(os.path.join(klasor, "toplu"))
+        assert len(yeniden.bilgi_tabani["bilgiler"]) == len(satirlar)
+        assert sonuc["unutulan_sayisi"] == 0
+        tek_tek.kayit_iscisi.bosalt()
+        
+        # Hafıza sınırını aşan satırlar öğrenilenlerden ayrı sayılır
+        sinirli = _gecici_ogrenme_modulu(os.path.join(klasor, "sinirli"), maksimum_hafiza=10)
+        sonuc = sinirli.toplu_ogren(iter(satirlar), parti_boyutu=7, isci_sayisi=0)
+        assert sonuc["satir_sayisi"] == len(satirlar)
+        assert sonuc["unutulan_sayisi"] == len(satirlar) - 10
+        assert len(sinirli.bilgi_tabani["bilgiler"]) == 10
+        sinirli.kapat()
+
+def test_tfidf_indeksi():
+    """TF-IDF matrisinin n-gram indeksiyle aynı aday kümesini verdiğini test et"""
+    print("\n📐 TF-IDF İndeksi Test Ediliyor...\n")
+    
+    if not numpy_var_mi():
+        print("   ⏭️ numpy kurulu değil, test atlandı (pip install -r requirements-dev.txt)")
+        if "pytest" in sys.modules:
+            import pytest
+            pytest.skip("numpy kurulu değil")
+        return
+    
+    metinler = []
+    for konu in ["python", "java", "okul", "kitap", "müzik", "futbol", "hava"]:
+        for kalip in ["{} nedir", "{} nasıl öğrenilir", "en iyi {} hangisi", "{} sever misin", "{}"]:
+            metinler.append((f"bilgi_{len(metinler)}", kalip.format(konu)))
+    
+    ngram = NgramIndeksi()
+    ngram.olustur(metinler[:10])
+    tfidf = TfidfIndeksi()
+    tfidf.olustur(metinler[:10])
+    # Artımlı ekleme de aynı sonucu vermeli
+    for bilgi_id, temiz_metin in metinler[10:]:
+        ngram.ekle(bilgi_id, temiz_metin)
+        tfidf.ekle(bilgi_id, temiz_metin)
+    
+    sorgular = ["python nedir", "en iyi kitap", "futbol", "xyz", "hava nasıl"]
+    for sorgu, toplu in zip(sorgular, tfidf.toplu_adaylar(sorgular, 0.6, 1000)):
+        assert toplu == ngram.adaylar(sorgu, 0.6, 1000) == tfidf.adaylar(sorgu, 0.6, 1000)
+    
+    # Sınırlı aday listesinde en benzer bilgiler kalmalı
+    adaylar = tfidf.adaylar("python nedir", 0.0, 3)
+    print(f"   🔍 'python nedir' -> {adaylar}")
+    assert len(adaylar) == 3 and "bilgi_0" in adaylar
+    
+    tfidf.cikar("bilgi_0")
+    assert "bilgi_0" not in tfidf.adaylar("python nedir", 0.6, 1000)
+    
+    # Kaydedilen matris aynı adayları vermeli, imza uyuşmazsa yüklenmemeli
+    with _gecici_klasor() as klasor:
+        dosya = os.path.join(klasor, "indeks.npz")
+        assert tfidf.kaydet(dosya, "imza")
+        yuklenen = TfidfIndeksi()
+        assert not yuklenen.yukle(dosya, "baska")
+        assert yuklenen.yukle(dosya, "imza")
+        for sorgu in sorgular + ["python nedir"]:
+            assert yuklenen.adaylar(sorgu, 0.6, 1000) == tfidf.adaylar(sorgu, 0.6, 1000)
+        yuklenen.ekle("bilgi_yeni", "python nedir")
+        assert "bilgi_yeni" in yuklenen.adaylar("python nedir", 0.6, 1000)
+
+def test_sorgu_onbellegi():
+    """Önbellekten dönen sonuçların ve geçersiz kılmanın doğruluğunu test et"""
+    print("\n⚡ Sorgu Önbelleği Test Ediliyor...\n")
     
-    for soru, cevap, konu in test_veriler:
-        print(f"📚 Öğrenilen: '{soru}' -> '{cevap}' [{konu}]")
-        basarili = ogrenme.yeni_bilgi_ogren(soru, cevap, konu)
-        print(f"   ✅ Başarılı: {basarili}")
-    
-    # Benzer bilgi arama testi
-    print(f"\n🔍 Benzer bilgi arama testi:")
-    benzer = ogrenme.benzer_bilgi_bul("Python programlama dili nedir?")
-    if benzer:
-        print(f"   💡 Bulundu: {benzer[0]['asistan_cevap']}")
-        print(f"   📊 Benzerlik: {benzer[0]['benzerlik_skoru']:.2f}")
-    else:
-        print("   ❌ Benzer bilgi bulunamadı")
-    
-    # İstatistikler
-    stats = ogrenme.ogrenme_istatistikleri_getir()
-    print(f"\n📊 Öğrenme İstatistikleri:")
-    print(f"   🧠 Toplam Bilgi: {stats['toplam_bilgi']}")
-    print(f"   ✅ Başarılı: {stats['basarili_ogrenmeler']}")
-    print(f"   � Başarı Oranı: %{stats['basari_orani']:.1f}")
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        ogrenme.yeni_bilgi_ogren("Python nedir?", "Bir programlama dili.")
+        ogrenme.yeni_bilgi_ogren("Hava nasıl?", "Güneşli.")
+        onbellek = ogrenme.sorgu_onbellegi
+        
+        ilk = ogrenme.benzer_bilgi_bul("Python nedir?")
+        assert onbellek.iskalama == 1 and onbellek.isabet == 0
+        
+        # Normalize hali aynı mesajlar isabet etmeli, kullanım sayısı yine artmalı
+        assert ogrenme.en_iyi_cevap_bul("python  nedir?") == "Bir programlama dili."
+        assert ogrenme.en_iyi_cevap_bul("PYTHON NEDIR?") == "Bir programlama dili."
+        assert onbellek.isabet == 2
+        assert ogrenme.kullanim_sayilarini_isle() == 1
+        bilgi_id = ilk[0]["id"]
+        assert ogrenme.bilgi_tabani["bilgiler"][bilgi_id]["kullanim_sayisi"] == 3
+        
+        # Güncellenen cevap önbellekten de güncel gelmeli
+        ogrenme.bilgi_guncelle(bilgi_id, "Yorumlanan bir dil.")
+        assert ogrenme.en_iyi_cevap_bul("Python nedir?") == "Yorumlanan bir dil."
+        
+        # İlgisiz bilgi önbelleği bozmaz, benzer bilgi ilgili sorguyu çıkarır
+        ogrenme.benzer_bilgi_bul("Hava nasıl?")
+        ogrenme.yeni_bilgi_ogren("Futbol sever misin?", "Evet.")
+        assert len(onbellek) == 2
+        ogrenme.yeni_bilgi_ogren("Python nedir ki?", "Bir dil.")
+        assert len(onbellek) == 1
+        
+        yeni_id = list(ogrenme.bilgi_tabani["bilgiler"])[-1]
+        sonuc = [b["id"] for b in ogrenme.benzer_bilgi_bul("Python nedir?")]
+        print(f"   🔍 {onbellek.istatistikler()}")
+        assert sonuc == [bilgi_id, yeni_id]
+        
+        ogrenme.kayit_iscisi.bosalt()
+
+def test_hafiza_siniri():
+    """Hafıza sınırında az kullanılan bilgilerin unutulup arşivlendiğini test et"""
+    print("\n🧹 Hafıza Sınırı Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        ogrenme.maksimum_hafiza = 5
+        ogrenme.arsiv_dosya = os.path.join(klasor, "arsiv.jsonl")
+        
+        konular = ["python", "java", "okul", "kitap", "müzik", "futbol", "hava", "film"]
+        ogrenme.yeni_bilgi_ogren("python nedir?", "Bir programlama dili.")
+        for _ in range(3):
+            ogrenme.en_iyi_cevap_bul("python nedir?")
+        for konu in konular[1:]:
+            ogrenme.yeni_bilgi_ogren(f"{konu} nedir?", f"{konu} cevabı")
+        
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        print(f"   🧠 Kalan bilgiler: {list(bilgiler)}")
+        assert len(bilgiler) == 5
+        # Çok kullanılan eski bilgi kalmalı, kullanılmayan eskiler unutulmalı
+        assert "teknoloji_0" in bilgiler
+        assert sorted(sum(ogrenme.bilgi_tabani["konular"].values(), [])) == sorted(bilgiler)
+        assert set(ogrenme.arama_indeksi.uzunluklar) == set(bilgiler)
+        assert all(b["id"] in bilgiler for b in ogrenme.benzer_bilgi_bul("java nedir?"))
+        
+        ogrenme.kayit_iscisi.bosalt()
+        with open(ogrenme.arsiv_dosya, encoding='utf-8') as f:
+            arsiv = [json.loads(satir)["id"] for satir in f]
+        assert len(arsiv) == 3 and not set(arsiv) & set(bilgiler)
+        
+        # Unutmadan sonra kimlikler çakışmamalı
+        ogrenme.yeni_bilgi_ogren("satranç nedir?", "Bir oyun.")
+        assert len(bilgiler) == 5 and list(bilgiler)[-1].endswith("_8")
+        
+        # Günlükten geri yüklenince aynı bilgiler kalmalı
+        ogrenme.kayit_iscisi.bosalt()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert list(yeniden.bilgi_tabani["bilgiler"]) == list(bilgiler)
+        assert yeniden.bilgi_tabani["konular"] == ogrenme.bilgi_tabani["konular"]
+        
+        # Sınırdan büyük bilgi tabanını açmak bilgi unutturmaz, sınır ilk öğrenmede uygulanır
+        def unutma_sayisi():
+            with open(yeniden.gunluk_dosya, encoding='utf-8') as f:
+                return sum(json.loads(satir)["tip"] == "unut" for satir in f)
+        unutmalar = unutma_sayisi()
+        kucuk = _gecici_ogrenme_modulu(klasor, maksimum_hafiza=3)
+        kucuk.kayit_iscisi.bosalt()
+        assert len(kucuk.bilgi_tabani["bilgiler"]) == 5 and unutma_sayisi() == unutmalar
+        kucuk.yeni_bilgi_ogren("tenis nedir?", "Bir spor.")
+        assert len(kucuk.bilgi_tabani["bilgiler"]) == 3
+
+def test_konu_siralamasi():
+    """Konu bilgilerinin başarı ve kullanıma göre sıralı tutulduğunu test et"""
+    print("\n🏅 Konu Sıralaması Test Ediliyor...\n")
+    
+    def tam_siralama(ogrenme, konu):
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        konu_listesi = list(ogrenme.bilgi_tabani["konular"].get(konu, []))
+        return sorted(konu_listesi, key=lambda bilgi_id: (
+            -bilgiler[bilgi_id]["basari_skoru"], -bilgiler[bilgi_id]["kullanim_sayisi"],
+            konu_listesi.index(bilgi_id)))
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, kullanim_tampon_boyutu=1)
+        for dil in ["python", "java", "rust", "go"]:
+            ogrenme.yeni_bilgi_ogren(f"{dil} nedir?", f"{dil} bir dil.", "teknoloji")
+        
+        # Eşitlikte önce öğrenilen önde; sıralama ilk soruda kurulur
+        assert "teknoloji" not in ogrenme.konu_siralamasi
+        ilkler = [b["id"] for b in ogrenme.konu_bazli_bilgi_getir("teknoloji", 2)]
+        assert ilkler == ["teknoloji_0", "teknoloji_1"]
+        
+        # Kullanım, öğrenme, güncelleme ve unutma sıralamayı yerinde günceller
+        for _ in range(2):
+            assert ogrenme.en_iyi_cevap_bul("rust nedir?") == "rust bir dil."
+        ogrenme.en_iyi_cevap_bul("go nedir?")
+        ogrenme.yeni_bilgi_ogren("c nedir?", "c bir dil.", "teknoloji")
+        assert ogrenme.bilgi_guncelle("teknoloji_3", "go da bir dil.")
+        ogrenme._olay_isle({"tip": "unut", "bilgi_id": "teknoloji_0"})
+        
+        sirali = [b["id"] for b in ogrenme.konu_bazli_bilgi_getir("teknoloji", 10)]
+        print(f"   🏅 Teknoloji: {sirali}")
+        assert sirali == ["teknoloji_2", "teknoloji_3", "teknoloji_1", "teknoloji_4"]
+        assert sirali == tam_siralama(ogrenme, "teknoloji")
+        assert ogrenme.konu_bazli_bilgi_getir("teknoloji", 1)[0]["asistan_cevap"] == "rust bir dil."
+        assert ogrenme.konu_bazli_bilgi_getir("yok", 3) == []
+        
+        # Günlükten geri yüklenen ve SQLite'a aktarılan depolar aynı sırayı verir
+        ogrenme.kayit_iscisi.bosalt()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert [b["id"] for b in yeniden.konu_bazli_bilgi_getir("teknoloji", 10)] == sirali
+        
+        ogrenme.verileri_kaydet()
+        veritabani = os.path.join(klasor, "bilgi_tabani.db")
+        assert yonetim.main([
+            "sqlite-aktar",
+            "--bilgi-tabani", ogrenme.bilgi_tabani_dosya,
+            "--ogrenme-gecmisi", ogrenme.ogrenme_gecmisi_dosya,
+            "--hedef", veritabani
+        ]) == 0
+        sqlite_ogrenme = _gecici_ogrenme_modulu(klasor, depo=SqliteDepo(veritabani))
+        assert [b["id"] for b in sqlite_ogrenme.konu_bazli_bilgi_getir("teknoloji", 10)] == sirali
+        plan = sqlite_ogrenme.depo.baglanti().execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM bilgiler WHERE konu = ? "
+            "ORDER BY basari_skoru DESC, kullanim_sayisi DESC, sira LIMIT 3", ("teknoloji",)
+        ).fetchall()
+        assert "bilgiler_konu_sirasi" in str(plan) and "TEMP B-TREE" not in str(plan)
+
+def test_tekrar_birlestirme():
+    """Neredeyse aynı mesajların öğrenmede ve toplu temizlemede birleştirildiğini test et"""
+    print("\n🧬 Tekrar Birleştirme Test Ediliyor...\n")
+    
+    indeks = MinHashIndeksi()
+    indeks.ekle("a", "python programlama dili nedir")
+    indeks.ekle("b", "bugün hava çok güzel değil mi")
+    assert indeks.imza("python nedir") == MinHashIndeksi().imza("python nedir")
+    assert indeks.adaylar("python programlama dili nedir") == ["a"]
+    indeks.cikar("a")
+    assert indeks.adaylar("python programlama dili nedir") == [] and len(indeks) == 1
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        ogrenme.yeni_bilgi_ogren("Python programlama dili nedir?", "Bir dil.", "teknoloji")
+        assert ogrenme.tekrar_indeksi is not None
+        
+        # Aynı konudaki tekrar birleşir, daha açıklayıcı cevap tutulur
+        ogrenme.yeni_bilgi_ogren("python programlama dili nedir", "Yüksek seviyeli bir programlama dili.", "teknoloji")
+        ogrenme.yeni_bilgi_ogren("PYTHON programlama dili nedir?", "Dil.", "teknoloji")
+        ogrenme.yeni_bilgi_ogren("Java programlama dili nedir?", "Başka bir dil.", "teknoloji")
+        ogrenme.yeni_bilgi_ogren("Python programlama dili nedir?", "Ders konusu.", "eğitim")
+        
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        print(f"   🧬 Bilgiler: {list(bilgiler)}")
+        assert list(bilgiler) == ["teknoloji_0", "teknoloji_1", "eğitim_2"]
+        assert bilgiler["teknoloji_0"]["kullanim_sayisi"] == 3
+        assert bilgiler["teknoloji_0"]["asistan_cevap"] == "Yüksek seviyeli bir programlama dili."
+        assert ogrenme.ogrenme_istatistikleri_getir()["basarili_ogrenmeler"] == 5
+        
+        # Günlükten geri yüklenince birleşmiş haller gelir
+        ogrenme.kayit_iscisi.bosalt()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert dict(yeniden.bilgi_tabani["bilgiler"]) == dict(bilgiler)
+        
+        # Tekrar denetimi kapalıyken biriken tekrarlar komutla temizlenir
+        kapali = _gecici_ogrenme_modulu(os.path.join(klasor, "kapali"), tekrar_esigi=0)
+        for i in range(20):
+            kapali.yeni_bilgi_ogren(f"{'KOD' if i % 2 else 'Kod'} yazmayı nereden öğrenebilirim?", f"Cevap {i}", "eğitim")
+        kapali.yeni_bilgi_ogren("Kod yazmayı ne zaman öğrenebilirim?", "Her zaman.", "eğitim")
+        kapali.kullanim_sayilarini_isle()
+        assert kapali.verileri_kaydet()
+        assert len(kapali.bilgi_tabani["bilgiler"]) == 21
+        onceki_boyut = os.path.getsize(kapali.bilgi_tabani_dosya)
+        
+        assert yonetim.main([
+            "tekrar-temizle",
+            "--bilgi-tabani", kapali.bilgi_tabani_dosya,
+            "--ogrenme-gecmisi", kapali.ogrenme_gecmisi_dosya,
+            "--esik", "0.98"
+        ]) == 0
+        temiz = _gecici_ogrenme_modulu(os.path.join(klasor, "kapali"), tekrar_esigi=0)
+        temiz_bilgiler = temiz.bilgi_tabani["bilgiler"]
+        assert list(temiz_bilgiler) == ["eğitim_0", "eğitim_20"]
+        assert temiz_bilgiler["eğitim_0"]["kullanim_sayisi"] == 20
+        assert temiz.bilgi_tabani["konular"]["eğitim"] == ["eğitim_0", "eğitim_20"]
+        assert len(temiz.arama_indeksi) == 2
+        assert os.path.getsize(temiz.bilgi_tabani_dosya) < onceki_boyut / 5
+        
+        # JSON deposunda birleştirme günlüğe yazılır; anlık kayıt olmadan da geri yüklenir
+        gunluklu = _gecici_ogrenme_modulu(os.path.join(klasor, "gunluklu"), tekrar_esigi=0)
+        for i in range(4):
+            gunluklu.yeni_bilgi_ogren(f"{'KOD' if i % 2 else 'Kod'} yazmayı nereden öğrenebilirim?", f"Cevap {i}", "eğitim")
+        assert gunluklu.verileri_kaydet()
+        assert gunluklu.tekrarlari_birlestir(0.98) == 3
+        gunluklu.kayit_iscisi.bosalt()
+        geri = _gecici_ogrenme_modulu(os.path.join(klasor, "gunluklu"), tekrar_esigi=0)
+        assert list(geri.bilgi_tabani["bilgiler"]) == ["eğitim_0"]
+        assert dict(geri.bilgi_tabani["bilgiler"]) == dict(gunluklu.bilgi_tabani["bilgiler"])
+        assert geri.bilgi_tabani["konular"]["eğitim"] == ["eğitim_0"]
+        
+        # SQLite deposunda indeks yalnızca mesaj sütunundan kurulur
+        veritabani = os.path.join(klasor, "bilgi_tabani.db")
+        assert yonetim.main([
+            "sqlite-aktar",
+            "--bilgi-tabani", ogrenme.bilgi_tabani_dosya,
+            "--ogrenme-gecmisi", ogrenme.ogrenme_gecmisi_dosya,
+            "--hedef", veritabani
+        ]) == 0
+        sqlite_ogrenme = _gecici_ogrenme_modulu(klasor, depo=SqliteDepo(veritabani))
+        sqlite_ogrenme.yeni_bilgi_ogren("JAVA programlama dili nedir", "Cevap.", "teknoloji")
+        assert len(sqlite_ogrenme.bilgi_tabani["bilgiler"]) == 3
+        assert sqlite_ogrenme.bilgi_tabani["bilgiler"]["teknoloji_1"]["kullanim_sayisi"] == 2
+        sqlite_ogrenme.depo.kapat()
+
+def test_bilgi_kayitlari():
+    """Sıkıştırılmış bilgi kayıtlarının JSON şemasını koruduğunu ve görünümleri test et"""
+    print("\n🧮 Bilgi Kayıtları Test Ediliyor...\n")
+    
+    bilgiler = {
+        "teknoloji_0": {
+            "id": "teknoloji_0", "kullanici_mesaj": "Python nedir?", "asistan_cevap": "Bir dil.",
+            "konu": "teknoloji", "anahtar_kelimeler": ["python", "nedir?"],
+            "ogrenme_tarihi": "2025-08-12T00:12:53.484039", "kullanim_sayisi": 3, "basari_skoru": 0.5,
+            "guncelleme_tarihi": "2025-08-12T00:12:53.484039", "temiz_mesaj": "python nedir?",
+            "mesaj_uzunlugu": 13
+        },
+        # Şemadan sapan değerler ve ek alanlar olduğu gibi geri yazılmalı
+        "teknoloji_1": {
+            "id": "teknoloji_1", "kullanici_mesaj": "Java nedir?", "konu": "teknoloji",
+            "anahtar_kelimeler": ["java", 1], "ogrenme_tarihi": "2025-08-12T03:00:00+03:00",
+            "kullanim_sayisi": 1, "basari_skoru": 0, "guncelleme_tarihi": "2025-08-12",
+            "temiz_mesaj": "java nedir?", "kaynak": "eski"
+        },
+        "genel_2": {
+            "id": "genel_2", "kullanici_mesaj": "Merhaba", "asistan_cevap": "Selam!", "konu": "genel",
+            "anahtar_kelimeler": [], "ogrenme_tarihi": "1999-12-31T23:59:59",
+            "guncelleme_tarihi": "2025-08-12T00:12:53.484039", "temiz_mesaj": "merhaba", "mesaj_uzunlugu": 7
+        }
+    }
+    metin = json.dumps(bilgiler, ensure_ascii=False, indent=2)
+    kayitlar = BilgiKayitlari.sozlukten(json.loads(metin))
+    assert list(kayitlar) == list(bilgiler) and len(kayitlar) == 3
+    assert json.dumps({bilgi_id: dict(bilgi) for bilgi_id, bilgi in kayitlar.items()},
+                      ensure_ascii=False, indent=2) == metin
+    assert kayitlar == bilgiler and "genel_3" not in kayitlar and kayitlar.get("genel_3") is None
+    assert len(kayitlar.konular) == 2 and len(kayitlar.kelimeler) == 2
+    assert isinstance(kayitlar._kayitlar["teknoloji_0"].ogrenme_tarihi, float)
+    
+    # Görünüm değişikliği geri atanana kadar kayda yansımaz; eski görünümler değişmez
+    bilgi = kayitlar["teknoloji_0"]
+    eski = kayitlar["teknoloji_0"]
+    bilgi["kullanim_sayisi"] = 4
+    del bilgi["anahtar_kelimeler"]
+    bilgi["etiket"] = "yeni"
+    assert kayitlar["teknoloji_0"]["kullanim_sayisi"] == 3
+    kayitlar["teknoloji_0"] = bilgi
+    assert kayitlar["teknoloji_0"]["kullanim_sayisi"] == 4 and kayitlar["teknoloji_0"]["etiket"] == "yeni"
+    assert "anahtar_kelimeler" not in kayitlar["teknoloji_0"]
+    assert eski["kullanim_sayisi"] == 3 and eski["anahtar_kelimeler"] == ["python", "nedir?"]
+    assert list(kayitlar["teknoloji_0"])[-1] == "etiket"
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor)
+        ogrenme.yeni_bilgi_ogren("Python nedir?", "Bir programlama dili.", "teknoloji")
+        ogrenme.yeni_bilgi_ogren("Bugün hava nasıl?", "Güneşli.", "genel")
+        assert isinstance(ogrenme.bilgi_tabani["bilgiler"], BilgiKayitlari)
+        
+        # Arama sonuçları kopya değil görünümdür ve sonraki güncellemelerden etkilenmez
+        sonuc = ogrenme.benzer_bilgi_bul("python nedir")[0]
+        assert isinstance(sonuc, BilgiGorunumu) and sonuc["benzerlik_skoru"] > 0.8
+        ogrenme.bilgi_guncelle("teknoloji_0", "Yüksek seviyeli bir dil.")
+        assert sonuc["asistan_cevap"] == "Bir programlama dili."
+        assert "benzerlik_skoru" not in ogrenme.bilgi_tabani["bilgiler"]["teknoloji_0"]
+        
+        # Anlık kayıt bugünkü JSON şemasıyla yazılır ve aynen geri yüklenir
+        assert ogrenme.verileri_kaydet()
+        with open(ogrenme.bilgi_tabani_dosya, encoding='utf-8') as f:
+            dosya = json.load(f)
+        assert dosya["bilgiler"] == {bilgi_id: dict(bilgi) for bilgi_id, bilgi in ogrenme.bilgi_tabani["bilgiler"].items()}
+        assert dosya["bilgiler"]["teknoloji_0"]["asistan_cevap"] == "Yüksek seviyeli bir dil."
+        assert list(dosya["bilgiler"]["teknoloji_0"]) == list(ogrenme._bilgi_olustur(
+            "x", "x", "x", "x", ogrenme.dil_isleme.mesaj_analizi("x"), "2025-01-01T00:00:00"))
+        
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert isinstance(yeniden.bilgi_tabani["bilgiler"], BilgiKayitlari)
+        assert yeniden.bilgi_tabani["bilgiler"] == dosya["bilgiler"]
+        # Konu listeleri kayıtlardaki kimlik metinlerini paylaşır
+        kimlik = yeniden.bilgi_tabani["konular"]["teknoloji"][0]
+        assert kimlik is yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]["id"]
+    
+    # Kayıtlar aynı bilgilerin JSON'dan yüklenmiş sözlüklerinden belirgin biçimde küçüktür
+    derlem = {}
+    for sira, (soru, cevap, konu) in enumerate(kiyaslama.sentetik_derlem(500)):
+        derlem[f"{konu}_{sira}"] = ogrenme._bilgi_olustur(f"{konu}_{sira}", soru, cevap, konu,
+                                                           ogrenme.dil_isleme.mesaj_analizi(soru),
+                                                           "2025-08-12T00:12:53.484039")
+    bellek = kiyaslama.bilgi_bellegi_olc(derlem)
+    print(f"   🧮 Bilgi başına: sözlük {bellek['sozluk_bilgi_bayt']:.0f} B, kayıt {bellek['kayit_bilgi_bayt']:.0f} B")
+    assert bellek["kayit_bilgi_bayt"] < 0.6 * bellek["sozluk_bilgi_bayt"]
+
+def test_gecmis_halkasi():
+    """Geçmişin sınırlı tutulup eski kayıtların arşive taşındığını test et"""
+    print("\n📜 Geçmiş Halkası Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        arsiv_klasoru = os.path.join(klasor, "gecmis")
+        ogrenme = _gecici_ogrenme_modulu(klasor, gecmis_tampon_boyutu=3, gecmis_arsiv_klasoru=arsiv_klasoru)
+        for konu in ["python", "java", "okul", "kitap", "müzik"]:
+            ogrenme.yeni_bilgi_ogren(f"{konu} nedir?", f"{konu} cevabı")
+        
+        idler = list(ogrenme.bilgi_tabani["bilgiler"])
+        kayitlar = ogrenme.ogrenme_gecmisi["ogrenme_kayitlari"]
+        assert [k["bilgi_id"] for k in kayitlar] == idler[2:]
+        
+        istatistikler = ogrenme.ogrenme_istatistikleri_getir()
+        print(f"   📈 Bugün: {istatistikler['bugun']}")
+        assert istatistikler["basarili_ogrenmeler"] == 5
+        assert istatistikler["bugun"] == {"basarili": 5, "basarisiz": 0}
+        
+        ogrenme.verileri_kaydet()
+        assert [k["bilgi_id"] for k in ogrenme.gecmis_arsivi.oku()] == idler[:2]
+        with open(ogrenme.ogrenme_gecmisi_dosya, encoding='utf-8') as f:
+            assert len(json.load(f)["ogrenme_kayitlari"]) == 3
+        
+        # Yeniden yüklenince halka ve arşiv kaldığı yerden devam etmeli
+        yeniden = _gecici_ogrenme_modulu(klasor, gecmis_tampon_boyutu=3, gecmis_arsiv_klasoru=arsiv_klasoru)
+        yeniden.yeni_bilgi_ogren("film nedir?", "film cevabı")
+        yeniden.verileri_kaydet()
+        assert [k["bilgi_id"] for k in yeniden.gecmis_arsivi.oku()] == idler[:3]
+        assert yeniden.ogrenme_istatistikleri_getir()["basarili_ogrenmeler"] == 6
+
+def test_profil_deposu():
+    """Profillerin tek tek yüklenip yalnızca değişenlerin yazıldığını test et"""
+    print("\n👤 Profil Deposu Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        eski_dosya = os.path.join(klasor, "kullanici_profilleri.json")
+        with open(eski_dosya, 'w', encoding='utf-8') as f:
+            json.dump({
+                "kullanicilar": {"ayse": {"ad": "ayse", "tercihler": {}, "toplam_sohbet": 4}},
+                "varsayilan_profil": {"ad": "", "tercihler": {}, "kisilik_profili": "dostane", "toplam_sohbet": 0}
+            }, f)
+        
+        profil_klasoru = os.path.join(klasor, "kullanicilar")
+        depo = ProfilDeposu(profil_klasoru, eski_dosya, onbellek_boyutu=2)
+        assert depo.getir("ayse")["toplam_sohbet"] == 4
+        assert depo.getir("yok") is None
+        
+        def artir(profil):
+            profil["toplam_sohbet"] += 1
+        
+        profil, yeni_mi = depo.guncelle("mehmet", artir)
+        assert yeni_mi and profil["kisilik_profili"] == "dostane" and profil["toplam_sohbet"] == 1
+        profil["tercihler"]["renk"] = "mavi"
+        assert depo.varsayilan_profil["tercihler"] == {}
+        
+        # Önbellekten düşen değişmiş profil kaybolmamalı
+        depo.guncelle("ayse", artir)
+        for ad in ["a", "b", "c"]:
+            depo.guncelle(ad, artir)
+        assert depo.getir("ayse")["toplam_sohbet"] == 5
+        
+        depo.yaz()
+        assert depo.yaz() and not depo._kirliler
+        
+        yeniden = ProfilDeposu(profil_klasoru, eski_dosya)
+        assert yeniden.getir("ayse")["toplam_sohbet"] == 5
+        assert yeniden.getir("mehmet")["tercihler"] == {"renk": "mavi"}
+        print(f"   📁 {yeniden.profil_yolu('mehmet')}")
+
+def test_eszamanli_erisim():
+    """Paralel arama ve öğrenmede kilidin ve kullanım tamponunun güncelleme kaybetmediğini test et"""
+    print("\n🔒 Eşzamanlı Erişim Test Ediliyor...\n")
+    
+    # Okuyucular birbirini beklemez, yazıcı okuyucuların bitmesini bekler
+    kilit = OkumaYazmaKilidi()
+    okundu, yazildi = threading.Event(), threading.Event()
+    
+    def oku():
+        with kilit.okuma():
+            okundu.set()
+    
+    def yaz():
+        with kilit.yazma():
+            yazildi.set()
+    
+    with kilit.okuma():
+        threading.Thread(target=oku).start()
+        assert okundu.wait(1)
+        yazici = threading.Thread(target=yaz)
+        yazici.start()
+        assert not yazildi.wait(0.05)
+    yazici.join()
+    assert yazildi.is_set()
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, kullanim_tampon_boyutu=7)
+        ogrenme.yeni_bilgi_ogren("python nedir?", "Bir programlama dili.", "teknoloji")
+        okuyucu_sayisi, arama_sayisi, yazici_sayisi, ogrenme_sayisi = 8, 100, 2, 40
+        hatalar = []
+        
+        def ara():
+            try:
+                for _ in range(arama_sayisi):
+                    assert ogrenme.en_iyi_cevap_bul("python nedir?") == "Bir programlama dili."
+            except Exception as e:
+                hatalar.append(e)
+        
+        def ogren(sira: int):
+            for i in range(ogrenme_sayisi):
+                if not ogrenme.yeni_bilgi_ogren(f"deneme {sira} soru {i}", "cevap", "genel"):
+                    hatalar.append(f"{sira}/{i} öğrenilemedi")
+        
+        # Sık iş parçacığı geçişiyle çakışmaları artır
+        eski_aralik = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            is_parcaciklari = [threading.Thread(target=ara) for _ in range(okuyucu_sayisi)]
+            is_parcaciklari += [threading.Thread(target=ogren, args=(sira,)) for sira in range(yazici_sayisi)]
+            for is_parcacigi in is_parcaciklari:
+                is_parcacigi.start()
+            for is_parcacigi in is_parcaciklari:
+                is_parcacigi.join()
+        finally:
+            sys.setswitchinterval(eski_aralik)
+        
+        ogrenme.kullanim_sayilarini_isle()
+        assert not hatalar, hatalar
+        
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        beklenen_kullanim = 1 + okuyucu_sayisi * arama_sayisi
+        print(f"   🧮 Kullanım: {bilgiler['teknoloji_0']['kullanim_sayisi']} / {beklenen_kullanim}")
+        assert bilgiler["teknoloji_0"]["kullanim_sayisi"] == beklenen_kullanim
+        assert len(bilgiler) == 1 + yazici_sayisi * ogrenme_sayisi
+        assert sorted(sum(ogrenme.bilgi_tabani["konular"].values(), [])) == sorted(bilgiler)
+        assert set(ogrenme.arama_indeksi.uzunluklar) == set(bilgiler)
+        
+        # Toplanan artışlar günlükten de aynı geri yüklenmeli
+        ogrenme.kayit_iscisi.bosalt()
+        yeniden = _gecici_ogrenme_modulu(klasor)
+        assert yeniden.bilgi_tabani["bilgiler"]["teknoloji_0"]["kullanim_sayisi"] == beklenen_kullanim
+        
+        # Anlık kayıt aramaları durdurmaz: başka bir okuyucu varken de tamamlanır
+        kaydedildi = threading.Event()
+        with yeniden._kilit.okuma():
+            threading.Thread(target=lambda: yeniden.verileri_kaydet() and kaydedildi.set()).start()
+            assert kaydedildi.wait(5)
+        yeniden.kayit_iscisi.bosalt()
+
+def test_sunucu():
+    """Sunucuda oturumların ayrı tutulduğunu ve bağlantı sınırını test et"""
+    print("\n🌐 Sunucu Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, profil_klasoru=os.path.join(klasor, "kullanicilar"))
+        asistan = OgrenenAsistan(ogrenme_modulu=ogrenme)
+        # Asistan öğrenme modülünün dil işleme nesnesini paylaşır
+        assert asistan.dil_isleme is ogrenme.dil_isleme
+        sunucu = AsistanSunucusu(asistan, port=0, maksimum_baglanti=3, eszamanli_istek=2, isci_sayisi=2)
+        
+        async def senaryo():
+            await sunucu.baslat()
+            try:
+                ayse = AsistanIstemcisi(port=sunucu.port)
+                ali = AsistanIstemcisi(port=sunucu.port)
+                await ayse.baglan()
+                await ali.baglan()
+                
+                assert (await ayse.gonder("giris", kullanici="Ayse"))["kullanici"] == "ayse"
+                yanitlar = await asyncio.gather(
+                    ayse.gonder("mesaj", metin="merhaba", no=1),
+                    ayse.gonder("mesaj", metin="nasılsın", no=2),
+                    ali.gonder("mesaj", metin="python nedir", no=3)
+                )
+                assert all(y["tamam"] and y["cevap"] for y in yanitlar)
+                assert [y["no"] for y in yanitlar] == [1, 2, 3]
+                
+                ayse_stats = (await ayse.gonder("istatistik"))["istatistik"]["oturum"]
+                ali_stats = (await ali.gonder("istatistik"))["istatistik"]["oturum"]
+                assert (ayse_stats["kullanici"], ayse_stats["mesaj_sayisi"]) == ("ayse", 2)
+                assert (ali_stats["kullanici"], ali_stats["mesaj_sayisi"]) == ("misafir", 1)
+                assert not (await ali.gonder("bilinmeyen"))["tamam"]
+                
+                olcum = (await ali.gonder("olcumler"))["olcumler"]
+                assert olcum["asamalar"]["mesaj_isle"]["adet"] >= 3
+                metin = (await ali.gonder("olcumler", bicim="prometheus"))["olcumler"]
+                assert 'ogrenen_asistan_asama_sure_saniye_count{asama="mesaj_isle"}' in metin
+                assert not (await ali.gonder(["liste"]))["tamam"]
+                
+                # Sınırın üstündeki bağlantı reddedilir
+                fazla = [AsistanIstemcisi(port=sunucu.port) for _ in range(2)]
+                for istemci in fazla:
+                    await istemci.baglan()
+                assert (await fazla[0].gonder("istatistik"))["tamam"]
+                reddedilen = await fazla[1].gonder("istatistik")
+                assert not reddedilen["tamam"] and "dolu" in reddedilen["hata"]
+                for istemci in [ayse, ali] + fazla:
+                    await istemci.kapat()
+                
+                sonuc = await yuk_testi("127.0.0.1", sunucu.port, istemci_sayisi=3, mesaj_sayisi=5)
+                assert sonuc["istek_sayisi"] == 15 and sonuc["hata_sayisi"] == 0
+                print(f"   ⚡ {sonuc['istek_hizi']:.0f} istek/sn, p95 {sonuc['p95']:.1f} ms")
+            finally:
+                await sunucu.kapat()
+        
+        asyncio.run(senaryo())
+        assert asistan.profil_deposu.getir("ayse")["toplam_sohbet"] == 1
+        ogrenme.kayit_iscisi.bosalt()
+
+def test_isci_havuzu():
+    """İşçinin sahip yayınladığı görüntüden okuyup yazmaları sahibe ilettiğini test et"""
+    print("\n🏭 İşçi Havuzu Test Ediliyor...\n")
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, kullanim_tampon_boyutu=100)
+        ogrenme.yeni_bilgi_ogren("Python nedir?", "Bir programlama dili.", "teknoloji")
+        ogrenme.yeni_bilgi_ogren("Okul ne zaman başlıyor?", "Eylülde.", "eğitim")
+        ogrenme.yeni_bilgi_ogren("Java nedir?", "Başka bir dil.", "teknoloji")
+        
+        # Görüntü bilgileri, konuları ve arama adaylarını aynen vermeli
+        dosya = os.path.join(klasor, "goruntu.bin")
+        assert ogrenme.goruntu_yaz(dosya, nesil=7)
+        goruntu = IkiliGoruntu(dosya)
+        bilgiler = ogrenme.bilgi_tabani["bilgiler"]
+        assert goruntu.nesil == 7 and len(goruntu) == len(bilgiler)
+        assert [goruntu.bilgi(no) for no in range(len(goruntu))] == list(bilgiler.values())
+        assert goruntu.numara("teknoloji_2") == 2 and goruntu.numara("yok") is None
+        assert goruntu.konu_listeleri() == ogrenme.bilgi_tabani["konular"]
+        for sorgu in ["python nedir", "java nedir", "okul"]:
+            temiz = ogrenme.dil_isleme.temizle_metin(sorgu)
+            beklenen = ogrenme.arama_indeksi.adaylar(temiz, ogrenme.benzerlik_esigi, 2)
+            assert [goruntu.bilgi_id(no) for no in goruntu.adaylar(temiz, ogrenme.benzerlik_esigi, 2)] == beklenen
+        goruntu.kapat()
+        
+        profiller = ProfilDeposu(os.path.join(klasor, "kullanicilar"), "veri/kullanici_profilleri.json")
+        sahip = GoruntuSahibi(ogrenme, os.path.join(klasor, "goruntu"), yayin_araligi=0, profil_deposu=profiller)
+        assert sahip.yayinla()
+        isci = GoruntuOgrenmeModulu(sahip.klasor, sahip.nesil, sahip.kuyruk, ogrenme.ayarlar, ogrenme.dil_isleme)
+        
+        # İki işçiden gelen girişler sahipte sırayla uygulanır, biri diğerini ezmez
+        isci_profilleri = [UzakProfilDeposu(profiller.klasor, isci._gonder) for _ in range(2)]
+        for uzak in isci_profilleri:
+            _, yeni_mi = uzak.guncelle("ayse", _giris_profili_guncelle)
+            assert yeni_mi
+        while sahip.adim(zaman_asimi=1.0) < 2:
+            pass
+        ogrenme.kayit_iscisi.bosalt()
+        assert isci_profilleri[0].getir("ayse")["toplam_sohbet"] == 2
+        
+        assert isci.en_iyi_cevap_bul("python nedir?") == "Bir programlama dili."
+        assert isci.konu_bazli_bilgi_getir("teknoloji", 5)[1]["asistan_cevap"] == "Başka bir dil."
+        assert isci.yeni_bilgi_ogren("Kahve nasıl yapılır?", "Demleyerek.", "genel")
+        assert isci.en_iyi_cevap_bul("kahve nasıl yapılır") is None
+        
+        # Sahip istekleri işleyip yeni nesil yayınlayınca işçi yeniden başlamadan görür
+        islenen = 0
+        while islenen < 2:
+            islenen += sahip.adim(zaman_asimi=1.0)
+        assert sahip.nesil.value == 2
+        assert isci.en_iyi_cevap_bul("kahve nasıl yapılır") == "Demleyerek."
+        assert isci.goruntu().getir("teknoloji_0")["kullanim_sayisi"] == 2
+        assert isci.ogrenme_istatistikleri_getir()["toplam_bilgi"] == 4
+        
+        sahip.bosalt()
+        assert ogrenme.bilgi_tabani["bilgiler"]["genel_3"]["kullanim_sayisi"] == 2
+        assert sorted(os.listdir(sahip.klasor)) == ["goruntu_2.bin", "goruntu_3.bin"]
+        ogrenme.kayit_iscisi.bosalt()
+
+def test_kiyaslama():
+    """Sentetik derlemin belirlenimci olduğunu ve ölçümlerin temel ölçümle karşılaştırıldığını test et"""
+    print("\n⏱️ Kıyaslama Takımı Test Ediliyor...\n")
+    
+    derlem = list(kiyaslama.sentetik_derlem(2000))
+    assert derlem == list(kiyaslama.sentetik_derlem(2000))
+    assert len({soru for soru, _, _ in derlem}) == len(derlem)
+    assert derlem[1500:] == list(kiyaslama.sentetik_derlem(500, baslangic=1500))
+    assert list(kiyaslama.sentetik_derlem(10, tohum=7)) != derlem[:10]
+    sorgular = kiyaslama.sentetik_sorgular(2000, 50)
+    assert len(sorgular) == len(set(sorgular)) and sorgular == kiyaslama.sentetik_sorgular(2000, 50)
+    
+    with _gecici_klasor() as klasor:
+        sonuc = kiyaslama.boyutu_olc(200, klasor, sorgu_sayisi=20, ogrenme_sayisi=20)
+    for ad in ["toplu_yukleme_sn", "yeni_bilgi_hizi", "kaydetme_sn", "soguk_baslangic_sn",
+               "benzer_bilgi_bul_p99_ms", "mesaj_isle_p50_ms"]:
+        assert sonuc[ad] > 0, ad
+    assert 0 < sonuc["kayit_bilgi_bayt"] < sonuc["sozluk_bilgi_bayt"]
+    print(f"   📊 200 bilgi: benzer_bilgi_bul p50 {sonuc['benzer_bilgi_bul_p50_ms']:.2f} ms, "
+          f"bilgi başına {sonuc['sozluk_bilgi_bayt']:.0f} → {sonuc['kayit_bilgi_bayt']:.0f} B")
+    
+    # Süre artışı ve hız düşüşü eşiği aşınca gerileme sayılır
+    temel = {"boyutlar": {"200": {"boyut": 200, "kaydetme_sn": 1.0, "yeni_bilgi_hizi": 100.0}}}
+    iyi = {"boyutlar": {"200": {"boyut": 200, "kaydetme_sn": 1.1, "yeni_bilgi_hizi": 120.0}}}
+    kotu = {"boyutlar": {"200": {"boyut": 200, "kaydetme_sn": 1.5, "yeni_bilgi_hizi": 50.0}}}
+    assert kiyaslama.karsilastir(iyi, temel, 0.2) == []
+    assert len(kiyaslama.karsilastir(kotu, temel, 0.2)) == 2
+    assert kiyaslama.karsilastir(kotu, {"boyutlar": {}}, 0.2) == []
+
+def test_olcumler():
+    """Aşama histogramlarını, sayaçları, Prometheus çıktısını ve yavaş istek profilini test et"""
+    print("\n⏱️ Ölçümler Test Ediliyor...\n")
+    
+    histogram = Histogram((0.001, 0.01, 0.1))
+    for sure in [0.0005] * 50 + [0.005] * 45 + [0.05] * 4 + [0.5]:
+        histogram.gozlemle(sure)
+    assert histogram.sayilar == [50, 45, 4, 1] and histogram.adet == 100
+    assert (histogram.yuzdelik(0.50), histogram.yuzdelik(0.95), histogram.yuzdelik(0.99)) == (0.001, 0.01, 0.1)
+    assert histogram.yuzdelik(1.0) == 0.5 and Histogram().yuzdelik(0.5) == 0.0
+    
+    kayit = Olcumler((0.001, 0.01))
+    kayit.artir("arama")
+    kayit.artir("yazilan_bayt", 512)
+    with kayit.sure("mesaj_isle"):
+        pass
+    kayit.gozlemle("mesaj_isle", 0.02)
+    goruntu = kayit.anlik_goruntu()
+    assert goruntu["sayaclar"] == {"arama": 1, "yazilan_bayt": 512}
+    assert goruntu["asamalar"]["mesaj_isle"]["adet"] == 2
+    assert goruntu["asamalar"]["mesaj_isle"]["kovalar"] == [1, 0, 1]
+    metin = kayit.prometheus_metni()
+    assert "ogrenen_asistan_yazilan_bayt_total 512" in metin
+    assert 'ogrenen_asistan_asama_sure_saniye_bucket{asama="mesaj_isle",le="0.01"} 1' in metin
+    assert 'ogrenen_asistan_asama_sure_saniye_bucket{asama="mesaj_isle",le="+Inf"} 2' in metin
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, olcum_dosya=os.path.join(klasor, "olcumler.prom"),
+                                         olcum_profil_orani=1.0, olcum_profil_esigi=0.0)
+        asistan = OgrenenAsistan(ogrenme_modulu=ogrenme,
+                                 profil_deposu=ProfilDeposu(os.path.join(klasor, "kullanicilar"),
+                                                            os.path.join(klasor, "profiller.json")))
+        olcumler.sifirla()
+        asistan.mesaj_isle("Python programlama dili nedir?")
+        ogrenme.ogrenme_kuyrugu.bosalt()
+        asistan.mesaj_isle("Python programlama dili nedir?")
+        ogrenme.verileri_kaydet()
+        
+        goruntu = olcumler.anlik_goruntu()
+        for asama in ["mesaj_isle", "mesaj_analizi", "cevap_uret", "en_iyi_cevap_bul",
+                      "benzer_bilgi_bul", "ogrenme_sureci", "yeni_bilgi_ogren", "verileri_kaydet"]:
+            assert goruntu["asamalar"][asama]["adet"] >= 1, asama
+        sayaclar = goruntu["sayaclar"]
+        # Aynı mesaj ikinci kez yeni bilgi açmaz, ilkiyle birleştirilir
+        assert sayaclar["ogrenme"] == 1 and sayaclar["tekrar_birlestirme"] == 1 and sayaclar["arama"] >= 1
+        assert sayaclar.get("onbellek_isabet", 0) + sayaclar["onbellek_iskalama"] == sayaclar["arama"]
+        assert sayaclar["yazilan_bayt"] > 0
+        
+        # Her istek örneklendi ve eşik 0 olduğu için profili yazıldı
+        assert sayaclar["kaydedilen_profil"] == 2
+        assert len(os.listdir(os.path.join(klasor, "profiller"))) == 2
+        ogrenme.kayit_iscisi.bosalt()
+        with open(os.path.join(klasor, "olcumler.prom"), encoding='utf-8') as f:
+            assert "ogrenen_asistan_ogrenme_total 1" in f.read()
+        asistan.istatistikleri_goster()
+        olcumler.ayarla(profil_orani=0.0)
+
+def test_arka_plan_ogrenme():
+    """Öğrenmenin cevabı beklemeden, sırayla ve sınırlı kuyrukla yapıldığını test et"""
+    print("\n📨 Arka Plan Öğrenme Test Ediliyor...\n")
+    
+    # İşler sırayla çalışır; kuyruk dolunca ekleyen bekler
+    kuyruk = SiraliIsKuyrugu(boyut=2)
+    sira, serbest = [], threading.Event()
+    kuyruk.ekle(serbest.wait)
+    time.sleep(0.05)
+    kuyruk.ekle(lambda: sira.append(1))
+    kuyruk.ekle(lambda: sira.append(2))
+    ekleyen = threading.Thread(target=kuyruk.ekle, args=(lambda: sira.append(3),))
+    ekleyen.start()
+    ekleyen.join(0.2)
+    assert ekleyen.is_alive() and len(kuyruk) == 2
+    serbest.set()
+    ekleyen.join(1)
+    kuyruk.bosalt()
+    assert sira == [1, 2, 3]
+    kuyruk.durdur()
+    kuyruk.ekle(lambda: sira.append(4))
+    assert sira == [1, 2, 3, 4]
+    
+    with _gecici_klasor() as klasor:
+        ogrenme = _gecici_ogrenme_modulu(klasor, yanit_gecikmesi=5)
+        asistan = OgrenenAsistan(ogrenme_modulu=ogrenme,
+                                 profil_deposu=ProfilDeposu(os.path.join(klasor, "kullanicilar"),
+                                                            os.path.join(klasor, "profiller.json")))
+        
+        # Öğrenme kuyrukta beklerken cevap döner
+        serbest = threading.Event()
+        ogrenme.ogrenme_kuyrugu.ekle(serbest.wait)
+        sorular = ["Python programlama dili nedir?", "Okulda hangi dersler var?", "Kahve nasıl demlenir acaba?"]
+        cikti = io.StringIO()
+        with redirect_stdout(cikti):
+            for soru in sorular:
+                assert asistan.mesaj_isle(soru)
+        assert len(ogrenme.bilgi_tabani.get("bilgiler", {})) == 0
+        # Konsol dışında (sunucu) öğrenme bildirimi yazılmaz
+        assert "öğrendim" not in cikti.getvalue()
+        serbest.set()
+        ogrenme.verileri_kaydet()
+        ogrenilenler = [bilgi["kullanici_mesaj"] for bilgi in ogrenme.bilgi_tabani["bilgiler"].values()]
+        assert ogrenilenler == sorular
+        
+        # Konsol girdisi yönlendirilmişken ayarlanan gecikme uygulanmaz
+        # Konsolda yalnızca yeni bilgi açan öğrenme bildirilir, birleştirme bildirilmez
+        girdiler = iter(["", "Java programlama dili nedir?", "Java programlama dili nedir?", "çıkış"])
+        eski_input = builtins.input
+        builtins.input = lambda _="": next(girdiler)
+        cikti = io.StringIO()
+        try:
+            baslangic = time.monotonic()
+            with redirect_stdout(cikti):
+                asistan.calistir()
+            assert time.monotonic() - baslangic < 2
+        finally:
+            builtins.input = eski_input
+        assert len(ogrenme.bilgi_tabani["bilgiler"]) == 4
+        assert cikti.getvalue().count("Yeni bilgi öğrendim") == 1
+        
+        # Bildirim yalnızca başarılı yeni öğrenmede çağrılır; hata bildirilmez
+        bildirimler = []
+        ogrenme.arka_planda_ogren("Kahve nasıl demlenir acaba?", "Yavaşça", ogrenildi=lambda: bildirimler.append(1))
+        ogrenme.arka_planda_ogren("Çay nasıl demlenir peki?", "Demlikte", ogrenildi=lambda: bildirimler.append(2))
+        ogrenme.verileri_kaydet()
+        eski_olustur = ogrenme._bilgi_olustur
+        ogrenme._bilgi_olustur = lambda *args: 1 / 0
+        with redirect_stdout(io.StringIO()):
+            ogrenme.arka_planda_ogren("Bira nasıl mayalanır acaba?", "Fıçıda", ogrenildi=lambda: bildirimler.append(3))
+            ogrenme.verileri_kaydet()
+        ogrenme._bilgi_olustur = eski_olustur
+        assert bildirimler == [2]
+        assert ogrenme.yeni_bilgi_ogren("Kahve nasıl demlenir acaba?", "Yavaşça") is True
 
 def main():
     """Ana test fonksiyonu"""
@@ -73,10 +1460,38 @@ def main():
     try:
         # Dil işleme testleri
         test_dil_isleme()
+        test_mesaj_analizi()
+        test_bulanik_sozluk()
+        test_ifade_otomati()
+        test_gecikmeli_yukleme()
         
         # Öğrenme modülü testleri  
         test_ogrenme_modulu()
         
+        # Arama indeksi testleri
+        test_arama_indeksi()
+        test_tam_tarama_karsilastirma()
+        test_aday_limiti()
+        test_olay_gunlugu()
+        test_kayit_iscisi()
+        test_sqlite_depo()
+        test_ikili_depo()
+        test_toplu_ogrenme()
+        test_tfidf_indeksi()
+        test_sorgu_onbellegi()
+        test_hafiza_siniri()
+        test_konu_siralamasi()
+        test_tekrar_birlestirme()
+        test_bilgi_kayitlari()
+        test_gecmis_halkasi()
+        test_profil_deposu()
+        test_eszamanli_erisim()
+        test_arka_plan_ogrenme()
+        test_sunucu()
+        test_isci_havuzu()
+        test_kiyaslama()
+        test_olcumler()
+        
         print("\n🎉 Tüm testler başarıyla tamamlandı!")
         print("✅ Öğrenen Asistan kullanıma hazır!")
         
@@ -0,0 +1,292 @@
+"""
+Vektör Arama Modülü
+Bu modül bilgi tabanındaki mesajlar için karakter n-gramı TF-IDF matrisi sağlar.
+Sorgunun tüm bilgilerle kosinüs benzerliği tek bir seyrek matris çarpımıyla hesaplanır,
+en yüksek skorlu adaylar argpartition ile seçilir. NumPy kurulu değilse kullanılamaz.
+"""
+
+import os
+import json
+import math
+import threading
+import importlib.util
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Set
+
+# numpy yüklemesi uzun sürdüğü için ilk TfidfIndeksi oluşturulurken yapılır
+np = None
+
+
+def numpy_var_mi() -> bool:
+    """TF-IDF arama motoru kullanılabilir mi? (numpy yüklenmeden bakılır)"""
+    return np is not None or importlib.util.find_spec("numpy") is not None
+
+
+def _numpy_yukle():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+
+
+class TfidfIndeksi:
+    def __init__(self, n: int = 3):
+        """Boş bir TF-IDF matrisi oluştur
+
+        Matris n-gram başına (satır, frekans) dizileri olarak sütun sütun tutulur,
+        böylece yeni bilgi eklemek yalnızca dizilerin sonuna yazmaktır.
+        """
+        if not numpy_var_mi():
+            raise ImportError("TF-IDF arama motoru için numpy gerekli")
+        _numpy_yukle()
+
+        self.n = n
+        self.idler: List[str] = []
+        self.satirlar: Dict[str, int] = {}
+        self._satir_dizileri: Dict[str, array] = {}
+        self._frekans_dizileri: Dict[str, array] = {}
+        self._uzunluklar = array('i')
+        self._normlar = array('d')
+        self._silinmisler: Set[int] = set()
+        self._agirliklandirilan = 0
+        self._kilit = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.satirlar)
+
+    def __contains__(self, bilgi_id: str) -> bool:
+        return bilgi_id in self.satirlar
+
+    def ngramlari_cikart(self, temiz_metin: str) -> Counter:
+        """Temizlenmiş metnin karakter n-gramlarını frekanslarıyla çıkart"""
+        dolgulu = f" {temiz_metin} "
+        if len(dolgulu) <= self.n:
+            return Counter([dolgulu])
+        return Counter(dolgulu[i:i + self.n] for i in range(len(dolgulu) - self.n + 1))
+
+    def _idf(self, ngram: str) -> float:
+        """N-gramın ters belge frekansı"""
+        belge_sayisi = len(self._satir_dizileri.get(ngram, ()))
+        return math.log((len(self.idler) + 1) / (belge_sayisi + 1)) + 1
+
+    def ekle(self, bilgi_id: str, temiz_metin: str):
+        """Bilgiyi matrise yeni satır olarak ekle"""
+        with self._kilit:
+            if bilgi_id in self.satirlar:
+                return
+
+            satir = len(self.idler)
+            self.idler.append(bilgi_id)
+            self.satirlar[bilgi_id] = satir
+
+            frekanslar = self.ngramlari_cikart(temiz_metin)
+            for ngram, frekans in frekanslar.items():
+                self._satir_dizileri.setdefault(ngram, array('i')).append(satir)
+                self._frekans_dizileri.setdefault(ngram, array('f')).append(frekans)
+
+            self._uzunluklar.append(len(temiz_metin))
+
+            # Toplu oluşturmada normlar en sonda bir kez hesaplanır
+            if self._agirliklandirilan == math.inf:
+                self._normlar.append(0.0)
+                return
+
+            self._normlar.append(math.sqrt(sum(
+                (frekans * self._idf(ngram)) ** 2 for ngram, frekans in frekanslar.items()
+            )))
+
+            # IDF değerleri bilgi sayısıyla kayar; sayı ikiye katlandıkça normları yenile
+            if len(self.idler) >= 2 * max(self._agirliklandirilan, 64):
+                self._normlari_yenile()
+
+    def cikar(self, bilgi_id: str, temiz_metin: str = None):
+        """Bilgiyi aramalardan çıkar (satırı matriste silinmiş olarak işaretlenir)"""
+        with self._kilit:
+            satir = self.satirlar.pop(bilgi_id, None)
+            if satir is not None:
+                self._silinmisler.add(satir)
+
+    def _normlari_yenile(self):
+        """Satır normlarını güncel IDF değerleriyle yeniden hesapla"""
+        kareler = np.zeros(len(self.idler))
+        for ngram, satirlar in self._satir_dizileri.items():
+            idf = self._idf(ngram)
+            agirliklar = np.array(self._frekans_dizileri[ngram], dtype=np.float64) * idf
+            # Bir n-gram bir satırda en fazla bir kez geçtiği için indeksler tekildir
+            kareler[np.array(satirlar, dtype=np.int64)] += agirliklar * agirliklar
+
+        self._normlar = array('d', np.sqrt(kareler).tobytes())
+        self._agirliklandirilan = len(self.idler)
+
+    def skor_matrisi(self, temiz_metinler: List[str]) -> "np.ndarray":
+        """Sorguların tüm bilgilerle kosinüs benzerliği (sorgu sayısı x bilgi sayısı)
+
+        Tüm sorguların sütunları birleştirilip tek bir bincount ile toplanır.
+        """
+        with self._kilit:
+            return self._skor_matrisi(temiz_metinler)
+
+    def _skor_matrisi(self, temiz_metinler: List[str]) -> "np.ndarray":
+        bilgi_sayisi = len(self.idler)
+        konumlar = []
+        agirliklar = []
+        sorgu_normlari = np.zeros(len(temiz_metinler))
+
+        for sorgu, temiz_metin in enumerate(temiz_metinler):
+            for ngram, frekans in self.ngramlari_cikart(temiz_metin).items():
+                idf = self._idf(ngram)
+                sorgu_agirligi = frekans * idf
+                sorgu_normlari[sorgu] += sorgu_agirligi * sorgu_agirligi
+
+                satirlar = self._satir_dizileri.get(ngram)
+                if satirlar is None:
+                    continue
+                konumlar.append(np.array(satirlar, dtype=np.int64) + sorgu * bilgi_sayisi)
+                agirliklar.append(np.array(self._frekans_dizileri[ngram], dtype=np.float64) * (sorgu_agirligi * idf))
+
+        boyut = len(temiz_metinler) * bilgi_sayisi
+        if konumlar:
+            carpimlar = np.bincount(np.concatenate(konumlar), np.concatenate(agirliklar), minlength=boyut)
+        else:
+            carpimlar = np.zeros(boyut)
+        matris = carpimlar.reshape(len(temiz_metinler), bilgi_sayisi)
+
+        payda = np.sqrt(sorgu_normlari)[:, None] * np.array(self._normlar, dtype=np.float64)[None, :]
+        return np.divide(matris, payda, out=np.zeros_like(matris), where=payda > 0)
+
+    def adaylar(self, temiz_metin: str, esik: float, aday_limiti: int) -> List[str]:
+        """En yüksek kosinüs skorlu, uzunluğu uygun aday bilgileri getir
+
+        Adaylar eklenme sırasına göre döner; eşit skorlarda önce eklenen seçilir.
+        """
+        return self.toplu_adaylar([temiz_metin], esik, aday_limiti)[0]
+
+    def toplu_adaylar(self, temiz_metinler: List[str], esik: float, aday_limiti: int) -> List[List[str]]:
+        """Birden fazla sorgunun adaylarını tek matris işlemiyle getir"""
+        with self._kilit:
+            skorlar = self._skor_matrisi(temiz_metinler)
+            uzunluklar = np.array(self._uzunluklar, dtype=np.int64)
+            silinmisler = np.fromiter(self._silinmisler, dtype=np.int64, count=len(self._silinmisler))
+            idler = self.idler
+
+        sonuclar = []
+        for temiz_metin, skor in zip(temiz_metinler, skorlar):
+            uygun = (skor > 0) & self._uzunluk_uygun(len(temiz_metin), uzunluklar, esik)
+            uygun[silinmisler] = False
+            satirlar = np.flatnonzero(uygun)
+
+            if 0 < aday_limiti < len(satirlar):
+                satirlar = self._en_yuksekler(satirlar, skor[satirlar], aday_limiti)
+
+            sonuclar.append([idler[satir] for satir in satirlar])
+        return sonuclar
+
+    @staticmethod
+    def _uzunluk_uygun(uzunluk: int, uzunluklar: "np.ndarray", esik: float) -> "np.ndarray":
+        """NgramIndeksi.uzunluk_uygun kuralının vektör hali"""
+        toplamlar = uzunluklar + uzunluk
+        ust_sinirlar = np.round(200 * np.minimum(uzunluklar, uzunluk) / np.maximum(toplamlar, 1)) / 100.0
+        return (ust_sinirlar >= esik) | (toplamlar == 0)
+
+    @staticmethod
+    def _en_yuksekler(satirlar: "np.ndarray", skorlar: "np.ndarray", limit: int) -> "np.ndarray":
+        """Skoru en yüksek limit kadar satırı seç, eşitlikte küçük satır numarası önce gelir"""
+        sinir = len(skorlar) - limit
+        sinir_skoru = skorlar[np.argpartition(skorlar, sinir)[sinir]]
+
+        ustte = satirlar[skorlar > sinir_skoru]
+        esitler = satirlar[skorlar == sinir_skoru][:limit - len(ustte)]
+        return np.sort(np.concatenate([ustte, esitler]))
+
+    def olustur(self, metinler: Iterable):
+        """(bilgi_id, temiz_metin) çiftlerinden matrisi sıfırdan oluştur"""
+        with self._kilit:
+            self.idler = []
+            self.satirlar = {}
+            self._satir_dizileri = {}
+            self._frekans_dizileri = {}
+            self._uzunluklar = array('i')
+            self._normlar = array('d')
+            self._silinmisler = set()
+            # Ekleme sırasında normlar hesaplanmasın
+            self._agirliklandirilan = math.inf
+
+        for bilgi_id, temiz_metin in metinler:
+            self.ekle(bilgi_id, temiz_metin)
+
+        with self._kilit:
+            self._normlari_yenile()
+
+    def kaydet(self, dosya_yolu: str, imza: str) -> bool:
+        """Matrisi sütun dizileri birleştirilmiş olarak .npz dosyasına atomik kaydet"""
+        with self._kilit:
+            ngramlar = list(self._satir_dizileri)
+            uzunluklar = [len(self._satir_dizileri[ngram]) for ngram in ngramlar]
+            veri = {
+                "meta": np.array(json.dumps({
+                    "imza": imza,
+                    "n": self.n,
+                    "idler": self.idler,
+                    "ngramlar": ngramlar,
+                    "agirliklandirilan": self._agirliklandirilan
+                }, ensure_ascii=False)),
+                "konumlar": np.cumsum([0] + uzunluklar, dtype=np.int64),
+                "satirlar": np.array(
+                    [satir for ngram in ngramlar for satir in self._satir_dizileri[ngram]], dtype=np.int32),
+                "frekanslar": np.array(
+                    [frekans for ngram in ngramlar for frekans in self._frekans_dizileri[ngram]], dtype=np.float32),
+                "uzunluklar": np.array(self._uzunluklar, dtype=np.int32),
+                "normlar": np.array(self._normlar, dtype=np.float64),
+                "silinmisler": np.array(sorted(self._silinmisler), dtype=np.int64)
+            }
+
+        import tempfile
+
+        klasor = os.path.dirname(os.path.abspath(dosya_yolu))
+        try:
+            fd, gecici_yol = tempfile.mkstemp(dir=klasor, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(f, **veri)
+                os.replace(gecici_yol, dosya_yolu)
+            except BaseException:
+                if os.path.exists(gecici_yol):
+                    os.remove(gecici_yol)
+                raise
+            return True
+        except Exception as e:
+            print(f"❌ İndeks kaydetme hatası {dosya_yolu}: {e}")
+            return False
+
+    def yukle(self, dosya_yolu: str, imza: str) -> bool:
+        """Matrisi dosyadan yükle, imza uyuşmazsa yükleme"""
+        try:
+            with np.load(dosya_yolu, allow_pickle=False) as veri:
+                meta = json.loads(str(veri["meta"]))
+                if meta.get("imza") != imza or meta.get("n") != self.n:
+                    return False
+                konumlar = veri["konumlar"]
+                satirlar = veri["satirlar"]
+                frekanslar = veri["frekanslar"]
+                uzunluklar = veri["uzunluklar"]
+                normlar = veri["normlar"]
+                silinmisler = veri["silinmisler"]
+        except (OSError, ValueError, KeyError):
+            return False
+
+        with self._kilit:
+            self.idler = meta["idler"]
+            self._silinmisler = set(silinmisler.tolist())
+            self.satirlar = {bilgi_id: satir for satir, bilgi_id in enumerate(self.idler)
+                             if satir not in self._silinmisler}
+            self._satir_dizileri = {}
+            self._frekans_dizileri = {}
+            for i, ngram in enumerate(meta["ngramlar"]):
+                baslangic, bitis = konumlar[i], konumlar[i + 1]
+                self._satir_dizileri[ngram] = array('i', satirlar[baslangic:bitis].tolist())
+                self._frekans_dizileri[ngram] = array('f', frekanslar[baslangic:bitis].tolist())
+            self._uzunluklar = array('i', uzunluklar.tolist())
+            self._normlar = array('d', normlar.tolist())
+            self._agirliklandirilan = meta["agirliklandirilan"]
+        return True
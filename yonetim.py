@@ -0,0 +1,269 @@
+"""
+Öğrenen Asistan - Yönetim Komutları
+Bilgi tabanı üzerinde toplu işlemler için komut satırı aracı
+
+Kullanım:
+    python yonetim.py sqlite-aktar [--hedef veri/bilgi_tabani.db]
+    python yonetim.py ikili-aktar [--hedef veri/bilgi_tabani.bin]
+    python yonetim.py json-aktar [--kaynak veri/bilgi_tabani.bin] [--hedef veri/bilgi_tabani.json]
+    python yonetim.py toplu-ogren veriler.jsonl [--bicim jsonl|csv] [--isci 4] [--parti 1000]
+    python yonetim.py tekrar-temizle [--bilgi-tabani veri/bilgi_tabani.json] [--esik 0.98]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Iterable, Iterator, Optional, Tuple
+from depolama import JsonDepo, gunluk_yolu, json_kaydet
+from ikili_depo import IkiliDepo, sozluge_cevir
+from ikili_goruntu import goruntu_yaz
+from ogrenme_modulu import OgrenmeModulu
+from sqlite_depo import SqliteDepo
+
+
+def sqlite_aktar(argumanlar: argparse.Namespace) -> int:
+    """JSON bilgi tabanını (günlükteki olaylarla birlikte) SQLite veritabanına aktar"""
+    baslangic = time.perf_counter()
+    
+    kaynak = OgrenmeModulu(
+        bilgi_tabani_dosya=argumanlar.bilgi_tabani,
+        ogrenme_gecmisi_dosya=argumanlar.ogrenme_gecmisi,
+        depo=JsonDepo(argumanlar.bilgi_tabani, argumanlar.ogrenme_gecmisi, gunluk_yolu(argumanlar.bilgi_tabani))
+    )
+    
+    toplam = len(kaynak.bilgi_tabani.get("bilgiler", {}))
+    hedef = SqliteDepo(argumanlar.hedef)
+    try:
+        hedef.json_aktar(kaynak.bilgi_tabani, kaynak.ogrenme_gecmisi)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        hedef.kapat()
+        kaynak.kapat()
+    
+    print(f"✅ {toplam} bilgi {argumanlar.hedef} dosyasına aktarıldı "
+          f"({time.perf_counter() - baslangic:.2f} sn)")
+    print("💡 Kullanmak için ayarlar.json içinde \"depolama\": \"sqlite\" yapın.")
+    return 0
+
+
+def ikili_aktar(argumanlar: argparse.Namespace) -> int:
+    """JSON bilgi tabanını (günlükteki olaylarla birlikte) ikili görüntüye aktar
+
+    Görüntü günlüğün son olayına kadar günceldir; aynı günlükle "depolama": "ikili"
+    ayarıyla açılınca olaylar tekrar uygulanmaz.
+    """
+    baslangic = time.perf_counter()
+    
+    kaynak = OgrenmeModulu(
+        bilgi_tabani_dosya=argumanlar.bilgi_tabani,
+        ogrenme_gecmisi_dosya=argumanlar.ogrenme_gecmisi,
+        depo=JsonDepo(argumanlar.bilgi_tabani, argumanlar.ogrenme_gecmisi, gunluk_yolu(argumanlar.bilgi_tabani))
+    )
+    
+    bilgi_tabani = dict(kaynak.bilgi_tabani)
+    bilgi_tabani["istatistikler"] = {
+        **bilgi_tabani.get("istatistikler", {}),
+        "gunluk_sirasi": kaynak.depo.gunluk.sira
+    }
+    basarili = goruntu_yaz(bilgi_tabani, argumanlar.hedef)
+    kaynak.kapat()
+    if not basarili:
+        return 1
+    
+    toplam = len(bilgi_tabani.get("bilgiler", {}))
+    print(f"✅ {toplam} bilgi {argumanlar.hedef} dosyasına aktarıldı "
+          f"({time.perf_counter() - baslangic:.2f} sn)")
+    print("💡 Kullanmak için ayarlar.json içinde \"depolama\": \"ikili\" yapın.")
+    return 0
+
+
+def json_aktar(argumanlar: argparse.Namespace) -> int:
+    """İkili görüntüyü (günlükteki olaylarla birlikte) JSON bilgi tabanına geri aktar
+
+    Günlük, öğrenme modülündeki gibi --bilgi-tabani dosyasının yanında aranır.
+    """
+    baslangic = time.perf_counter()
+    
+    kaynak = OgrenmeModulu(
+        bilgi_tabani_dosya=argumanlar.bilgi_tabani,
+        ogrenme_gecmisi_dosya=argumanlar.ogrenme_gecmisi,
+        depo=IkiliDepo(argumanlar.kaynak, argumanlar.bilgi_tabani, argumanlar.ogrenme_gecmisi,
+                       gunluk_yolu(argumanlar.bilgi_tabani))
+    )
+    if kaynak.depo.goruntu is None:
+        print(f"❌ Görüntü dosyası bulunamadı: {argumanlar.kaynak}")
+        kaynak.kapat()
+        return 1
+    
+    bilgi_tabani = sozluge_cevir(kaynak.bilgi_tabani)
+    bilgi_tabani["istatistikler"] = {
+        **bilgi_tabani.get("istatistikler", {}),
+        "gunluk_sirasi": kaynak.depo.gunluk.sira
+    }
+    kaynak.kapat()
+    if not json_kaydet(bilgi_tabani, argumanlar.hedef):
+        return 1
+    
+    print(f"✅ {len(bilgi_tabani['bilgiler'])} bilgi {argumanlar.hedef} dosyasına aktarıldı "
+          f"({time.perf_counter() - baslangic:.2f} sn)")
+    return 0
+
+
+def jsonl_satirlari(dosya_yolu: str) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """JSON satırlarından (soru, cevap, konu) üçlülerini akış halinde oku"""
+    with open(dosya_yolu, 'r', encoding='utf-8') as f:
+        for satir_no, satir in enumerate(f, 1):
+            if not satir.strip():
+                continue
+            try:
+                kayit = json.loads(satir)
+                soru, cevap, konu = kayit["soru"], kayit["cevap"], kayit.get("konu") or None
+            except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+                print(f"⚠️ {satir_no}. satır atlandı: {e}")
+                continue
+            if not (isinstance(soru, str) and isinstance(cevap, str) and isinstance(konu, (str, type(None)))):
+                print(f"⚠️ {satir_no}. satır atlandı: soru, cevap ve konu metin olmalı")
+                continue
+            yield soru, cevap, konu
+
+
+def csv_satirlari(dosya_yolu: str) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """CSV dosyasından (soru, cevap, konu) üçlülerini akış halinde oku
+
+    Sütun sırası soru, cevap ve isteğe bağlı konudur; başlık satırı varsa atlanır.
+    """
+    with open(dosya_yolu, 'r', encoding='utf-8', newline='') as f:
+        for satir_no, sutunlar in enumerate(csv.reader(f), 1):
+            if satir_no == 1 and sutunlar and sutunlar[0].strip().lower() == "soru":
+                continue
+            if len(sutunlar) < 2:
+                if sutunlar:
+                    print(f"⚠️ {satir_no}. satır atlandı: eksik sütun")
+                continue
+            konu = sutunlar[2].strip() if len(sutunlar) > 2 else ""
+            yield sutunlar[0], sutunlar[1], konu or None
+
+
+def toplu_ogren(argumanlar: argparse.Namespace) -> int:
+    """JSONL ya da CSV dosyasındaki soru-cevap çiftlerini bilgi tabanına öğret"""
+    bicim = argumanlar.bicim or ("csv" if argumanlar.dosya.lower().endswith(".csv") else "jsonl")
+    satirlar = csv_satirlari(argumanlar.dosya) if bicim == "csv" else jsonl_satirlari(argumanlar.dosya)
+    
+    ogrenme_modulu = OgrenmeModulu()
+    
+    def ilerleme(satir_sayisi: int, sure: float):
+        print(f"📥 {satir_sayisi} satır öğrenildi ({satir_sayisi / sure:.0f} satır/sn)")
+    
+    try:
+        sonuc = ogrenme_modulu.toplu_ogren(
+            satirlar,
+            parti_boyutu=argumanlar.parti,
+            isci_sayisi=argumanlar.isci,
+            ilerleme=ilerleme
+        )
+    except FileNotFoundError:
+        print(f"❌ Dosya bulunamadı: {argumanlar.dosya}")
+        return 1
+    finally:
+        ogrenme_modulu.kapat()
+    
+    print(f"✅ {sonuc['satir_sayisi']} bilgi öğrenildi "
+          f"({sonuc['sure']:.2f} sn, {sonuc['satir_hizi']:.0f} satır/sn)")
+    if sonuc["unutulan_sayisi"]:
+        print(f"🗑️ Hafıza sınırı ({ogrenme_modulu.maksimum_hafiza}) nedeniyle "
+              f"{sonuc['unutulan_sayisi']} bilgi unutuldu")
+    return 0
+
+
+def _toplam_boyut(dosyalar: Iterable[str]) -> int:
+    """Var olan dosyaların bayt cinsinden toplam boyutu"""
+    return sum(os.path.getsize(dosya) for dosya in dosyalar if os.path.exists(dosya))
+
+
+def tekrar_temizle(argumanlar: argparse.Namespace) -> int:
+    """JSON bilgi tabanındaki neredeyse aynı bilgileri birleştirip dosyayı yeniden yaz
+
+    Anlık kayıt alındığı için günlük de sıfırlanır; kazanılan alan bilgi tabanı ve
+    günlük dosyalarının toplam boyutundaki azalmadır.
+    """
+    baslangic = time.perf_counter()
+    dosyalar = [argumanlar.bilgi_tabani, gunluk_yolu(argumanlar.bilgi_tabani)]
+    onceki_boyut = _toplam_boyut(dosyalar)
+    
+    kaynak = OgrenmeModulu(
+        bilgi_tabani_dosya=argumanlar.bilgi_tabani,
+        ogrenme_gecmisi_dosya=argumanlar.ogrenme_gecmisi,
+        arama_indeksi_dosya=os.path.join(os.path.dirname(argumanlar.bilgi_tabani), "arama_indeksi.json"),
+        depo=JsonDepo(argumanlar.bilgi_tabani, argumanlar.ogrenme_gecmisi, gunluk_yolu(argumanlar.bilgi_tabani))
+    )
+    esik = argumanlar.esik or kaynak.tekrar_esigi
+    if esik <= 0:
+        print("❌ Tekrar denetimi ayarlarda kapalı (tekrar_esigi 0); --esik ile bir eşik verin")
+        kaynak.kapat()
+        return 1
+    
+    onceki_sayi = len(kaynak.bilgi_tabani.get("bilgiler", {}))
+    birlesen = kaynak.tekrarlari_birlestir(esik)
+    kaydedildi = kaynak.verileri_kaydet()
+    kaynak.kapat()
+    if not kaydedildi:
+        return 1
+    
+    sonraki_boyut = _toplam_boyut(dosyalar)
+    print(f"✅ {birlesen} tekrar birleştirildi: {onceki_sayi} → {onceki_sayi - birlesen} bilgi "
+          f"({time.perf_counter() - baslangic:.2f} sn)")
+    print(f"💾 {onceki_boyut / 1024:.1f} KB → {sonraki_boyut / 1024:.1f} KB, "
+          f"{(onceki_boyut - sonraki_boyut) / 1024:.1f} KB kazanıldı")
+    return 0
+
+
+def main(argv=None) -> int:
+    """Komut satırı argümanlarını çözümle ve ilgili komutu çalıştır"""
+    ayristirici = argparse.ArgumentParser(description="Öğrenen Asistan yönetim komutları")
+    alt_komutlar = ayristirici.add_subparsers(dest="komut", required=True)
+    
+    aktar = alt_komutlar.add_parser("sqlite-aktar", help="JSON bilgi tabanını SQLite'a aktar")
+    aktar.add_argument("--bilgi-tabani", default="veri/bilgi_tabani.json")
+    aktar.add_argument("--ogrenme-gecmisi", default="veri/ogrenme_gecmisi.json")
+    aktar.add_argument("--hedef", default="veri/bilgi_tabani.db")
+    aktar.set_defaults(islev=sqlite_aktar)
+    
+    ikili = alt_komutlar.add_parser("ikili-aktar", help="JSON bilgi tabanını ikili görüntüye aktar")
+    ikili.add_argument("--bilgi-tabani", default="veri/bilgi_tabani.json")
+    ikili.add_argument("--ogrenme-gecmisi", default="veri/ogrenme_gecmisi.json")
+    ikili.add_argument("--hedef", default="veri/bilgi_tabani.bin")
+    ikili.set_defaults(islev=ikili_aktar)
+    
+    json_geri = alt_komutlar.add_parser("json-aktar", help="İkili görüntüyü JSON bilgi tabanına aktar")
+    json_geri.add_argument("--kaynak", default="veri/bilgi_tabani.bin")
+    json_geri.add_argument("--bilgi-tabani", default="veri/bilgi_tabani.json",
+                           help="günlüğü okunacak bilgi tabanı dosyası")
+    json_geri.add_argument("--ogrenme-gecmisi", default="veri/ogrenme_gecmisi.json")
+    json_geri.add_argument("--hedef", default="veri/bilgi_tabani.json")
+    json_geri.set_defaults(islev=json_aktar)
+    
+    ogren = alt_komutlar.add_parser("toplu-ogren", help="JSONL/CSV dosyasından toplu öğren")
+    ogren.add_argument("dosya", help="soru, cevap ve isteğe bağlı konu içeren dosya")
+    ogren.add_argument("--bicim", choices=("jsonl", "csv"), help="dosya uzantısından anlaşılmazsa")
+    ogren.add_argument("--isci", type=int, default=None, help="analiz süreci sayısı (0: paralel yok)")
+    ogren.add_argument("--parti", type=int, default=1000, help="tek seferde işlenen satır sayısı")
+    ogren.set_defaults(islev=toplu_ogren)
+    
+    tekrar = alt_komutlar.add_parser("tekrar-temizle", help="Neredeyse aynı bilgileri birleştir")
+    tekrar.add_argument("--bilgi-tabani", default="veri/bilgi_tabani.json")
+    tekrar.add_argument("--ogrenme-gecmisi", default="veri/ogrenme_gecmisi.json")
+    tekrar.add_argument("--esik", type=float, default=None,
+                        help="mesaj benzerliği eşiği (varsayılan: ayarlardaki tekrar_esigi)")
+    tekrar.set_defaults(islev=tekrar_temizle)
+    
+    argumanlar = ayristirici.parse_args(argv)
+    return argumanlar.islev(argumanlar)
+
+
+if __name__ == "__main__":
+    sys.exit(main())